@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Alarm Kural Motoru
+Okuyucu thread'de her örnek için çalışan eşik, değişim hızı ve kayan z-skor
+kuralları. Her kuralın durumu sabit boyuttadır (O(1)), histerezis sayesinde
+sınırda salınan değerler tekrar tekrar alarm üretmez. Yalnızca durum
+geçişleri (alarm başladı / bitti) olay olarak döndürülür.
+
+Kurallar JSON dosyasından yüklenir (bkz. alarm_rules.json):
+
+    {"rules": [
+        {"name": "Aşırı akım", "channel": "Current", "type": "threshold",
+         "above": 30.0, "hysteresis": 2.0, "severity": "critical"}
+    ]}
+"""
+
+import json
+import math
+import os
+import threading
+import time
+
+# Varsayılan kural dosyası - betik ile aynı dizinde
+DEFAULT_RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'alarm_rules.json')
+
+SEVERITIES = ('info', 'warning', 'critical')
+
+
+class AlarmRule:
+    """Ortak alan ve histerezisli durum makinesi"""
+
+    kind = None
+
+    def __init__(self, name, channel, hysteresis=0.0, severity='warning', message=None):
+        if severity not in SEVERITIES:
+            raise ValueError(f"Geçersiz önem derecesi: {severity}")
+        self.name = name
+        self.channel = channel
+        self.hysteresis = hysteresis
+        self.severity = severity
+        self.message = message or name
+        self.active = False
+
+    def measure(self, value, timestamp):
+        """Kuralın izlediği büyüklük ve aşım durumu: (ölçü, tetik, temizle)"""
+        raise NotImplementedError
+
+    def update(self, value, timestamp):
+        """Örneği işle, durum değiştiyse (aktif, ölçü) döndür"""
+        measured, trigger, clear = self.measure(value, timestamp)
+        if not self.active and trigger:
+            self.active = True
+            return True, measured
+        if self.active and clear:
+            self.active = False
+            return False, measured
+        return None
+
+    def reset(self):
+        self.active = False
+
+
+class ThresholdRule(AlarmRule):
+    """Değer üst sınırı aşınca veya alt sınırın altına düşünce"""
+
+    kind = 'threshold'
+
+    def __init__(self, name, channel, above=None, below=None, **kwargs):
+        super().__init__(name, channel, **kwargs)
+        if above is None and below is None:
+            raise ValueError(f"{name}: 'above' veya 'below' gerekli")
+        self.above = above
+        self.below = below
+
+    def measure(self, value, timestamp):
+        h = self.hysteresis
+        trigger = ((self.above is not None and value > self.above) or
+                   (self.below is not None and value < self.below))
+        clear = ((self.above is None or value < self.above - h) and
+                 (self.below is None or value > self.below + h))
+        return value, trigger, clear
+
+
+class RateRule(AlarmRule):
+    """Değişim hızı (birim/saniye) sınırı aşınca"""
+
+    kind = 'rate'
+
+    def __init__(self, name, channel, max_rate, **kwargs):
+        super().__init__(name, channel, **kwargs)
+        self.max_rate = max_rate
+        self.last_value = None
+        self.last_time = None
+
+    def measure(self, value, timestamp):
+        rate = 0.0
+        if self.last_time is not None and timestamp > self.last_time:
+            rate = abs(value - self.last_value) / (timestamp - self.last_time)
+        self.last_value = value
+        self.last_time = timestamp
+        return rate, rate > self.max_rate, rate < self.max_rate - self.hysteresis
+
+    def reset(self):
+        super().reset()
+        self.last_value = None
+        self.last_time = None
+
+
+class ZScoreRule(AlarmRule):
+    """
+    Kanalın yakın geçmişine göre aykırı değer
+
+    Ortalama ve varyans üstel ağırlıklı tutulur (span örnek), böylece durum
+    pencere boyundan bağımsız olarak sabit kalır.
+    """
+
+    kind = 'zscore'
+
+    def __init__(self, name, channel, z=4.0, span=200, min_samples=30, **kwargs):
+        super().__init__(name, channel, **kwargs)
+        self.z = z
+        self.alpha = 2.0 / (span + 1.0)
+        self.min_samples = min_samples
+        self.count = 0
+        self.mean = 0.0
+        self.var = 0.0
+
+    def measure(self, value, timestamp):
+        score = 0.0
+        if self.count >= self.min_samples and self.var > 0:
+            score = abs(value - self.mean) / math.sqrt(self.var)
+
+        # Skor, örnek istatistiklere eklenmeden önce hesaplanır
+        self.count += 1
+        if self.count == 1:
+            self.mean = value
+        else:
+            delta = value - self.mean
+            self.mean += self.alpha * delta
+            self.var = (1.0 - self.alpha) * (self.var + self.alpha * delta * delta)
+        return score, score > self.z, score < self.z - self.hysteresis
+
+    def reset(self):
+        super().reset()
+        self.count = 0
+        self.mean = 0.0
+        self.var = 0.0
+
+
+RULE_TYPES = {rule.kind: rule for rule in (ThresholdRule, RateRule, ZScoreRule)}
+
+
+def rule_from_config(config):
+    """Tek kural tanımından kural nesnesi oluştur"""
+    options = dict(config)
+    kind = options.pop('type', None)
+    if kind not in RULE_TYPES:
+        raise ValueError(f"Bilinmeyen kural tipi: {kind}")
+    return RULE_TYPES[kind](**options)
+
+
+class AlarmEngine:
+    """
+    Kanal başına kural listesi ve aktif alarmlar
+
+    evaluate() okuyucu thread'de, reset() ve kural yükleme GUI thread'inde
+    çağrılır; kural durumları kilitle korunur (rakipsiz kilit örnek başına
+    yalnızca onlarca nanosaniye).
+    """
+
+    def __init__(self, rules=()):
+        self.rules = []
+        self.by_channel = {}
+        self.lock = threading.Lock()
+        self.set_rules(rules)
+
+    def set_rules(self, rules):
+        rules = list(rules)
+        by_channel = {}
+        for rule in rules:
+            by_channel.setdefault(rule.channel, []).append(rule)
+        with self.lock:
+            self.rules = rules
+            self.by_channel = by_channel
+
+    def load(self, filename=DEFAULT_RULES_FILE):
+        """Kuralları JSON dosyasından yükle, kural sayısını döndür"""
+        with open(filename, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        self.set_rules(rule_from_config(item) for item in config.get('rules', []))
+        return len(self.rules)
+
+    def evaluate(self, channel, value, timestamp):
+        """Örneği kanalın kurallarında değerlendir, yalnızca durum geçişlerini döndür"""
+        rules = self.by_channel.get(channel)
+        if not rules:
+            return ()
+
+        events = []
+        with self.lock:
+            for rule in rules:
+                change = rule.update(value, timestamp)
+                if change is not None:
+                    active, measured = change
+                    events.append({
+                        'rule': rule.name,
+                        'channel': channel,
+                        'kind': rule.kind,
+                        'severity': rule.severity,
+                        'message': rule.message,
+                        'active': active,
+                        'value': value,
+                        'measured': measured,
+                        'time': timestamp,
+                    })
+        return events
+
+    def active_alarms(self):
+        return [rule for rule in self.rules if rule.active]
+
+    def reset(self):
+        with self.lock:
+            for rule in self.rules:
+                rule.reset()
+
+
+def benchmark(engine, rate_hz=1000, seconds=10.0, channels=('Current', 'Voltage', 'Power')):
+    """
+    rate_hz örnek/saniye akışta değerlendirme maliyetini ölç
+
+    Dönüş: (örnek başına mikro saniye, 1 saniyelik akış için CPU oranı)
+    """
+    count = int(rate_hz * seconds)
+    samples = []
+    for i in range(count):
+        t = i / rate_hz
+        # Ara sıra sıçrama içeren sentetik sinyal
+        value = 10.0 + 5.0 * math.sin(t) + (40.0 if i % 5000 == 4999 else 0.0)
+        samples.append((channels[i % len(channels)], value, t))
+
+    evaluate = engine.evaluate
+    start = time.perf_counter()
+    for channel, value, t in samples:
+        evaluate(channel, value, t)
+    elapsed = time.perf_counter() - start
+    per_sample = elapsed / count
+    return per_sample * 1e6, per_sample * rate_hz
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Alarm kurallarını doğrula ve ölç')
+    parser.add_argument('rules', nargs='?', default=DEFAULT_RULES_FILE, help='Kural dosyası (JSON)')
+    parser.add_argument('--rate', type=float, default=1000.0, help='Örnek hızı (Hz)')
+    parser.add_argument('--seconds', type=float, default=10.0, help='Ölçüm süresi (akış saniyesi)')
+    args = parser.parse_args()
+
+    engine = AlarmEngine()
+    count = engine.load(args.rules)
+    print(f"🚨 {count} kural yüklendi: {args.rules}")
+    for rule in engine.rules:
+        print(f"  • [{rule.severity}] {rule.name} ({rule.channel}, {rule.kind})")
+
+    per_sample_us, cpu_share = benchmark(engine, args.rate, args.seconds)
+    print(f"⏱️ Örnek başına: {per_sample_us:.2f} µs | {args.rate:g} Hz'de CPU payı: %{cpu_share * 100:.2f}")
+
+
+if __name__ == "__main__":
+    main()
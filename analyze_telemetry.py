@@ -5,25 +5,134 @@ Telemetri JSON Dosyası Analiz Aracı
 Datetime anahtarlı JSON dosyalarını okur ve analiz eder
 """
 
+import argparse
+import contextlib
+import io
 import json
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from operator import itemgetter
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
+from report_renderer import (draw_panels, is_headless, new_figure, parse_formats, save_figure,
+                             use_headless_backend)
+from resampler import align_channels
+from segment_index import DEFAULT_MIN_STOP, build_segment_index
+from session_index import ROW_FIELDS, collect_rows, find_sessions, print_rows
+from session_store import MANIFEST_NAME, SessionStore
+
+# Kayıtlardaki kanal dışı anahtarlar
+META_KEYS = ('timestamp', 'datetime')
+
+# float32'ye dönüşümde kabul edilen en büyük göreli hata
+FLOAT32_RTOL = 1e-6
+
+# Yerel saat ofsetinin bir kez hesaplandığı aralık (saniye) - saat dilimi
+# geçişleri her zaman çeyrek saat sınırına denk gelir
+UTC_OFFSET_BUCKET = 900.0
+
+# Boş hücre oranı bunu aşarsa kanallar ortak zaman ızgarasına hizalanır
+ALIGN_NULL_FRACTION = 0.5
+
+
+def local_datetime_index(timestamps):
+    """
+    Unix zaman damgalarından yerel saatli (tz'siz) DatetimeIndex oluştur
+
+    Yaz/kış saati geçişini kapsayan oturumlarda her örneğe kendi anındaki ofset
+    uygulanır. Geçişler çeyrek saat sınırlarında olduğundan ofset 15 dakikalık
+    kova başına bir kez hesaplanır (örnek başına Python çağrısı yok).
+    """
+    if len(timestamps) == 0:
+        return pd.DatetimeIndex([], name='datetime')
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    buckets, inverse = np.unique(np.floor(timestamps / UTC_OFFSET_BUCKET), return_inverse=True)
+    offsets = np.array([time.localtime(bucket * UTC_OFFSET_BUCKET).tm_gmtoff for bucket in buckets],
+                       dtype=np.float64)
+    # Kayıtlardaki 'datetime' metinleri yerel saattir (mikrosaniye çözünürlük);
+    # 1e18 mertebesinde float64 çarpımı kesri bozacağından tam saniye ayrı çevrilir
+    seconds = np.floor(timestamps)
+    nanoseconds = ((seconds + offsets[inverse.reshape(-1)]).astype('int64') * 1_000_000_000 +
+                   np.round((timestamps - seconds) * 1e6).astype('int64') * 1000)
+    return pd.DatetimeIndex(nanoseconds.astype('datetime64[ns]'), name='datetime')
+
+
+def align_sparse_columns(timestamps, columns):
+    """
+    Her alanı ayrı zaman damgalı (çoğu hücresi boş) tabloyu ortak ızgaraya hizala
+
+    Dönüş: (timestamps, columns) - tablo zaten yoğunsa aynen döner
+    """
+    if not columns or len(timestamps) == 0:
+        return timestamps, columns
+    filled = sum(int(np.count_nonzero(~np.isnan(values))) for values in columns.values())
+    if 1.0 - filled / (len(timestamps) * len(columns)) <= ALIGN_NULL_FRACTION:
+        return timestamps, columns
+    
+    order = np.argsort(timestamps, kind='stable')
+    sorted_times = timestamps[order]
+    channels = {}
+    for name, values in columns.items():
+        values = values[order]
+        mask = ~np.isnan(values)
+        channels[name] = {'times': sorted_times[mask], 'values': values[mask]}
+    return align_channels(channels)
+
+
+def downcast_column(values):
+    """Değer kaybı olmayacaksa kanalı float32'ye indir"""
+    finite = values[np.isfinite(values)]
+    if len(finite) == 0:
+        return values.astype(np.float32)
+    # float32 aralığını aşan değerler inf olur ve hata eşiği kanalı float64'te tutar
+    with np.errstate(over='ignore'):
+        as_float32 = finite.astype(np.float32).astype(np.float64)
+    error = np.abs(as_float32 - finite)
+    if np.all(error <= FLOAT32_RTOL * np.maximum(1.0, np.abs(finite))):
+        return values.astype(np.float32)
+    return values
+
 class TelemetryAnalyzer:
     def __init__(self, json_file):
         self.json_file = json_file
         self.data = None
+        self.store = None
         self.df = None
+        self.segments = None
+        self.timings = {}
         
+    def is_session_store(self):
+        """Dosya yolu disk tabanlı oturum deposunu mu gösteriyor?"""
+        return (os.path.isdir(self.json_file) or
+                os.path.basename(self.json_file) == MANIFEST_NAME)
+    
+    def output_path(self, suffix):
+        """Rapor dosyası adı: kaynak dosya adı + sonek"""
+        source = self.json_file.rstrip('/\\')
+        if os.path.basename(source) == MANIFEST_NAME:
+            source = os.path.dirname(source)
+        base, _ = os.path.splitext(source)
+        return base + suffix
+    
     def load_data(self):
-        """JSON dosyasını yükle"""
+        """JSON dosyasını veya oturum deposunu yükle"""
         try:
-            with open(self.json_file, 'r', encoding='utf-8') as f:
-                self.data = json.load(f)
-            
-            print(f"✅ JSON dosyası yüklendi: {self.json_file}")
+            start = time.perf_counter()
+            if self.is_session_store():
+                # Sütunlu depo: kanallar DataFrame oluşturulurken doğrudan okunur
+                self.store = SessionStore(self.json_file)
+                self.data = {'export_info': self.store.info}
+                print(f"✅ Oturum deposu açıldı: {self.json_file}")
+            else:
+                with open(self.json_file, 'r', encoding='utf-8') as f:
+                    self.data = json.load(f)
+                print(f"✅ JSON dosyası yüklendi: {self.json_file}")
+            self.timings['load'] = time.perf_counter() - start
             
             # Export bilgilerini göster
             if 'export_info' in self.data:
@@ -40,29 +149,84 @@ class TelemetryAnalyzer:
             print(f"❌ JSON dosyası yüklenirken hata: {e}")
             return False
     
-    def convert_to_dataframe(self):
-        """JSON verisini pandas DataFrame'e dönüştür"""
-        if not self.data or 'data' not in self.data:
-            print("❌ Veri bulunamadı!")
-            return False
+    def convert_to_dataframe(self, align=True):
+        """JSON verisini pandas DataFrame'e dönüştür (sütun bazlı)"""
+        start = time.perf_counter()
         
-        records = []
-        for datetime_str, record in self.data['data'].items():
-            # Datetime'ı index olarak kullan
-            record_copy = record.copy()
-            record_copy['datetime_str'] = datetime_str
-            records.append(record_copy)
+        if self.store is not None:
+            timestamps, columns = self.read_store_columns()
+        else:
+            if not self.data or 'data' not in self.data:
+                print("❌ Veri bulunamadı!")
+                return False
+            timestamps, columns = self.read_json_columns()
+        
+        # Alan başına ayrı kayıtlı eski dosyalar: her veri bloğu tek satır olur
+        if align:
+            raw_rows = len(timestamps)
+            timestamps, columns = align_sparse_columns(timestamps, columns)
+            if len(timestamps) != raw_rows:
+                print(f"🧭 Kanallar ortak zaman ızgarasına hizalandı: {raw_rows} → {len(timestamps)} satır")
+        
+        # Değer kaybı olmayan kanallar float32'ye indirilir
+        columns = {name: downcast_column(values) for name, values in columns.items()}
         
-        # DataFrame oluştur
-        self.df = pd.DataFrame(records)
+        self.df = pd.DataFrame(columns, index=local_datetime_index(timestamps))
+        self.df.insert(0, 'timestamp', timestamps)
+        self.df.sort_index(inplace=True)
         
-        # Datetime sütununu datetime tipine çevir
-        self.df['datetime'] = pd.to_datetime(self.df['datetime'])
-        self.df.set_index('datetime', inplace=True)
+        self.timings['dataframe'] = time.perf_counter() - start
+        memory_mb = self.df.memory_usage(deep=False).sum() / (1024 * 1024)
         
-        print(f"📊 DataFrame oluşturuldu: {len(self.df)} satır x {len(self.df.columns)} sütun")
+        print(f"📊 DataFrame oluşturuldu: {len(self.df)} satır x {len(self.df.columns)} sütun "
+              f"({memory_mb:.1f} MB)")
+        print(f"⏱️ Yükleme: {self.timings.get('load', 0.0) * 1000:.0f} ms | "
+              f"DataFrame: {self.timings['dataframe'] * 1000:.0f} ms")
         return True
     
+    def read_json_columns(self):
+        """Datetime anahtarlı kayıtlardan kanal başına tipli diziler oluştur"""
+        records = [record for record in self.data['data'].values()
+                   if isinstance(record, dict) and record.get('timestamp') is not None]
+        
+        # Kanal listesi export bilgisinden, yoksa ilk kayıttan alınır
+        channels = self.data.get('export_info', {}).get('data_types')
+        if not channels:
+            channels = [key for key in (records[0] if records else {}) if key not in META_KEYS]
+        
+        # Tek geçişte her kayıttan (zaman, kanal1, kanal2, ...) demeti alınır,
+        # None değerler float dizide NaN olur
+        keys = ['timestamp'] + list(channels)
+        try:
+            rows = list(map(itemgetter(*keys), records))
+        except KeyError:
+            # Eksik anahtarlı kayıtlar için yavaş yol
+            rows = [tuple(record.get(key) for key in keys) for record in records]
+        table = np.array(rows, dtype=np.float64).reshape(len(records), len(keys))
+        
+        timestamps = table[:, 0]
+        columns = {}
+        for index, channel in enumerate(channels, start=1):
+            values = table[:, index]
+            if not np.all(np.isnan(values)):
+                columns[channel] = values
+        return timestamps, columns
+    
+    def read_store_columns(self):
+        """Oturum deposundaki kanalları ortak zaman eksenine yerleştir"""
+        raw = {channel: self.store.read_channel(channel) for channel in self.store.channels}
+        if not raw:
+            return np.empty(0), {}
+        
+        # JSON formatıyla aynı şekilde her farklı zaman damgası bir satır olur
+        timestamps = np.unique(np.concatenate([times for times, _ in raw.values()]))
+        columns = {}
+        for channel, (times, values) in raw.items():
+            column = np.full(len(timestamps), np.nan)
+            column[np.searchsorted(timestamps, times)] = values
+            columns[channel] = column
+        return timestamps, columns
+    
     def show_statistics(self):
         """Veri istatistiklerini göster"""
         if self.df is None:
@@ -86,8 +250,8 @@ class TelemetryAnalyzer:
                 print(f"  • Standart Sapma: {data.std():.2f}")
                 print(f"  • Veri Sayısı: {len(data)}")
     
-    def plot_data(self, save_plot=False):
-        """Verileri grafikle"""
+    def plot_data(self, save_plot=False, show=True, formats=('png',)):
+        """Verileri grafikle (piksel başına min/max seyrekleştirilmiş)"""
         if self.df is None:
             print("❌ DataFrame bulunamadı!")
             return
@@ -100,37 +264,28 @@ class TelemetryAnalyzer:
             print("❌ Grafiklenecek veri bulunamadı!")
             return
         
-        # Subplot sayısını hesapla
-        n_plots = len(existing_cols)
-        cols = 2
-        rows = (n_plots + 1) // 2
+        # Ekran yoksa pencere açmak yerine dosyaya kaydedilir
+        if show and is_headless():
+            print("📊 Ekran bulunamadı, grafik dosyaya kaydediliyor")
+            show, save_plot = False, True
         
-        plt.figure(figsize=(15, 4 * rows))
-        plt.suptitle(f'Telemetri Verisi Analizi - {self.json_file}', fontsize=16)
-        
-        for i, col in enumerate(existing_cols):
-            plt.subplot(rows, cols, i + 1)
-            data = self.df[col].dropna()
-            
-            if len(data) > 0:
-                plt.plot(data.index, data.values, marker='o', markersize=2, linewidth=1)
-                plt.title(f'{col}')
-                plt.xlabel('Zaman')
-                plt.ylabel(col)
-                plt.grid(True, alpha=0.3)
-                plt.xticks(rotation=45)
-        
-        plt.tight_layout()
+        start = time.perf_counter()
+        rows = (len(existing_cols) + 1) // 2
+        figure = plt.figure(figsize=(15, 4 * rows)) if show else new_figure(rows)
+        index = self.df.index.values
+        panels = [(col, index, self.df[col].to_numpy(dtype=np.float64)) for col in existing_cols]
+        raw_points, drawn_points = draw_panels(figure, panels, f'Telemetri Verisi Analizi - {self.json_file}')
         
         if save_plot:
-            plot_filename = self.json_file.replace('.json', '_analysis.png')
-            plt.savefig(plot_filename, dpi=150, bbox_inches='tight')
-            print(f"📊 Grafik kaydedildi: {plot_filename}")
+            for plot_filename in save_figure(figure, self.output_path('_analysis'), formats):
+                print(f"📊 Grafik kaydedildi: {plot_filename}")
         
-        try:
+        self.timings['plot'] = time.perf_counter() - start
+        print(f"🖼️ {raw_points} örnek → {drawn_points} nokta çizildi "
+              f"({self.timings['plot'] * 1000:.0f} ms)")
+        
+        if show:
             plt.show()
-        except:
-            print("📊 Grafik gösterimi başarısız (GUI olmayabilir)")
     
     def export_summary(self):
         """Özet rapor oluştur"""
@@ -138,7 +293,7 @@ class TelemetryAnalyzer:
             print("❌ DataFrame bulunamadı!")
             return
         
-        summary_filename = self.json_file.replace('.json', '_summary.txt')
+        summary_filename = self.output_path('_summary.txt')
         
         with open(summary_filename, 'w', encoding='utf-8') as f:
             f.write("TELEMETRI VERİSİ ÖZET RAPORU\n")
@@ -164,13 +319,258 @@ class TelemetryAnalyzer:
         
         print(f"📄 Özet rapor oluşturuldu: {summary_filename}")
 
+    def build_segments(self, track_length_km=None, min_stop_s=DEFAULT_MIN_STOP):
+        """Tur (pist uzunluğu verilirse) veya stint indeksini bir kez oluştur"""
+        if self.df is None:
+            print("❌ DataFrame bulunamadı!")
+            return None
+        
+        channels = {}
+        timestamps = self.df['timestamp'].to_numpy(dtype=np.float64)
+        for col in ('Speed', 'Power', 'Current'):
+            if col in self.df.columns:
+                values = self.df[col].to_numpy(dtype=np.float64)
+                mask = ~np.isnan(values)
+                channels[col] = {'times': timestamps[mask], 'values': values[mask]}
+        
+        self.segments = build_segment_index(channels, track_length_km, min_stop_s)
+        return self.segments
+    
+    def power_vs_speed(self, bins=10):
+        """Hizalanmış Speed/Power satırlarından hız aralığı başına ortalama güç"""
+        if self.df is None or 'Speed' not in self.df.columns or 'Power' not in self.df.columns:
+            return None
+        
+        pairs = self.df[['Speed', 'Power']].dropna()
+        if len(pairs) < 2:
+            return None
+        
+        speed = pairs['Speed'].to_numpy(dtype=np.float64)
+        power = pairs['Power'].to_numpy(dtype=np.float64)
+        edges = np.linspace(speed.min(), speed.max(), bins + 1)
+        which = np.clip(np.searchsorted(edges, speed, side='right') - 1, 0, bins - 1)
+        counts = np.bincount(which, minlength=bins)
+        sums = np.bincount(which, weights=power, minlength=bins)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+        correlation = float(np.corrcoef(speed, power)[0, 1]) if speed.std() and power.std() else 0.0
+        return {'edges': edges, 'counts': counts, 'mean_power': means,
+                'correlation': correlation, 'pairs': len(pairs)}
+    
+    def show_power_vs_speed(self):
+        """Hız aralıklarına göre ortalama güç tablosu"""
+        result = self.power_vs_speed()
+        if result is None:
+            return
+        
+        print("⚡ GÜÇ - HIZ İLİŞKİSİ")
+        print("=" * 50)
+        print(f"Eşleşen satır: {result['pairs']} | Korelasyon: {result['correlation']:.3f}")
+        edges = result['edges']
+        for i, (count, mean) in enumerate(zip(result['counts'], result['mean_power'])):
+            if count:
+                print(f"  {edges[i]:6.1f} - {edges[i + 1]:6.1f} km/h: {mean:8.2f} W ({count} örnek)")
+    
+    def show_segments(self):
+        """Tur/stint karşılaştırma tablosunu indeksten yazdır"""
+        if self.segments is None or not len(self.segments):
+            print("🏁 Segment bulunamadı")
+            return
+        
+        title = "TUR" if self.segments.kind == 'lap' else "STINT"
+        print(f"🏁 {title} KARŞILAŞTIRMASI")
+        print("=" * 50)
+        print(f"{'#':>3} {'Süre (s)':>9} {'Mesafe':>8} {'Enerji':>8} {'Wh/km':>7} "
+              f"{'Maks A':>7} {'km/h':>6} {'Δ en iyi':>9}")
+        for row in self.segments.records():
+            wh_per_km = f"{row['wh_per_km']:.1f}" if row['wh_per_km'] is not None else "-"
+            delta = f"{row['delta_best_s']:+.1f}" if row['delta_best_s'] is not None else "eksik"
+            print(f"{row['segment']:>3} {row['duration_s']:>9.1f} {row['distance_km']:>8.3f} "
+                  f"{row['energy_wh']:>8.2f} {wh_per_km:>7} {row['max_current']:>7.2f} "
+                  f"{row['avg_speed']:>6.1f} {delta:>9}")
+    
+    def export_segments(self):
+        """Segment indeksini CSV olarak kaydet"""
+        if self.segments is None or not len(self.segments):
+            return None
+        
+        filename = self.output_path('_laps.csv')
+        pd.DataFrame(self.segments.records()).to_csv(filename, index=False)
+        print(f"🏁 Segment tablosu kaydedildi: {filename}")
+        return filename
+    
+    def summary_row(self):
+        """Oturumlar arası karşılaştırma tablosu için tek satırlık özet"""
+        row = {
+            'file': os.path.basename(self.json_file.rstrip('/\\')),
+            'records': len(self.df),
+        }
+        if len(self.df):
+            row['start'] = self.df.index[0].isoformat()
+            row['end'] = self.df.index[-1].isoformat()
+            row['duration_min'] = round((self.df['timestamp'].iloc[-1] -
+                                         self.df['timestamp'].iloc[0]) / 60.0, 3)
+        
+        numeric_cols = ['ERPM', 'RPM', 'Speed', 'Current', 'Duty', 'Voltage', 'Power']
+        for col in numeric_cols:
+            if col not in self.df.columns:
+                continue
+            data = self.df[col].dropna()
+            if len(data) > 0:
+                row[f'{col}_mean'] = round(float(data.mean()), 3)
+                row[f'{col}_min'] = round(float(data.min()), 3)
+                row[f'{col}_max'] = round(float(data.max()), 3)
+                row[f'{col}_std'] = round(float(data.std()), 3)
+        return row
+
+
+def init_batch_worker():
+    """Alt süreçte grafikler ekransız (Agg) çizilir"""
+    use_headless_backend(force=True)
+
+
+def analyze_file(json_file, make_plot=True, track_length_km=None, formats=('png',)):
+    """
+    Tek dosyayı etkileşimsiz analiz et (alt süreçte çalışır)
+
+    Özet rapor ve grafik dosyaları yazılır, karşılaştırma tablosu satırı döner.
+    """
+    start = time.perf_counter()
+    row = {'file': os.path.basename(json_file.rstrip('/\\')), 'path': json_file, 'records': 0}
+    
+    # Alt süreçlerin konsol çıktıları ilerleme göstergesini bozmasın
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            analyzer = TelemetryAnalyzer(json_file)
+            if not analyzer.load_data() or not analyzer.convert_to_dataframe():
+                # Analizörün son mesajı hatayı açıklar; çıktı yoksa genel mesaj
+                lines = output.getvalue().strip().splitlines()
+                raise ValueError(lines[-1] if lines else "Dosya yüklenemedi")
+            analyzer.export_summary()
+            segments = analyzer.build_segments(track_length_km)
+            analyzer.export_segments()
+            if make_plot:
+                analyzer.plot_data(save_plot=True, show=False, formats=formats)
+        
+        row.update(analyzer.summary_row())
+        row['segments'] = len(segments)
+        best = segments.best()
+        if best is not None:
+            row['best_segment'] = best + 1
+            row['best_segment_s'] = round(float(segments.segments['duration_s'][best]), 3)
+        row['path'] = json_file
+        row['load_s'] = round(analyzer.timings.get('load', 0.0), 3)
+        row['dataframe_s'] = round(analyzer.timings.get('dataframe', 0.0), 3)
+        row['plot_s'] = round(analyzer.timings.get('plot', 0.0), 3)
+    except Exception as e:
+        row['error'] = str(e)
+    
+    row['total_s'] = round(time.perf_counter() - start, 3)
+    return row
+
+
+def run_batch(patterns, jobs=None, output_prefix=None, make_plot=True, track_length_km=None,
+              formats=('png',)):
+    """Birden çok oturumu paralel analiz et ve karşılaştırma tablosu yaz"""
+    files = find_sessions(patterns)
+    if not files:
+        print("❌ Analiz edilecek dosya bulunamadı!")
+        return []
+    
+    jobs = jobs or min(len(files), os.cpu_count() or 1)
+    print(f"🔍 Toplu analiz: {len(files)} dosya, {jobs} süreç")
+    print("=" * 40)
+    
+    start = time.perf_counter()
+    rows = []
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_batch_worker) as executor:
+        futures = {executor.submit(analyze_file, path, make_plot, track_length_km, formats): path
+                   for path in files}
+        for done, future in enumerate(as_completed(futures), start=1):
+            row = future.result()
+            rows.append(row)
+            if 'error' in row:
+                print(f"[{done}/{len(files)}] ❌ {row['file']}: {row['error']}")
+            else:
+                print(f"[{done}/{len(files)}] ✅ {row['file']} - {row['records']} kayıt, "
+                      f"{row['total_s']:.2f} s")
+    
+    # Tablo giriş sırasına göre yazılır
+    order = {path: index for index, path in enumerate(files)}
+    rows.sort(key=lambda row: order[row['path']])
+    
+    output_prefix = output_prefix or f"telemetri_toplu_analiz_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    table = pd.DataFrame(rows)
+    table.to_csv(output_prefix + '.csv', index=False)
+    with open(output_prefix + '.json', 'w', encoding='utf-8') as f:
+        json.dump(rows, f, indent=2, ensure_ascii=False)
+    
+    failed = sum(1 for row in rows if 'error' in row)
+    print("=" * 40)
+    print(f"⏱️ Toplam süre: {time.perf_counter() - start:.2f} s "
+          f"({len(rows) - failed} başarılı, {failed} hatalı)")
+    print(f"📄 Karşılaştırma tablosu: {output_prefix}.csv / {output_prefix}.json")
+    return rows
+
+
+def batch_main(argv):
+    """Toplu analiz komut satırı"""
+    parser = argparse.ArgumentParser(
+        prog='analyze_telemetry.py --batch',
+        description='Birden çok telemetri oturumunu paralel ve etkileşimsiz analiz eder')
+    parser.add_argument('patterns', nargs='+', help='JSON dosyaları, glob desenleri veya dizinler')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='Paralel süreç sayısı')
+    parser.add_argument('-o', '--output', default=None,
+                        help='Karşılaştırma tablosu dosya adı öneki (.csv ve .json eklenir)')
+    parser.add_argument('--no-plot', action='store_true', help='Grafik dosyalarını oluşturma')
+    parser.add_argument('--formats', type=parse_formats, default=('png',),
+                        help='Grafik biçimleri, virgülle ayrılmış: png, svg, pdf (varsayılan png)')
+    parser.add_argument('--track-length', type=float, default=None,
+                        help='Pist uzunluğu (km) - verilmezse oturumlar duraklara göre bölünür')
+    parser.add_argument('--index', action='store_true',
+                        help='Analiz yapmadan yalnızca özet indekslerinden listele ve sırala')
+    parser.add_argument('--sort', choices=ROW_FIELDS, default='start', help='--index sıralama alanı')
+    parser.add_argument('--desc', action='store_true', help='--index için azalan sıralama')
+    args = parser.parse_args(argv)
+    
+    if args.index:
+        # Yalnızca küçük özet dosyaları okunur, bayat olanlar yeniden oluşturulur
+        start = time.perf_counter()
+        rows, rebuilt = collect_rows(find_sessions(args.patterns),
+                                     sort_key=args.sort, descending=args.desc)
+        print_rows(rows)
+        print(f"\n📚 {len(rows)} oturum, {rebuilt} indeks yeniden oluşturuldu "
+              f"({time.perf_counter() - start:.2f} s)")
+        if args.output:
+            pd.DataFrame(rows).to_csv(args.output + '.csv', index=False)
+            print(f"📄 Liste: {args.output}.csv")
+        return
+    
+    run_batch(args.patterns, jobs=args.jobs, output_prefix=args.output,
+              make_plot=not args.no_plot, track_length_km=args.track_length,
+              formats=args.formats)
+
+
 def main():
-    if len(sys.argv) != 2:
-        print("Kullanım: python analyze_telemetry.py <json_dosyasi>")
+    if len(sys.argv) > 1 and sys.argv[1] == '--batch':
+        batch_main(sys.argv[2:])
+        return
+    
+    if len(sys.argv) < 2:
+        print("Kullanım: python analyze_telemetry.py <json_dosyasi | oturum.tstore> [--track-length KM]")
         print("Örnek: python analyze_telemetry.py telemetri_data_20250930_215719.json")
+        print("Toplu: python analyze_telemetry.py --batch <dosya|glob|dizin> ... [-j N] [-o onek]")
         return
     
-    json_file = sys.argv[1]
+    parser = argparse.ArgumentParser(description='Telemetri JSON dosyasını analiz eder')
+    parser.add_argument('json_file', help='JSON dosyası veya .tstore oturum deposu')
+    parser.add_argument('--track-length', type=float, default=None,
+                        help='Pist uzunluğu (km) - verilmezse oturum duraklara göre bölünür')
+    parser.add_argument('--min-stop', type=float, default=DEFAULT_MIN_STOP,
+                        help=f'Durak sayılacak en kısa süre (saniye, varsayılan {DEFAULT_MIN_STOP:g})')
+    args = parser.parse_args()
+    json_file = args.json_file
     
     print("🔍 Telemetri JSON Analiz Aracı")
     print("=" * 40)
@@ -190,6 +590,14 @@ def main():
     analyzer.show_statistics()
     print()
     
+    # Tur/stint indeksi bir kez oluşturulur, karşılaştırmalar indeksten okunur
+    analyzer.build_segments(args.track_length, args.min_stop)
+    analyzer.show_segments()
+    print()
+    
+    analyzer.show_power_vs_speed()
+    print()
+    
     # Kullanıcıya seçenek sun
     print("Seçenekler:")
     print("1. Grafik göster")
@@ -207,9 +615,11 @@ def main():
             analyzer.plot_data(save_plot=True)
         elif choice == '3':
             analyzer.export_summary()
+            analyzer.export_segments()
         elif choice == '4':
             analyzer.plot_data(save_plot=True)
             analyzer.export_summary()
+            analyzer.export_segments()
         elif choice == '5':
             print("👋 Çıkılıyor...")
         else:
@@ -7,53 +7,30 @@ Test amaçlı Arduino verilerini simüle eder
 
 import serial
 import time
-import random
 from datetime import datetime
 
+from pty_port import DEFAULT_PTY_LINK, PtySerialPort
+from scenario_engine import ScenarioEngine
+
+# Konsol simülatörü saniyede bir veri seti üretir
+STEP_SECONDS = 1.0
+
 class ArduinoSimulator:
-    def __init__(self, port='COM1', baudrate=9600):
+    def __init__(self, port='COM1', baudrate=9600, scenario=None, seed=None, pty_link=None):
         self.port = port
         self.baudrate = baudrate
         self.is_running = False
         
-        # Simülasyon parametreleri
-        self.erpm = 0
-        self.rpm = 0
-        self.speed = 0.0
-        self.current = 0.0
-        self.duty = 0
-        self.voltage = 19.5
-        self.power = 0.0
-        
-    def generate_data(self):
-        """Gerçekçi telemetri verisi üret"""
-        # ERPM değişimi (daha yumuşak geçişler)
-        change = random.randint(-30, 30)
-        self.erpm += change
-        self.erpm = max(-1500, min(1500, self.erpm))
-        
-        # RPM hesaplama (ERPM'den türetilmiş)
-        self.rpm = abs(self.erpm) // 12
+        # pty_link verilirse veriler sanal seri porta da yazılır
+        self.pty = PtySerialPort(pty_link, baudrate) if pty_link else None
         
-        # Hız hesaplama (RPM'e dayalı, km/h)
-        self.speed = abs(self.rpm) * 0.05
-        self.speed = max(0, min(60, self.speed))
+        # Araç modeli - virtual_arduino.py ile aynı senaryo motoru
+        self.engine = ScenarioEngine(scenario, seed)
+        self.engine.copy_to(self)
         
-        # Akım değişimi (hıza bağlı)
-        base_current = abs(self.speed * 0.1)
-        self.current = base_current + random.uniform(-2.0, 2.0)
-        self.current = max(-10.0, min(15.0, self.current))
-        
-        # Duty cycle (hıza bağlı)
-        base_duty = min(80, abs(self.speed * 1.5))
-        self.duty = int(base_duty + random.randint(-5, 5))
-        self.duty = max(0, min(100, self.duty))
-        
-        # Gerilim (küçük dalgalanmalar)
-        self.voltage = 19.2 + random.uniform(-0.5, 0.8)
-        
-        # Güç hesaplama (gerilim x akım)
-        self.power = self.voltage * self.current
+    def generate_data(self):
+        """Senaryo motorunu bir adım ilerlet"""
+        self.engine.apply(self, STEP_SECONDS)
         
     def format_data_line(self, data_type, value, unit=""):
         """Veri satırını Arduino formatında oluştur"""
@@ -83,10 +60,20 @@ class ArduinoSimulator:
     
     def run_simulation(self, duration=None):
         """Simülasyonu çalıştır"""
+        if self.pty:
+            try:
+                self.port = self.pty.open()
+            except OSError as e:
+                self.pty.close()
+                print(f"❌ Sanal seri port oluşturulamadı: {e}")
+                return
+
         print("=" * 50)
         print("   ARDUINO TELEMETRİ SİMÜLATÖRÜ")
         print("=" * 50)
         print(f"📡 Seri Port: {self.port}")
+        if self.pty:
+            print(f"🔌 Arayüzde port olarak '{self.pty.link}' seçin")
         print(f"⚡ Baudrate: {self.baudrate}")
         if duration:
             print(f"⏱️  Test Süresi: {duration} saniye")
@@ -109,6 +96,8 @@ class ArduinoSimulator:
                 
                 for line in lines:
                     print(line.strip())
+                if self.pty:
+                    self.pty.write("".join(lines).encode('utf-8'))
                 
                 data_count += 1
                 time.sleep(1)  # 1 saniye bekle
@@ -120,16 +109,26 @@ class ArduinoSimulator:
             print(f"📊 Toplam {data_count} veri seti gönderildi")
             print(f"⏱️  Çalışma süresi: {time.time() - start_time:.1f} saniye")
             print("=" * 50)
+        finally:
+            if self.pty:
+                self.pty.close()
 
 def main():
-    import sys
+    import argparse
     
     # Komut satırı argümanları
-    port = sys.argv[1] if len(sys.argv) > 1 else 'COM3'
-    baudrate = int(sys.argv[2]) if len(sys.argv) > 2 else 9600
-    duration = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    parser = argparse.ArgumentParser(description='Arduino telemetri konsol simülatörü')
+    parser.add_argument('port', nargs='?', default='COM3')
+    parser.add_argument('baudrate', nargs='?', type=int, default=9600)
+    parser.add_argument('duration', nargs='?', type=int, default=None)
+    parser.add_argument('--scenario', default=None, help='Senaryo dosyası (JSON)')
+    parser.add_argument('--seed', type=int, default=None, help='Rastgele tohum')
+    parser.add_argument('--pty', nargs='?', const=DEFAULT_PTY_LINK, default=None,
+                        help=f'Verileri sanal seri porta da yaz (Linux/macOS, varsayılan {DEFAULT_PTY_LINK})')
+    args = parser.parse_args()
     
-    simulator = ArduinoSimulator(port, baudrate)
+    simulator = ArduinoSimulator(args.port, args.baudrate, args.scenario, args.seed, args.pty)
+    duration = args.duration
     simulator.run_simulation(duration)
 
 if __name__ == '__main__':
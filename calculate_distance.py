@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Telemetri Mesafe Hesaplayıcı
+JSON telemetri dosyalarından zaman ve hız verilerini kullanarak toplam kat
+edilen mesafeyi hesaplar. Canlı arayüzle aynı mesafe motorunu kullanır.
+"""
+
+import argparse
+import json
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+
+from distance_engine import DEFAULT_MAX_GAP, distance_totals
+
+DEFAULT_FILE = '2025_yarisma_verileri_1_FIXED.json'
+
+
+def load_speed_series(json_file):
+    """JSON oturumundan zaman sıralı (timestamp, Speed) dizilerini oku"""
+    with open(json_file, 'r', encoding='utf-8') as f:
+        json_data = json.load(f)
+
+    export_info = json_data.get('export_info', {})
+    records = json_data.get('data', {})
+    pairs = [(record['timestamp'], record['Speed']) for record in records.values()
+             if isinstance(record, dict) and record.get('timestamp') is not None
+             and record.get('Speed') is not None]
+
+    if not pairs:
+        return export_info, len(records), np.zeros(0), np.zeros(0)
+
+    series = np.array(pairs, dtype=np.float64)
+    series = series[np.argsort(series[:, 0], kind='stable')]
+    return export_info, len(records), series[:, 0], series[:, 1]
+
+
+def calculate(json_file, max_gap=DEFAULT_MAX_GAP):
+    """Mesafe özetini hesapla, özet sözlüğü döndür"""
+    print(f"📂 Dosya okunuyor: {json_file}")
+    print("=" * 60)
+
+    export_info, total_records, times, speeds = load_speed_series(json_file)
+    print(f"📅 Export Zamanı: {export_info.get('export_time', 'Bilinmiyor')}")
+    print(f"📊 Toplam Kayıt: {total_records}")
+    data_types = [dt for dt in export_info.get('data_types', []) if dt != 'Distance']
+    if data_types:
+        print(f"📈 Veri Tipleri: {', '.join(data_types)}")
+    print()
+
+    if len(times) < 2:
+        print("❌ Mesafe hesabı için yeterli zaman-hız verisi yok!")
+        return None
+
+    print(f"✅ {len(times)} adet zaman-hız verisi bulundu")
+    print()
+    print("🔄 Mesafe hesaplanıyor...")
+    print("-" * 60)
+
+    start = time.perf_counter()
+    totals = distance_totals(times, speeds, max_gap)
+    elapsed = time.perf_counter() - start
+    print(f"  ⚡ {len(times)} örnek {elapsed * 1000:.1f} ms içinde işlendi")
+
+    duration = float(times[-1] - times[0])
+    summary = {
+        'calculation_info': {
+            'source_file': os.path.basename(json_file),
+            'calculation_time': datetime.now().isoformat(),
+            'total_records': int(len(times)),
+            'max_gap_seconds': max_gap,
+        },
+        'time_info': {
+            'start_time': datetime.fromtimestamp(times[0]).isoformat(),
+            'end_time': datetime.fromtimestamp(times[-1]).isoformat(),
+            'duration_seconds': round(duration, 3),
+            'duration_minutes': round(duration / 60.0, 3),
+            'duration_hours': round(duration / 3600.0, 3),
+        },
+        'distance_info': {
+            'total_distance_km': round(totals['total_km'], 3),
+            'total_distance_meters': round(totals['total_km'] * 1000.0, 1),
+            'forward_distance_km': round(totals['forward_km'], 3),
+            'backward_distance_km': round(totals['backward_km'], 3),
+            'net_distance_km': round(totals['net_km'], 3),
+            'gap_count': totals['gap_count'],
+        },
+        'speed_info': {
+            'max_speed_kmh': round(float(speeds.max()), 2),
+            'average_speed_kmh': round(float(speeds.mean()), 2),
+            'zero_speed_count': int(np.count_nonzero(speeds == 0)),
+        },
+    }
+
+    hydrogen_liters = export_info.get('hydrogen_consumed_liters', 0.0)
+    if hydrogen_liters:
+        hydrogen_m3 = hydrogen_liters / 1000.0
+        summary['hydrogen_info'] = {
+            'hydrogen_consumed_liters': hydrogen_liters,
+            'hydrogen_consumed_m3': hydrogen_m3,
+            'efficiency_km_per_m3': round(totals['total_km'] / hydrogen_m3, 2),
+        }
+
+    print_summary(summary)
+    return summary
+
+
+def print_summary(summary):
+    """Sonuçları konsola yazdır"""
+    time_info = summary['time_info']
+    distance_info = summary['distance_info']
+    speed_info = summary['speed_info']
+
+    print()
+    print("=" * 60)
+    print("📊 MESAFE HESAPLAMA SONUÇLARI")
+    print("=" * 60)
+    print()
+    print(f"🕐 Başlangıç Zamanı: {time_info['start_time'][:19].replace('T', ' ')}")
+    print(f"🕐 Bitiş Zamanı:     {time_info['end_time'][:19].replace('T', ' ')}")
+    print(f"⏱️  Toplam Süre:      {time_info['duration_hours']:.2f} saat "
+          f"({time_info['duration_minutes']:.2f} dakika)")
+    print()
+    print(f"🛣️  TOPLAM MESAFE:    {distance_info['total_distance_km']:.3f} km")
+    print(f"                     {distance_info['total_distance_meters']:.1f} metre")
+    print()
+    print(f"➡️  İleri Mesafe:     {distance_info['forward_distance_km']:.3f} km")
+    print(f"⬅️  Geri Mesafe:      {distance_info['backward_distance_km']:.3f} km")
+    print(f"↔️  Net Mesafe:       {distance_info['net_distance_km']:.3f} km")
+    print(f"⏸️  Durma Sayısı:     {speed_info['zero_speed_count']} kayıt")
+    if distance_info['gap_count']:
+        print(f"📡 Veri Kesintisi:   {distance_info['gap_count']} "
+              f"(> {summary['calculation_info']['max_gap_seconds']:g} s, mesafeye eklenmedi)")
+    print()
+    print(f"🚀 Maksimum Hız:     {speed_info['max_speed_kmh']:.2f} km/h")
+    print(f"📊 Ortalama Hız:     {speed_info['average_speed_kmh']:.2f} km/h")
+
+    hydrogen_info = summary.get('hydrogen_info')
+    if hydrogen_info:
+        print()
+        print(f"💧 Hidrojen:         {hydrogen_info['hydrogen_consumed_liters']:.3f} L "
+              f"({hydrogen_info['hydrogen_consumed_m3']:.3f} m³)")
+        print(f"✨ Verimlilik:       {hydrogen_info['efficiency_km_per_m3']:.2f} km/m³")
+    print()
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Telemetri JSON dosyasından mesafe hesaplar')
+    parser.add_argument('json_file', nargs='?', default=DEFAULT_FILE, help='JSON telemetri dosyası')
+    parser.add_argument('--max-gap', type=float, default=DEFAULT_MAX_GAP,
+                        help=f'Kesinti sayılacak örnek aralığı (saniye, varsayılan {DEFAULT_MAX_GAP:g})')
+    args = parser.parse_args()
+
+    print("🚗 TELEMETRI MESAFE HESAPLAYICI v1.1")
+    print("=" * 60)
+    print()
+
+    if not os.path.exists(args.json_file):
+        print(f"❌ Dosya bulunamadı: {args.json_file}")
+        return
+
+    try:
+        summary = calculate(args.json_file, args.max_gap)
+    except Exception as e:
+        print(f"❌ Hesaplama hatası: {e}")
+        return
+
+    if summary is None:
+        return
+
+    output_file = os.path.splitext(args.json_file)[0] + '_distance_summary.json'
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+    print(f"💾 Özet dosya kaydedildi: {output_file}")
+    print()
+    print("✅ Hesaplama tamamlandı!")
+
+
+if __name__ == "__main__":
+    main()
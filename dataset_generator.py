@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Toplu Veri Seti Üretici
+Yükleyici ve analiz ölçümleri için büyük test dosyalarını duvar saatini
+beklemeden üretir. Örnekler BulkScenario ile parça parça vektörel olarak
+hesaplanır, her parça tek bir büyük yazma ile diske aktarılır:
+
+    text   - FileSimulator'ın metin protokolü (başlık + veri blokları)
+    raw    - TCP sunucusunun gönderdiği ham bayt akışı
+    json   - Arayüzün yüklediği datetime anahtarlı JSON oturumu
+    tstore - Sütunlu oturum deposu (session_store.py)
+
+Çerçeve zamanları başlangıç anından itibaren dt aralıklıdır.
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+
+from scenario_engine import BulkScenario
+from session_store import SessionStoreWriter
+
+FORMATS = ('text', 'raw', 'json', 'tstore')
+
+# Parça başına çerçeve ve dosya yazma tamponu
+DEFAULT_CHUNK_FRAMES = 100000
+WRITE_BUFFER = 8 * 1024 * 1024
+
+# Model alanı -> arayüz kanal adı
+CHANNEL_NAMES = {
+    'speed': 'Speed',
+    'current': 'Current',
+    'voltage': 'Voltage',
+    'power': 'Power',
+    'erpm': 'ERPM',
+    'rpm': 'RPM',
+    'duty': 'Duty',
+}
+
+TEXT_HEADER = "Arduino Telemetri Simülasyon Verileri\n" + "=" * 50 + "\n\n"
+
+# Tek çerçevenin protokol bloğu - VirtualSerialSimulator.send_data_set ile aynı
+FRAME_TEMPLATE = (
+    "%s -> ----- ALINAN VERİ -----\n"
+    "%s -> ERPM: %d\n"
+    "%s -> RPM: %d\n"
+    "%s -> Hız (km/h): %.2f\n"
+    "%s -> Akım (A): %.2f\n"
+    "%s -> Duty: %d\n"
+    "%s -> Gerilim (V): %.2f\n"
+    "%s -> Güç (W): %.2f\n"
+    "\n"
+)
+FRAME_FIELDS = ('erpm', 'rpm', 'speed', 'current', 'duty', 'voltage', 'power')
+
+RECORD_TEMPLATE = (
+    '"%s": {"timestamp": %.6f, "datetime": "%s", "Speed": %.2f, "Current": %.2f, '
+    '"Voltage": %.2f, "Power": %.2f, "ERPM": %d, "RPM": %d, "Duty": %d}'
+)
+RECORD_FIELDS = ('speed', 'current', 'voltage', 'power', 'erpm', 'rpm', 'duty')
+
+
+def frame_clock(start, first, count, dt):
+    """
+    Çerçeve zamanları
+
+    Dönüş: (epoch saniye dizisi, yerel datetime64[us] dizisi)
+    """
+    offsets = (first + np.arange(count)) * dt
+    local = np.datetime64(start.replace(tzinfo=None), 'us') + np.rint(offsets * 1e6).astype('timedelta64[us]')
+    return start.timestamp() + offsets, local
+
+
+def interleave(columns):
+    """Sütunları satır sırasında tek düz listeye çevir (% biçimlendirme için)"""
+    table = np.empty((len(columns[0]), len(columns)), dtype=object)
+    for i, column in enumerate(columns):
+        table[:, i] = column
+    return table.ravel().tolist()
+
+
+def format_text_frames(local, sample):
+    """Parçanın metin protokolü - tüm çerçeveler tek % işlemiyle biçimlenir"""
+    stamps = [text[11:23] for text in np.datetime_as_string(local, unit='ms').tolist()]
+    columns = []
+    for name in ('', *FRAME_FIELDS):
+        columns.append(stamps)
+        if name:
+            columns.append(sample[name].tolist())
+    return (FRAME_TEMPLATE * len(stamps)) % tuple(interleave(columns))
+
+
+def format_json_records(epoch, local, sample):
+    """Parçanın JSON kayıtları (virgülle ayrılmış, süslü parantezsiz)"""
+    keys = np.datetime_as_string(local, unit='us').tolist()
+    columns = [keys, epoch.tolist(), keys] + [sample[name].tolist() for name in RECORD_FIELDS]
+    return ",\n".join([RECORD_TEMPLATE] * len(keys)) % tuple(interleave(columns))
+
+
+def path_size(path):
+    """Dosya veya depo klasörünün toplam boyutu"""
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(root, name))
+               for root, _, names in os.walk(path) for name in names)
+
+
+def write_dataset(filename, frames, fmt='text', scenario=None, seed=None, dt=0.1,
+                  start=None, chunk_frames=DEFAULT_CHUNK_FRAMES, verbose=True):
+    """
+    frames çerçevelik veri setini fmt biçiminde yaz
+
+    Dönüş: {'frames', 'bytes', 'seconds', 'frames_per_s', 'mb_per_s'}
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Desteklenmeyen biçim: {fmt}")
+    if frames <= 0:
+        raise ValueError("Çerçeve sayısı pozitif olmalı")
+
+    generator = BulkScenario(scenario, seed, dt)
+    start = start or datetime.now()
+    began = time.perf_counter()
+    export_info = {
+        'export_time': datetime.now().isoformat(),
+        'total_records': frames,
+        'data_types': list(CHANNEL_NAMES.values()),
+        'format': 'datetime_keyed',
+        'generator': {'scenario': generator.scenario['name'], 'seed': seed, 'dt': dt},
+    }
+
+    writer = output = None
+    if fmt == 'tstore':
+        writer = SessionStoreWriter(filename, info=export_info)
+    elif fmt == 'raw':
+        output = open(filename, 'wb', buffering=WRITE_BUFFER)
+    else:
+        output = open(filename, 'w', encoding='utf-8', newline='\n', buffering=WRITE_BUFFER)
+
+    try:
+        if fmt == 'text':
+            output.write(TEXT_HEADER)
+        elif fmt == 'json':
+            output.write('{"export_info": %s, "data": {\n' % json.dumps(export_info, ensure_ascii=False))
+
+        written = 0
+        while written < frames:
+            count = min(chunk_frames, frames - written)
+            sample = generator.next_chunk(count)
+            epoch, local = frame_clock(start, written, count, dt)
+
+            if fmt == 'tstore':
+                for name, channel in CHANNEL_NAMES.items():
+                    writer.append(channel, epoch, sample[name].astype(np.float64))
+            elif fmt == 'json':
+                if written:
+                    output.write(",\n")
+                output.write(format_json_records(epoch, local, sample))
+            elif fmt == 'raw':
+                output.write(format_text_frames(local, sample).encode('utf-8'))
+            else:
+                output.write(format_text_frames(local, sample))
+
+            written += count
+            if verbose:
+                print(f"📝 {written:,}/{frames:,} çerçeve yazıldı...")
+
+        if fmt == 'json':
+            output.write("\n}}\n")
+    finally:
+        if writer is not None:
+            writer.close()
+        if output is not None:
+            output.close()
+
+    seconds = time.perf_counter() - began
+    size = path_size(filename)
+    return {
+        'frames': frames,
+        'bytes': size,
+        'seconds': seconds,
+        'frames_per_s': frames / seconds if seconds > 0 else 0.0,
+        'mb_per_s': size / seconds / 1e6 if seconds > 0 else 0.0,
+    }
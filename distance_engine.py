@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mesafe Hesaplama Motoru
+Canlı arayüz ve çevrimdışı araçlar aynı yamuk (trapez) kuralını kullanır:
+iki ardışık örnek arasındaki mesafe = ortalama hız × zaman farkı / 3600.
+Canlı akışta örnek başına O(1) artımlı güncelleme, kayıtlı oturumlarda NumPy
+ile tek geçişte vektörel hesap yapılır. max_gap'ten uzun boşluklar (bağlantı
+kopması vb.) kesinti sayılır ve mesafeye eklenmez.
+"""
+
+import numpy as np
+
+# Bu süreden (saniye) uzun örnek aralıkları kesinti kabul edilir
+DEFAULT_MAX_GAP = 5.0
+
+
+class DistanceIntegrator:
+    """Canlı veri için artımlı yamuk integrali (km)"""
+
+    __slots__ = ('max_gap', 'forward', 'backward', 'gaps', 'last_time', 'last_speed')
+
+    def __init__(self, max_gap=DEFAULT_MAX_GAP):
+        self.max_gap = max_gap
+        self.reset()
+
+    def reset(self, forward=0.0, backward=0.0):
+        """Sayaçları sıfırla (veya yüklenen oturumun toplamlarından devam et)"""
+        self.forward = forward
+        self.backward = backward
+        self.gaps = 0
+        self.last_time = None
+        self.last_speed = None
+
+    @property
+    def total(self):
+        """Kat edilen toplam yol (ileri + geri)"""
+        return self.forward + self.backward
+
+    @property
+    def net(self):
+        """Net yer değiştirme (ileri - geri)"""
+        return self.forward - self.backward
+
+    def add(self, speed, timestamp):
+        """Yeni hız örneği (km/h, Unix zamanı) ekle, toplam mesafeyi döndür"""
+        if self.last_time is not None:
+            dt = timestamp - self.last_time
+            if 0 < dt <= self.max_gap:
+                increment = (self.last_speed + speed) * 0.5 * dt / 3600.0
+                if increment >= 0:
+                    self.forward += increment
+                else:
+                    self.backward -= increment
+            elif dt > self.max_gap:
+                self.gaps += 1
+
+        # Zamanda geri giden örnek referans noktasını değiştirmez
+        if self.last_time is None or timestamp >= self.last_time:
+            self.last_time = timestamp
+            self.last_speed = speed
+        return self.forward + self.backward
+
+
+def trapezoid_increments(times, values, scale, max_gap=DEFAULT_MAX_GAP):
+    """
+    Ardışık örnekler arası yamuk alanları × scale
+
+    Dönen dizinin uzunluğu len(times) - 1'dir; kesinti veya sıfır/negatif
+    zaman farkı olan aralıklar 0 olur.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    if len(times) < 2:
+        return np.zeros(0)
+
+    dt = np.diff(times)
+    increments = (values[1:] + values[:-1]) * (0.5 * scale) * dt
+    increments[(dt <= 0) | (dt > max_gap)] = 0.0
+    return increments
+
+
+def distance_increments(times, speeds, max_gap=DEFAULT_MAX_GAP):
+    """Ardışık örnekler arası işaretli mesafe artışları (km/h × s → km)"""
+    return trapezoid_increments(times, speeds, 1.0 / 3600.0, max_gap)
+
+
+def cumulative_distance(times, speeds, max_gap=DEFAULT_MAX_GAP):
+    """Her örnek anındaki toplam kat edilen yol (km) - canlı Distance kanalı ile aynı"""
+    increments = np.abs(distance_increments(times, speeds, max_gap))
+    distance = np.zeros(len(increments) + 1 if len(times) else 0)
+    np.cumsum(increments, out=distance[1:])
+    return distance
+
+
+def distance_totals(times, speeds, max_gap=DEFAULT_MAX_GAP):
+    """Oturumun toplam, ileri, geri ve net mesafesi (km) ile kesinti sayısı"""
+    times = np.asarray(times, dtype=np.float64)
+    increments = distance_increments(times, speeds, max_gap)
+    forward = float(increments[increments > 0].sum())
+    backward = float(np.abs(increments[increments < 0]).sum())
+    gaps = int(np.count_nonzero(np.diff(times) > max_gap)) if len(times) > 1 else 0
+    return {
+        'total_km': forward + backward,
+        'forward_km': forward,
+        'backward_km': backward,
+        'net_km': forward - backward,
+        'gap_count': gaps,
+    }
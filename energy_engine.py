@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Enerji ve Hidrojen Verimliliği
+Power kanalı veri geldikçe yamuk kuralıyla Wh'a, firmware hidrojen akışı
+gönderiyorsa H2Flow (L/dk) kanalı litreye entegre edilir. Bunlardan türetilen
+zaman serileri:
+
+    Energy   - toplam enerji (Wh)
+    WhPerKm  - kat edilen km başına enerji (Wh/km)
+    H2Used   - toplam hidrojen tüketimi (L)
+    KmPerM3  - 1 m³ hidrojen ile gidilen yol (km/m³)
+
+Canlı akışta örnek başına O(1) güncellenir, JSON yüklemesinden sonra
+derive_energy_channels ile vektörel olarak yeniden hesaplanır.
+"""
+
+import numpy as np
+
+from distance_engine import DEFAULT_MAX_GAP, trapezoid_increments
+
+# Türetilmiş kanallar
+ENERGY_CHANNELS = ['Energy', 'WhPerKm', 'H2Used', 'KmPerM3']
+
+# Bu mesafenin altında oranlar anlamsız derecede büyük olur (km)
+MIN_DISTANCE_KM = 0.01
+
+# Oran hesaplanacak en küçük hidrojen tüketimi (L)
+MIN_HYDROGEN_LITERS = 0.001
+
+
+class TrapezoidAccumulator:
+    """Tek kanal için artımlı yamuk integrali (değer × saniye × scale)"""
+
+    __slots__ = ('scale', 'max_gap', 'total', 'last_time', 'last_value')
+
+    def __init__(self, scale, max_gap=DEFAULT_MAX_GAP):
+        self.scale = scale
+        self.max_gap = max_gap
+        self.reset()
+
+    def reset(self, total=0.0):
+        self.total = total
+        self.last_time = None
+        self.last_value = None
+
+    def add(self, value, timestamp):
+        """Yeni örnek ekle, toplamı döndür"""
+        if self.last_time is not None:
+            dt = timestamp - self.last_time
+            if 0 < dt <= self.max_gap:
+                self.total += (self.last_value + value) * (0.5 * self.scale) * dt
+
+        if self.last_time is None or timestamp >= self.last_time:
+            self.last_time = timestamp
+            self.last_value = value
+        return self.total
+
+
+def wh_per_km(energy_wh, distance_km):
+    """Km başına enerji, mesafe çok kısaysa None"""
+    if distance_km < MIN_DISTANCE_KM:
+        return None
+    return energy_wh / distance_km
+
+
+def km_per_m3(distance_km, hydrogen_liters):
+    """1 m³ hidrojen ile gidilen yol, tüketim yoksa None"""
+    if hydrogen_liters < MIN_HYDROGEN_LITERS:
+        return None
+    return distance_km / (hydrogen_liters / 1000.0)
+
+
+class EnergyTracker:
+    """Canlı akışta enerji ve hidrojen toplamları"""
+
+    def __init__(self, max_gap=DEFAULT_MAX_GAP):
+        # W × s → Wh ve L/dk × s → L
+        self.energy = TrapezoidAccumulator(1.0 / 3600.0, max_gap)
+        self.hydrogen = TrapezoidAccumulator(1.0 / 60.0, max_gap)
+
+    @property
+    def energy_wh(self):
+        return self.energy.total
+
+    @property
+    def hydrogen_liters(self):
+        return self.hydrogen.total
+
+    def add_power(self, power, timestamp):
+        """Güç örneği (W) ekle, toplam enerjiyi (Wh) döndür"""
+        return self.energy.add(power, timestamp)
+
+    def add_hydrogen_flow(self, flow, timestamp):
+        """Hidrojen akışı örneği (L/dk) ekle, toplam tüketimi (L) döndür"""
+        return self.hydrogen.add(flow, timestamp)
+
+    def reset(self, energy_wh=0.0, hydrogen_liters=0.0):
+        self.energy.reset(energy_wh)
+        self.hydrogen.reset(hydrogen_liters)
+
+
+def cumulative_integral(times, values, scale, max_gap=DEFAULT_MAX_GAP):
+    """Her örnek anındaki toplam integral - canlı toplayıcı ile aynı"""
+    increments = trapezoid_increments(times, values, scale, max_gap)
+    total = np.zeros(len(increments) + 1 if len(times) else 0)
+    np.cumsum(increments, out=total[1:])
+    return total
+
+
+def derive_energy_channels(telemetry_data, max_gap=DEFAULT_MAX_GAP):
+    """
+    Zaman sıralı ham kanallardan türetilmiş kanalları vektörel hesapla
+
+    telemetry_data: {'Power': {'times', 'values'}, 'Distance': ..., 'H2Flow': ...}
+    Dönüş: {kanal: (times, values)} - yalnızca hesaplanabilen kanallar
+    """
+    derived = {}
+    distance = telemetry_data.get('Distance', {})
+    distance_times = np.asarray(distance.get('times', []), dtype=np.float64)
+    distance_values = np.asarray(distance.get('values', []), dtype=np.float64)
+
+    def distance_at(times):
+        if len(distance_times) == 0:
+            return np.zeros(len(times))
+        return np.interp(times, distance_times, distance_values)
+
+    power = telemetry_data.get('Power', {})
+    if len(power.get('times', [])) > 1:
+        times = np.asarray(power['times'], dtype=np.float64)
+        energy = cumulative_integral(times, power['values'], 1.0 / 3600.0, max_gap)
+        derived['Energy'] = (times, energy)
+
+        km = distance_at(times)
+        valid = km >= MIN_DISTANCE_KM
+        if np.any(valid):
+            derived['WhPerKm'] = (times[valid], energy[valid] / km[valid])
+
+    flow = telemetry_data.get('H2Flow', {})
+    if len(flow.get('times', [])) > 1:
+        times = np.asarray(flow['times'], dtype=np.float64)
+        liters = cumulative_integral(times, flow['values'], 1.0 / 60.0, max_gap)
+        derived['H2Used'] = (times, liters)
+
+        valid = liters >= MIN_HYDROGEN_LITERS
+        if np.any(valid):
+            derived['KmPerM3'] = (times[valid], distance_at(times[valid]) / (liters[valid] / 1000.0))
+
+    return derived
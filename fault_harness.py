@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ayrıştırıcı Dayanıklılık Ölçümü
+Simülatör akışına FaultInjector ile hat bozulmaları ekler, akışı LineFramer
+ve parse_line'dan geçirir, sonucu kaynak değerlerle karşılaştırır:
+
+    kurtarılan  - 7 alanın tamamı doğru okunan çerçeve
+    kısmi       - bazı alanları doğru okunan çerçeve
+    kayıp       - hiçbir alanı okunamayan çerçeve
+    yanlış      - kaynakta olmayan değer (yanlış kanal, değer veya zaman damgası)
+
+Okuyucu tarafı gerçek recv/read gibi rastgele boyutlu parçalar alır, böylece
+çok baytlı karakterler ve satırlar parçalar arasında bölünür. Duraklamalar
+parça sınırı olarak modellenir. Zaman damgaları tekil olmalı: 100 ms aralıkla
+en fazla 24 saatlik (864.000) çerçeve.
+
+Kullanım:
+    python fault_harness.py --frames 100000 --faults truncate=0.01,merge=0.01,garbage=0.01,bad_utf8=0.01
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime
+
+import numpy as np
+
+from dataset_generator import FRAME_FIELDS, format_text_frames, frame_clock
+from fault_injector import FaultInjector, parse_fault_spec
+from scenario_engine import BulkScenario
+from telemetry_parser import LineFramer, parse_line
+
+MAX_FRAMES = 864000
+DEFAULT_RECV_SIZE = 1024
+CHUNK_FRAMES = 10000
+
+# Çerçeve alanı -> parse_line kanal adı ve kaynaktaki biçim (%d veya %.2f)
+FIELD_CHANNELS = {
+    'erpm': ('ERPM', int),
+    'rpm': ('RPM', int),
+    'speed': ('Speed', float),
+    'current': ('Current', float),
+    'duty': ('Duty', int),
+    'voltage': ('Voltage', float),
+    'power': ('Power', float),
+}
+CHANNEL_COLUMNS = {FIELD_CHANNELS[name][0]: column for column, name in enumerate(FRAME_FIELDS)}
+
+# Zaman damgaları gün içinde tekil kalsın diye sabit başlangıç
+STREAM_START = datetime(2026, 1, 1)
+
+
+def expected_values(sample):
+    """Kaynağın protokolde yazdığı değerler (çerçeve x alan)"""
+    columns = []
+    for name in FRAME_FIELDS:
+        values = sample[name].astype(np.float64)
+        # %d sıfıra doğru keser, %.2f iki basamağa yuvarlar
+        columns.append(np.trunc(values) if FIELD_CHANNELS[name][1] is int else np.round(values, 2))
+    return np.column_stack(columns)
+
+
+def build_stream(frames, injector=None, seed=None, dt=0.1, recv_size=DEFAULT_RECV_SIZE):
+    """
+    Bozulmuş bayt akışı ve kaynak değerleri
+
+    Dönüş: (parça listesi, {zaman damgası: çerçeve no}, beklenen değerler dizisi)
+    """
+    if not 0 < frames <= MAX_FRAMES:
+        raise ValueError(f"Çerçeve sayısı 1-{MAX_FRAMES} aralığında olmalı")
+
+    generator = BulkScenario(None, seed, dt)
+    chunk_random = random.Random(seed)
+    stream = bytearray()
+    boundaries = []
+    index = {}
+    expected = []
+
+    written = 0
+    while written < frames:
+        count = min(CHUNK_FRAMES, frames - written)
+        sample = generator.next_chunk(count)
+        _, local = frame_clock(STREAM_START, written, count, dt)
+        text = format_text_frames(local, sample)
+        for offset, stamp in enumerate(np.datetime_as_string(local, unit='ms').tolist()):
+            index[stamp[11:23]] = written + offset
+        expected.append(expected_values(sample))
+
+        if injector is None:
+            stream += text.encode('utf-8')
+        else:
+            for block in text.split("\n\n")[:-1]:
+                stream += injector.apply((block + "\n\n").encode('utf-8'))
+                if injector.take_stall():
+                    boundaries.append(len(stream))
+        written += count
+
+    # Okuyucunun aldığı parçalar: duraklama sınırları arasında rastgele boyutlar
+    chunks = []
+    view = memoryview(bytes(stream))
+    position = 0
+    for boundary in boundaries + [len(view)]:
+        while position < boundary:
+            size = min(chunk_random.randint(1, recv_size), boundary - position)
+            chunks.append(view[position:position + size].tobytes())
+            position += size
+    return chunks, index, np.concatenate(expected)
+
+
+def run_harness(frames=100000, faults=None, seed=None, fault_seed=None,
+                recv_size=DEFAULT_RECV_SIZE):
+    """
+    Akışı üret, ayrıştır ve karşılaştır
+
+    faults: FaultInjector argümanları (dict) veya tanım metni; None temiz akış
+    Dönüş: istatistik sözlüğü
+    """
+    if isinstance(faults, str):
+        faults = parse_fault_spec(faults)
+    injector = FaultInjector(fault_seed, **faults) if faults else None
+    chunks, index, expected = build_stream(frames, injector, seed, recv_size=recv_size)
+
+    # Ölçülen kısım: okuyucu thread'lerinin yaptığı iş (çerçeveleme + ayrıştırma)
+    framer = LineFramer()
+    samples = []
+    lines = 0
+    began = time.perf_counter()
+    for chunk in chunks:
+        for line in framer.feed(chunk):
+            lines += 1
+            samples.extend(parse_line(line))
+    seconds = time.perf_counter() - began
+
+    correct = np.zeros(expected.shape, dtype=bool)
+    false_parses = 0
+    for data_type, value, timestamp in samples:
+        frame = index.get(timestamp)
+        column = CHANNEL_COLUMNS.get(data_type)
+        if frame is None or column is None or value != expected[frame, column] or correct[frame, column]:
+            false_parses += 1
+        else:
+            correct[frame, column] = True
+
+    per_frame = correct.sum(axis=1)
+    byte_count = sum(len(chunk) for chunk in chunks)
+    return {
+        'frames': frames,
+        'bytes': byte_count,
+        'chunks': len(chunks),
+        'lines': lines,
+        'seconds': seconds,
+        'mb_per_s': byte_count / seconds / 1e6 if seconds > 0 else 0.0,
+        'lines_per_s': lines / seconds if seconds > 0 else 0.0,
+        'samples': len(samples),
+        'recovered': int((per_frame == len(FRAME_FIELDS)).sum()),
+        'partial': int(((per_frame > 0) & (per_frame < len(FRAME_FIELDS))).sum()),
+        'dropped': int((per_frame == 0).sum()),
+        'fields_recovered': int(per_frame.sum()),
+        'false_parses': false_parses,
+        'overflows': framer.overflows,
+        'faults': dict(injector.counts) if injector is not None else {},
+    }
+
+
+def print_report(title, stats):
+    frames = stats['frames']
+    print(f"\n{title}")
+    print(f"   ⚡ {stats['bytes'] / 1e6:.1f} MB, {stats['lines']:,} satır, {stats['chunks']:,} parça, "
+          f"{stats['seconds']:.2f} s → {stats['mb_per_s']:.1f} MB/s, {stats['lines_per_s']:,.0f} satır/s")
+    print(f"   ✅ Kurtarılan: {stats['recovered']:,}/{frames:,} çerçeve "
+          f"({100.0 * stats['recovered'] / frames:.2f}%)")
+    print(f"   🧩 Kısmi: {stats['partial']:,} | 🕳️ Kayıp: {stats['dropped']:,} | "
+          f"Alan: {stats['fields_recovered']:,}/{frames * len(FRAME_FIELDS):,}")
+    print(f"   ❌ Yanlış ayrıştırma: {stats['false_parses']:,} | Taşan satır: {stats['overflows']}")
+    if stats['faults']:
+        print("   💥 Enjekte edilen: " + ", ".join(f"{name}={count:,}" for name, count in sorted(stats['faults'].items())))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Bozulmuş hat verisinde ayrıştırıcı hız ve doğruluk ölçümü')
+    parser.add_argument('--frames', type=int, default=100000,
+                        help=f'Çerçeve sayısı (en fazla {MAX_FRAMES:,})')
+    parser.add_argument('--faults', default='truncate=0.01,merge=0.01,garbage=0.01,bad_utf8=0.01,stall=0.001',
+                        help='Çerçeve başına hata olasılıkları')
+    parser.add_argument('--seed', type=int, default=1, help='Araç modeli tohumu')
+    parser.add_argument('--fault-seed', type=int, default=1, help='Hata enjeksiyonu tohumu')
+    parser.add_argument('--recv-size', type=int, default=DEFAULT_RECV_SIZE,
+                        help='Okuyucunun tek seferde aldığı en fazla bayt')
+    parser.add_argument('--no-baseline', action='store_true', help='Temiz akış ölçümünü atla')
+    args = parser.parse_args(argv)
+
+    try:
+        faults = parse_fault_spec(args.faults)
+        if not args.no_baseline:
+            print_report("🧪 Temiz akış", run_harness(args.frames, None, args.seed, recv_size=args.recv_size))
+        stats = run_harness(args.frames, faults, args.seed, args.fault_seed, args.recv_size)
+    except ValueError as e:
+        parser.error(str(e))
+    print_report(f"💥 Bozulmuş akış ({args.faults})", stats)
+    return stats
+
+
+if __name__ == '__main__':
+    main()
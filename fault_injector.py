@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hata Enjeksiyonu
+Telsiz hattında görülen bozulmaları simülatör çerçevelerine uygular. Her
+hata çerçeve başına verilen olasılıkla, tohumlanmış üreteçle seçilir:
+
+    truncate - çerçevenin ortasından bayt kaybı (satır sonu dahil)
+    merge    - çerçeve sonu kaybolur, sonraki çerçeveyle birleşir
+    garbage  - rastgele çöp baytlar araya girer
+    bad_utf8 - "Hız", "Akım", "Güç" etiketlerinde geçersiz UTF-8
+    stall    - gönderim stall_s saniye durur
+
+Olasılıklar komut satırında "truncate=0.01,garbage=0.005,stall=0.001,stall_s=0.5"
+biçiminde verilir.
+"""
+
+import random
+from collections import Counter
+
+FAULT_TYPES = ('truncate', 'merge', 'garbage', 'bad_utf8', 'stall')
+
+# Etiketlerdeki çok baytlı karakterler (ı, ü, ç, İ)
+MULTIBYTE_CHARS = [char.encode('utf-8') for char in ('ı', 'ü', 'ç', 'İ')]
+
+DEFAULT_STALL_SECONDS = 0.5
+
+
+def parse_fault_spec(text):
+    """'truncate=0.01,stall=0.001' → FaultInjector argümanları"""
+    options = {}
+    for part in (text or '').split(','):
+        if not part.strip():
+            continue
+        name, _, value = part.partition('=')
+        name = name.strip()
+        if name not in FAULT_TYPES and name != 'stall_s':
+            raise ValueError(f"Bilinmeyen hata tipi: {name}")
+        try:
+            options[name] = float(value)
+        except ValueError:
+            raise ValueError(f"Geçersiz olasılık: {part}")
+        if name != 'stall_s' and not 0.0 <= options[name] <= 1.0:
+            raise ValueError(f"Olasılık 0-1 aralığında olmalı: {part}")
+    return options
+
+
+class FaultInjector:
+    """Çerçeve baytlarına tohumlanmış hata uygular, uygulanan hataları sayar"""
+
+    def __init__(self, seed=None, truncate=0.0, merge=0.0, garbage=0.0, bad_utf8=0.0,
+                 stall=0.0, stall_s=DEFAULT_STALL_SECONDS):
+        self.random = random.Random(seed)
+        self.probabilities = {'truncate': truncate, 'merge': merge, 'garbage': garbage,
+                              'bad_utf8': bad_utf8, 'stall': stall}
+        self.stall_seconds = stall_s
+        self.counts = Counter()
+        self.frames = 0
+        self.pending_stall = 0.0
+
+    @classmethod
+    def from_spec(cls, text, seed=None):
+        """Komut satırı tanımından; tanım boşsa None"""
+        options = parse_fault_spec(text)
+        return cls(seed, **options) if options else None
+
+    @property
+    def enabled(self):
+        return any(self.probabilities.values())
+
+    def _hit(self, fault):
+        probability = self.probabilities[fault]
+        if probability and self.random.random() < probability:
+            self.counts[fault] += 1
+            return True
+        return False
+
+    def apply(self, payload):
+        """Tek çerçevenin baytlarını boz; duraklama kararı take_stall() ile alınır"""
+        self.frames += 1
+        data = bytearray(payload)
+
+        if self._hit('bad_utf8'):
+            positions = [(i, char) for char in MULTIBYTE_CHARS
+                         for i in self._find_all(data, char)]
+            if positions:
+                index, char = self.random.choice(positions)
+                if self.random.random() < 0.5:
+                    data[index] = 0xFF                      # geçersiz öncü bayt
+                else:
+                    del data[index + len(char) - 1]         # eksik devam baytı
+
+        if self._hit('garbage'):
+            noise = bytes(self.random.randrange(256) for _ in range(self.random.randint(1, 16)))
+            position = self.random.randrange(len(data) + 1)
+            data[position:position] = noise
+
+        if self._hit('truncate') and len(data) > 2:
+            start = self.random.randrange(len(data) - 2)
+            del data[start:start + self.random.randint(1, 40)]
+
+        if self._hit('merge'):
+            data = bytearray(data.rstrip(b'\n'))
+
+        if self._hit('stall'):
+            self.pending_stall += self.stall_seconds
+        return bytes(data)
+
+    def take_stall(self):
+        """Biriken duraklama süresini döndür ve sıfırla"""
+        stall, self.pending_stall = self.pending_stall, 0.0
+        return stall
+
+    @staticmethod
+    def _find_all(data, token):
+        index = data.find(token)
+        while index >= 0:
+            yield index
+            index = data.find(token, index + 1)
+
+    def summary(self):
+        parts = [f"{fault}: {self.counts[fault]}" for fault in FAULT_TYPES if self.probabilities[fault]]
+        return f"{self.frames} çerçeve, " + ", ".join(parts)
@@ -0,0 +1,523 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Telemetri Alım Çekirdeği
+Kaynak (TCP, seri port, ham kayıt), satır çerçeveleme, ayrıştırma, türetilmiş
+kanallar ve depoya yazma adımlarını Qt'den bağımsız tek bir boru hattında
+toplar. Arayüzdeki okuyucu thread'ler ve başsız kayıt aracı
+(telemetry_record.py) aynı çekirdeği kullanır.
+
+Kullanım:
+    pipeline = IngestPipeline(open_source("socket://localhost:8888"))
+    for sample in pipeline.samples():
+        print(sample.data_type, sample.value)
+"""
+
+import errno
+import os
+import select
+import socket
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from distance_engine import DEFAULT_MAX_GAP, DistanceIntegrator
+from energy_engine import ENERGY_CHANNELS, EnergyTracker, km_per_m3, wh_per_km
+from raw_capture import CaptureReader, CaptureWriter, is_capture_path
+from rolling_window import ROLLING_SPECS, RollingChannels
+from session_index import build_source_index
+from session_store import SessionStoreWriter
+from telemetry_parser import LineFramer, StreamParser
+
+# Bağlantı koptuğunda yeniden deneme aralığı (saniye)
+DEFAULT_RECONNECT_DELAY = 2.0
+
+# Okuma zaman aşımı: stop() en geç bu kadar sürede fark edilir (saniye)
+DEFAULT_READ_TIMEOUT = 0.5
+
+# TCP bağlantı kurma zaman aşımı (saniye); beklerken de cancel() okuma aralığında fark edilir
+DEFAULT_CONNECT_TIMEOUT = 5.0
+
+# Depoya yazılmadan bellekte tutulan en fazla örnek / süre
+STORE_BATCH = 4096
+STORE_FLUSH_SECONDS = 5.0
+
+# Satır zamanında geç gelen örnekler için sıralanmadan bekletilen son süre (saniye)
+STORE_REORDER_SECONDS = 2.0
+
+# Tek bir örnek: Unix zamanı, veri tipi, değer, Arduino zaman metni
+Sample = namedtuple('Sample', ['time', 'data_type', 'value', 'timestamp'])
+
+
+class TcpSource:
+    """TCP soket kaynağı (sanal Arduino, ESP köprüsü)"""
+
+    def __init__(self, host, port, timeout=DEFAULT_READ_TIMEOUT, recv_size=4096,
+                 connect_timeout=DEFAULT_CONNECT_TIMEOUT):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.recv_size = recv_size
+        self.socket = None
+        self.cancelled = threading.Event()
+        self.name = f"tcp://{host}:{port}"
+
+    @property
+    def is_open(self):
+        return self.socket is not None
+
+    def open(self):
+        """Adresleri sırayla dene; cancel() bağlantı beklenirken de en geç timeout içinde fark edilir"""
+        if self.cancelled.is_set():
+            raise OSError("Bağlantı iptal edildi")
+        error = OSError(f"Adres bulunamadı: {self.host}")
+        for family, kind, proto, _, address in socket.getaddrinfo(self.host, self.port, type=socket.SOCK_STREAM):
+            sock = socket.socket(family, kind, proto)
+            try:
+                self._connect(sock, address)
+            except OSError as e:
+                sock.close()
+                if self.cancelled.is_set():
+                    raise
+                error = e
+                continue
+            sock.settimeout(self.timeout)
+            self.socket = sock
+            return
+        raise error
+
+    def _connect(self, sock, address):
+        """Bloklamayan bağlantı: yazılabilir olana kadar kısa aralıklarla bekle"""
+        sock.setblocking(False)
+        result = sock.connect_ex(address)
+        if result not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY):
+            raise OSError(result, os.strerror(result))
+        deadline = time.monotonic() + self.connect_timeout
+        while result:
+            if self.cancelled.is_set():
+                raise OSError("Bağlantı iptal edildi")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise socket.timeout("Bağlantı zaman aşımı")
+            _, writable, failed = select.select([], [sock], [sock], min(self.timeout, remaining))
+            if writable or failed:
+                result = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                if result:
+                    raise OSError(result, os.strerror(result))
+                return
+
+    def read(self):
+        """(alım zamanı, baytlar); zaman aşımında boş bayt, bağlantı kapanınca None"""
+        sock = self.socket
+        if sock is None:
+            return None
+        try:
+            data = sock.recv(self.recv_size)
+        except socket.timeout:
+            return time.time(), b''
+        if not data:
+            return None
+        return time.time(), data
+
+    def close(self):
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
+
+    def cancel(self):
+        """Başka thread'den: süren open()/read() bırakılır, kaynak yeniden açılmaz"""
+        self.cancelled.set()
+        self.close()
+
+
+class SerialSource:
+    """
+    Seri port kaynağı
+
+    İlk bayt için zaman aşımlı bloklayan okuma yapılır, ardından tampondaki
+    her şey tek seferde alınır - boşta beklerken CPU harcanmaz.
+    """
+
+    def __init__(self, port, baudrate=9600, timeout=DEFAULT_READ_TIMEOUT):
+        self.port = port
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.connection = None
+        self.name = f"{port}@{baudrate}"
+
+    @property
+    def is_open(self):
+        return self.connection is not None and self.connection.is_open
+
+    def open(self):
+        # pyserial yalnızca seri port kullanıldığında gerekir
+        import serial
+        self.connection = serial.Serial(self.port, self.baudrate, timeout=self.timeout)
+
+    def read(self):
+        connection = self.connection
+        if connection is None:
+            return None
+        data = connection.read(1)
+        if data:
+            waiting = connection.in_waiting
+            if waiting:
+                data += connection.read(waiting)
+        return time.time(), data
+
+    def close(self):
+        if self.connection is not None and self.connection.is_open:
+            self.connection.close()
+        self.connection = None
+
+    def cancel(self):
+        """Başka thread'den: bloklayan okuma port kapatılarak bırakılır"""
+        self.close()
+
+
+class CaptureSource:
+    """
+    Ham bayt kaydı kaynağı (.rawcap.gz/.xz)
+
+    speed=0 beklemeden, speed=1 kayıttaki alım aralıklarıyla oynatır; alım
+    zamanları kayıttaki değerleridir.
+    """
+
+    def __init__(self, path, speed=0.0):
+        self.path = path
+        self.speed = speed
+        self.records = None
+        self.name = path
+        self.first_receipt = None
+        self.started = None
+
+    @property
+    def is_open(self):
+        return self.records is not None
+
+    def open(self):
+        self.records = iter(CaptureReader(self.path))
+
+    def read(self):
+        record = next(self.records, None)
+        if record is None or self.speed <= 0:
+            return record
+        receipt_time = record[0]
+        if self.first_receipt is None:
+            self.first_receipt, self.started = receipt_time, time.monotonic()
+        delay = self.started + (receipt_time - self.first_receipt) / self.speed - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        return record
+
+    def close(self):
+        self.records = None
+
+    def cancel(self):
+        self.close()
+
+
+def open_source(spec, baudrate=9600, speed=0.0):
+    """
+    Kaynak tanımından kaynak nesnesi oluştur
+
+    "socket://host:port" TCP, .rawcap.gz/.xz uzantılı dosya ham kayıt,
+    diğer her şey seri port (COM3, /dev/ttyUSB0, /dev/ttyVirtualArduino) sayılır.
+    """
+    if spec.startswith('socket://') or spec.startswith('tcp://'):
+        address = spec.split('://', 1)[1]
+        host, _, port = address.rpartition(':')
+        if not host or not port.isdigit():
+            raise ValueError(f"Geçersiz TCP adresi: {spec} (socket://host:port)")
+        return TcpSource(host, int(port))
+    if is_capture_path(spec):
+        return CaptureSource(spec, speed)
+    return SerialSource(spec, baudrate)
+
+
+class DerivedChannels:
+    """
+    Ham örneklerden canlı türetilen kanallar
+
+    Distance (hızdan), Energy/WhPerKm (güçten), H2Used/KmPerM3 (hidrojen
+    akışından) ve kayan pencere kanalları örnek başına O(1) güncellenir.
+    """
+
+    def __init__(self, max_gap=DEFAULT_MAX_GAP, rolling_specs=ROLLING_SPECS):
+        self.distance = DistanceIntegrator(max_gap)
+        self.energy = EnergyTracker(max_gap)
+        self.rolling = RollingChannels(rolling_specs)
+
+    @property
+    def names(self):
+        return ['Distance'] + ENERGY_CHANNELS + self.rolling.names
+
+    @property
+    def total_distance(self):
+        return self.distance.total
+
+    def add(self, data_type, value, timestamp):
+        """Ham örneği işle, [(kanal, değer), ...] türetilmiş örnekleri döndür"""
+        derived = []
+        if data_type == 'Speed':
+            derived.append(('Distance', self.distance.add(value, timestamp)))
+        elif data_type == 'Power':
+            energy = self.energy.add_power(value, timestamp)
+            derived.append(('Energy', energy))
+            consumption = wh_per_km(energy, self.distance.total)
+            if consumption is not None:
+                derived.append(('WhPerKm', consumption))
+        elif data_type == 'H2Flow':
+            liters = self.energy.add_hydrogen_flow(value, timestamp)
+            derived.append(('H2Used', liters))
+            efficiency = km_per_m3(self.distance.total, liters)
+            if efficiency is not None:
+                derived.append(('KmPerM3', efficiency))
+        derived.extend(self.rolling.add(data_type, value, timestamp))
+        return derived
+
+    def reset(self, distance_km=0.0, energy_wh=0.0, hydrogen_liters=0.0):
+        """Sayaçları sıfırla (veya yüklenen oturumun toplamlarından devam et)"""
+        self.distance.reset(forward=distance_km)
+        self.energy.reset(energy_wh, hydrogen_liters)
+        self.rolling.reset()
+
+
+class StoreSink:
+    """
+    Örnekleri oturum deposuna (.tstore) toplu halinde yazar
+
+    Kanal başına en fazla STORE_BATCH örnek veya STORE_FLUSH_SECONDS süre
+    bellekte bekler; close() manifest'i ve oturum tarayıcısı indeksini yazar.
+    Satır zamanı kullanıldığında örnekler sırasız gelebilir: her yazımda
+    kanalın son reorder_seconds'lık kısmı sonraki toplu yazıma bekletilir.
+    Kanala son yazılandan da eski gelen örnek o zamana çekilir (late_samples).
+    """
+
+    def __init__(self, path, info=None, batch=STORE_BATCH, flush_seconds=STORE_FLUSH_SECONDS,
+                 reorder_seconds=STORE_REORDER_SECONDS):
+        self.path = path
+        self.writer = SessionStoreWriter(path, info=info)
+        self.batch = batch
+        self.flush_seconds = flush_seconds
+        self.reorder_seconds = reorder_seconds
+        self.batches = {}
+        self.last_written = {}
+        self.last_flush = time.monotonic()
+        self.samples = 0
+        self.late_samples = 0
+
+    def add(self, data_type, moment, value):
+        times, values = self.batches.setdefault(data_type, ([], []))
+        times.append(moment)
+        values.append(value)
+        self.samples += 1
+        if len(times) >= self.batch:
+            self._flush_channel(data_type, times, values)
+        elif time.monotonic() - self.last_flush >= self.flush_seconds:
+            self.flush()
+
+    def _flush_channel(self, data_type, times, values, final=False):
+        times_array = np.asarray(times, dtype=np.float64)
+        values_array = np.asarray(values, dtype=np.float64)
+        if len(times_array) > 1 and np.any(np.diff(times_array) < 0):
+            order = np.argsort(times_array, kind='stable')
+            times_array, values_array = times_array[order], values_array[order]
+
+        split = len(times_array)
+        if not final:
+            # Geç gelecek örnekler bu aralığa karışabilir; en fazla yarım toplu yazım bekletilir
+            cutoff = times_array[-1] - self.reorder_seconds
+            split = max(int(np.searchsorted(times_array, cutoff, side='right')),
+                        len(times_array) - self.batch // 2)
+        held_times, held_values = times_array[split:].tolist(), values_array[split:].tolist()
+        times_array, values_array = times_array[:split], values_array[:split]
+
+        if len(times_array):
+            last = self.last_written.get(data_type)
+            if last is not None and times_array[0] < last:
+                self.late_samples += int(np.count_nonzero(times_array < last))
+                times_array = np.maximum(times_array, last)
+            self.writer.append(data_type, times_array, values_array)
+            self.last_written[data_type] = float(times_array[-1])
+        times[:] = held_times
+        values[:] = held_values
+
+    def flush(self, final=False):
+        for data_type, (times, values) in self.batches.items():
+            if times:
+                self._flush_channel(data_type, times, values, final)
+        self.last_flush = time.monotonic()
+
+    def close(self, info=None):
+        """Depoyu kapat; info (ör. oturum toplamları) manifest bilgisine eklenir"""
+        if self.writer is None:
+            return
+        self.flush(final=True)
+        self.writer.info.update(info or {})
+        self.writer.close()
+        self.writer = None
+        if self.samples:
+            build_source_index(self.path)
+
+
+class IngestPipeline:
+    """
+    Kaynak → çerçeveleme → ayrıştırma → türetilmiş kanallar → depo
+
+    samples() örnek üreteci, run(callback) her örnek için geri çağırma
+    sağlar. reconnect_delay verilirse kopan bağlantı beklenip yeniden açılır;
+    verilmezse okuma hatası çağırana iletilir. stop() başka bir thread'den
+    çağrılabilir.
+    """
+
+    def __init__(self, source, clock='receipt', derived=None, store=None, capture_path=None,
+                 capture_info=None, reconnect_delay=None, on_read=None, on_status=None):
+        self.source = source
+        self.parser = StreamParser(clock)
+        self.derived = derived
+        self.store = store
+        self.capture_path = capture_path
+        self.capture_info = capture_info
+        self.capture = None
+        self.reconnect_delay = reconnect_delay
+        self.on_read = on_read
+        self.on_status = on_status or (lambda message: None)
+        self.running = False
+        self.stopped = threading.Event()
+        self.connections = 0
+        self.samples_out = 0
+
+    @property
+    def stats(self):
+        return {
+            'reads': self.parser.records,
+            'bytes': self.parser.bytes,
+            'lines': self.parser.lines,
+            'samples': self.samples_out,
+            'connections': self.connections,
+            'overflows': self.parser.framer.overflows,
+        }
+
+    def _records(self):
+        """Bağlantı açık kaldıkça (alım zamanı, baytlar) çiftleri"""
+        while self.running:
+            try:
+                record = self.source.read()
+            except Exception as e:
+                # stop() kaynağı kapattığında okuma hata verir
+                if not self.running:
+                    return
+                if self.reconnect_delay is None or not isinstance(e, (OSError, ValueError)):
+                    raise
+                self.on_status(f"Okuma hatası: {e}")
+                return
+            if record is None:
+                self.on_status("Bağlantı kapandı")
+                return
+            if not record[1]:
+                continue
+            if self.on_read is not None:
+                self.on_read(record[1])
+            if self.capture is not None:
+                self._tee(record)
+            yield record
+
+    def _tee(self, record):
+        """Baytları ham kayda ekle; kayıt yazılamazsa bırakılır, okuma sürer"""
+        try:
+            self.capture.write(record[1], record[0])
+        except OSError as e:
+            capture, self.capture = self.capture, None
+            try:
+                capture.close()
+            except OSError:
+                pass
+            self.on_status(f"Ham kayıt durduruldu, okuma kayıtsız sürüyor: {e}")
+
+    def _connect(self):
+        """Kaynağı aç; yeniden bağlanma açıksa başarana veya durdurulana kadar dener"""
+        while self.running:
+            try:
+                self.source.open()
+            except (OSError, ValueError) as e:
+                if self.reconnect_delay is None:
+                    raise
+                self.on_status(f"Bağlanılamadı: {e} - {self.reconnect_delay:.0f} s sonra yeniden denenecek")
+                self.stopped.wait(self.reconnect_delay)
+                continue
+            return True
+        return False
+
+    def samples(self):
+        """Ham ve türetilmiş örnekleri Sample olarak üret (stop() sonrası hiç okumaz)"""
+        # Başlamadan önce gelen stop() geçerli kalır
+        self.running = not self.stopped.is_set()
+        try:
+            if self.capture_path and self.capture is None:
+                try:
+                    self.capture = CaptureWriter(self.capture_path, source=self.source.name,
+                                                 info=self.capture_info)
+                except OSError as e:
+                    self.on_status(f"Ham kayıt açılamadı, okuma kayıtsız sürüyor: {e}")
+            while self.running:
+                if not self.source.is_open and not self._connect():
+                    break
+                self.connections += 1
+                if self.connections > 1:
+                    # Önceki bağlantıdan kalan yarım satır yeni akışa karışmasın
+                    self.parser.framer = LineFramer()
+                    self.on_status(f"Yeniden bağlanıldı: {self.source.name}")
+
+                for moment, data_type, value, timestamp in self.parser.samples(self._records()):
+                    sample = Sample(moment, data_type, value, timestamp)
+                    self._store(sample)
+                    yield sample
+                    if self.derived is not None:
+                        for name, derived_value in self.derived.add(data_type, value, moment):
+                            sample = Sample(moment, name, derived_value, timestamp)
+                            self._store(sample)
+                            yield sample
+
+                self.source.close()
+                if self.reconnect_delay is None or isinstance(self.source, CaptureSource):
+                    break
+                self.stopped.wait(self.reconnect_delay)
+        finally:
+            self.running = False
+            self.close()
+
+    def _store(self, sample):
+        self.samples_out += 1
+        if self.store is not None:
+            self.store.add(sample.data_type, sample.time, sample.value)
+
+    def run(self, callback):
+        """Her örnek için callback(sample) çağır, kaynak bitince veya stop() ile dön"""
+        for sample in self.samples():
+            callback(sample)
+        return self.stats
+
+    def stop(self):
+        """Okumayı durdur - bloklayan okuma kaynak kapatılarak çözülür"""
+        self.running = False
+        self.stopped.set()
+        try:
+            self.source.cancel()
+        except Exception:
+            pass
+
+    def close(self):
+        self.source.close()
+        if self.capture is not None:
+            capture, self.capture = self.capture, None
+            try:
+                capture.close()
+            except OSError as e:
+                self.on_status(f"Ham kaydın sonu yazılamadı: {e}")
+        if self.store is not None:
+            totals = {'total_distance_km': self.derived.total_distance} if self.derived is not None else None
+            self.store.close(totals)
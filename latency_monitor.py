@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gecikme ve Kare Hızı Ölçümü
+Her örnek bayt alımı, parse sonrası, GUI kuyruğundan çıkış ve çizim anlarında
+damgalanır. Aşama süreleri kayan histogramlarda tutulur (p50/p95/p99).
+Ölçüm kapalıyken okuyucu thread'lerde yalnızca tek bir bayrak kontrolü yapılır.
+"""
+
+import math
+import time
+from collections import deque
+
+# Ölçülen aşamalar: (anahtar, açıklama)
+STAGES = [
+    ('parse', 'Alım → Parse'),
+    ('queue', 'Parse → GUI Kuyruğu'),
+    ('render', 'GUI → Çizim'),
+    ('total', 'Toplam (Alım → Çizim)'),
+]
+
+# Zaman kaynağı - tüm thread'lerde ortak, monoton
+now = time.perf_counter
+
+
+class RollingHistogram:
+    """
+    Son N ölçümün logaritmik kovalı histogramı
+
+    Ekleme O(1): yeni değer kovasını artırır, pencereden düşen değer kendi
+    kovasını azaltır. Yüzdelikler kova sınırları arasında interpolasyonla bulunur.
+    """
+
+    def __init__(self, window=4096, min_value=1e-6, max_value=10.0, bins_per_decade=20):
+        self.window = window
+        self.min_value = min_value
+        self.bins_per_decade = bins_per_decade
+        self.log_min = math.log10(min_value)
+        self.n_bins = int(math.ceil((math.log10(max_value) - self.log_min) * bins_per_decade)) + 1
+        self.counts = [0] * self.n_bins
+        self.samples = deque()
+        self.maximum = 0.0
+
+    def _bin(self, value):
+        if value <= self.min_value:
+            return 0
+        index = int((math.log10(value) - self.log_min) * self.bins_per_decade)
+        return min(index, self.n_bins - 1)
+
+    def _bin_edge(self, index):
+        return 10 ** (self.log_min + index / self.bins_per_decade)
+
+    def add(self, value):
+        """Yeni ölçüm ekle (saniye)"""
+        index = self._bin(value)
+        self.counts[index] += 1
+        self.samples.append(index)
+        if value > self.maximum:
+            self.maximum = value
+
+        if len(self.samples) > self.window:
+            self.counts[self.samples.popleft()] -= 1
+
+    def __len__(self):
+        return len(self.samples)
+
+    def percentile(self, q):
+        """q (0-100) yüzdeliğini döndür, veri yoksa None"""
+        total = len(self.samples)
+        if total == 0:
+            return None
+
+        target = q / 100.0 * total
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            if count and cumulative + count >= target:
+                # Kova içinde logaritmik interpolasyon
+                fraction = (target - cumulative) / count
+                low, high = self._bin_edge(index), self._bin_edge(index + 1)
+                return low * (high / low) ** fraction
+            cumulative += count
+        return self._bin_edge(self.n_bins)
+
+    def clear(self):
+        self.counts = [0] * self.n_bins
+        self.samples.clear()
+        self.maximum = 0.0
+
+
+class RateCounter:
+    """Son bir saniyedeki olay sayısı (ör. çizim FPS)"""
+
+    def __init__(self, period=1.0):
+        self.period = period
+        self.events = deque()
+
+    def tick(self, timestamp=None):
+        timestamp = now() if timestamp is None else timestamp
+        self.events.append(timestamp)
+        self._expire(timestamp)
+
+    def _expire(self, timestamp):
+        while self.events and timestamp - self.events[0] > self.period:
+            self.events.popleft()
+
+    def rate(self):
+        self._expire(now())
+        return len(self.events) / self.period
+
+    def clear(self):
+        self.events.clear()
+
+
+class LatencyMonitor:
+    """Uçtan uca gecikme, çizim FPS ve kuyruk derinliği ölçümü"""
+
+    def __init__(self, window=4096):
+        self.enabled = False
+        self.histograms = {key: RollingHistogram(window) for key, _ in STAGES}
+        self.fps = RateCounter()
+        self.sample_rate = RateCounter()
+        # Okuyucu thread'ler yalnızca emitted'i, GUI yalnızca dequeued'i artırır
+        self.emitted = 0
+        self.dequeued = 0
+        # Çizim olmazsa (grafik gizli/küçültülmüş) yalnızca son örnekler bekler
+        self.pending_render = deque(maxlen=window)
+
+    def set_enabled(self, enabled):
+        """Ölçümü aç/kapat - açılışta eski ölçümler temizlenir, kapanışta bekleyenler bırakılır"""
+        if enabled and not self.enabled:
+            self.reset()
+        elif not enabled:
+            self.pending_render.clear()
+        self.enabled = enabled
+
+    def reset(self):
+        """GUI thread: ölçümleri temizle"""
+        for histogram in self.histograms.values():
+            histogram.clear()
+        self.fps.clear()
+        self.sample_rate.clear()
+        # emitted'e yalnızca okuyucu thread yazar; sıfırlamak yerine kuyruk
+        # derinliği sıfırlanır, eşzamanlı artış kaybolmaz
+        self.dequeued = self.emitted
+        self.pending_render.clear()
+
+    def stamp_parsed(self, data, receipt_time):
+        """Okuyucu thread: örneğe alım ve parse zamanlarını ekle"""
+        data['t_recv'] = receipt_time
+        data['t_parsed'] = now()
+        self.emitted += 1
+
+    def record_dequeue(self, data, rendered=True):
+        """GUI thread: örnek kuyruktan çıktı, çizilecekse çizim için beklet"""
+        t_recv = data.get('t_recv')
+        if t_recv is None:
+            return
+
+        t_dequeue = now()
+        self.dequeued += 1
+        self.sample_rate.tick(t_dequeue)
+        self.histograms['parse'].add(data['t_parsed'] - t_recv)
+        self.histograms['queue'].add(t_dequeue - data['t_parsed'])
+        if rendered:
+            self.pending_render.append((t_recv, t_dequeue))
+
+    def record_frame(self):
+        """GUI thread: grafik sahnesi çizilmek üzere - bekleyen örnekleri kapat"""
+        t_render = now()
+        self.fps.tick(t_render)
+        for t_recv, t_dequeue in self.pending_render:
+            self.histograms['render'].add(t_render - t_dequeue)
+            self.histograms['total'].add(t_render - t_recv)
+        self.pending_render.clear()
+
+    @property
+    def queue_depth(self):
+        """Okuyucu tarafından gönderilip GUI'de henüz işlenmemiş örnek sayısı"""
+        return max(0, self.emitted - self.dequeued)
+
+    def snapshot(self):
+        """Aşama başına yüzdelikleri (milisaniye) içeren özet"""
+        stages = []
+        for key, title in STAGES:
+            histogram = self.histograms[key]
+            stages.append({
+                'key': key,
+                'title': title,
+                'count': len(histogram),
+                'p50': _to_ms(histogram.percentile(50)),
+                'p95': _to_ms(histogram.percentile(95)),
+                'p99': _to_ms(histogram.percentile(99)),
+                'max': _to_ms(histogram.maximum if len(histogram) else None),
+            })
+        return {
+            'stages': stages,
+            'fps': self.fps.rate(),
+            'sample_rate': self.sample_rate.rate(),
+            'queue_depth': self.queue_depth,
+        }
+
+    def format_overlay(self):
+        """Grafik üstü kısa özet metni"""
+        snapshot = self.snapshot()
+        lines = [f"FPS: {snapshot['fps']:.0f}  |  Örnek/s: {snapshot['sample_rate']:.0f}  |  "
+                 f"Kuyruk: {snapshot['queue_depth']}"]
+        for stage in snapshot['stages']:
+            if stage['count']:
+                lines.append(f"{stage['title']}: p50 {stage['p50']:.2f} / p95 {stage['p95']:.2f} / "
+                             f"p99 {stage['p99']:.2f} ms")
+        return "\n".join(lines)
+
+
+def _to_ms(seconds):
+    return None if seconds is None else seconds * 1000.0
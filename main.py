@@ -14,11 +14,17 @@ if sys.version_info < (3, 7):
     print("Lütfen Python'u güncelleyin: https://python.org/downloads/")
     sys.exit(1)
 
-# Paket import kontrolü
-try:
-    import serial
-    import serial.tools.list_ports
-except ImportError:
+import time
+
+from startup_profile import BENCHMARK_FLAG, PROFILE_FLAG, PROFILE_PREFIX, StartupProfile
+
+# Açılış aşamalarının süreleri (python startup_profile.py ile ölçülür)
+startup_profile = StartupProfile()
+
+# Paket kontrolü - pyserial yalnızca bulunur, port listesi modülü ilk taramada yüklenir
+import importlib.util
+
+if importlib.util.find_spec('serial') is None:
     print("HATA: pyserial paketi bulunamadı!")
     print("Kurulum için: pip install pyserial")
     sys.exit(1)
@@ -31,169 +37,134 @@ except ImportError:
     sys.exit(1)
 
 import os
-import re
-import socket
+import queue
+import threading
 from datetime import datetime
+import csv
 import json
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLabel, QPushButton, QComboBox, 
                              QTextEdit, QGroupBox, QGridLayout, QMessageBox,
                              QFileDialog, QSpinBox, QDoubleSpinBox, QMenu, QAction, QDialog,
                              QTableWidget, QTableWidgetItem, QTabWidget,
-                             QScrollArea)
+                             QScrollArea, QSlider)
 from PyQt5.QtCore import QTimer, QThread, pyqtSignal, Qt
 from PyQt5.QtGui import QFont, QPalette, QPixmap, QPainter, QBrush
 import pyqtgraph as pg
-import pyqtgraph.exporters
-
-# Arduino tanıma için VID/PID listesi
-ARDUINO_VID_PID = {
-    '2341': ['0043', '0001', '0042', '0243', '8036', '8037'],  # Arduino LLC
-    '1B4F': ['9206', '9207', '9208'],  # SparkFun
-    '16C0': ['0483'],  # VOTI (Arduino clones)
-    '10C4': ['EA60'],  # Silicon Labs (ESP32 boards)
-    '1A86': ['7523'],  # QinHeng Electronics (CH340)
-    '0403': ['6001', '6014'],  # FTDI (FTDI chips)
-}
-
-def is_arduino_port(port):
-    """Portun Arduino olup olmadığını kontrol et"""
-    if not hasattr(port, 'vid') or not hasattr(port, 'pid'):
-        return False
-    
-    vid = f"{port.vid:04X}" if port.vid else ""
-    pid = f"{port.pid:04X}" if port.pid else ""
-    
-    return vid in ARDUINO_VID_PID and pid in ARDUINO_VID_PID[vid]
-
-def classify_port(port):
-    """Port tipini sınıflandır"""
-    description = port.description.lower()
-    manufacturer = getattr(port, 'manufacturer', '').lower() if hasattr(port, 'manufacturer') else ''
-    
-    # Arduino kontrolü
-    if (is_arduino_port(port) or 
-        'arduino' in description or 
-        'arduino' in manufacturer or
-        'uno' in description or 
-        'nano' in description or
-        'mega' in description):
-        return "🔧 Arduino", "Arduino"
-    
-    # ESP32/ESP8266 kontrolü
-    elif ('esp32' in description or 'esp8266' in description or
-          'nodemcu' in description or 'wemos' in description):
-        return "🌐 ESP Board", "ESP"
-    
-    # Bluetooth kontrolü
-    elif ('bluetooth' in description or 'bt' in description.replace(' ', '') or
-          'blue' in description):
-        return "📶 Bluetooth", "Bluetooth"
-    
-    # USB Serial kontrolü
-    elif ('usb' in description and 'serial' in description) or 'ch340' in description or 'cp210' in description:
-        return "🔌 USB Serial", "USB Serial"
-    
-    # Genel Serial
-    elif 'serial' in description or 'com' in description:
-        return "📟 Serial", "Serial"
-    
-    # Bilinmeyen
-    else:
-        return "❓ Diğer", "Unknown"
-
-class TCPThread(QThread):
-    """TCP socket bağlantısı için thread"""
+
+startup_profile.mark('qt_imports')
+
+from session_replay import ReplayClock, load_replay_events, seek_index
+from session_store import MANIFEST_NAME, SessionStore, ensure_session_store
+from latency_monitor import LatencyMonitor, now as latency_now
+from telemetry_stats import SessionStats
+from distance_engine import cumulative_distance
+from energy_engine import ENERGY_CHANNELS, derive_energy_channels, km_per_m3
+from segment_index import DEFAULT_MIN_STOP, SegmentHistory, build_segment_index
+from rolling_window import KIND_LABELS, derive_rolling_channels, rolling_channel_name
+from alarm_engine import DEFAULT_RULES_FILE, AlarmEngine
+from report_renderer import decimate_min_max, panel_width_px
+from resampler import align_channels, choose_reference, median_spacing, unaligned_table, unused_samples
+from session_index import build_index, collect_rows, find_sessions, write_index
+from session_compare import AXES, COMPARE_CHANNELS, DELTA_TIME, CompareSession, delta_trace
+from pty_port import DEFAULT_PTY_LINK
+from port_watcher import DEFAULT_POLL_SECONDS, PortWatcher, board_key
+from raw_capture import CaptureWriter, capture_filename
+from ingest_core import DerivedChannels, IngestPipeline, SerialSource, TcpSource
+
+startup_profile.mark('app_imports')
+
+# Uçtan uca gecikme ölçümü - okuyucu thread'ler ve GUI tarafından ortak kullanılır
+latency_monitor = LatencyMonitor()
+
+# Alarm kuralları - okuyucu thread'lerde her örnekte değerlendirilir
+alarm_engine = AlarmEngine()
+
+def image_exporter(plot_item):
+    """Grafik dışa aktarıcısı - exporters modülü ilk kayıtta yüklenir"""
+    import pyqtgraph.exporters
+    return pyqtgraph.exporters.ImageExporter(plot_item)
+
+# Bir kez çözülmüş resimler (dosya adı → QPixmap)
+_pixmap_cache = {}
+
+def load_pixmap(name):
+    """images/ altındaki resmi ilk kullanımda çöz, sonra önbellekten ver; yoksa None"""
+    if name not in _pixmap_cache:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'images', name)
+        pixmap = QPixmap(path) if os.path.exists(path) else None
+        _pixmap_cache[name] = pixmap if pixmap is not None and not pixmap.isNull() else None
+    return _pixmap_cache[name]
+
+class SourceThread(QThread):
+    """
+    Canlı kaynak okuyucu thread'lerinin ortak tabanı
+
+    Okuma, çerçeveleme ve ayrıştırma ingest_core.IngestPipeline'da yapılır;
+    thread örnekleri sinyal olarak ana thread'e iletir ve alarmları değerlendirir.
+    """
     data_received = pyqtSignal(dict)
     error_occurred = pyqtSignal(str)
+    status_message = pyqtSignal(str)  # Bağlantıyı kesmeyen uyarılar (ör. ham kayıt yazılamadı)
+    alarm_changed = pyqtSignal(dict)  # Yalnızca alarm başlangıç/bitişleri
+    disconnected = pyqtSignal()  # Kaynak akışı kendiliğinden bitirdi (EOF)
     
-    def __init__(self, host, port):
+    # Hata mesajlarında kullanılan kaynak adı
+    label = "Kaynak"
+    
+    def __init__(self, capture_path=None):
         super().__init__()
-        self.host = host
-        self.port = port
         self.is_running = False
-        self.socket = None
-        
+        self.stop_requested = False
+        self.pipeline = None
+        self.receipt_time = None
+        self.capture_path = capture_path
+    
+    def create_source(self):
+        raise NotImplementedError
+    
     def run(self):
+        # Boru hattı bağlantıdan önce kurulur: TCP bağlantısı beklenirken
+        # gelen stop() kaybolmaz
+        source = self.create_source()
+        self.pipeline = IngestPipeline(source, on_read=self.mark_receipt,
+                                       on_status=self.status_message.emit)
+        if self.stop_requested:
+            return
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.connect((self.host, self.port))
-            self.is_running = True
-            
-            buffer = ""
-            while self.is_running:
-                try:
-                    data = self.socket.recv(1024).decode('utf-8', errors='ignore')
-                    if not data:
-                        break
-                        
-                    buffer += data
-                    while '\n' in buffer:
-                        line, buffer = buffer.split('\n', 1)
-                        if line.strip():
-                            self.parse_data(line.strip())
-                            
-                except socket.timeout:
-                    continue
-                except Exception as e:
-                    self.error_occurred.emit(f"TCP okuma hatası: {str(e)}")
-                    break
-                        
+            source.open()
         except Exception as e:
-            self.error_occurred.emit(f"TCP bağlantı hatası: {str(e)}")
-        finally:
-            if self.socket:
-                self.socket.close()
-    
-    def parse_data(self, line):
-        """TCP'den gelen veriyi parse et"""
+            if not self.stop_requested:
+                self.error_occurred.emit(f"{self.label} bağlantı hatası: {str(e)}")
+            return
+        if self.stop_requested:
+            source.close()
+            return
+        
+        self.is_running = True
+        if self.capture_path:
+            # Ham kayıt açılamazsa okuma kayıtsız sürer
+            try:
+                self.pipeline.capture = CaptureWriter(self.capture_path, source=source.name)
+            except (OSError, ValueError) as e:
+                self.status_message.emit(f"Ham kayıt açılamadı, okuma kayıtsız sürüyor: {str(e)}")
         try:
-            # Zaman damgası ve veri kısmını ayır
-            if "->" in line:
-                parts = line.split("->", 1)
-                if len(parts) == 2:
-                    timestamp = parts[0].strip()
-                    data_part = parts[1].strip()
-                    
-                    # Veri tipini kontrol et
-                    if "ERPM:" in data_part:
-                        match = re.search(r'ERPM:\s*(-?\d+)', data_part)
-                        if match:
-                            erpm = int(match.group(1))
-                            self.emit_data("ERPM", erpm, timestamp)
-                    elif "RPM:" in data_part:
-                        match = re.search(r'RPM:\s*(-?\d+)', data_part)
-                        if match:
-                            rpm = int(match.group(1))
-                            self.emit_data("RPM", rpm, timestamp)
-                    elif "Hız" in data_part:
-                        match = re.search(r'Hız.*?:\s*(-?\d+\.?\d*)', data_part)
-                        if match:
-                            speed = float(match.group(1))
-                            self.emit_data("Speed", speed, timestamp)
-                    elif "Akım" in data_part:
-                        match = re.search(r'Akım.*?:\s*(-?\d+\.?\d*)', data_part)
-                        if match:
-                            current = float(match.group(1))
-                            self.emit_data("Current", current, timestamp)
-                    elif "Duty:" in data_part:
-                        match = re.search(r'Duty:\s*(-?\d+)', data_part)
-                        if match:
-                            duty = int(match.group(1))
-                            self.emit_data("Duty", duty, timestamp)
-                    elif "Gerilim" in data_part:
-                        match = re.search(r'Gerilim.*?:\s*(-?\d+\.?\d*)', data_part)
-                        if match:
-                            voltage = float(match.group(1))
-                            self.emit_data("Voltage", voltage, timestamp)
-                    elif "Güç" in data_part:
-                        match = re.search(r'Güç.*?:\s*(-?\d+\.?\d*)', data_part)
-                        if match:
-                            power = float(match.group(1))
-                            self.emit_data("Power", power, timestamp)
+            self.pipeline.run(self.emit_sample)
         except Exception as e:
-            # Parsing hatalarını logla
-            print(f"TCP Parse hatası: {e}, line: {line}")
+            self.is_running = False
+            self.error_occurred.emit(f"{self.label} okuma hatası: {str(e)}")
+            return
+        
+        self.is_running = False
+        if not self.stop_requested:
+            self.disconnected.emit()
+    
+    def mark_receipt(self, data):
+        """Okunan parçanın alım anı (gecikme ölçümü için)"""
+        self.receipt_time = latency_now()
+    
+    def emit_sample(self, sample):
+        self.emit_data(sample.data_type, sample.value, sample.timestamp)
     
     def emit_data(self, data_type, value, timestamp):
         """Veriyi ana thread'e gönder"""
@@ -203,171 +174,310 @@ class TCPThread(QThread):
             'timestamp': timestamp,
             'datetime': datetime.now()
         }
+        if latency_monitor.enabled:
+            latency_monitor.stamp_parsed(data, self.receipt_time)
         self.data_received.emit(data)
+        
+        for event in alarm_engine.evaluate(data_type, value, data['datetime'].timestamp()):
+            self.alarm_changed.emit(event)
     
     def stop(self):
-        """Thread'i durdur"""
+        """Thread'i durdur - bloklayan okuma kaynak kapatılarak çözülür"""
         self.is_running = False
-        if self.socket:
-            self.socket.close()
+        self.stop_requested = True
+        if self.pipeline:
+            self.pipeline.stop()
+
+class TCPThread(SourceThread):
+    """TCP socket bağlantısı için thread"""
+    label = "TCP"
+    
+    def __init__(self, host, port, capture_path=None):
+        super().__init__(capture_path)
+        self.host = host
+        self.port = port
+    
+    def create_source(self):
+        return TcpSource(self.host, self.port)
 
-class SerialThread(QThread):
+class SerialThread(SourceThread):
     """Seri port okuma thread'i"""
-    data_received = pyqtSignal(dict)
-    error_occurred = pyqtSignal(str)
+    label = "Seri port"
     
-    def __init__(self, port, baudrate=9600):
-        super().__init__()
+    def __init__(self, port, baudrate=9600, capture_path=None):
+        super().__init__(capture_path)
         self.port = port
         self.baudrate = baudrate
+    
+    def create_source(self):
+        return SerialSource(self.port, self.baudrate)
+
+class ReplayThread(QThread):
+    """Kaydedilmiş oturumu canlı veri yolu üzerinden oynatan thread"""
+    data_received = pyqtSignal(dict)
+    error_occurred = pyqtSignal(str)
+    progress_changed = pyqtSignal(float, float)  # (geçen süre, toplam süre) saniye
+    seeked = pyqtSignal(float)  # Atlanan konum (saniye)
+    replay_finished = pyqtSignal()
+    alarm_changed = pyqtSignal(dict)  # Yalnızca alarm başlangıç/bitişleri
+
+    def __init__(self, filename, speed=1.0):
+        super().__init__()
+        self.filename = filename
         self.is_running = False
-        self.serial_connection = None
-        
+        self.is_paused = False
+        self.clock = ReplayClock(speed)
+        self.pending_speed = None
+        self.seek_target = None
+        self.duration = 0.0
+
     def run(self):
+        self.is_running = True
         try:
-            self.serial_connection = serial.Serial(self.port, self.baudrate, timeout=1)
-            self.is_running = True
-            
-            buffer = ""
-            while self.is_running:
+            events = load_replay_events(self.filename)
+        except Exception as e:
+            self.is_running = False
+            self.error_occurred.emit(f"Kayıt okuma hatası: {str(e)}")
+            return
+
+        if not events:
+            self.is_running = False
+            self.error_occurred.emit("Kayıtta oynatılacak veri bulunamadı!")
+            return
+
+        event_times = [event.time for event in events]
+        session_start = event_times[0]
+        self.duration = event_times[-1] - session_start
+
+        index = 0
+        self.clock.anchor(session_start)
+        last_progress = 0.0
+
+        while self.is_running and index < len(events):
+            # Atlama isteği
+            if self.seek_target is not None:
+                target = session_start + self.seek_target
+                self.seek_target = None
+                index = seek_index(event_times, target)
+                self.clock.anchor(target)
+                self.seeked.emit(target - session_start)
+                continue
+
+            # Hız değişimi
+            if self.pending_speed is not None:
+                self.clock.set_speed(self.pending_speed, event_times[index])
+                self.pending_speed = None
+
+            # Duraklatma - devam edildiğinde saat yeniden çapalanır
+            if self.is_paused:
+                self.msleep(50)
+                self.clock.anchor(event_times[index])
+                continue
+
+            delay = self.clock.delay_until(event_times[index])
+            if delay > 0:
+                # Duraklatma/atlama isteklerine hızlı tepki için kısa aralıklarla bekle
+                self.msleep(int(min(delay, 0.05) * 1000) or 1)
+                continue
+
+            event = events[index]
+            data = {
+                'type': event.data_type,
+                'value': event.value,
+                'timestamp': event.timestamp,
+                'datetime': datetime.fromtimestamp(event.time)
+            }
+            if latency_monitor.enabled:
+                # Oynatmada alım anı, örneğin kayıttan okunduğu an kabul edilir
+                latency_monitor.stamp_parsed(data, latency_now())
+            self.data_received.emit(data)
+            for alarm in alarm_engine.evaluate(event.data_type, event.value, event.time):
+                self.alarm_changed.emit(alarm)
+            index += 1
+
+            # İlerleme bilgisini saniyede en fazla 10 kez gönder
+            now = time.monotonic()
+            if now - last_progress >= 0.1:
+                last_progress = now
+                self.progress_changed.emit(event.time - session_start, self.duration)
+
+        self.progress_changed.emit(event_times[min(index, len(events) - 1)] - session_start, self.duration)
+        self.is_running = False
+        self.replay_finished.emit()
+
+    def set_speed(self, speed):
+        """Oynatma hızını değiştir (0 = beklemesiz)"""
+        self.pending_speed = speed
+
+    def set_paused(self, paused):
+        """Oynatmayı duraklat / devam ettir"""
+        self.is_paused = paused
+
+    def seek(self, position):
+        """Oturum başından itibaren verilen saniyeye atla"""
+        self.seek_target = max(0.0, position)
+
+    def stop(self):
+        """Thread'i durdur"""
+        self.is_running = False
+
+class ArchiveLoaderThread(QThread):
+    """Arşiv deposundan görünür zaman aralığını arka planda yükleyen thread"""
+    data_loaded = pyqtSignal(str, object, object, int)  # (kanal, zamanlar, değerler, seviye)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+        self.requests = queue.Queue()
+        self.is_running = False
+
+    def request(self, channel, t0, t1, max_points):
+        """Kanal için yeni aralık sorgusu ekle"""
+        self.requests.put((channel, t0, t1, max_points))
+
+    def run(self):
+        self.is_running = True
+        while self.is_running:
+            try:
+                item = self.requests.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            # Kaydırma/zoom sırasında biriken eski istekleri at, kanal başına sonuncusu yüklenir
+            latest = {}
+            while item is not None:
+                latest[item[0]] = item
                 try:
-                    if self.serial_connection.in_waiting > 0:
-                        data = self.serial_connection.read(self.serial_connection.in_waiting).decode('utf-8', errors='ignore')
-                        buffer += data
-                        
-                        # Satır satır işle
-                        while '\n' in buffer:
-                            line, buffer = buffer.split('\n', 1)
-                            line = line.strip()
-                            if line:
-                                self.parse_data(line)
-                    else:
-                        # Biraz bekle
-                        self.msleep(10)
-                        
+                    item = self.requests.get_nowait()
+                except queue.Empty:
+                    break
+            if item is None:
+                break
+
+            for channel, t0, t1, max_points in latest.values():
+                try:
+                    times, values, level = self.store.query(channel, t0, t1, max_points)
                 except Exception as e:
-                    self.error_occurred.emit(f"Seri port okuma hatası: {str(e)}")
+                    self.error_occurred.emit(f"Arşiv okuma hatası ({channel}): {e}")
+                    continue
+                self.data_loaded.emit(channel, times, values, level)
+
+    def stop(self):
+        """Thread'i durdur"""
+        self.is_running = False
+        self.requests.put(None)
+
+class CompareLoaderThread(QThread):
+    """Karşılaştırılan oturumların görünür aralığını ve fark eğrilerini arka planda yükleyen thread"""
+    curve_loaded = pyqtSignal(int, str, object, object)  # (oturum sırası, kanal, eksen, değerler)
+    delta_loaded = pyqtSignal(int, object, object)  # (oturum sırası, ızgara, fark)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.requests = queue.Queue()
+        self.is_running = False
+
+    def request(self, sessions, axis, x0, x1, max_points, delta_channel):
+        """Tüm oturumlar için yeni aralık sorgusu ekle"""
+        self.requests.put((list(sessions), axis, x0, x1, max_points, delta_channel))
+
+    def run(self):
+        self.is_running = True
+        while self.is_running:
+            try:
+                item = self.requests.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            # Kaydırma/zoom sırasında biriken eski istekleri at, yalnızca sonuncusu yüklenir
+            latest = item
+            while item is not None:
+                latest = item
+                try:
+                    item = self.requests.get_nowait()
+                except queue.Empty:
                     break
-                        
-        except Exception as e:
-            self.error_occurred.emit(f"Seri port bağlantı hatası: {str(e)}")
-        finally:
-            if self.serial_connection and self.serial_connection.is_open:
-                self.serial_connection.close()
+            if item is None:
+                break
+
+            sessions, axis, x0, x1, max_points, delta_channel = latest
+            try:
+                for index, session in enumerate(sessions):
+                    for channel in COMPARE_CHANNELS:
+                        x, values, _ = session.query(channel, x0, x1, axis, max_points)
+                        self.curve_loaded.emit(index, channel, x, values)
+                for index, session in enumerate(sessions[1:], start=1):
+                    grid, delta = delta_trace(sessions[0], session, delta_channel, axis,
+                                              x0, x1, max_points // 2)
+                    self.delta_loaded.emit(index, grid, delta)
+            except Exception as e:
+                self.error_occurred.emit(f"Karşılaştırma okuma hatası: {e}")
+
+    def stop(self):
+        """Thread'i durdur"""
+        self.is_running = False
+        self.requests.put(None)
+
+class PortWatcherThread(QThread):
+    """
+    Seri port takılma / çıkarılmalarını arka planda izler
+
+    Yalnızca değişiklikler bildirilir; ilk tarama ve "Portları Yenile" ile
+    istenen taramalar full=True olarak işaretlenir.
+    """
+    ports_changed = pyqtSignal(list, list, bool)  # (eklenen PortEntry'ler, çıkarılan cihazlar, tam tarama)
+    error_occurred = pyqtSignal(str)  # Aynı hata her yoklamada tekrar bildirilmez
     
-    def parse_data(self, line):
-        """Arduino'dan gelen veriyi parse et"""
-        try:
-            # Debug için tüm gelen veriyi yazdır
-            print(f"Seri port verisi: {line}")
-            
-            # Zaman damgası ve veri kısmını ayır
-            if "->" in line:
-                parts = line.split("->", 1)
-                if len(parts) == 2:
-                    timestamp = parts[0].strip()
-                    data_part = parts[1].strip()
-                    
-                    # Veri tipini kontrol et
-                    if "ERPM:" in data_part:
-                        match = re.search(r'ERPM:\s*(-?\d+)', data_part)
-                        if match:
-                            erpm = int(match.group(1))
-                            self.emit_data("ERPM", erpm, timestamp)
-                    elif "RPM:" in data_part:
-                        match = re.search(r'RPM:\s*(-?\d+)', data_part)
-                        if match:
-                            rpm = int(match.group(1))
-                            self.emit_data("RPM", rpm, timestamp)
-                    elif "Hız" in data_part:
-                        match = re.search(r'Hız.*?:\s*(-?\d+\.?\d*)', data_part)
-                        if match:
-                            speed = float(match.group(1))
-                            self.emit_data("Speed", speed, timestamp)
-                    elif "Akım" in data_part:
-                        match = re.search(r'Akım.*?:\s*(-?\d+\.?\d*)', data_part)
-                        if match:
-                            current = float(match.group(1))
-                            self.emit_data("Current", current, timestamp)
-                    elif "Duty:" in data_part:
-                        match = re.search(r'Duty:\s*(-?\d+)', data_part)
-                        if match:
-                            duty = int(match.group(1))
-                            self.emit_data("Duty", duty, timestamp)
-                    elif "Gerilim" in data_part:
-                        match = re.search(r'Gerilim.*?:\s*(-?\d+\.?\d*)', data_part)
-                        if match:
-                            voltage = float(match.group(1))
-                            self.emit_data("Voltage", voltage, timestamp)
-                    elif "Güç" in data_part:
-                        match = re.search(r'Güç.*?:\s*(-?\d+\.?\d*)', data_part)
-                        if match:
-                            power = float(match.group(1))
-                            self.emit_data("Power", power, timestamp)
-            else:
-                # Arduino'nun direkt veri göndermesi durumu (format olmadan)
-                # Örnek: ERPM:-6 RPM:0 Hız:0.00 Akım:-0.20 Duty:0 Gerilim:19.47 Güç:-3.89
-                # Bu durumu da kontrol et
-                if any(keyword in line for keyword in ["ERPM", "RPM", "Hız", "Akım", "Duty", "Gerilim", "Güç"]):
-                    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                    
-                    # Her parametreyi ayrı ayrı parse et
-                    erpm_match = re.search(r'ERPM:\s*(-?\d+)', line)
-                    if erpm_match:
-                        self.emit_data("ERPM", int(erpm_match.group(1)), timestamp)
-                    
-                    rpm_match = re.search(r'RPM:\s*(-?\d+)', line)
-                    if rpm_match:
-                        self.emit_data("RPM", int(rpm_match.group(1)), timestamp)
-                    
-                    speed_match = re.search(r'Hız.*?:\s*(-?\d+\.?\d*)', line)
-                    if speed_match:
-                        self.emit_data("Speed", float(speed_match.group(1)), timestamp)
-                    
-                    current_match = re.search(r'Akım.*?:\s*(-?\d+\.?\d*)', line)
-                    if current_match:
-                        self.emit_data("Current", float(current_match.group(1)), timestamp)
-                    
-                    duty_match = re.search(r'Duty:\s*(-?\d+)', line)
-                    if duty_match:
-                        self.emit_data("Duty", int(duty_match.group(1)), timestamp)
-                    
-                    voltage_match = re.search(r'Gerilim.*?:\s*(-?\d+\.?\d*)', line)
-                    if voltage_match:
-                        self.emit_data("Voltage", float(voltage_match.group(1)), timestamp)
-                    
-                    power_match = re.search(r'Güç.*?:\s*(-?\d+\.?\d*)', line)
-                    if power_match:
-                        self.emit_data("Power", float(power_match.group(1)), timestamp)
-                        
-        except Exception as e:
-            # Parsing hatalarını logla
-            print(f"Seri Parse hatası: {e}, line: {line}")
+    def __init__(self, interval=DEFAULT_POLL_SECONDS):
+        super().__init__()
+        self.watcher = PortWatcher(virtual_devices=[DEFAULT_PTY_LINK])
+        self.interval = interval
+        self.wakeup = threading.Event()
+        self.force = True
+        self.is_running = False
     
-    def emit_data(self, data_type, value, timestamp):
-        """Veriyi ana thread'e gönder"""
-        data = {
-            'type': data_type,
-            'value': value,
-            'timestamp': timestamp,
-            'datetime': datetime.now()
-        }
-        self.data_received.emit(data)
+    def run(self):
+        self.is_running = True
+        last_error = None
+        while self.is_running:
+            full, self.force = self.force, False
+            try:
+                added, removed = self.watcher.poll(force=full)
+                last_error = None
+            except Exception as e:
+                if str(e) != last_error:
+                    last_error = str(e)
+                    self.error_occurred.emit(f"Port tarama hatası: {e}")
+                added, removed = [], []
+            if added or removed or full:
+                self.ports_changed.emit(added, removed, full)
+            self.wakeup.wait(self.interval)
+            self.wakeup.clear()
+    
+    def rescan(self):
+        """Beklemeden tam tarama yap"""
+        self.force = True
+        self.wakeup.set()
     
     def stop(self):
-        """Thread'i durdur"""
         self.is_running = False
-        if self.serial_connection and self.serial_connection.is_open:
-            self.serial_connection.close()
+        self.wakeup.set()
 
 class SpeedDisplayWidget(QWidget):
     """Hız gösterimi için özel widget"""
     def __init__(self):
         super().__init__()
         self.speed_value = 0.0
-        self.speed_frame_path = os.path.join('images', 'hiz.png')
         self.setFixedSize(400, 280)  # Çerçeve küçültüldü
         
+        # Çerçeve resmi bir kez çözülüp widget boyutuna ölçeklenir (her çizimde değil)
+        frame_pixmap = load_pixmap('hiz.png')
+        self.frame_pixmap = None
+        if frame_pixmap is not None:
+            self.frame_pixmap = frame_pixmap.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        
     def set_speed(self, speed):
         """Hız değerini güncelle"""
         self.speed_value = speed
@@ -378,20 +488,11 @@ class SpeedDisplayWidget(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        # Çerçeve resmini çiz
-        if os.path.exists(self.speed_frame_path):
-            frame_pixmap = QPixmap(self.speed_frame_path)
-            if not frame_pixmap.isNull():
-                # Resmi widget boyutuna ölçekle
-                scaled_pixmap = frame_pixmap.scaled(
-                    self.size(), 
-                    Qt.KeepAspectRatio, 
-                    Qt.SmoothTransformation
-                )
-                # Resmi ortala
-                x_offset = (self.width() - scaled_pixmap.width()) // 2
-                y_offset = (self.height() - scaled_pixmap.height()) // 2
-                painter.drawPixmap(x_offset, y_offset, scaled_pixmap)
+        # Çerçeve resmini çiz (ortalanmış)
+        if self.frame_pixmap is not None:
+            x_offset = (self.width() - self.frame_pixmap.width()) // 2
+            y_offset = (self.height() - self.frame_pixmap.height()) // 2
+            painter.drawPixmap(x_offset, y_offset, self.frame_pixmap)
         
         # Hız değerini çiz
         font = QFont()
@@ -411,9 +512,22 @@ class SpeedDisplayWidget(QWidget):
 
 class DataAnalysisDialog(QDialog):
     """Veri analizi penceresi"""
-    def __init__(self, telemetry_data, parent=None):
+    def __init__(self, telemetry_data, session_stats=None, segment_history=None, parent=None):
         super().__init__(parent)
         self.telemetry_data = telemetry_data
+        
+        # Turlar tüm oturumdan bulunur; geçmiş verilmezse görüntülenen veri kullanılır
+        if segment_history is None:
+            segment_history = SegmentHistory()
+            segment_history.rebuild(telemetry_data)
+        self.segment_history = segment_history
+        
+        # Oturum istatistikleri verilmezse görüntülenen veriden oluşturulur
+        if session_stats is None:
+            session_stats = SessionStats()
+            session_stats.rebuild(telemetry_data)
+        self.session_stats = session_stats
+        self.segment_index = None
         self.setWindowTitle("📊 Telemetri Veri Analizi")
         self.setGeometry(200, 200, 1000, 700)
         self.init_ui()
@@ -436,6 +550,9 @@ class DataAnalysisDialog(QDialog):
         # Özet sekmesi
         self.create_summary_tab()
         
+        # Tur / stint sekmesi
+        self.create_segments_tab()
+        
         # Butonlar
         button_layout = QHBoxLayout()
         
@@ -498,34 +615,108 @@ class DataAnalysisDialog(QDialog):
         layout.addWidget(self.summary_text)
         
         self.tab_widget.addTab(summary_widget, "📋 Özet")
+    
+    def create_segments_tab(self):
+        """Tur / stint karşılaştırma sekmesi"""
+        segments_widget = QWidget()
+        layout = QVBoxLayout(segments_widget)
+        
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Bölme:"))
+        self.segment_mode_combo = QComboBox()
+        self.segment_mode_combo.addItems(["Pist uzunluğu (tur)", "Duraklar (stint)"])
+        controls.addWidget(self.segment_mode_combo)
+        
+        controls.addWidget(QLabel("Pist (km):"))
+        self.track_length_input = QDoubleSpinBox()
+        self.track_length_input.setRange(0.01, 100.0)
+        self.track_length_input.setDecimals(3)
+        self.track_length_input.setSingleStep(0.1)
+        self.track_length_input.setValue(1.0)
+        controls.addWidget(self.track_length_input)
+        
+        controls.addWidget(QLabel("Min. durak (s):"))
+        self.min_stop_input = QSpinBox()
+        self.min_stop_input.setRange(1, 3600)
+        self.min_stop_input.setValue(int(DEFAULT_MIN_STOP))
+        controls.addWidget(self.min_stop_input)
+        
+        detect_btn = QPushButton("🔍 Segmentleri Bul")
+        detect_btn.clicked.connect(self.detect_segments)
+        controls.addWidget(detect_btn)
+        controls.addStretch()
+        layout.addLayout(controls)
+        
+        self.segments_table = QTableWidget()
+        layout.addWidget(self.segments_table)
+        
+        self.tab_widget.addTab(segments_widget, "🏁 Turlar")
+    
+    def detect_segments(self):
+        """Segment indeksini bir kez oluştur, tabloyu indeksten doldur"""
+        track_length = None
+        if self.segment_mode_combo.currentIndex() == 0:
+            track_length = self.track_length_input.value()
+        
+        self.segment_index = build_segment_index(self.segment_history.as_telemetry_data(), track_length,
+                                                 self.min_stop_input.value())
+        self.fill_segments_table()
+    
+    def fill_segments_table(self):
+        """Tur karşılaştırma tablosunu doldur"""
+        headers = ['#', 'Başlangıç (dk)', 'Süre (s)', 'Δ En İyi (s)', 'Mesafe (km)',
+                   'Enerji (Wh)', 'Wh/km', 'Maks. Akım (A)', 'Ort. Hız (km/h)']
+        self.segments_table.setColumnCount(len(headers))
+        self.segments_table.setHorizontalHeaderLabels(headers)
+        
+        rows = self.segment_index.records()
+        self.segments_table.setRowCount(len(rows))
+        if not rows:
+            return
+        
+        session_start = rows[0]['start_time']
+        best = self.segment_index.best()
+        for row, segment in enumerate(rows):
+            delta = segment['delta_best_s']
+            cells = [
+                str(segment['segment']),
+                f"{(segment['start_time'] - session_start) / 60.0:.2f}",
+                f"{segment['duration_s']:.1f}",
+                f"{delta:+.1f}" if delta is not None else "eksik",
+                f"{segment['distance_km']:.3f}",
+                f"{segment['energy_wh']:.2f}",
+                f"{segment['wh_per_km']:.1f}" if segment['wh_per_km'] is not None else "-",
+                f"{segment['max_current']:.2f}",
+                f"{segment['avg_speed']:.1f}",
+            ]
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if row == best:
+                    item.setForeground(QBrush(Qt.darkGreen))
+                self.segments_table.setItem(row, column, item)
+        
+        self.segments_table.resizeColumnsToContents()
         
     def calculate_statistics(self):
         """İstatistikleri hesapla ve tabloya ekle"""
         # Tablo başlıklarını ayarla
-        headers = ['Veri Tipi', 'Ortalama', 'Minimum', 'Maksimum', 'Std. Sapma', 'Veri Sayısı']
+        headers = ['Veri Tipi', 'Ortalama', 'Minimum', 'Maksimum', 'Std. Sapma',
+                   'Medyan', 'p95', 'Veri Sayısı']
         self.stats_table.setColumnCount(len(headers))
         self.stats_table.setHorizontalHeaderLabels(headers)
         
         # Analiz edilecek veri tipleri
-        data_types = ['Speed', 'Current', 'Voltage', 'Power', 'RPM', 'ERPM', 'Duty']
+        data_types = ['Speed', 'Current', 'Voltage', 'Power', 'RPM', 'ERPM', 'Duty',
+                      'Distance', 'Energy', 'WhPerKm', 'H2Flow', 'H2Used', 'KmPerM3']
         valid_data = []
         
+        # Toplayıcılar veri geldikçe güncellendiği için okuma O(1)
         for data_type in data_types:
-            if (data_type in self.telemetry_data and 
-                self.telemetry_data[data_type]['values']):
-                
-                values = self.telemetry_data[data_type]['values']
-                if values:
-                    import numpy as np
-                    stats = {
-                        'type': data_type,
-                        'mean': np.mean(values),
-                        'min': np.min(values),
-                        'max': np.max(values),
-                        'std': np.std(values),
-                        'count': len(values)
-                    }
-                    valid_data.append(stats)
+            running = self.session_stats.get(data_type)
+            if running is not None and running.count:
+                stats = running.as_dict()
+                stats['type'] = data_type
+                valid_data.append(stats)
         
         # Tabloyu doldur
         self.stats_table.setRowCount(len(valid_data))
@@ -536,7 +727,9 @@ class DataAnalysisDialog(QDialog):
             self.stats_table.setItem(row, 2, QTableWidgetItem(f"{stats['min']:.2f}"))
             self.stats_table.setItem(row, 3, QTableWidgetItem(f"{stats['max']:.2f}"))
             self.stats_table.setItem(row, 4, QTableWidgetItem(f"{stats['std']:.2f}"))
-            self.stats_table.setItem(row, 5, QTableWidgetItem(str(stats['count'])))
+            self.stats_table.setItem(row, 5, QTableWidgetItem(f"{stats['median']:.2f}"))
+            self.stats_table.setItem(row, 6, QTableWidgetItem(f"{stats['p95']:.2f}"))
+            self.stats_table.setItem(row, 7, QTableWidgetItem(str(stats['count'])))
         
         # Sütun genişliklerini ayarla
         self.stats_table.resizeColumnsToContents()
@@ -563,6 +756,8 @@ class DataAnalysisDialog(QDialog):
             summary += f"  • Minimum: {stats['min']:.2f}\n"
             summary += f"  • Maksimum: {stats['max']:.2f}\n"
             summary += f"  • Standart Sapma: {stats['std']:.2f}\n"
+            summary += f"  • Medyan: {stats['median']:.2f}\n"
+            summary += f"  • 95. Yüzdelik: {stats['p95']:.2f}\n"
             summary += f"  • Veri Sayısı: {stats['count']}\n\n"
         
         # Öne çıkan bulgular
@@ -606,8 +801,16 @@ class DataAnalysisDialog(QDialog):
                 self.canvas.draw()
                 return
             
+            # Güç-hız ilişkisi: iki kanal ortak ızgaraya hizalanarak eşlenir
+            grid, aligned = align_channels(self.telemetry_data, ['Speed', 'Power'])
+            pairs = None
+            if 'Speed' in aligned and 'Power' in aligned:
+                mask = ~np.isnan(aligned['Speed']) & ~np.isnan(aligned['Power'])
+                if np.any(mask):
+                    pairs = (aligned['Speed'][mask], aligned['Power'][mask])
+            
             # Subplot düzenini hesapla
-            n_plots = len(available_data)
+            n_plots = len(available_data) + (1 if pairs is not None else 0)
             if n_plots == 1:
                 rows, cols = 1, 1
             elif n_plots == 2:
@@ -625,15 +828,25 @@ class DataAnalysisDialog(QDialog):
                 values = self.telemetry_data[data_type]['values']
                 
                 if times:
-                    # Relative time'a çevir
-                    relative_times = [(t - times[0]) for t in times]
-                    ax.plot(relative_times, values, 'o-', markersize=2, linewidth=1)
+                    # Relative time'a çevir, piksel sütunu başına min/max örneğe indir
+                    relative_times = np.asarray(times, dtype=np.float64) - times[0]
+                    values = np.asarray(values, dtype=np.float64)
+                    keep = decimate_min_max(relative_times, values, panel_width_px(self.figure, cols))
+                    ax.plot(relative_times[keep], values[keep], linewidth=1)
                 
                 ax.set_title(f'{data_type}')
                 ax.set_xlabel('Zaman (saniye)')
                 ax.grid(True, alpha=0.3)
                 ax.tick_params(axis='x', rotation=45)
             
+            if pairs is not None:
+                ax = self.figure.add_subplot(rows, cols, len(available_data) + 1)
+                ax.scatter(pairs[0], pairs[1], s=2, alpha=0.4)
+                ax.set_title('Power - Speed')
+                ax.set_xlabel('Hız (km/h)')
+                ax.set_ylabel('Güç (W)')
+                ax.grid(True, alpha=0.3)
+            
             self.figure.suptitle('Telemetri Veri Analizi', fontsize=16, fontweight='bold')
             self.figure.tight_layout()
             self.canvas.draw()
@@ -659,6 +872,359 @@ class DataAnalysisDialog(QDialog):
             except Exception as e:
                 QMessageBox.critical(self, "Hata", f"Rapor kaydetme hatası:\n{str(e)}")
 
+class LatencyStatsDialog(QDialog):
+    """Gecikme ve kare hızı istatistikleri penceresi"""
+    def __init__(self, monitor, parent=None):
+        super().__init__(parent)
+        self.monitor = monitor
+        self.setWindowTitle("⏱️ Gecikme İstatistikleri")
+        self.setGeometry(250, 250, 700, 320)
+        
+        # Pencere açıkken ölçüm aktif olmalı, kapanınca önceki duruma dönülür
+        self.was_enabled = monitor.enabled
+        monitor.set_enabled(True)
+        
+        layout = QVBoxLayout(self)
+        
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+        
+        self.stats_table = QTableWidget()
+        headers = ['Aşama', 'Örnek', 'p50 (ms)', 'p95 (ms)', 'p99 (ms)', 'Maks (ms)']
+        self.stats_table.setColumnCount(len(headers))
+        self.stats_table.setHorizontalHeaderLabels(headers)
+        layout.addWidget(self.stats_table)
+        
+        button_layout = QHBoxLayout()
+        
+        reset_btn = QPushButton("🗑️ Sıfırla")
+        reset_btn.clicked.connect(self.reset_stats)
+        button_layout.addWidget(reset_btn)
+        
+        close_btn = QPushButton("Kapat")
+        close_btn.clicked.connect(self.close)
+        button_layout.addWidget(close_btn)
+        
+        button_layout.addStretch()
+        layout.addLayout(button_layout)
+        
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh_stats)
+        self.refresh_timer.start(1000)
+        self.finished.connect(self.handle_finished)
+        self.refresh_stats()
+    
+    def refresh_stats(self):
+        """Tabloyu güncel ölçümlerle doldur"""
+        snapshot = self.monitor.snapshot()
+        self.summary_label.setText(f"🎞️ Çizim FPS: {snapshot['fps']:.1f}    "
+                                   f"📥 Örnek/s: {snapshot['sample_rate']:.0f}    "
+                                   f"📦 Kuyruk derinliği: {snapshot['queue_depth']}")
+        
+        self.stats_table.setRowCount(len(snapshot['stages']))
+        for row, stage in enumerate(snapshot['stages']):
+            self.stats_table.setItem(row, 0, QTableWidgetItem(stage['title']))
+            self.stats_table.setItem(row, 1, QTableWidgetItem(str(stage['count'])))
+            for column, key in enumerate(['p50', 'p95', 'p99', 'max'], start=2):
+                value = stage[key]
+                text = f"{value:.3f}" if value is not None else "-"
+                self.stats_table.setItem(row, column, QTableWidgetItem(text))
+        self.stats_table.resizeColumnsToContents()
+    
+    def reset_stats(self):
+        """Ölçümleri sıfırla"""
+        self.monitor.reset()
+        self.refresh_stats()
+    
+    def handle_finished(self):
+        """Pencere kapanınca ölçümü önceki durumuna döndür"""
+        self.refresh_timer.stop()
+        self.monitor.set_enabled(self.was_enabled)
+
+class SessionCompareDialog(QDialog):
+    """Birden çok oturumu zaman veya mesafe ekseninde üst üste gösteren pencere"""
+    
+    SESSION_COLORS = ['#FF6B35', '#00E5FF', '#76FF03', '#FF4081', '#FFD700',
+                      '#B388FF', '#FFFFFF', '#FF9800']
+    
+    def __init__(self, cache_bytes, parent=None):
+        super().__init__(parent)
+        self.cache_bytes = cache_bytes
+        self.sessions = []
+        self.curves = {}
+        self.delta_curves = {}
+        self.setWindowTitle("🆚 Oturum Karşılaştırma")
+        self.setGeometry(150, 150, 1300, 850)
+        
+        layout = QVBoxLayout(self)
+        
+        controls = QHBoxLayout()
+        add_btn = QPushButton("➕ Oturum Ekle")
+        add_btn.clicked.connect(self.add_sessions)
+        controls.addWidget(add_btn)
+        
+        clear_btn = QPushButton("🗑️ Temizle")
+        clear_btn.clicked.connect(self.clear_sessions)
+        controls.addWidget(clear_btn)
+        
+        controls.addWidget(QLabel("Eksen:"))
+        self.axis_combo = QComboBox()
+        self.axis_combo.addItem("Geçen süre", 'time')
+        self.axis_combo.addItem("Mesafe (konum)", 'distance')
+        self.axis_combo.currentIndexChanged.connect(self.change_axis)
+        controls.addWidget(self.axis_combo)
+        
+        controls.addWidget(QLabel("Fark:"))
+        self.delta_combo = QComboBox()
+        for channel in COMPARE_CHANNELS:
+            self.delta_combo.addItem(channel, channel)
+        self.delta_combo.currentIndexChanged.connect(self.schedule_query)
+        controls.addWidget(self.delta_combo)
+        
+        controls.addStretch()
+        layout.addLayout(controls)
+        
+        self.sessions_label = QLabel("Karşılaştırmak için oturum ekleyin (ilk oturum referanstır)")
+        self.sessions_label.setWordWrap(True)
+        layout.addWidget(self.sessions_label)
+        
+        self.graph_widget = pg.GraphicsLayoutWidget()
+        self.graph_widget.setBackground('#2b2b2b')
+        layout.addWidget(self.graph_widget)
+        
+        # 2x2 kanal grafikleri + altta tam genişlikte fark grafiği, x eksenleri bağlı
+        self.plots = {}
+        for i, channel in enumerate(COMPARE_CHANNELS):
+            if i % 2 == 0 and i > 0:
+                self.graph_widget.nextRow()
+            plot = self.graph_widget.addPlot(title=channel)
+            plot.showGrid(x=True, y=True, alpha=0.3)
+            plot.getViewBox().setAutoVisible(y=True)
+            if self.plots:
+                plot.setXLink(self.plots[COMPARE_CHANNELS[0]])
+            else:
+                plot.addLegend(offset=(-10, 10))
+            self.plots[channel] = plot
+        
+        self.graph_widget.nextRow()
+        self.delta_plot = self.graph_widget.addPlot(title="Fark (oturum - referans)", colspan=2)
+        self.delta_plot.showGrid(x=True, y=True, alpha=0.3)
+        self.delta_plot.getViewBox().setAutoVisible(y=True)
+        self.delta_plot.setXLink(self.plots[COMPARE_CHANNELS[0]])
+        self.delta_plot.addLine(y=0, pen=pg.mkPen('#888888', style=Qt.DashLine))
+        self.update_axis_labels()
+        
+        # Görünür aralık değişikliklerini toplayıp tek seferde sorgula
+        self.query_timer = QTimer(self)
+        self.query_timer.setSingleShot(True)
+        self.query_timer.setInterval(50)
+        self.query_timer.timeout.connect(self.flush_query)
+        self.plots[COMPARE_CHANNELS[0]].getViewBox().sigXRangeChanged.connect(self.schedule_query)
+        
+        self.loader = CompareLoaderThread()
+        self.loader.curve_loaded.connect(self.apply_curve)
+        self.loader.delta_loaded.connect(self.apply_delta)
+        self.loader.error_occurred.connect(self.show_load_error)
+        self.loader.start()
+        self.finished.connect(self.handle_finished)
+    
+    @property
+    def axis(self):
+        return self.axis_combo.currentData()
+    
+    def add_sessions(self):
+        """Oturum seç - JSON dosyaları bir kez depoya dönüştürülür, ham veri belleğe alınmaz"""
+        filenames, _ = QFileDialog.getOpenFileNames(
+            self, "Karşılaştırılacak Oturumlar", "",
+            f"JSON files (*.json);;Oturum deposu ({MANIFEST_NAME});;All files (*.*)"
+        )
+        if not filenames:
+            return
+        
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            for filename in filenames:
+                try:
+                    store = SessionStore(ensure_session_store(filename), cache_bytes=self.cache_bytes)
+                    if store.start_time is None:
+                        raise ValueError("Oturumda veri yok")
+                    self.add_session(CompareSession(store))
+                except Exception as e:
+                    QMessageBox.warning(self, "Uyarı", f"{os.path.basename(filename)} açılamadı:\n{str(e)}")
+        finally:
+            QApplication.restoreOverrideCursor()
+        self.reset_view()
+    
+    def add_session(self, session):
+        """Oturumu ekle ve eğrilerini oluştur"""
+        index = len(self.sessions)
+        color = self.SESSION_COLORS[index % len(self.SESSION_COLORS)]
+        self.sessions.append(session)
+        for channel, plot in self.plots.items():
+            name = session.label if channel == COMPARE_CHANNELS[0] else None
+            self.curves[(index, channel)] = plot.plot(pen=pg.mkPen(color, width=1.5), name=name)
+        if index > 0:
+            self.delta_curves[index] = self.delta_plot.plot(pen=pg.mkPen(color, width=1.5))
+        self.update_sessions_label()
+    
+    def clear_sessions(self):
+        """Tüm oturumları kaldır"""
+        for (_, channel), curve in self.curves.items():
+            self.plots[channel].removeItem(curve)
+        for curve in self.delta_curves.values():
+            self.delta_plot.removeItem(curve)
+        legend = self.plots[COMPARE_CHANNELS[0]].legend
+        if legend is not None:
+            legend.clear()
+        self.sessions = []
+        self.curves = {}
+        self.delta_curves = {}
+        self.update_sessions_label()
+    
+    def update_sessions_label(self):
+        if not self.sessions:
+            self.sessions_label.setText("Karşılaştırmak için oturum ekleyin (ilk oturum referanstır)")
+            return
+        parts = [f"{'⭐ ' if i == 0 else ''}{session.label} ({session.duration_min:.1f} dk)"
+                 for i, session in enumerate(self.sessions)]
+        self.sessions_label.setText("  |  ".join(parts))
+    
+    def show_load_error(self, message):
+        """Arka plan okuma hatasını oturum satırının altında göster"""
+        self.update_sessions_label()
+        self.sessions_label.setText(f"{self.sessions_label.text()}\n⚠️ {message}")
+    
+    def change_axis(self):
+        """Eksen değişince fark seçeneklerini ve görünümü güncelle"""
+        has_delta_time = self.delta_combo.findData(DELTA_TIME) >= 0
+        if self.axis == 'distance' and not has_delta_time:
+            self.delta_combo.addItem("Zaman farkı (s)", DELTA_TIME)
+        elif self.axis != 'distance' and has_delta_time:
+            self.delta_combo.removeItem(self.delta_combo.findData(DELTA_TIME))
+        self.update_axis_labels()
+        self.reset_view()
+    
+    def update_axis_labels(self):
+        label = AXES[self.axis]
+        for plot in list(self.plots.values()) + [self.delta_plot]:
+            plot.setLabel('bottom', label)
+    
+    def reset_view(self):
+        """Tüm oturumları kapsayacak şekilde x aralığını ayarla"""
+        if not self.sessions:
+            return
+        x_max = max(session.extent(self.axis)[1] for session in self.sessions)
+        self.plots[COMPARE_CHANNELS[0]].setXRange(0, x_max or 1.0, padding=0.02)
+        self.schedule_query()
+    
+    def schedule_query(self, *args):
+        """Görünür aralık değiştiğinde sorguyu kısa bir gecikmeyle planla"""
+        if self.sessions:
+            self.query_timer.start()
+    
+    def flush_query(self):
+        """Görünür aralığı tüm oturumlar için yükleyiciye gönder"""
+        vb = self.plots[COMPARE_CHANNELS[0]].getViewBox()
+        x0, x1 = vb.viewRange()[0]
+        # Piksel sütunu başına bir min/max çifti yeterli
+        max_points = max(500, int(vb.width()) * 2)
+        self.loader.request(self.sessions, self.axis, max(0.0, x0), x1, max_points,
+                            self.delta_combo.currentData())
+    
+    def apply_curve(self, index, channel, x, values):
+        curve = self.curves.get((index, channel))
+        if curve is not None:
+            curve.setData(x, values)
+    
+    def apply_delta(self, index, grid, delta):
+        curve = self.delta_curves.get(index)
+        if curve is not None:
+            curve.setData(grid, delta, connect='finite')
+    
+    def handle_finished(self):
+        self.loader.stop()
+        self.loader.wait()
+
+
+class SessionBrowserDialog(QDialog):
+    """Bir klasördeki oturumları özet indeksleri üzerinden listeleyen pencere"""
+    
+    COLUMNS = [('file', 'Dosya'), ('start', 'Başlangıç'), ('duration_min', 'Süre (dk)'),
+               ('distance_km', 'Mesafe (km)'), ('energy_wh', 'Enerji (Wh)'), ('wh_per_km', 'Wh/km'),
+               ('avg_speed', 'Ort. Hız'), ('max_speed', 'Maks. Hız'), ('max_current', 'Maks. Akım'),
+               ('max_power', 'Maks. Güç')]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.selected_path = None
+        self.setWindowTitle("📚 Oturumlar")
+        self.setGeometry(200, 200, 1100, 600)
+        
+        layout = QVBoxLayout(self)
+        
+        controls = QHBoxLayout()
+        folder_btn = QPushButton("📁 Klasör Seç")
+        folder_btn.clicked.connect(self.choose_folder)
+        controls.addWidget(folder_btn)
+        self.folder_label = QLabel("Klasör seçilmedi")
+        controls.addWidget(self.folder_label)
+        controls.addStretch()
+        layout.addLayout(controls)
+        
+        self.table = QTableWidget()
+        self.table.setColumnCount(len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels([title for _, title in self.COLUMNS])
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.cellDoubleClicked.connect(self.open_row)
+        layout.addWidget(self.table)
+        
+        self.status_label = QLabel("Çift tıklanan oturum ana pencereye yüklenir")
+        layout.addWidget(self.status_label)
+    
+    def choose_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Oturum Klasörü")
+        if folder:
+            self.load_folder(folder)
+    
+    def load_folder(self, folder):
+        """Klasördeki oturumları indekslerinden listele, bayat indeksleri yeniden oluştur"""
+        self.folder_label.setText(folder)
+        start = time.perf_counter()
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            sources = [path for path in find_sessions([folder]) if path.endswith('.json')]
+            rows, rebuilt = collect_rows(sources, sort_key='start', descending=True)
+        finally:
+            QApplication.restoreOverrideCursor()
+        
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(rows))
+        for row_index, row in enumerate(rows):
+            for column, (key, _) in enumerate(self.COLUMNS):
+                value = row.get(key)
+                item = QTableWidgetItem()
+                if isinstance(value, float):
+                    # Sayısal sıralama için değer, gösterim için yuvarlanmış metin
+                    item.setData(Qt.DisplayRole, round(value, 2))
+                elif key == 'file' and 'error' in row:
+                    item.setText(f"❌ {value}: {row['error']}")
+                else:
+                    item.setText('' if value is None else str(value))
+                item.setData(Qt.UserRole, row['path'])
+                self.table.setItem(row_index, column, item)
+        self.table.setSortingEnabled(True)
+        self.table.resizeColumnsToContents()
+        
+        self.status_label.setText(f"📚 {len(rows)} oturum, {rebuilt} indeks yeniden oluşturuldu "
+                                  f"({time.perf_counter() - start:.2f} s) - "
+                                  f"çift tıklanan oturum ana pencereye yüklenir")
+    
+    def open_row(self, row, column):
+        self.selected_path = self.table.item(row, 0).data(Qt.UserRole)
+        self.accept()
+
+
 class TelemetryApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -672,7 +1238,22 @@ class TelemetryApp(QMainWindow):
         
         # Mesafe takibi için değişkenler
         self.total_distance = 0.0  # km cinsinden
-        self.last_speed_time = None
+        
+        # Hızdan mesafe, güç / hidrojen akışından enerji ve verimlilik,
+        # akım ve güç için kayan pencere kanalları (ingest_core ile ortak)
+        self.derived_channels = DerivedChannels()
+        
+        # Oturum boyunca kanal istatistikleri (grafik penceresinden bağımsız)
+        self.session_stats = SessionStats()
+        
+        # Tur / stint tespiti için Speed, Power, Current'ın tüm örnekleri
+        self.segment_history = SegmentHistory()
+        
+        # Arşiv (disk tabanlı oturum deposu) görüntüleme
+        self.archive_store = None
+        self.archive_loader = None
+        self.archive_cache_bytes = 64 * 1024 * 1024
+        self.archive_dirty_plots = set()
         
         # Hidrojen tüketimi için değişkenler
         self.hydrogen_consumed_liters = 0.0  # Litre cinsinden
@@ -685,15 +1266,38 @@ class TelemetryApp(QMainWindow):
             'Voltage': {'values': [], 'times': []},
             'Power': {'values': [], 'times': []},
             'Distance': {'values': [], 'times': []},  # Yeni: Mesafe verisi
+            # Türetilmiş enerji ve verimlilik kanalları
+            'Energy': {'values': [], 'times': []},  # Wh
+            'WhPerKm': {'values': [], 'times': []},
+            'H2Flow': {'values': [], 'times': []},  # L/dk (firmware gönderiyorsa)
+            'H2Used': {'values': [], 'times': []},  # L
+            'KmPerM3': {'values': [], 'times': []},
             # Diğer veriler de parse edilecek ama grafik gösterilmeyecek
             'ERPM': {'values': [], 'times': []},
             'RPM': {'values': [], 'times': []},
             'Duty': {'values': [], 'times': []}
         }
+        for name in self.derived_channels.rolling.names:
+            self.telemetry_data[name] = {'values': [], 'times': []}
+        
+        # Aktif alarmlar (kural adı → olay) ve grafik işaretçileri
+        self.active_alarms = {}
+        self.alarm_markers = []
+        
+        # Port takibi ilk çizimden sonra arka planda başlar
+        self.port_watcher = None
+        self.port_entries = {}  # cihaz → PortEntry
+        self.configured_board = None  # Son bağlanılan kartın kimliği (board_key)
+        self.port_offer_open = False
+        self.first_paint_done = False
         
         self.init_ui()
-        self.update_port_list()
+        startup_profile.mark('init_ui')
+        self.load_alarm_rules(DEFAULT_RULES_FILE)
+        startup_profile.mark('alarm_rules')
+        self.port_combo.addItem("🖥️ Virtual Arduino Simulator (TCP)")
         self.set_background_image()  # Koyu temayı ayarla
+        startup_profile.mark('theme')
     
     def set_background_image(self):
         """Koyu tema ayarla"""
@@ -779,6 +1383,9 @@ class TelemetryApp(QMainWindow):
         # Üst kontrol paneli
         self.create_control_panel(main_layout)
         
+        # Kayıt oynatma paneli
+        self.create_replay_panel(main_layout)
+        
         # Orta kısım - Hız gösterimi, grafikler ve değerler
         middle_layout = QHBoxLayout()
         
@@ -826,6 +1433,13 @@ class TelemetryApp(QMainWindow):
         self.connect_btn.clicked.connect(self.toggle_connection)
         control_layout.addWidget(self.connect_btn)
         
+        # Ham bayt kaydı - ayrıştırıcı düzeltildiğinde oturum yeniden üretilebilir
+        self.raw_capture_btn = QPushButton("⏺️ Ham Kayıt")
+        self.raw_capture_btn.setCheckable(True)
+        self.raw_capture_btn.setToolTip("Bağlantıda alınan baytları zamanlarıyla "
+                                        "captures/ klasörüne sıkıştırılmış olarak kaydet")
+        control_layout.addWidget(self.raw_capture_btn)
+        
         # Veri temizleme
         self.clear_btn = QPushButton("Grafikleri Temizle")
         self.clear_btn.clicked.connect(self.clear_data)
@@ -836,11 +1450,32 @@ class TelemetryApp(QMainWindow):
         self.load_json_control_btn.clicked.connect(self.load_data_json)
         control_layout.addWidget(self.load_json_control_btn)
         
+        # Arşiv açma butonu - büyük oturumlar parça parça yüklenir
+        self.open_archive_btn = QPushButton("🗄️ Arşiv Aç")
+        self.open_archive_btn.clicked.connect(self.open_archive)
+        control_layout.addWidget(self.open_archive_btn)
+        
+        # Oturum karşılaştırma - kayıtlar salt okunur depolardan üst üste çizilir
+        self.compare_btn = QPushButton("🆚 Karşılaştır")
+        self.compare_btn.clicked.connect(self.show_compare)
+        control_layout.addWidget(self.compare_btn)
+        
+        # Kayıtlı oturumları özet indeksleriyle listele
+        self.browse_sessions_btn = QPushButton("📚 Oturumlar")
+        self.browse_sessions_btn.clicked.connect(self.show_session_browser)
+        control_layout.addWidget(self.browse_sessions_btn)
+        
         # Grafik kaydetme butonları
         self.save_graphs_btn = QPushButton("📸 Tüm Grafikleri Kaydet")
         self.save_graphs_btn.clicked.connect(self.save_all_graphs)
         control_layout.addWidget(self.save_graphs_btn)
         
+        # Gecikme/FPS ölçüm katmanı
+        self.latency_overlay_btn = QPushButton("⏱️ Performans")
+        self.latency_overlay_btn.setCheckable(True)
+        self.latency_overlay_btn.toggled.connect(self.toggle_latency_overlay)
+        control_layout.addWidget(self.latency_overlay_btn)
+        
         # Veri analizi butonu (kontrol panelinde de)
         self.analyze_control_btn = QPushButton("📊 Veri Analizi")
         self.analyze_control_btn.clicked.connect(self.show_analysis)
@@ -849,6 +1484,124 @@ class TelemetryApp(QMainWindow):
         control_layout.addStretch()
         parent_layout.addWidget(control_group)
         
+    def create_replay_panel(self, parent_layout):
+        """Kayıt oynatma panelini oluştur"""
+        replay_group = QGroupBox("Kayıt Oynatma")
+        replay_layout = QHBoxLayout(replay_group)
+        
+        self.replay_btn = QPushButton("▶️ Kayıt Oynat")
+        self.replay_btn.clicked.connect(self.start_replay)
+        replay_layout.addWidget(self.replay_btn)
+        
+        self.replay_pause_btn = QPushButton("⏸️ Duraklat")
+        self.replay_pause_btn.setCheckable(True)
+        self.replay_pause_btn.setEnabled(False)
+        self.replay_pause_btn.toggled.connect(self.toggle_replay_pause)
+        replay_layout.addWidget(self.replay_pause_btn)
+        
+        # Oynatma hızı (0 = beklemesiz)
+        replay_layout.addWidget(QLabel("Hız:"))
+        self.replay_speed_combo = QComboBox()
+        for text, speed in [("1×", 1.0), ("2×", 2.0), ("5×", 5.0), ("10×", 10.0),
+                            ("50×", 50.0), ("Maksimum", 0.0)]:
+            self.replay_speed_combo.addItem(text, speed)
+        self.replay_speed_combo.currentIndexChanged.connect(self.change_replay_speed)
+        replay_layout.addWidget(self.replay_speed_combo)
+        
+        # Konum çubuğu - bırakıldığında seçilen konuma atlanır
+        self.replay_slider = QSlider(Qt.Horizontal)
+        self.replay_slider.setRange(0, 1000)
+        self.replay_slider.setEnabled(False)
+        self.replay_slider.sliderReleased.connect(self.seek_replay)
+        replay_layout.addWidget(self.replay_slider, 1)
+        
+        self.replay_position_label = QLabel("00:00 / 00:00")
+        replay_layout.addWidget(self.replay_position_label)
+        
+        parent_layout.addWidget(replay_group)
+    
+    def start_replay(self):
+        """Kaydedilmiş oturumu veya ham kaydı canlı veri yolundan oynat"""
+        if self.serial_thread and self.serial_thread.is_running:
+            QMessageBox.warning(self, "Uyarı", "Oynatma için önce mevcut bağlantıyı kesin!")
+            return
+        
+        filename, _ = QFileDialog.getOpenFileName(
+            self, "Oynatılacak Kaydı Seç", "",
+            "Telemetri kayıtları (*.json *.txt *.log *.rawcap.gz *.rawcap.xz);;All files (*.*)"
+        )
+        
+        if not filename:
+            return
+        
+        self.clear_data()
+        
+        self.serial_thread = ReplayThread(filename, self.replay_speed_combo.currentData())
+        self.serial_thread.data_received.connect(self.update_data)
+        self.serial_thread.error_occurred.connect(self.handle_error)
+        self.serial_thread.alarm_changed.connect(self.handle_alarm)
+        self.serial_thread.progress_changed.connect(self.update_replay_progress)
+        self.serial_thread.seeked.connect(self.handle_replay_seeked)
+        self.serial_thread.replay_finished.connect(self.handle_replay_finished)
+        self.serial_thread.start()
+        
+        # UI güncellemeleri
+        self.connect_btn.setText("Bağlantıyı Kes")
+        self.connect_btn.setStyleSheet("background-color: #4CAF50; color: white;")
+        self.refresh_btn.setEnabled(False)
+        self.port_combo.setEnabled(False)
+        self.baudrate_combo.setEnabled(False)
+        self.raw_capture_btn.setEnabled(False)
+        self.replay_btn.setEnabled(False)
+        self.replay_pause_btn.setEnabled(True)
+        self.replay_slider.setEnabled(True)
+        
+        self.log_message(f"▶️ Kayıt oynatılıyor: {os.path.basename(filename)} "
+                         f"({self.replay_speed_combo.currentText()})")
+    
+    def toggle_replay_pause(self, paused):
+        """Oynatmayı duraklat / devam ettir"""
+        if isinstance(self.serial_thread, ReplayThread):
+            self.serial_thread.set_paused(paused)
+            self.replay_pause_btn.setText("▶️ Devam" if paused else "⏸️ Duraklat")
+    
+    def change_replay_speed(self):
+        """Oynatma hızını değiştir"""
+        if isinstance(self.serial_thread, ReplayThread):
+            self.serial_thread.set_speed(self.replay_speed_combo.currentData())
+            self.log_message(f"⏩ Oynatma hızı: {self.replay_speed_combo.currentText()}")
+    
+    def seek_replay(self):
+        """Konum çubuğunda seçilen noktaya atla"""
+        if isinstance(self.serial_thread, ReplayThread) and self.serial_thread.duration > 0:
+            fraction = self.replay_slider.value() / self.replay_slider.maximum()
+            self.serial_thread.seek(fraction * self.serial_thread.duration)
+    
+    def update_replay_progress(self, position, duration):
+        """Oynatma konumunu göster"""
+        if duration > 0 and not self.replay_slider.isSliderDown():
+            self.replay_slider.setValue(int(position / duration * self.replay_slider.maximum()))
+        
+        def format_time(seconds):
+            return f"{int(seconds // 60):02d}:{int(seconds % 60):02d}"
+        
+        self.replay_position_label.setText(f"{format_time(position)} / {format_time(duration)}")
+    
+    def handle_replay_seeked(self, position):
+        """Atlama sonrası grafikleri yeni konumdan başlat"""
+        self.clear_data()
+        self.log_message(f"⏭️ Oynatma konumu: {position:.1f} s")
+    
+    def handle_replay_finished(self):
+        """Oynatma bittiğinde arayüzü sıfırla"""
+        if self.serial_thread is not None and self.sender() is self.serial_thread:
+            self.disconnect_source("⏹️ Kayıt oynatma tamamlandı")
+    
+    def handle_source_disconnected(self):
+        """Kaynak bağlantıyı kendisi kapattığında (EOF) arayüzü sıfırla"""
+        if self.serial_thread is not None and self.sender() is self.serial_thread:
+            self.disconnect_source(f"🔌 {self.serial_thread.label} bağlantısı karşı taraftan kapatıldı")
+    
     def create_values_panel(self, parent_layout):
         """Anlık değerler panelini oluştur - tüm parametreler"""
         values_group = QGroupBox("Anlık Değerler")
@@ -865,6 +1618,8 @@ class TelemetryApp(QMainWindow):
             ("Voltage", "Gerilim (V):", "0.00"),
             ("Power", "Güç (W):", "0.00"),
             ("Distance", "Mesafe (km):", "0.000"),
+            ("Energy", "Enerji (Wh):", "0.00"),
+            ("WhPerKm", "Tüketim (Wh/km):", "0.00"),
             ("Hydrogen", "H₂ (L):", "0.000"),  # Yeni: Hidrojen tüketimi
             ("Efficiency", "1 m³ H₂ ile (km):", "0.00"),  # Değişti: 1 m³ ile gidilen yol
             ("RPM", "RPM:", "0"),
@@ -887,6 +1642,8 @@ class TelemetryApp(QMainWindow):
                 value_label.setStyleSheet("QLabel { color: #00CED1; font-weight: bold; }")  # Turkuaz (H₂)
             elif key == "Efficiency":
                 value_label.setStyleSheet("QLabel { color: #32CD32; font-weight: bold; }")  # Lime yeşili
+            elif key in ("Energy", "WhPerKm"):
+                value_label.setStyleSheet("QLabel { color: #FFA07A; font-weight: bold; }")  # Somon (enerji)
             else:
                 value_label.setStyleSheet("QLabel { color: #0066CC; font-weight: bold; }")
             
@@ -898,7 +1655,7 @@ class TelemetryApp(QMainWindow):
             self.value_labels[key] = value_label
         
         values_group.setMaximumWidth(300)
-        values_group.setMaximumHeight(380)  # Yükseklik artırıldı
+        values_group.setMaximumHeight(440)  # Yükseklik artırıldı
         parent_layout.addWidget(values_group)
         parent_layout.addStretch()
     
@@ -968,6 +1725,11 @@ class TelemetryApp(QMainWindow):
         # Kaydetme butonları
         save_layout = QHBoxLayout()
         
+        save_csv_btn = QPushButton("📄 CSV Kaydet")
+        save_csv_btn.clicked.connect(self.save_data_csv)
+        save_csv_btn.setStyleSheet("background-color: #009688; color: white; padding: 8px;")
+        save_layout.addWidget(save_csv_btn)
+        
         save_json_btn = QPushButton("📊 JSON Kaydet")
         save_json_btn.clicked.connect(self.save_data_json)
         save_json_btn.setStyleSheet("background-color: #2196F3; color: white; padding: 8px;")
@@ -983,6 +1745,16 @@ class TelemetryApp(QMainWindow):
         analyze_btn.setStyleSheet("background-color: #9C27B0; color: white; padding: 8px;")
         save_layout.addWidget(analyze_btn)
         
+        latency_btn = QPushButton("⏱️ Gecikme İstatistikleri")
+        latency_btn.clicked.connect(self.show_latency_stats)
+        latency_btn.setStyleSheet("background-color: #607D8B; color: white; padding: 8px;")
+        save_layout.addWidget(latency_btn)
+        
+        alarm_rules_btn = QPushButton("🚨 Alarm Kuralları")
+        alarm_rules_btn.clicked.connect(self.choose_alarm_rules)
+        alarm_rules_btn.setStyleSheet("background-color: #D32F2F; color: white; padding: 8px;")
+        save_layout.addWidget(alarm_rules_btn)
+        
         log_layout.addLayout(save_layout)
         log_main_layout.addWidget(log_group)
         
@@ -993,12 +1765,10 @@ class TelemetryApp(QMainWindow):
         
         # KTECH logosu
         ktech_logo_label = QLabel()
-        ktech_logo_path = os.path.join(os.path.dirname(__file__), 'images', 'ktech.png')
-        if os.path.exists(ktech_logo_path):
-            ktech_pixmap = QPixmap(ktech_logo_path)
-            # Logo boyutunu ayarla (yükseklik: 60px)
-            ktech_pixmap = ktech_pixmap.scaledToHeight(150, Qt.SmoothTransformation)
-            ktech_logo_label.setPixmap(ktech_pixmap)
+        ktech_pixmap = load_pixmap('ktech.png')
+        if ktech_pixmap is not None:
+            # Logo boyutunu ayarla (yükseklik: 150px)
+            ktech_logo_label.setPixmap(ktech_pixmap.scaledToHeight(150, Qt.SmoothTransformation))
         else:
             ktech_logo_label.setText("KTECH")
             ktech_logo_label.setStyleSheet("color: white; font-weight: bold; font-size: 16pt;")
@@ -1010,12 +1780,10 @@ class TelemetryApp(QMainWindow):
         
         # KATOT logosu
         katot_logo_label = QLabel()
-        katot_logo_path = os.path.join(os.path.dirname(__file__), 'images', 'katot.png')
-        if os.path.exists(katot_logo_path):
-            katot_pixmap = QPixmap(katot_logo_path)
-            # Logo boyutunu ayarla (yükseklik: 60px)
-            katot_pixmap = katot_pixmap.scaledToHeight(150, Qt.SmoothTransformation)
-            katot_logo_label.setPixmap(katot_pixmap)
+        katot_pixmap = load_pixmap('katot.png')
+        if katot_pixmap is not None:
+            # Logo boyutunu ayarla (yükseklik: 150px)
+            katot_logo_label.setPixmap(katot_pixmap.scaledToHeight(150, Qt.SmoothTransformation))
         else:
             katot_logo_label.setText("KATOT")
             katot_logo_label.setStyleSheet("color: white; font-weight: bold; font-size: 16pt;")
@@ -1028,27 +1796,62 @@ class TelemetryApp(QMainWindow):
         parent_layout.addLayout(log_main_layout)
 
     def create_graphs_panel(self, parent_layout):
-        """Grafik panelini oluştur - 4 grafik"""
+        """Grafik panelini oluştur - 6 grafik"""
         graphs_group = QGroupBox("Grafikler")
         graphs_layout = QVBoxLayout(graphs_group)
         
+        # Alarm şeridi - yalnızca aktif alarm varken görünür
+        self.alarm_banner = QLabel()
+        self.alarm_banner.setAlignment(Qt.AlignCenter)
+        self.alarm_banner.setWordWrap(True)
+        self.alarm_banner.hide()
+        graphs_layout.addWidget(self.alarm_banner)
+        
         # Grafik widget'ı oluştur
         self.graph_widget = pg.GraphicsLayoutWidget()
         self.graph_widget.setBackground('#2b2b2b')
         graphs_layout.addWidget(self.graph_widget)
         
-        # Alt grafikler oluştur - 4 tanesi
+        # Çizim anı ölçümü: sahne her çizimden önce bu sinyali yayar
+        self.graph_widget.scene().sigPrepareForPaint.connect(self.handle_graph_paint)
+        
+        # Gecikme katmanı - grafiklerin sol üst köşesinde
+        self.latency_overlay = QLabel(self.graph_widget)
+        self.latency_overlay.setStyleSheet("""
+            QLabel {
+                background-color: rgba(0, 0, 0, 180);
+                color: #00ff00;
+                font-family: 'Courier New';
+                font-size: 9pt;
+                padding: 4px;
+            }
+        """)
+        self.latency_overlay.move(8, 8)
+        self.latency_overlay.hide()
+        
+        self.latency_overlay_timer = QTimer(self)
+        self.latency_overlay_timer.timeout.connect(self.refresh_latency_overlay)
+        
+        # Alt grafikler oluştur - 6 tanesi
         self.plots = {}
         self.curves = {}
         
+        # Arşiv modunda görünür aralık değişikliklerini toplayıp tek seferde sorgula
+        self.archive_query_timer = QTimer(self)
+        self.archive_query_timer.setSingleShot(True)
+        self.archive_query_timer.setInterval(50)
+        self.archive_query_timer.timeout.connect(self.flush_archive_queries)
+        
         plot_configs = [
             ('Speed', 'Hız (km/h)', '#FF6B35'),
             ('Current', 'Akım (A)', '#FF1744'),
             ('Voltage', 'Gerilim (V)', '#00C853'),
-            ('Power', 'Güç (W)', '#FF9800')
+            ('Power', 'Güç (W)', '#FF9800'),
+            ('Energy', 'Enerji (Wh)', '#FFD700'),
+            ('WhPerKm', 'Tüketim (Wh/km)', '#00CED1')
         ]
         
-        # 2 satır 2 sütun düzeni (2x2 grid)
+        # 3 satır 2 sütun düzeni (3x2 grid)
         for i, (key, title, color) in enumerate(plot_configs):
             if i % 2 == 0 and i > 0:
                 self.graph_widget.nextRow()
@@ -1090,10 +1893,28 @@ class TelemetryApp(QMainWindow):
             
             plot.scene().sigMouseClicked.connect(make_context_menu_handler(key, title))
             
+            # Kayan pencere kanalları aynı grafikte kesikli çizgiyle gösterilir
+            overlays = [spec for spec in self.derived_channels.rolling.specs if spec[0] == key]
+            if overlays:
+                plot.addLegend(offset=(-10, 10))
+            
             # Veri eğrisi
             curve = plot.plot(pen=pg.mkPen(color, width=2), name=title, 
                             symbol='o', symbolSize=4, symbolBrush=color, symbolPen=color)
             
+            overlay_styles = {
+                'mean': ('#FFFFFF', Qt.DashLine),
+                'min': ('#40C4FF', Qt.DotLine),
+                'max': ('#FF4081', Qt.DotLine),
+                'ewma': ('#00E5FF', Qt.DashLine),
+            }
+            for source, kind, window in overlays:
+                overlay_color, overlay_style = overlay_styles[kind]
+                overlay_name = rolling_channel_name(source, kind, window)
+                self.curves[overlay_name] = plot.plot(
+                    pen=pg.mkPen(overlay_color, width=1.5, style=overlay_style),
+                    name=f"{KIND_LABELS[kind]} {window:g} s")
+            
             # Crosshair
             vLine = pg.InfiniteLine(angle=90, movable=False, pen=pg.mkPen('#FFFFFF', width=1, style=Qt.DashLine))
             hLine = pg.InfiniteLine(angle=0, movable=False, pen=pg.mkPen('#FFFFFF', width=1, style=Qt.DashLine))
@@ -1142,36 +1963,283 @@ class TelemetryApp(QMainWindow):
             
             plot.scene().sigMouseMoved.connect(make_mouse_moved_handler(plot, vLine, hLine, curve, value_label, key))
             
+            def make_range_changed_handler(graph_key):
+                def range_changed(*args):
+                    self.schedule_archive_query(graph_key)
+                return range_changed
+            
+            vb.sigXRangeChanged.connect(make_range_changed_handler(key))
+            
             self.plots[key] = plot
             self.curves[key] = curve
         
         parent_layout.addWidget(graphs_group)
 
-    def calculate_distance(self, current_speed, current_time):
-        """Hız ve zaman farkından mesafe hesapla"""
-        if self.last_speed_time is not None and current_speed > 0:
-            # Zaman farkı (saniye cinsinden)
-            time_diff = (current_time - self.last_speed_time)
-            
-            # Mesafe = Hız × Zaman
-            # Hız km/h cinsinden, zaman saniye cinsinden
-            # Sonuç km cinsinden
-            distance_increment = (current_speed * time_diff) / 3600.0
+    def open_archive(self):
+        """Disk tabanlı oturum deposunu aç - yalnızca görünen aralık yüklenir"""
+        if self.serial_thread and self.serial_thread.is_running:
+            QMessageBox.warning(self, "Uyarı", "Arşiv açmak için önce mevcut bağlantıyı kesin!")
+            return
+        
+        filename, _ = QFileDialog.getOpenFileName(
+            self, "Arşiv Aç", "",
+            f"Oturum deposu ({MANIFEST_NAME});;JSON files (*.json);;All files (*.*)"
+        )
+        
+        if not filename:
+            return
+        
+        try:
+            # JSON oturumu ilk açılışta depoya dönüştürülür, sonraki açılışlarda yeniden kullanılır
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            try:
+                store_path = ensure_session_store(filename)
+            finally:
+                QApplication.restoreOverrideCursor()
             
-            self.total_distance += distance_increment
+            store = SessionStore(store_path, cache_bytes=self.archive_cache_bytes)
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Arşiv açma hatası:\n{str(e)}")
+            return
+        
+        if store.start_time is None:
+            QMessageBox.warning(self, "Uyarı", "Arşivde veri bulunamadı!")
+            return
+        
+        self.clear_data()
+        
+        self.archive_store = store
+        self.start_time = store.start_time
+        self.archive_loader = ArchiveLoaderThread(store)
+        self.archive_loader.data_loaded.connect(self.apply_archive_data)
+        self.archive_loader.error_occurred.connect(lambda message: self.log_message(f"⚠️ {message}"))
+        self.archive_loader.start()
+        
+        duration_minutes = (store.end_time - store.start_time) / 60.0
+        for key, plot in self.plots.items():
+            # Yoğun veride nokta sembolleri kapatılır, y ekseni görünen veriye uyar
+            self.curves[key].setSymbol(None)
+            vb = plot.getViewBox()
+            vb.setAutoVisible(y=True)
+            vb.enableAutoRange(axis=pg.ViewBox.YAxis, enable=True)
+            vb.setXRange(0, duration_minutes, padding=0.02)
+            self.schedule_archive_query(key)
+        
+        total = sum(meta['count'] for meta in store.manifest['channels'].values())
+        self.log_message(f"🗄️ Arşiv açıldı: {os.path.basename(store.path)} "
+                         f"({total} örnek, {duration_minutes:.1f} dk)")
+    
+    def close_archive(self):
+        """Arşiv modundan çık"""
+        if self.archive_store is None:
+            return
+        
+        if self.archive_loader:
+            self.archive_loader.stop()
+            self.archive_loader.wait()
+            self.archive_loader = None
+        
+        self.archive_store = None
+        self.archive_dirty_plots.clear()
+        
+        for key, plot in self.plots.items():
+            self.curves[key].setSymbol('o')
+            vb = plot.getViewBox()
+            vb.setAutoVisible(y=False)
+            vb.enableAutoRange(enable=False)
+    
+    def schedule_archive_query(self, graph_key):
+        """Görünür aralık değiştiğinde sorguyu kısa bir gecikmeyle planla"""
+        if self.archive_store is None:
+            return
+        self.archive_dirty_plots.add(graph_key)
+        self.archive_query_timer.start()
+    
+    def flush_archive_queries(self):
+        """Değişen grafiklerin görünür aralıklarını arka plan yükleyicisine gönder"""
+        if self.archive_store is None or self.archive_loader is None:
+            return
+        
+        for key in self.archive_dirty_plots:
+            vb = self.plots[key].getViewBox()
+            x_min, x_max = vb.viewRange()[0]
+            t0 = self.start_time + x_min * 60.0
+            t1 = self.start_time + x_max * 60.0
+            # Piksel sütunu başına bir min/max çifti yeterli
+            max_points = max(500, int(vb.width()) * 2)
+            self.archive_loader.request(key, t0, t1, max_points)
+        self.archive_dirty_plots.clear()
+    
+    def apply_archive_data(self, channel, times, values, level):
+        """Yüklenen arşiv parçasını grafiğe uygula"""
+        if self.archive_store is None or channel not in self.curves:
+            return
+        relative_times = (times - self.start_time) / 60.0
+        self.curves[channel].setData(relative_times, values)
+    
+    def toggle_latency_overlay(self, enabled):
+        """Gecikme/FPS katmanını ve ölçümü aç/kapat"""
+        latency_monitor.set_enabled(enabled)
+        if enabled:
+            self.refresh_latency_overlay()
+            self.latency_overlay.show()
+            self.latency_overlay_timer.start(500)
+            self.log_message("⏱️ Gecikme ölçümü açıldı")
+        else:
+            self.latency_overlay_timer.stop()
+            self.latency_overlay.hide()
+            self.log_message("⏱️ Gecikme ölçümü kapatıldı")
+    
+    def refresh_latency_overlay(self):
+        """Katman metnini güncelle"""
+        self.latency_overlay.setText(latency_monitor.format_overlay())
+        self.latency_overlay.adjustSize()
+        self.latency_overlay.raise_()
+    
+    def handle_graph_paint(self):
+        """Grafik sahnesi çizilmeden önce bekleyen örneklerin çizim anını kaydet"""
+        if latency_monitor.enabled:
+            latency_monitor.record_frame()
+    
+    def show_latency_stats(self):
+        """Gecikme istatistikleri penceresini göster"""
+        dialog = LatencyStatsDialog(latency_monitor, self)
+        dialog.exec_()
+    
+    def load_alarm_rules(self, filename):
+        """Alarm kurallarını dosyadan yükle"""
+        try:
+            count = alarm_engine.load(filename)
+        except FileNotFoundError:
+            self.log_message(f"⚠️ Alarm kural dosyası bulunamadı: {filename}")
+            return
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Alarm kuralları yüklenemedi:\n{str(e)}")
+            return
+        
+        self.active_alarms.clear()
+        self.update_alarm_banner()
+        self.log_message(f"🚨 {count} alarm kuralı yüklendi: {os.path.basename(filename)}")
+    
+    def choose_alarm_rules(self):
+        """Kullanıcının seçtiği alarm kural dosyasını yükle"""
+        filename, _ = QFileDialog.getOpenFileName(
+            self, "Alarm Kural Dosyası Aç", os.path.dirname(DEFAULT_RULES_FILE),
+            "JSON files (*.json);;All files (*.*)"
+        )
+        if filename:
+            self.load_alarm_rules(filename)
+    
+    def handle_alarm(self, event):
+        """Okuyucu thread'den gelen alarm başlangıç/bitiş olayını işle"""
+        if event['active']:
+            self.active_alarms[event['rule']] = event
+            self.add_alarm_marker(event)
+            self.log_message(f"🚨 ALARM [{event['severity']}] {event['rule']}: {event['message']} "
+                             f"({event['channel']} = {event['value']:.2f})")
+        else:
+            self.active_alarms.pop(event['rule'], None)
+            self.log_message(f"✅ Alarm bitti: {event['rule']} "
+                             f"({event['channel']} = {event['value']:.2f})")
+        self.update_alarm_banner()
+    
+    def update_alarm_banner(self):
+        """Aktif alarmları grafiklerin üstündeki şeritte göster"""
+        if not self.active_alarms:
+            self.alarm_banner.hide()
+            return
+        
+        critical = any(event['severity'] == 'critical' for event in self.active_alarms.values())
+        color = '#D32F2F' if critical else '#F57C00'
+        self.alarm_banner.setStyleSheet(f"""
+            QLabel {{
+                background-color: {color};
+                color: white;
+                font-size: 13pt;
+                font-weight: bold;
+                padding: 6px;
+                border-radius: 4px;
+            }}
+        """)
+        self.alarm_banner.setText("  |  ".join(f"🚨 {event['message']}"
+                                               for event in self.active_alarms.values()))
+        self.alarm_banner.show()
+    
+    def add_alarm_marker(self, event):
+        """Alarmın başladığı anı ilgili grafikte dikey çizgiyle işaretle"""
+        plot = self.plots.get(event['channel'])
+        if plot is None or self.start_time is None:
+            return
+        
+        color = '#FF1744' if event['severity'] == 'critical' else '#FFA000'
+        marker = pg.InfiniteLine(pos=(event['time'] - self.start_time) / 60.0, angle=90, movable=False,
+                                 pen=pg.mkPen(color, width=2), label=event['rule'],
+                                 labelOpts={'position': 0.9, 'color': color})
+        plot.addItem(marker, ignoreBounds=True)
+        self.alarm_markers.append((plot, marker))
+        
+        # Çok uzun oturumlarda en eski işaretçileri kaldır
+        if len(self.alarm_markers) > 100:
+            old_plot, old_marker = self.alarm_markers.pop(0)
+            old_plot.removeItem(old_marker)
+    
+    def clear_alarms(self):
+        """Alarm durumlarını, şeridi ve işaretçileri temizle"""
+        alarm_engine.reset()
+        self.active_alarms.clear()
+        for plot, marker in self.alarm_markers:
+            plot.removeItem(marker)
+        self.alarm_markers = []
+        self.update_alarm_banner()
+    
+    def recompute_distance_from_speed(self, saved_total=0.0):
+        """
+        Yüklenen hız serisinden Distance kanalını vektörel olarak yeniden oluştur
+        
+        Canlı kayıtlarda hız serisi max_data_points ile kırpılmış olabilir; dosyada
+        kayıtlı toplam varsa esas odur ve seri o toplamda bitecek şekilde kaydırılır.
+        """
+        speed = self.telemetry_data['Speed']
+        if len(speed['times']) < 2:
+            return
         
-        self.last_speed_time = current_time
+        distance = cumulative_distance(speed['times'], speed['values'],
+                                       self.derived_channels.distance.max_gap)
+        if saved_total > 0:
+            distance += saved_total - distance[-1]
+        self.telemetry_data['Distance']['times'] = list(speed['times'])
+        self.telemetry_data['Distance']['values'] = distance.tolist()
+        self.total_distance = float(distance[-1])
+        
+        # Canlı veri gelirse toplam buradan devam etsin
+        self.derived_channels.distance.reset(forward=self.total_distance)
+    
+    def recompute_energy_channels(self):
+        """Yüklenen Power / H2Flow serilerinden enerji kanallarını vektörel oluştur"""
+        derived = derive_energy_channels(self.telemetry_data, self.derived_channels.distance.max_gap)
+        for data_type in ENERGY_CHANNELS:
+            if data_type in derived:
+                times, values = derived[data_type]
+                self.telemetry_data[data_type]['times'] = times.tolist()
+                self.telemetry_data[data_type]['values'] = values.tolist()
+        
+        energy = self.telemetry_data['Energy']['values']
+        liters = self.telemetry_data['H2Used']['values']
+        self.derived_channels.energy.reset(energy[-1] if energy else 0.0, liters[-1] if liters else 0.0)
+    
+    def recompute_rolling_channels(self):
+        """Yüklenen verilerden kayan pencere kanallarını vektörel oluştur"""
+        derived = derive_rolling_channels(self.telemetry_data, self.derived_channels.rolling.specs)
+        for name, (times, values) in derived.items():
+            self.telemetry_data[name]['times'] = times.tolist()
+            self.telemetry_data[name]['values'] = values.tolist()
     
     def update_hydrogen_consumption(self):
         """Hidrojen tüketimini güncelle ve verimlilik hesapla"""
         self.hydrogen_consumed_liters = self.hydrogen_input.value()
         
-        # Verimlilik hesapla: km/m³
-        if self.hydrogen_consumed_liters > 0:
-            hydrogen_m3 = self.hydrogen_consumed_liters / 1000.0  # Litre → m³
-            self.hydrogen_efficiency = self.total_distance / hydrogen_m3 if hydrogen_m3 > 0 else 0.0
-        else:
-            self.hydrogen_efficiency = 0.0
+        # Verimlilik hesapla: km/m³ (canlı H2Flow kanalı ile aynı formül)
+        self.hydrogen_efficiency = km_per_m3(self.total_distance, self.hydrogen_consumed_liters) or 0.0
         
         # Göstergeleri güncelle
         if 'Hydrogen' in self.value_labels:
@@ -1213,8 +2281,7 @@ class TelemetryApp(QMainWindow):
     def calculate_efficiency_on_distance_change(self):
         """Mesafe değiştiğinde verimlilik otomatik hesapla"""
         if self.hydrogen_consumed_liters > 0:
-            hydrogen_m3 = self.hydrogen_consumed_liters / 1000.0
-            self.hydrogen_efficiency = self.total_distance / hydrogen_m3 if hydrogen_m3 > 0 else 0.0
+            self.hydrogen_efficiency = km_per_m3(self.total_distance, self.hydrogen_consumed_liters) or 0.0
             
             if 'Efficiency' in self.value_labels:
                 self.value_labels['Efficiency'].setText(f"{self.hydrogen_efficiency:.2f}")
@@ -1225,34 +2292,28 @@ class TelemetryApp(QMainWindow):
         value = data['value']
         timestamp = data['datetime']
         
+        if latency_monitor.enabled:
+            latency_monitor.record_dequeue(data, rendered=data_type in self.curves)
+        
         # İlk veri geldiğinde başlangıç zamanını ayarla
         if self.start_time is None:
             self.start_time = timestamp.timestamp()
         
-        # Hız verisi geldiğinde mesafe hesapla
-        if data_type == 'Speed':
-            old_distance = self.total_distance
-            self.calculate_distance(value, timestamp.timestamp())
-            
-            # Mesafe verisini de kaydet
-            self.telemetry_data['Distance']['values'].append(self.total_distance)
-            self.telemetry_data['Distance']['times'].append(timestamp.timestamp())
-            
-            # Maksimum veri noktası kontrolü
-            if len(self.telemetry_data['Distance']['values']) > self.max_data_points:
-                self.telemetry_data['Distance']['values'].pop(0)
-                self.telemetry_data['Distance']['times'].pop(0)
-            
-            # Mesafe değerini güncelle
-            if 'Distance' in self.value_labels:
-                self.value_labels['Distance'].setText(f"{self.total_distance:.3f}")
-            
-            # Mesafe değiştiğinde verimlilik hesapla (otomatik)
-            if old_distance != self.total_distance:
-                self.calculate_efficiency_on_distance_change()
+        # Türetilmiş kanallar: mesafe, enerji, hidrojen verimliliği, kayan pencereler
+        old_distance = self.total_distance
+        derived = self.derived_channels.add(data_type, value, timestamp.timestamp())
+        self.total_distance = self.derived_channels.total_distance
+        
+        # Mesafe değiştiğinde verimlilik hesapla (otomatik)
+        if old_distance != self.total_distance:
+            self.calculate_efficiency_on_distance_change()
         
         # Diğer veri tipleri için güncelleme
         if data_type in self.telemetry_data:
+            # Oturum istatistiklerini ve tur geçmişini güncelle
+            self.session_stats.add(data_type, value)
+            self.segment_history.add(data_type, value, timestamp.timestamp())
+            
             # Veriyi depola
             self.telemetry_data[data_type]['values'].append(value)
             self.telemetry_data[data_type]['times'].append(timestamp.timestamp())
@@ -1274,7 +2335,7 @@ class TelemetryApp(QMainWindow):
                 self.speed_display.set_speed(value)
             
             # Grafiği güncelle - ana grafikler için
-            if data_type in self.curves and data_type in ['Speed', 'Current', 'Voltage', 'Power']:
+            if data_type in self.curves:
                 times = self.telemetry_data[data_type]['times']
                 values = self.telemetry_data[data_type]['values']
                 
@@ -1282,6 +2343,10 @@ class TelemetryApp(QMainWindow):
                     relative_times = [(t - self.start_time) / 60.0 for t in times]
                     self.curves[data_type].setData(relative_times, values)
         
+        # Türetilmiş örnekleri depola (örnek başına amortize O(1))
+        for name, derived_value in derived:
+            self.append_derived_sample(name, derived_value, timestamp.timestamp())
+        
         # Log mesajı
         log_msg = f"{data['timestamp']} - {data_type}: {value}"
         if data_type == 'Speed':
@@ -1290,14 +2355,42 @@ class TelemetryApp(QMainWindow):
                 log_msg += f" | 1m³ ile: {self.hydrogen_efficiency:.2f} km"
         self.log_message(log_msg)
 
+    def append_derived_sample(self, data_type, value, timestamp):
+        """Hesaplanan kanala örnek ekle, gösterge ve grafiği güncelle"""
+        series = self.telemetry_data[data_type]
+        series['values'].append(value)
+        series['times'].append(timestamp)
+        self.session_stats.add(data_type, value)
+        
+        # Maksimum veri noktası kontrolü
+        if len(series['values']) > self.max_data_points:
+            series['values'].pop(0)
+            series['times'].pop(0)
+        
+        if data_type in self.value_labels:
+            precision = 3 if data_type == 'Distance' else 2
+            self.value_labels[data_type].setText(f"{value:.{precision}f}")
+        
+        if data_type in self.curves and self.start_time:
+            relative_times = [(t - self.start_time) / 60.0 for t in series['times']]
+            self.curves[data_type].setData(relative_times, series['values'])
+    
     def clear_data(self):
         """Tüm veriyi ve grafikleri temizle"""
+        # Arşiv modundan çık
+        self.close_archive()
+        
         # Başlangıç zamanını sıfırla
         self.start_time = None
         
+        # Oturum istatistiklerini sıfırla
+        self.session_stats.clear()
+        self.segment_history.clear()
+        
         # Mesafe verilerini sıfırla
         self.total_distance = 0.0
-        self.last_speed_time = None
+        self.derived_channels.reset()
+        self.clear_alarms()
         
         # Hidrojen verilerini KORUYALIM (kullanıcı manuel girdiği için)
         # self.hydrogen_consumed_liters = 0.0  # KALDIRILDI
@@ -1344,20 +2437,17 @@ class TelemetryApp(QMainWindow):
         
         if filename:
             try:
-                # Tüm zaman damgalarını topla ve sırala
-                all_timestamps = set()
-                for key in self.telemetry_data:
-                    all_timestamps.update(self.telemetry_data[key]['times'])
-                
-                all_timestamps = sorted(all_timestamps)
+                # Kanallar ortak zaman ızgarasına hizalanır: her veri bloğu tek kayıt
+                grid, aligned, alignment = self.aligned_export_table()
                 
                 # JSON için datetime anahtarlı veri yapısı oluştur
                 json_data = {
                     'export_info': {
                         'export_time': datetime.now().isoformat(),
-                        'total_records': len(all_timestamps),
+                        'total_records': len(grid),
                         'data_types': list(self.telemetry_data.keys()),
                         'format': 'datetime_keyed',
+                        'alignment': alignment,
                         'total_distance_km': self.total_distance,
                         'hydrogen_consumed_liters': self.hydrogen_consumed_liters,  # Yeni
                         'hydrogen_efficiency_km_per_m3': self.hydrogen_efficiency  # Yeni
@@ -1365,29 +2455,38 @@ class TelemetryApp(QMainWindow):
                     'data': {}
                 }
                 
-                # Her zaman damgası için bir kayıt oluştur
-                for timestamp in all_timestamps:
+                # Her ızgara zamanı için bir kayıt oluştur
+                empty = [None] * len(grid)
+                columns = [(data_type, aligned[data_type].tolist() if data_type in aligned else empty)
+                           for data_type in self.telemetry_data]
+                for index, timestamp in enumerate(grid.tolist()):
                     datetime_str = datetime.fromtimestamp(timestamp).isoformat()
                     record = {
                         'timestamp': timestamp,
                         'datetime': datetime_str
                     }
-                    
-                    # Bu zaman damgasında hangi veriler var?
-                    for data_type in self.telemetry_data:
-                        if timestamp in self.telemetry_data[data_type]['times']:
-                            idx = self.telemetry_data[data_type]['times'].index(timestamp)
-                            value = self.telemetry_data[data_type]['values'][idx]
-                            record[data_type] = value
-                        else:
-                            record[data_type] = None
+                    for data_type, values in columns:
+                        value = values[index]
+                        record[data_type] = None if value != value else value  # NaN → null
                     
                     json_data['data'][datetime_str] = record
                 
                 with open(filename, 'w', encoding='utf-8') as jsonfile:
                     json.dump(json_data, jsonfile, indent=2, ensure_ascii=False)
                 
-                self.log_message(f"💾 JSON kaydedildi: {len(all_timestamps)} kayıt, "
+                # Oturum tarayıcısı için özet indeksi - dosyaya yazılan hizalı tablodan,
+                # dosya yeniden okunmaz (build_source_index ile aynı sonuç)
+                try:
+                    import numpy as np
+                    written = {}
+                    for data_type, values in aligned.items():
+                        present = ~np.isnan(values)
+                        written[data_type] = (grid[present], values[present])
+                    write_index(filename, build_index(written))
+                except Exception as e:
+                    self.log_message(f"⚠️ Özet indeksi yazılamadı: {e}")
+                
+                self.log_message(f"💾 JSON kaydedildi: {len(grid)} kayıt, "
                                f"Mesafe: {self.total_distance:.3f} km, "
                                f"H₂: {self.hydrogen_consumed_liters:.3f} L, "
                                f"1m³ ile: {self.hydrogen_efficiency:.2f} km")
@@ -1395,7 +2494,7 @@ class TelemetryApp(QMainWindow):
                 QMessageBox.information(self, "Başarılı", 
                                       f"Veriler datetime anahtarlı JSON formatında kaydedildi!\n\n"
                                       f"📄 Dosya: {filename}\n"
-                                      f"📊 Kayıt sayısı: {len(all_timestamps)}\n"
+                                      f"📊 Kayıt sayısı: {len(grid)}\n"
                                       f"📈 Veri tipleri: {len(self.telemetry_data)}\n"
                                       f"🛣️ Toplam Mesafe: {self.total_distance:.3f} km\n"
                                       f"💧 Hidrojen: {self.hydrogen_consumed_liters:.3f} L\n"
@@ -1404,13 +2503,91 @@ class TelemetryApp(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "Hata", f"JSON kaydetme hatası:\n{str(e)}")
     
-    def load_data_json(self):
-        """JSON dosyasından veri yükle"""
-        filename, _ = QFileDialog.getOpenFileName(
-            self, "JSON Dosyası Aç", "",
-            "JSON files (*.json);;All files (*.*)"
+    def aligned_export_table(self):
+        """
+        Dışa aktarma için kanalları referans kanalın zaman ızgarasına hizala
+        
+        Hizalama kayıplıdır: referanstan hızlı kaydedilen kanalların fazla
+        örnekleri ve toleransta referans örneği olmayan örnekler tabloya girmez.
+        Kayıp varsa kanal başına sayılar alignment['dropped_samples']'a yazılır
+        ve hizalamadan (tüm örnekler, zaman damgası başına bir satır) kaydetme
+        seçeneği sunulur.
+        """
+        reference = choose_reference(self.telemetry_data)
+        grid, aligned = align_channels(self.telemetry_data, reference=reference)
+        tolerance = median_spacing(grid) / 2
+        dropped = {}
+        for data_type in aligned:
+            count = unused_samples(self.telemetry_data[data_type]['times'], grid, tolerance or None)
+            if count:
+                dropped[data_type] = count
+        alignment = {
+            'reference': reference,
+            'method': 'nearest',
+            'tolerance_s': tolerance,
+            'dropped_samples': dropped,
+        }
+        if not dropped:
+            return grid, aligned, alignment
+        
+        details = "\n".join(f"• {data_type}: {count}" for data_type, count in dropped.items())
+        answer = QMessageBox.question(
+            self, "Hizalı Dışa Aktarma",
+            f"Ortak zaman ızgarasına ({reference}) hizalama {sum(dropped.values())} örneği "
+            f"dosyaya almıyor:\n{details}\n\n"
+            f"Hizalamadan, tüm örneklerle kaydedilsin mi?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        if answer == QMessageBox.Yes:
+            grid, table = unaligned_table(self.telemetry_data)
+            return grid, table, {'reference': None, 'method': 'none', 'dropped_samples': {}}
+        
+        self.log_message(f"⚠️ Hizalı dışa aktarma {sum(dropped.values())} örneği dışarıda bıraktı: "
+                         + ", ".join(f"{data_type} {count}" for data_type, count in dropped.items()))
+        return grid, aligned, alignment
+    
+    def save_data_csv(self):
+        """Veriyi CSV formatında kaydet - hizalanmış tek satır / veri bloğu"""
+        if not any(self.telemetry_data[key]['values'] for key in self.telemetry_data):
+            QMessageBox.warning(self, "Uyarı", "Kaydedilecek veri yok!")
+            return
+        
+        filename, _ = QFileDialog.getSaveFileName(
+            self, "CSV Dosyası Kaydet",
+            f"telemetri_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            "CSV files (*.csv);;All files (*.*)"
         )
         
+        if filename:
+            try:
+                grid, aligned, _ = self.aligned_export_table()
+                channels = [data_type for data_type in self.telemetry_data if data_type in aligned]
+                columns = [aligned[data_type].tolist() for data_type in channels]
+                
+                with open(filename, 'w', encoding='utf-8', newline='') as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(['Timestamp', 'DateTime'] + channels)
+                    for index, timestamp in enumerate(grid.tolist()):
+                        row = [timestamp, datetime.fromtimestamp(timestamp).isoformat(sep=' ')]
+                        row.extend('' if values[index] != values[index] else values[index]
+                                   for values in columns)
+                        writer.writerow(row)
+                
+                self.log_message(f"💾 CSV kaydedildi: {len(grid)} kayıt, {len(channels)} kanal")
+                QMessageBox.information(self, "Başarılı",
+                                        f"Veriler CSV formatında kaydedildi!\n\n"
+                                        f"📄 Dosya: {filename}\n"
+                                        f"📊 Kayıt sayısı: {len(grid)}")
+            except Exception as e:
+                QMessageBox.critical(self, "Hata", f"CSV kaydetme hatası:\n{str(e)}")
+    
+    def load_data_json(self, filename=None):
+        """JSON dosyasından veri yükle"""
+        if not filename:
+            filename, _ = QFileDialog.getOpenFileName(
+                self, "JSON Dosyası Aç", "",
+                "JSON files (*.json);;All files (*.*)"
+            )
+        
         if filename:
             try:
                 with open(filename, 'r', encoding='utf-8') as jsonfile:
@@ -1464,6 +2641,7 @@ class TelemetryApp(QMainWindow):
             # Kaydedilmiş değerleri geri yükle
             if saved_distance > 0:
                 self.total_distance = saved_distance
+                self.derived_channels.distance.reset(forward=saved_distance)
             
             if saved_hydrogen > 0:
                 self.hydrogen_consumed_liters = saved_hydrogen
@@ -1485,6 +2663,16 @@ class TelemetryApp(QMainWindow):
                     self.telemetry_data[data_type]['times'] = list(times)
                     self.telemetry_data[data_type]['values'] = list(values)
             
+            # Mesafe serisini hız verisinden canlı akışla aynı yöntemle yeniden hesapla
+            # (kayıtlı toplam varsa seri o toplamda biter)
+            self.recompute_distance_from_speed(saved_distance)
+            self.recompute_energy_channels()
+            self.recompute_rolling_channels()
+            
+            # Oturum istatistiklerini yüklenen veriden oluştur
+            self.session_stats.rebuild(self.telemetry_data)
+            self.segment_history.rebuild(self.telemetry_data)
+            
             # Grafikleri güncelle
             self.update_graphs_from_loaded_data()
             
@@ -1523,9 +2711,22 @@ class TelemetryApp(QMainWindow):
             QMessageBox.warning(self, "Uyarı", "Analiz edilecek veri yok!")
             return
         
-        analysis_dialog = DataAnalysisDialog(self.telemetry_data, self)
+        analysis_dialog = DataAnalysisDialog(self.telemetry_data, self.session_stats,
+                                             self.segment_history, self)
         analysis_dialog.exec_()
 
+    def show_session_browser(self):
+        """Oturum listesini göster, seçilen oturumu yükle"""
+        dialog = SessionBrowserDialog(self)
+        if dialog.exec_() == QDialog.Accepted and dialog.selected_path:
+            self.load_data_json(dialog.selected_path)
+    
+    def show_compare(self):
+        """Oturum karşılaştırma penceresini aç - mevcut veriler korunur"""
+        dialog = SessionCompareDialog(self.archive_cache_bytes, self)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.show()
+    
     def reset_graph_view(self, graph_key):
         """Grafik görünümünü sıfırla ve tüm veriyi göster"""
         if graph_key in self.plots:
@@ -1614,7 +2815,7 @@ class TelemetryApp(QMainWindow):
         
         if filename:
             try:
-                exporter = pg.exporters.ImageExporter(self.plots[graph_key].plotItem)
+                exporter = image_exporter(self.plots[graph_key].plotItem)
                 exporter.export(filename)
                 self.log_message(f"💾 Grafik kaydedildi: {filename}")
                 QMessageBox.information(self, "Başarılı", f"{graph_title} grafiği kaydedildi!")
@@ -1632,7 +2833,7 @@ class TelemetryApp(QMainWindow):
                 
                 for graph_key, plot in self.plots.items():
                     filename = os.path.join(folder, f"{graph_key}_{timestamp}.{format_type}")
-                    exporter = pg.exporters.ImageExporter(plot.plotItem)
+                    exporter = image_exporter(plot.plotItem)
                     exporter.export(filename)
                     saved_count += 1
                 
@@ -1643,38 +2844,130 @@ class TelemetryApp(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "Hata", f"Grafik kaydetme hatası:\n{str(e)}")
     
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self.first_paint_done:
+            self.first_paint_done = True
+            # Sıradaki olay döngüsü turunda - pencere çizildikten sonra
+            QTimer.singleShot(0, self.after_first_paint)
+    
+    def after_first_paint(self):
+        """Pencere göründükten sonra yapılacak yavaş başlangıç işleri"""
+        startup_profile.mark('first_paint')
+        self.update_port_list()
+    
     def update_port_list(self):
-        """Mevcut seri portları ve TCP simulatörünü listele"""
-        self.port_combo.clear()
+        """Port takibini başlat; çalışıyorsa beklemeden tam tarama iste"""
+        if self.port_watcher is not None:
+            self.port_watcher.rescan()
+            return
+        self.port_watcher = PortWatcherThread()
+        self.port_watcher.ports_changed.connect(self.handle_ports_changed)
+        self.port_watcher.error_occurred.connect(lambda message: self.log_message(f"⚠️ {message}"))
+        self.port_watcher.start()
+    
+    def handle_ports_changed(self, added, removed, full):
+        """Port listesini artımlı güncelle (seçim korunur)"""
+        startup = 'port_scan' not in startup_profile.marks
+        
+        for device in removed:
+            self.port_entries.pop(device, None)
+            index = self.port_combo.findData(device)
+            if index >= 0:
+                self.port_combo.removeItem(index)
+            self.log_message(f"🔌 Port çıkarıldı: {device}")
+        
+        for entry in added:
+            self.port_entries[entry.device] = entry
+            text = f"{entry.device} - {entry.label} {entry.description}"
+            if entry.kind in ('Arduino', 'Virtual'):
+                # Kartlar ve simülatör TCP simülatörünün hemen altında
+                self.port_combo.insertItem(1, text, entry.device)
+            else:
+                self.port_combo.addItem(text, entry.device)
+            if not startup and not full:
+                self.log_message(f"🔌 Yeni port: {entry.device} ({entry.label} {entry.description})")
+        
+        if full:
+            serial_count = sum(1 for entry in self.port_entries.values() if entry.kind != 'Virtual')
+            if serial_count:
+                self.log_message(f"✓ Virtual Arduino + {serial_count} seri port bulundu")
+            else:
+                self.log_message("✓ Virtual Arduino hazır (seri port yok)")
+        
+        if startup:
+            startup_profile.mark('port_scan')
+            self.report_startup()
+        elif not full:
+            for entry in added:
+                self.offer_board(entry)
+    
+    def offer_board(self, entry):
+        """Yapılandırılan kart (veya henüz bağlantı yokken yeni Arduino) takılınca bağlanmayı öner"""
+        if self.configured_board is not None:
+            if board_key(entry) != self.configured_board:
+                return
+            reconnect = True
+        elif entry.kind == 'Arduino':
+            reconnect = False
+        else:
+            return
         
-        # Sanal Arduino simulatörünü ekle
-        self.port_combo.addItem("🖥️ Virtual Arduino Simulator (TCP)")
+        if self.serial_thread is not None and self.serial_thread.is_running:
+            self.log_message(f"ℹ️ {entry.device} takıldı (aktif bağlantı sürüyor)")
+            return
+        if self.port_offer_open or not self.port_combo.isEnabled():
+            return
         
-        # Gerçek seri portları tara
-        ports = serial.tools.list_ports.comports()
+        self.port_combo.setCurrentIndex(self.port_combo.findData(entry.device))
+        question = (f"{entry.label} kartı yeniden takıldı: {entry.device}\n\nYeniden bağlanılsın mı?"
+                    if reconnect else
+                    f"{entry.label} takıldı: {entry.device} - {entry.description}\n\nBağlanılsın mı?")
+        self.port_offer_open = True
+        try:
+            answer = QMessageBox.question(self, "Kart Takıldı", question,
+                                          QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
+        finally:
+            self.port_offer_open = False
+        # Soru açıkken kart çıkarılmış veya başka yerden bağlanılmış olabilir
+        if (answer == QMessageBox.Yes and entry.device in self.port_entries
+                and not (self.serial_thread and self.serial_thread.is_running)):
+            self.toggle_connection()
+    
+    def report_startup(self):
+        """--startup-profile ile aşama tablosu, --startup-benchmark ile JSON yazıp çık"""
+        if PROFILE_FLAG in sys.argv:
+            print(startup_profile.report(), flush=True)
+        if BENCHMARK_FLAG in sys.argv:
+            print(PROFILE_PREFIX + json.dumps(startup_profile.as_dict()), flush=True)
+            self.close()
+    
+    def disconnect_source(self, message="❌ Bağlantı kesildi"):
+        """Aktif veri kaynağını (seri, TCP veya oynatma) durdur ve arayüzü sıfırla"""
+        if self.serial_thread:
+            self.serial_thread.stop()
+            self.serial_thread.wait()
+            self.serial_thread = None
         
-        if ports:
-            for port in ports:
-                self.port_combo.addItem(f"{port.device} - {port.description}")
-            self.log_message(f"✓ Virtual Arduino + {len(ports)} seri port bulundu")
-        else:
-            self.log_message("✓ Virtual Arduino hazır (seri port yok)")
+        self.connect_btn.setText("Bağlan")
+        self.connect_btn.setStyleSheet("")
+        self.refresh_btn.setEnabled(True)
+        self.port_combo.setEnabled(True)
+        self.baudrate_combo.setEnabled(True)
+        self.raw_capture_btn.setEnabled(True)
+        self.replay_btn.setEnabled(True)
+        self.replay_pause_btn.setEnabled(False)
+        self.replay_pause_btn.setChecked(False)
+        self.replay_pause_btn.setText("⏸️ Duraklat")
+        self.replay_slider.setEnabled(False)
+        
+        self.log_message(message)
     
     def toggle_connection(self):
         """Seri port veya TCP bağlantısını aç/kapat"""
         if self.serial_thread and self.serial_thread.is_running:
             # Bağlantıyı kes
-            self.serial_thread.stop()
-            self.serial_thread.wait()
-            self.serial_thread = None
-            
-            self.connect_btn.setText("Bağlan")
-            self.connect_btn.setStyleSheet("")
-            self.refresh_btn.setEnabled(True)
-            self.port_combo.setEnabled(True)
-            self.baudrate_combo.setEnabled(True)
-            
-            self.log_message("❌ Bağlantı kesildi")
+            self.disconnect_source()
         else:
             # Bağlan
             port_text = self.port_combo.currentText()
@@ -1682,22 +2975,35 @@ class TelemetryApp(QMainWindow):
                 QMessageBox.warning(self, "Uyarı", "Geçerli bir port seçin!")
                 return
             
+            # Canlı veri arşiv görünümünün üzerine yazılmasın
+            if self.archive_store is not None:
+                self.clear_data()
+            
             try:
+                capture_path = capture_filename() if self.raw_capture_btn.isChecked() else None
+                
                 # Virtual Arduino kontrolü
                 if "Virtual Arduino" in port_text:
                     # TCP bağlantısı
-                    self.serial_thread = TCPThread('localhost', 9999)
+                    self.serial_thread = TCPThread('localhost', 9999, capture_path)
                     self.log_message("🖥️ Virtual Arduino'ya bağlanılıyor (TCP)...")
                 else:
                     # Gerçek seri port bağlantısı
-                    port = port_text.split(' - ')[0]
+                    port = self.port_combo.currentData() or port_text.split(' - ')[0]
+                    entry = self.port_entries.get(port)
+                    self.configured_board = board_key(entry) if entry is not None else port
                     baudrate = int(self.baudrate_combo.currentText())
-                    self.serial_thread = SerialThread(port, baudrate)
+                    self.serial_thread = SerialThread(port, baudrate, capture_path)
                     self.log_message(f"📡 {port} portuna bağlanılıyor...")
+                if capture_path:
+                    self.log_message(f"⏺️ Ham bayt kaydı: {capture_path}")
                 
                 # Sinyalleri bağla
                 self.serial_thread.data_received.connect(self.update_data)
                 self.serial_thread.error_occurred.connect(self.handle_error)
+                self.serial_thread.status_message.connect(lambda message: self.log_message(f"⚠️ {message}"))
+                self.serial_thread.alarm_changed.connect(self.handle_alarm)
+                self.serial_thread.disconnected.connect(self.handle_source_disconnected)
                 self.serial_thread.start()
                 
                 # UI güncellemeleri
@@ -1706,6 +3012,8 @@ class TelemetryApp(QMainWindow):
                 self.refresh_btn.setEnabled(False)
                 self.port_combo.setEnabled(False)
                 self.baudrate_combo.setEnabled(False)
+                self.raw_capture_btn.setEnabled(False)
+                self.replay_btn.setEnabled(False)
                 
                 if "Virtual Arduino" in port_text:
                     self.log_message("✓ Virtual Arduino bağlantısı kuruldu (localhost:9999)")
@@ -1726,8 +3034,8 @@ class TelemetryApp(QMainWindow):
         if all_times:
             self.start_time = min(all_times)
         
-        # Sadece 4 grafik için güncelleme
-        for data_type in ['Speed', 'Current', 'Voltage', 'Power']:
+        # Grafiği olan kanallar için güncelleme
+        for data_type in self.curves:
             if data_type in self.curves and data_type in self.telemetry_data:
                 times = self.telemetry_data[data_type]['times']
                 values = self.telemetry_data[data_type]['values']
@@ -1765,6 +3073,13 @@ class TelemetryApp(QMainWindow):
             self.serial_thread = None
             self.connect_btn.setText("Bağlan")
             self.connect_btn.setStyleSheet("")
+            self.refresh_btn.setEnabled(True)
+            self.port_combo.setEnabled(True)
+            self.baudrate_combo.setEnabled(True)
+            self.raw_capture_btn.setEnabled(True)
+            self.replay_btn.setEnabled(True)
+            self.replay_pause_btn.setEnabled(False)
+            self.replay_slider.setEnabled(False)
     
     def log_message(self, message):
         """Log mesajı ekle"""
@@ -1781,12 +3096,18 @@ class TelemetryApp(QMainWindow):
         if self.serial_thread and self.serial_thread.is_running:
             self.serial_thread.stop()
             self.serial_thread.wait()
+        if self.port_watcher is not None:
+            self.port_watcher.stop()
+            self.port_watcher.wait()
+        self.close_archive()
         event.accept()
 
 def main():
     app = QApplication(sys.argv)
+    startup_profile.mark('qapplication')
     window = TelemetryApp()
     window.show()
+    startup_profile.mark('show')
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Seri Port Takibi
+Takılan / çıkarılan seri portları arka planda izler. Her yoklamada önce ucuz
+bir cihaz imzası (POSIX'te /dev listesi, Windows'ta SERIALCOMM kayıt
+anahtarı) karşılaştırılır; yalnızca imza değiştiğinde tam tarama yapılıp
+cihaz kümeleri farklanır. Yeni portlar VID/PID önbelleğiyle bir kez
+sınıflandırılır. Qt'den bağımsızdır - arayüz PortWatcherThread ile kullanır.
+"""
+
+import os
+from collections import namedtuple
+
+# Arduino tanıma için VID/PID listesi
+ARDUINO_VID_PID = {
+    '2341': ['0043', '0001', '0042', '0243', '8036', '8037'],  # Arduino LLC
+    '1B4F': ['9206', '9207', '9208'],  # SparkFun
+    '16C0': ['0483'],  # VOTI (Arduino clones)
+    '10C4': ['EA60'],  # Silicon Labs (ESP32 boards)
+    '1A86': ['7523'],  # QinHeng Electronics (CH340)
+    '0403': ['6001', '6014'],  # FTDI (FTDI chips)
+}
+
+# Aynı liste sayısal (vid, pid) kümesi olarak - port başına metin biçimlendirme yok
+ARDUINO_IDS = frozenset((int(vid, 16), int(pid, 16))
+                        for vid, pids in ARDUINO_VID_PID.items() for pid in pids)
+
+# Arka plan yoklama aralığı (saniye)
+DEFAULT_POLL_SECONDS = 1.0
+
+# Listedeki bir port: cihaz adı, açıklama, sınıf etiketi/tipi ve USB kimliği
+PortEntry = namedtuple('PortEntry', ['device', 'description', 'label', 'kind', 'vid', 'pid', 'serial_number'])
+
+
+def is_arduino_port(port):
+    """Portun Arduino olup olmadığını kontrol et"""
+    vid = getattr(port, 'vid', None)
+    pid = getattr(port, 'pid', None)
+    return vid is not None and pid is not None and (vid, pid) in ARDUINO_IDS
+
+
+def classify_port(port):
+    """Port tipini sınıflandır"""
+    description = (getattr(port, 'description', '') or '').lower()
+    manufacturer = (getattr(port, 'manufacturer', '') or '').lower()
+
+    # Arduino kontrolü
+    if (is_arduino_port(port) or
+            'arduino' in description or
+            'arduino' in manufacturer or
+            'uno' in description or
+            'nano' in description or
+            'mega' in description):
+        return "🔧 Arduino", "Arduino"
+
+    # ESP32/ESP8266 kontrolü
+    elif ('esp32' in description or 'esp8266' in description or
+          'nodemcu' in description or 'wemos' in description):
+        return "🌐 ESP Board", "ESP"
+
+    # Bluetooth kontrolü
+    elif ('bluetooth' in description or 'bt' in description.replace(' ', '') or
+          'blue' in description):
+        return "📶 Bluetooth", "Bluetooth"
+
+    # USB Serial kontrolü
+    elif ('usb' in description and 'serial' in description) or 'ch340' in description or 'cp210' in description:
+        return "🔌 USB Serial", "USB Serial"
+
+    # Genel Serial
+    elif 'serial' in description or 'com' in description:
+        return "📟 Serial", "Serial"
+
+    # Bilinmeyen
+    else:
+        return "❓ Diğer", "Unknown"
+
+
+def board_key(entry):
+    """
+    Kartın kimliği - USB kartlarda (vid, pid, seri no), diğerlerinde cihaz adı
+
+    Kart başka bir porta (COM5 → COM6, ttyACM0 → ttyACM1) düşse de tanınır.
+    """
+    if entry.vid is not None and entry.pid is not None:
+        return (entry.vid, entry.pid, entry.serial_number)
+    return entry.device
+
+
+class PortClassifier:
+    """classify_port sonuçlarını port kimliğine göre önbellekte tutar"""
+
+    def __init__(self):
+        self.cache = {}
+        self.misses = 0
+
+    def classify(self, port):
+        key = (getattr(port, 'vid', None), getattr(port, 'pid', None),
+               getattr(port, 'description', None), getattr(port, 'manufacturer', None))
+        result = self.cache.get(key)
+        if result is None:
+            self.misses += 1
+            result = self.cache[key] = classify_port(port)
+        return result
+
+    def entry(self, port):
+        label, kind = self.classify(port)
+        return PortEntry(port.device, port.description or port.device, label, kind,
+                         getattr(port, 'vid', None), getattr(port, 'pid', None),
+                         getattr(port, 'serial_number', None))
+
+
+def list_serial_ports():
+    """pyserial port listesi - modül ilk taramada yüklenir"""
+    import serial.tools.list_ports
+    return serial.tools.list_ports.comports()
+
+
+def device_signature():
+    """Port kümesi değişince değişen ucuz imza; platform desteklemiyorsa None"""
+    if os.name == 'nt':
+        try:
+            import winreg
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r'HARDWARE\DEVICEMAP\SERIALCOMM') as key:
+                count = winreg.QueryInfoKey(key)[1]
+                return frozenset(winreg.EnumValue(key, i)[1] for i in range(count))
+        except OSError:
+            # Hiç seri port yokken anahtar bulunmaz
+            return frozenset()
+    if os.path.isdir('/dev'):
+        return frozenset(os.listdir('/dev'))
+    return None
+
+
+class PortWatcher:
+    """
+    Port kümesindeki değişiklikleri bulur
+
+    poll() (eklenen PortEntry listesi, çıkarılan cihaz adları) döndürür; ilk
+    çağrıda mevcut tüm portlar eklenmiş sayılır. virtual_devices verilen
+    yollar (ör. pty simülatörünün bağlantısı) var olduğu sürece listede tutulur.
+    """
+
+    def __init__(self, list_ports=list_serial_ports, signature=device_signature, virtual_devices=()):
+        self.list_ports = list_ports
+        self.signature = signature
+        self.virtual_devices = tuple(virtual_devices)
+        self.classifier = PortClassifier()
+        self.ports = {}
+        self.last_signature = None
+        self.scans = 0
+
+    def _current_signature(self):
+        devices = self.signature() if self.signature is not None else None
+        if devices is None:
+            return None
+        return devices, tuple(os.path.exists(path) for path in self.virtual_devices)
+
+    def poll(self, force=False):
+        signature = self._current_signature()
+        if not force and signature is not None and signature == self.last_signature:
+            return [], []
+
+        self.scans += 1
+        current = {port.device: port for port in self.list_ports()}
+        for path in self.virtual_devices:
+            if os.path.exists(path):
+                current[path] = None
+        self.last_signature = signature
+
+        removed = [device for device in self.ports if device not in current]
+        for device in removed:
+            del self.ports[device]
+
+        added = []
+        for device, port in current.items():
+            if device in self.ports:
+                continue
+            if port is None:
+                entry = PortEntry(device, "Sanal seri port (pty)", "🖥️ Simülatör", "Virtual", None, None, None)
+            else:
+                entry = self.classifier.entry(port)
+            self.ports[device] = entry
+            added.append(entry)
+        return added, removed
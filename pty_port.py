@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sanal Seri Port (pty)
+Linux/macOS'ta os.openpty() ile bir sözde terminal çifti oluşturur. Simülatör
+ana (master) uca yazar; arayüz bağımlı (slave) cihazı herhangi bir COM port
+gibi açar, böylece SerialThread (yoklama, çözümleme, baud ayarı) donanım
+olmadan sınanabilir. Bağımlı uca sabit bir sembolik bağlantı (varsayılan
+/tmp/ttyVirtualArduino) oluşturulur, arayüz port listesinde bu adı gösterir.
+
+Okuyucu yokken yazılan veri çekirdek tamponunda bayatlamasın diye çerçeveler
+düşürülür: ana uçta POLLHUP, bağımlı ucu açık tutan kimse olmadığını gösterir.
+"""
+
+import os
+import select
+import struct
+import time
+
+# Arayüzün port listesinde aradığı varsayılan bağlantı
+DEFAULT_PTY_LINK = '/tmp/ttyVirtualArduino'
+
+# Okuyucu yavaşsa bekletilen en fazla bayt - aşan çerçeve düşürülür
+MAX_PENDING = 64 * 1024
+
+
+def pty_supported():
+    """Platform sözde terminal destekliyor mu (Windows'ta hayır)"""
+    return os.name == 'posix' and hasattr(os, 'openpty')
+
+
+def wire_seconds(byte_count, baudrate):
+    """byte_count baytın 8N1 hatta gönderim süresi (saniye) - 0 baud sınırsız"""
+    return byte_count * 10.0 / baudrate if baudrate else 0.0
+
+
+class PtySerialPort:
+    """Sözde terminal çiftinin simülatör tarafı"""
+
+    def __init__(self, link=DEFAULT_PTY_LINK, baudrate=115200):
+        self.link = link
+        self.baudrate = baudrate
+        self.master_fd = None
+        self.device = None
+        self.poller = None
+        self.pending = bytearray()
+        self.frames_dropped = 0
+
+    def open(self):
+        """pty çiftini oluştur, bağımlı ucu ham moda al ve bağlantıyı yaz"""
+        if not pty_supported():
+            raise OSError("Sözde terminal (pty) bu platformda desteklenmiyor")
+        import termios
+        import tty
+
+        master_fd, slave_fd = os.openpty()
+        try:
+            # Yankı ve satır dönüşümleri kapalı - gerçek UART gibi ham baytlar
+            tty.setraw(slave_fd)
+            speed = getattr(termios, f'B{self.baudrate}', None)
+            if speed is not None:
+                attrs = termios.tcgetattr(slave_fd)
+                attrs[4] = attrs[5] = speed
+                termios.tcsetattr(slave_fd, termios.TCSANOW, attrs)
+            self.device = os.ttyname(slave_fd)
+        finally:
+            # Bağımlı uç yalnızca okuyucu tarafından açık tutulur (POLLHUP tespiti için)
+            os.close(slave_fd)
+
+        os.set_blocking(master_fd, False)
+        self.master_fd = master_fd
+        self.poller = select.poll()
+        self.poller.register(master_fd, select.POLLOUT)
+
+        if self.link:
+            if os.path.islink(self.link):
+                os.unlink(self.link)
+            os.symlink(self.device, self.link)
+        return self.device
+
+    @property
+    def has_reader(self):
+        """Bağımlı uç bir okuyucu tarafından açık mı"""
+        for _, events in self.poller.poll(0):
+            if events & select.POLLHUP:
+                return False
+        return True
+
+    def write(self, data):
+        """
+        Çerçeveyi gönder
+
+        Okuyucu yoksa veya bekleyen veri MAX_PENDING'i aşıyorsa çerçeve
+        düşürülür. Dönüş: çerçeve gönderim kuyruğuna alındıysa True
+        """
+        if not self.has_reader:
+            self.pending.clear()
+            self.frames_dropped += 1
+            return False
+        if len(self.pending) + len(data) > MAX_PENDING:
+            self.flush()
+            if len(self.pending) + len(data) > MAX_PENDING:
+                self.frames_dropped += 1
+                return False
+        self.pending += data
+        self.flush()
+        return True
+
+    def flush(self):
+        """Bekleyen baytları engellemeden yaz"""
+        while self.pending:
+            try:
+                sent = os.write(self.master_fd, self.pending)
+            except BlockingIOError:
+                return
+            except OSError:
+                # Okuyucu tam bu sırada kapandı
+                self.pending.clear()
+                return
+            del self.pending[:sent]
+
+    def drain(self, timeout=1.0):
+        """Kapatmadan önce okuyucunun bekleyen baytları almasını bekle"""
+        if self.master_fd is None or not self.has_reader:
+            return
+        import fcntl
+        import termios
+
+        # Okunmamış bayt sayısı yalnızca bağımlı uçtan sorgulanabilir
+        slave_fd = os.open(self.device, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        try:
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                self.flush()
+                unread = struct.unpack('i', fcntl.ioctl(slave_fd, termios.FIONREAD, b'\0' * 4))[0]
+                if not self.pending and not unread:
+                    break
+                time.sleep(0.01)
+        finally:
+            os.close(slave_fd)
+
+    def close(self):
+        if self.master_fd is not None:
+            self.drain()
+        if self.link and os.path.islink(self.link) and os.readlink(self.link) == self.device:
+            os.unlink(self.link)
+        if self.master_fd is not None:
+            os.close(self.master_fd)
+            self.master_fd = None
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ham Bayt Kaydı
+Seri port / TCP okuyucularının aldığı baytları alım zamanlarıyla birlikte
+sıkıştırılmış kayıt dosyasına yazar. Ayrıştırıcı hatası veya firmware
+biçim değişikliğinden sonra kayıt düzeltilmiş ayrıştırıcıyla yeniden okunup
+oturum (JSON veya .tstore) olarak yeniden üretilebilir.
+
+Dosya, art arda eklenmiş bağımsız gzip (.gz) veya xz (.xz) parçalarından
+oluşur; yazım yarıda kesilirse yalnızca son parça kaybolur. Açılmış içerik:
+
+    TLMRAW1\\n
+    {"source": ..., "started": ..., ...}\\n     -> başlık (JSON)
+    <d: alım zamanı><I: uzunluk><baytlar>     -> her okuma bir kayıt
+    ...
+
+Kullanım:
+    python raw_capture.py captures/ham_kayit_20250930_210000.rawcap.gz -o oturum.tstore
+    python raw_capture.py kayit.rawcap.xz -o oturum.json --clock receipt
+    python raw_capture.py kayit.rawcap.gz --info
+"""
+
+import argparse
+import gzip
+import json
+import lzma
+import os
+import struct
+import sys
+import time
+import zlib
+from datetime import datetime
+
+import numpy as np
+
+from distance_engine import distance_totals
+from resampler import align_channels, choose_reference
+from session_index import build_index, write_index
+from session_store import STORE_EXTENSION, SessionStoreWriter
+from telemetry_parser import CLOCKS, StreamParser
+
+CAPTURE_MAGIC = b'TLMRAW1\n'
+CAPTURE_VERSION = 1
+CAPTURE_EXTENSION = '.rawcap'
+COMPRESSIONS = {'gz': gzip, 'xz': lzma}
+DEFAULT_CAPTURE_DIR = 'captures'
+
+# Kayıt başlığı: alım zamanı (Unix saniye) ve bayt sayısı
+RECORD_HEADER = struct.Struct('<dI')
+
+# Parça bu boyuta ulaşınca veya en eski kaydı bu kadar bekleyince sıkıştırılıp yazılır
+DEFAULT_CHUNK_BYTES = 256 * 1024
+DEFAULT_FLUSH_SECONDS = 2.0
+
+# Oturum yazarken kanal başına biriktirilen örnek sayısı
+SESSION_BATCH = 65536
+
+
+def capture_compression(path):
+    """Dosya uzantısından sıkıştırma türü"""
+    extension = os.path.splitext(path)[1].lstrip('.').lower()
+    if extension not in COMPRESSIONS:
+        raise ValueError(f"Ham kayıt uzantısı .gz veya .xz olmalı: {path}")
+    return extension
+
+
+def is_capture_path(path):
+    """Ham kayıt dosyası mı (ör. kayit.rawcap.gz)"""
+    base, extension = os.path.splitext(path.lower())
+    return extension.lstrip('.') in COMPRESSIONS and base.endswith(CAPTURE_EXTENSION)
+
+
+def capture_filename(directory=DEFAULT_CAPTURE_DIR, compression='gz', started=None):
+    """Yeni kayıt için zaman damgalı dosya adı"""
+    started = started or datetime.now()
+    return os.path.join(directory, f"ham_kayit_{started.strftime('%Y%m%d_%H%M%S')}"
+                                   f"{CAPTURE_EXTENSION}.{compression}")
+
+
+class CaptureWriter:
+    """
+    Ham baytları akış halinde kayda yazar
+
+    write() yalnızca tampona ekler; tampon chunk_bytes'a ulaşınca veya en eski
+    kayıt flush_seconds'tan eski olunca tampon tek parça olarak sıkıştırılıp
+    diske yazılır. Okuyucu thread'i kendi yazıcısına sahip olmalıdır.
+    """
+
+    def __init__(self, path, source='', info=None, chunk_bytes=DEFAULT_CHUNK_BYTES,
+                 flush_seconds=DEFAULT_FLUSH_SECONDS, clock=time.time):
+        self.path = path
+        self.compression = capture_compression(path)
+        self.chunk_bytes = chunk_bytes
+        self.flush_seconds = flush_seconds
+        self.clock = clock
+        self.buffer = bytearray()
+        self.buffer_started = None
+        self.records = 0
+        self.bytes_in = 0
+        self.bytes_written = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = open(path, 'wb')
+
+        self.info = {
+            'format': 'raw_capture',
+            'version': CAPTURE_VERSION,
+            'source': source,
+            'started': clock(),
+            'started_iso': datetime.now().isoformat(),
+        }
+        self.info.update(info or {})
+        header = json.dumps(self.info, ensure_ascii=False).encode('utf-8')
+        self.buffer += CAPTURE_MAGIC + header + b'\n'
+        self.flush()
+
+    def write(self, data, receipt_time=None):
+        """Okunan bayt parçasını alım zamanıyla ekle"""
+        if not data:
+            return
+        now = self.clock()
+        self.buffer += RECORD_HEADER.pack(now if receipt_time is None else receipt_time, len(data))
+        self.buffer += data
+        self.records += 1
+        self.bytes_in += len(data)
+        if self.buffer_started is None:
+            self.buffer_started = now
+        if len(self.buffer) >= self.chunk_bytes or now - self.buffer_started >= self.flush_seconds:
+            self.flush()
+
+    def flush(self):
+        """Tamponu bağımsız bir sıkıştırılmış parça olarak yaz"""
+        if not self.buffer or self.file is None:
+            return
+        if self.compression == 'gz':
+            chunk = gzip.compress(bytes(self.buffer), compresslevel=6)
+        else:
+            chunk = lzma.compress(bytes(self.buffer), preset=1)
+        self.file.write(chunk)
+        self.file.flush()
+        self.bytes_written += len(chunk)
+        self.buffer.clear()
+        self.buffer_started = None
+
+    def close(self):
+        if self.file is not None:
+            # Son parça yazılamasa da (disk dolu) dosya tanıtıcısı bırakılır
+            try:
+                self.flush()
+            finally:
+                file, self.file = self.file, None
+                file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class CaptureReader:
+    """
+    Ham kaydı (alım zamanı, baytlar) çiftleri olarak okur
+
+    Yarıda kesilmiş son parça okunabildiği yere kadar verilir, truncated True olur.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.module = COMPRESSIONS[capture_compression(path)]
+        self.truncated = False
+        with self.module.open(path, 'rb') as f:
+            self.info = self._read_header(f)
+
+    def _read_header(self, f):
+        if f.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+            raise ValueError(f"Ham kayıt dosyası değil: {self.path}")
+        return json.loads(f.readline().decode('utf-8'))
+
+    def __iter__(self):
+        self.truncated = False
+        header_size = RECORD_HEADER.size
+        with self.module.open(self.path, 'rb') as f:
+            self._read_header(f)
+            try:
+                while True:
+                    header = f.read(header_size)
+                    if len(header) < header_size:
+                        self.truncated = bool(header)
+                        return
+                    receipt_time, length = RECORD_HEADER.unpack(header)
+                    data = f.read(length)
+                    if len(data) < length:
+                        self.truncated = True
+                        return
+                    yield receipt_time, data
+            except (EOFError, lzma.LZMAError, zlib.error, gzip.BadGzipFile):
+                self.truncated = True
+
+
+def write_json_session(filename, channels, export_info):
+    """Arayüzün kaydettiği datetime anahtarlı, hizalanmış JSON oturumu"""
+    telemetry_data = {name: {'times': times, 'values': values} for name, (times, values) in channels.items()}
+    reference = choose_reference(telemetry_data)
+    grid, aligned = align_channels(telemetry_data, reference=reference)
+
+    json_data = {'export_info': dict(export_info, total_records=len(grid),
+                                     data_types=list(channels),
+                                     alignment={'reference': reference, 'method': 'nearest'}),
+                 'data': {}}
+    columns = [(name, values.tolist()) for name, values in aligned.items()]
+    for index, timestamp in enumerate(grid.tolist()):
+        datetime_str = datetime.fromtimestamp(timestamp).isoformat()
+        record = {'timestamp': timestamp, 'datetime': datetime_str}
+        for name, values in columns:
+            value = values[index]
+            record[name] = None if value != value else value  # NaN → null
+        json_data['data'][datetime_str] = record
+
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(json_data, f, ensure_ascii=False)
+
+
+def reparse_capture(path, output, clock='line', verbose=True):
+    """
+    Ham kaydı oturuma dönüştür (.tstore klasörü veya .json)
+
+    Dönüş: {'records', 'bytes', 'lines', 'samples', 'channels', 'seconds',
+            'mb_per_s', 'truncated'}
+    """
+    is_store = output.rstrip('/\\').endswith(STORE_EXTENSION)
+    if not is_store and not output.lower().endswith('.json'):
+        raise ValueError(f"Çıktı .json veya {STORE_EXTENSION} olmalı: {output}")
+
+    reader = CaptureReader(path)
+    began = time.perf_counter()
+    export_info = {
+        'export_time': datetime.now().isoformat(),
+        'format': 'datetime_keyed',
+        'source_capture': os.path.basename(path),
+        'capture_source': reader.info.get('source', ''),
+        'clock': clock,
+    }
+
+    capture_parser = StreamParser(clock)
+    batches = {}
+    channels = {}
+    writer = SessionStoreWriter(output, info=export_info) if is_store else None
+    samples = 0
+    try:
+        for moment, data_type, value, _ in capture_parser.samples(reader):
+            times, values = batches.setdefault(data_type, ([], []))
+            times.append(moment)
+            values.append(value)
+            samples += 1
+            if len(times) >= SESSION_BATCH:
+                _flush_batch(data_type, times, values, writer, channels)
+        for data_type, (times, values) in batches.items():
+            _flush_batch(data_type, times, values, writer, channels)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    merged = {name: (np.concatenate(parts[0]), np.concatenate(parts[1])) for name, parts in channels.items()}
+    if not is_store:
+        if 'Speed' in merged:
+            export_info['total_distance_km'] = distance_totals(*merged['Speed'])['total_km']
+        write_json_session(output, merged, export_info)
+    # Oturum tarayıcısı için özet indeksi
+    write_index(output, build_index(merged))
+
+    seconds = time.perf_counter() - began
+    stats = {
+        'records': capture_parser.records,
+        'bytes': capture_parser.bytes,
+        'lines': capture_parser.lines,
+        'samples': samples,
+        'channels': {name: len(times) for name, (times, _) in merged.items()},
+        'seconds': seconds,
+        'mb_per_s': capture_parser.bytes / seconds / 1e6 if seconds > 0 else 0.0,
+        'truncated': reader.truncated,
+    }
+    if verbose:
+        print(f"✅ {stats['records']:,} okuma, {stats['bytes'] / 1e6:.1f} MB, {stats['lines']:,} satır → "
+              f"{samples:,} örnek ({stats['seconds']:.2f} s, {stats['mb_per_s']:.1f} MB/s)")
+        if reader.truncated:
+            print("⚠️ Kaydın son parçası yarıda kesilmiş, okunabilen kısım kullanıldı")
+        print(f"📁 Oturum: {output}")
+    return stats
+
+
+def _flush_batch(data_type, times, values, writer, channels):
+    """Biriken örnekleri kanala aktar (depoya yaz, indeks/JSON için sakla)"""
+    if not times:
+        return
+    times_array = np.asarray(times, dtype=np.float64)
+    values_array = np.asarray(values, dtype=np.float64)
+    # Satır zamanı kullanıldığında geç gelen örnekler sırayı bozabilir
+    if len(times_array) > 1 and np.any(np.diff(times_array) < 0):
+        order = np.argsort(times_array, kind='stable')
+        times_array, values_array = times_array[order], values_array[order]
+    if writer is not None:
+        writer.append(data_type, times_array, values_array)
+    parts = channels.setdefault(data_type, ([], []))
+    parts[0].append(times_array)
+    parts[1].append(values_array)
+    times.clear()
+    values.clear()
+
+
+def print_info(path):
+    """Kayıt başlığı ve içerik özeti"""
+    reader = CaptureReader(path)
+    records = total = 0
+    first = last = None
+    for receipt_time, data in reader:
+        records += 1
+        total += len(data)
+        first = receipt_time if first is None else first
+        last = receipt_time
+    print(f"📼 {path}")
+    for key, value in reader.info.items():
+        print(f"   {key}: {value}")
+    print(f"   Okuma: {records:,} | Bayt: {total:,} | Dosya: {os.path.getsize(path):,} bayt")
+    if first is not None:
+        print(f"   Süre: {last - first:.1f} s ({datetime.fromtimestamp(first)} → {datetime.fromtimestamp(last)})")
+    if reader.truncated:
+        print("   ⚠️ Son parça yarıda kesilmiş")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Ham bayt kaydını yeniden ayrıştırıp oturum üret')
+    parser.add_argument('capture', help='Ham kayıt (.rawcap.gz / .rawcap.xz)')
+    parser.add_argument('-o', '--output', default=None,
+                        help=f'Oturum dosyası (.json veya {STORE_EXTENSION}, varsayılan kayıt adı + {STORE_EXTENSION})')
+    parser.add_argument('--clock', choices=CLOCKS, default='line',
+                        help='Örnek zamanı: satır zaman damgası (varsayılan) veya alım anı')
+    parser.add_argument('--info', action='store_true', help='Yalnızca kayıt bilgilerini göster')
+    args = parser.parse_args(argv)
+
+    try:
+        if args.info:
+            print_info(args.capture)
+            return None
+        output = args.output or args.capture[:args.capture.lower().rfind(CAPTURE_EXTENSION)] + STORE_EXTENSION
+        return reparse_capture(args.capture, output, args.clock)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ekransız Rapor Çizimi
+Analiz raporları için matplotlib figürleri. Her seri çizilmeden önce piksel
+sütunu başına min/max çiftine indirilir: ekranda aynı görünen grafik, ham
+örnek sayısından bağımsız olarak en fazla ~4 × genişlik noktayla çizilir.
+Figürler pyplot durum makinesi kullanılmadan (Figure + Agg tuvali) oluşturulur,
+böylece toplu analizde süreçler/thread'ler birbirini etkilemez.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+# Desteklenen çıktı biçimleri
+REPORT_FORMATS = ('png', 'svg', 'pdf')
+
+# Varsayılan rapor boyutu
+REPORT_DPI = 150
+PANEL_WIDTH_IN = 7.5
+PANEL_HEIGHT_IN = 4.0
+
+
+def is_headless():
+    """Görüntü sunucusu yoksa (CI, SSH) True"""
+    if os.environ.get('MPLBACKEND', '').lower() == 'agg':
+        return True
+    if sys.platform.startswith('linux'):
+        return not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+    return False
+
+
+def use_headless_backend(force=False):
+    """
+    Ekransız ortamda (veya force ile) etkileşimsiz Agg arka ucunu seç
+
+    Dönüş: Agg seçildiyse True
+    """
+    if not (force or is_headless()):
+        return False
+    import matplotlib
+    if 'matplotlib.pyplot' in sys.modules:
+        import matplotlib.pyplot as plt
+        plt.switch_backend('Agg')
+    else:
+        matplotlib.use('Agg')
+    return True
+
+
+def decimate_min_max(times, values, width_px):
+    """
+    Seriyi piksel sütunu başına min/max örneklerine indir
+
+    times artan sırada olmalıdır. Her sütunun ilk, son, en küçük ve en büyük
+    örneği korunur; dönen indeksler zaman sırasındadır.
+    Dönüş: seçilen örneklerin indeksleri
+    """
+    times = np.asarray(times, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    count = len(values)
+    width_px = max(1, int(width_px))
+    if count <= 4 * width_px:
+        return np.arange(count)
+
+    span = times[-1] - times[0]
+    if span <= 0:
+        column = (np.arange(count) * width_px) // count
+    else:
+        column = np.minimum(((times - times[0]) / span * width_px).astype(np.int64), width_px - 1)
+
+    # Sütun içinde değere göre sırala: grubun ilk elemanı min, sonuncusu max
+    order = np.lexsort((values, column))
+    group_edges = np.flatnonzero(np.diff(column[order])) + 1
+    firsts = np.concatenate(([0], group_edges))
+    lasts = np.concatenate((group_edges - 1, [count - 1]))
+
+    # Sütun sınırları (zaman sırasında ilk/son örnek) çizgilerin kopmaması için
+    boundaries = np.flatnonzero(np.diff(column)) + 1
+    keep = np.concatenate((order[firsts], order[lasts], boundaries, boundaries - 1, [0, count - 1]))
+    return np.unique(keep)
+
+
+def panel_width_px(figure, columns):
+    """Figürde tek panelin piksel genişliği"""
+    return int(figure.get_figwidth() * figure.dpi / max(1, columns))
+
+
+def new_figure(rows, columns=2, dpi=REPORT_DPI):
+    """pyplot'tan bağımsız, Agg tuvalli figür"""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=(PANEL_WIDTH_IN * columns, PANEL_HEIGHT_IN * rows), dpi=dpi)
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def draw_panels(figure, panels, title=None, columns=2, xlabel='Zaman'):
+    """
+    Serileri ızgara düzeninde, seyrekleştirerek çiz
+
+    panels: [(başlık, x, y), ...] - x sayısal veya datetime64 dizisi
+    Dönüş: (ham örnek sayısı, çizilen örnek sayısı)
+    """
+    rows = max(1, -(-len(panels) // columns))
+    width = panel_width_px(figure, columns)
+    raw_points = drawn_points = 0
+
+    for i, (name, x, y) in enumerate(panels):
+        ax = figure.add_subplot(rows, columns, i + 1)
+        x = np.asarray(x)
+        y = np.asarray(y, dtype=np.float64)
+        mask = ~np.isnan(y)
+        x, y = x[mask], y[mask]
+        if len(y):
+            # datetime64 ekseni için sayısal kopya üzerinde seyrekleştir
+            numeric = x.astype('datetime64[ns]').astype(np.int64) if x.dtype.kind == 'M' else x
+            keep = decimate_min_max(numeric, y, width)
+            ax.plot(x[keep], y[keep], linewidth=0.8)
+            raw_points += len(y)
+            drawn_points += len(keep)
+        ax.set_title(name)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(name)
+        ax.grid(True, alpha=0.3)
+        ax.tick_params(axis='x', rotation=45)
+
+    if title:
+        figure.suptitle(title, fontsize=16)
+    figure.tight_layout()
+    return raw_points, drawn_points
+
+
+def save_figure(figure, base_path, formats=('png',), dpi=REPORT_DPI):
+    """Figürü her biçimde base_path + '.' + biçim olarak kaydet, dosya adlarını döndür"""
+    filenames = []
+    for fmt in formats:
+        if fmt not in REPORT_FORMATS:
+            raise ValueError(f"Desteklenmeyen biçim: {fmt}")
+        filename = f"{base_path}.{fmt}"
+        # tight_layout zaten uygulandı, bbox_inches='tight' her kayıtta ikinci bir çizim gerektirir
+        figure.savefig(filename, format=fmt, dpi=dpi)
+        filenames.append(filename)
+    return filenames
+
+
+def parse_formats(text):
+    """'png,svg' biçimindeki listeyi doğrula"""
+    formats = tuple(part.strip().lower() for part in text.split(',') if part.strip())
+    unknown = [fmt for fmt in formats if fmt not in REPORT_FORMATS]
+    if unknown or not formats:
+        raise ValueError(f"Desteklenmeyen biçim: {', '.join(unknown) or text}")
+    return formats
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Zaman Hizalama ve Yeniden Örnekleme
+Okuyucu thread her alanı ayrı datetime.now() ile damgaladığı için aynı veri
+bloğundaki kanalların zamanları birkaç milisaniye farklıdır. Bu modül tüm
+kanalları ortak bir zaman ızgarasına (referans kanalın zamanları veya sabit
+periyot) vektörel olarak yerleştirir:
+
+    nearest  - toleranstaki en yakın örnek
+    previous - toleranstaki son örnek (sıfırıncı derece tutma)
+    linear   - iki komşu örnek arası doğrusal interpolasyon
+
+Tolerans içinde örneği olmayan hücreler NaN olur.
+"""
+
+import numpy as np
+
+METHODS = ('nearest', 'previous', 'linear')
+
+# Referans kanal seçiminde öncelik (yoksa en çok örneği olan kanal)
+PREFERRED_REFERENCE = 'Speed'
+
+
+def _as_arrays(series):
+    times = np.asarray(series.get('times', []), dtype=np.float64)
+    values = np.asarray(series.get('values', []), dtype=np.float64)
+    if len(times) > 1 and np.any(np.diff(times) < 0):
+        order = np.argsort(times, kind='stable')
+        times, values = times[order], values[order]
+    return times, values
+
+
+def median_spacing(times):
+    """Ardışık örnek aralıklarının medyanı (saniye)"""
+    if len(times) < 2:
+        return 0.0
+    spacing = np.diff(times)
+    spacing = spacing[spacing > 0]
+    return float(np.median(spacing)) if len(spacing) else 0.0
+
+
+def choose_reference(telemetry_data, channels=None):
+    """Izgara için referans kanal: tercih edilen kanal, yoksa en çok örnekli kanal"""
+    channels = [c for c in (channels or telemetry_data) if len(telemetry_data[c].get('times', []))]
+    if not channels:
+        return None
+    if PREFERRED_REFERENCE in channels:
+        return PREFERRED_REFERENCE
+    return max(channels, key=lambda c: len(telemetry_data[c]['times']))
+
+
+def make_grid(telemetry_data, period=None, reference=None, channels=None):
+    """
+    Ortak zaman ızgarası
+
+    period verilirse tüm kanalları kapsayan sabit aralıklı ızgara, verilmezse
+    referans kanalın kendi zaman damgaları kullanılır.
+    """
+    channels = [c for c in (channels or telemetry_data) if len(telemetry_data[c].get('times', []))]
+    if not channels:
+        return np.empty(0)
+
+    if period:
+        start = min(float(np.min(telemetry_data[c]['times'])) for c in channels)
+        end = max(float(np.max(telemetry_data[c]['times'])) for c in channels)
+        return start + np.arange(int(np.floor((end - start) / period)) + 1) * period
+
+    reference = reference or choose_reference(telemetry_data, channels)
+    times, _ = _as_arrays(telemetry_data[reference])
+    return np.unique(times)
+
+
+def _neighbours(times, grid):
+    """Her ızgara noktasının önceki/eşit ve sonraki örneği ile uzaklıkları"""
+    # right: ızgara noktasından sonraki ilk örnek, left: önceki/eşit son örnek
+    right = np.searchsorted(times, grid, side='right')
+    left = right - 1
+    left_c = np.clip(left, 0, len(times) - 1)
+    right_c = np.clip(right, 0, len(times) - 1)
+    left_gap = np.where(left >= 0, grid - times[left_c], np.inf)
+    right_gap = np.where(right < len(times), times[right_c] - grid, np.inf)
+    return left_c, right_c, left_gap, right_gap
+
+
+def _nearest(left_c, right_c, left_gap, right_gap, tolerance):
+    """Toleranstaki en yakın örneğin sırası ve geçerlilik maskesi"""
+    index = np.where(right_gap < left_gap, right_c, left_c)
+    valid = np.minimum(left_gap, right_gap) <= tolerance
+    return index, valid
+
+
+def resample(times, values, grid, method='nearest', tolerance=None):
+    """
+    Tek kanalı ızgaraya yerleştir
+
+    times artan sırada olmalıdır. tolerance (saniye) verilmezse sınırsızdır;
+    linear yönteminde komşu örneklerin ikisi de tolerans içinde olmalıdır.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Bilinmeyen yöntem: {method}")
+
+    times = np.asarray(times, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    grid = np.asarray(grid, dtype=np.float64)
+    result = np.full(len(grid), np.nan)
+    if len(times) == 0 or len(grid) == 0:
+        return result
+    tolerance = np.inf if tolerance is None else tolerance
+    left_c, right_c, left_gap, right_gap = _neighbours(times, grid)
+
+    if method == 'previous':
+        valid = left_gap <= tolerance
+        result[valid] = values[left_c[valid]]
+    elif method == 'nearest':
+        index, valid = _nearest(left_c, right_c, left_gap, right_gap, tolerance)
+        result[valid] = values[index[valid]]
+    else:
+        exact = left_gap == 0
+        result[exact] = values[left_c[exact]]
+        between = ~exact & (left_gap <= tolerance) & (right_gap <= tolerance)
+        span = times[right_c[between]] - times[left_c[between]]
+        # Aynı zaman damgalı örneklerde (span 0) soldaki değer kullanılır
+        weight = np.divide(left_gap[between], span, out=np.zeros(len(span)), where=span > 0)
+        result[between] = (values[left_c[between]] * (1.0 - weight) +
+                           values[right_c[between]] * weight)
+    return result
+
+
+def align_channels(telemetry_data, channels=None, period=None, method='nearest',
+                   tolerance=None, reference=None):
+    """
+    Kanalları ortak ızgaraya hizala
+
+    telemetry_data: {kanal: {'times', 'values'}}
+    method: tek yöntem adı veya {kanal: yöntem} sözlüğü (varsayılan nearest)
+    tolerance verilmezse ızgara aralığının yarısı (nearest) veya tamamı alınır.
+    Dönüş: (grid, {kanal: değer dizisi})
+    """
+    channels = [c for c in (channels or telemetry_data) if len(telemetry_data[c].get('times', []))]
+    grid = make_grid(telemetry_data, period, reference, channels)
+    if len(grid) == 0:
+        return grid, {}
+
+    spacing = period or median_spacing(grid)
+    aligned = {}
+    for channel in channels:
+        channel_method = method.get(channel, 'nearest') if isinstance(method, dict) else method
+        channel_tolerance = tolerance
+        if channel_tolerance is None and spacing:
+            channel_tolerance = spacing / 2 if channel_method == 'nearest' else spacing
+        times, values = _as_arrays(telemetry_data[channel])
+        aligned[channel] = resample(times, values, grid, channel_method, channel_tolerance)
+    return grid, aligned
+
+
+def unused_samples(times, grid, tolerance=None):
+    """
+    nearest hizalamada hiçbir ızgara noktasına yerleşmeyen örnek sayısı
+
+    Referanstan hızlı kaydedilen kanallarda ve toleransta ızgara noktası
+    olmayan örneklerde hizalı tablo bu örnekleri içermez.
+    """
+    times = np.sort(np.asarray(times, dtype=np.float64))
+    grid = np.asarray(grid, dtype=np.float64)
+    if len(times) == 0 or len(grid) == 0:
+        return len(times)
+    tolerance = np.inf if tolerance is None else tolerance
+    index, valid = _nearest(*_neighbours(times, grid), tolerance)
+    return len(times) - len(np.unique(index[valid]))
+
+
+def unaligned_table(telemetry_data, channels=None):
+    """
+    Kayıpsız tablo: tüm kanalların zaman damgalarının birleşimi
+
+    Her kanal yalnızca kendi örneğinin olduğu satırlarda değer taşır, diğer
+    hücreler NaN kalır. Dönüş: (zamanlar, {kanal: değer dizisi})
+    """
+    channels = [c for c in (channels or telemetry_data) if len(telemetry_data[c].get('times', []))]
+    if not channels:
+        return np.empty(0), {}
+    series = {channel: _as_arrays(telemetry_data[channel]) for channel in channels}
+    grid = np.unique(np.concatenate([times for times, _ in series.values()]))
+    table = {}
+    for channel, (times, values) in series.items():
+        column = np.full(len(grid), np.nan)
+        column[np.searchsorted(grid, times)] = values
+        table[channel] = column
+    return grid, table
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kayan Pencere Kanalları
+Akım ve güç gibi kanalların yanında çizilen yumuşatılmış seriler: saniye
+cinsinden pencereli ortalama, min/max ve EWMA. Canlı akışta örnek başına
+amortize O(1) güncellenir (min/max için monoton deque), kayıtlı oturumlar
+için aynı sonuçları veren vektörel karşılıkları vardır.
+
+Pencere tanımı: t anındaki değer, (t - pencere, t] aralığındaki örneklerden
+hesaplanır.
+"""
+
+import math
+from collections import deque
+
+import numpy as np
+
+# (kaynak kanal, tür, pencere/zaman sabiti saniye)
+ROLLING_SPECS = [
+    ('Current', 'mean', 5.0),
+    ('Current', 'max', 30.0),
+    ('Power', 'mean', 5.0),
+    ('Power', 'max', 30.0),
+    ('Power', 'ewma', 10.0),
+]
+
+# Grafikte gösterilen kısa adlar
+KIND_LABELS = {'mean': 'ort', 'min': 'min', 'max': 'maks', 'ewma': 'EWMA'}
+
+
+def rolling_channel_name(source, kind, window):
+    """Türetilmiş kanal adı, ör. Current_mean5s"""
+    return f"{source}_{kind}{window:g}s"
+
+
+class RollingMean:
+    """Zaman pencereli kayan ortalama"""
+
+    def __init__(self, window):
+        self.window = window
+        self.samples = deque()
+        self.total = 0.0
+
+    def add(self, value, timestamp):
+        self.samples.append((timestamp, value))
+        self.total += value
+        cutoff = timestamp - self.window
+        while self.samples[0][0] <= cutoff:
+            self.total -= self.samples.popleft()[1]
+        return self.total / len(self.samples)
+
+    def reset(self):
+        self.samples.clear()
+        self.total = 0.0
+
+
+class RollingExtreme:
+    """Zaman pencereli kayan min veya max - monoton deque"""
+
+    def __init__(self, window, mode='max'):
+        self.window = window
+        self.is_max = mode == 'max'
+        self.samples = deque()
+
+    def add(self, value, timestamp):
+        samples = self.samples
+        # Yeni değerin gölgelediği eski adayları at
+        if self.is_max:
+            while samples and samples[-1][1] <= value:
+                samples.pop()
+        else:
+            while samples and samples[-1][1] >= value:
+                samples.pop()
+        samples.append((timestamp, value))
+
+        cutoff = timestamp - self.window
+        while samples[0][0] <= cutoff:
+            samples.popleft()
+        return samples[0][1]
+
+    def reset(self):
+        self.samples.clear()
+
+
+class Ewma:
+    """Düzensiz örnek aralıklarına uygun üstel ağırlıklı ortalama"""
+
+    def __init__(self, tau):
+        self.tau = tau
+        self.value = None
+        self.last_time = None
+
+    def add(self, value, timestamp):
+        if self.value is None:
+            self.value = value
+        else:
+            dt = max(0.0, timestamp - self.last_time)
+            alpha = 1.0 - math.exp(-dt / self.tau)
+            self.value += alpha * (value - self.value)
+        self.last_time = timestamp
+        return self.value
+
+    def reset(self):
+        self.value = None
+        self.last_time = None
+
+
+def make_aggregator(kind, window):
+    if kind == 'mean':
+        return RollingMean(window)
+    if kind in ('min', 'max'):
+        return RollingExtreme(window, kind)
+    if kind == 'ewma':
+        return Ewma(window)
+    raise ValueError(f"Bilinmeyen pencere türü: {kind}")
+
+
+class RollingChannels:
+    """Kaynak kanal başına canlı toplayıcılar"""
+
+    def __init__(self, specs=ROLLING_SPECS):
+        self.specs = list(specs)
+        self.by_source = {}
+        for source, kind, window in self.specs:
+            self.by_source.setdefault(source, []).append(
+                (rolling_channel_name(source, kind, window), make_aggregator(kind, window)))
+
+    @property
+    def names(self):
+        return [rolling_channel_name(*spec) for spec in self.specs]
+
+    def add(self, source, value, timestamp):
+        """Kaynak örneğini işle: [(kanal, değer), ...]"""
+        aggregators = self.by_source.get(source)
+        if not aggregators:
+            return []
+        return [(name, aggregator.add(value, timestamp)) for name, aggregator in aggregators]
+
+    def reset(self):
+        for aggregators in self.by_source.values():
+            for _, aggregator in aggregators:
+                aggregator.reset()
+
+
+def rolling_mean(times, values, window):
+    """Vektörel kayan ortalama - RollingMean ile aynı"""
+    times = np.asarray(times, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    sums = np.concatenate(([0.0], np.cumsum(values)))
+    first = np.searchsorted(times, times - window, side='right')
+    last = np.arange(1, len(times) + 1)
+    return (sums[last] - sums[first]) / (last - first)
+
+
+def rolling_extreme(times, values, window, mode='max'):
+    """Vektörel kayan min/max - RollingExtreme ile aynı"""
+    import pandas as pd
+
+    series = pd.Series(np.asarray(values, dtype=np.float64),
+                       index=pd.to_datetime(np.asarray(times, dtype=np.float64), unit='s'))
+    rolling = series.rolling(pd.Timedelta(seconds=window))
+    result = rolling.max() if mode == 'max' else rolling.min()
+    return result.to_numpy()
+
+
+def ewma(times, values, tau):
+    """Vektörel EWMA - Ewma ile aynı (yarı ömür = tau × ln 2)"""
+    import pandas as pd
+
+    times = np.asarray(times, dtype=np.float64)
+    series = pd.Series(np.asarray(values, dtype=np.float64))
+    try:
+        result = series.ewm(halflife=pd.Timedelta(seconds=tau * math.log(2)),
+                            times=pd.to_datetime(times, unit='s'), adjust=False).mean()
+        return result.to_numpy()
+    except NotImplementedError:
+        # Eski pandas sürümleri times ile adjust=False desteklemez
+        aggregator = Ewma(tau)
+        return np.array([aggregator.add(v, t) for t, v in zip(times, series.to_numpy())])
+
+
+def derive_rolling_channels(telemetry_data, specs=ROLLING_SPECS):
+    """
+    Zaman sıralı kaynak kanallardan kayan pencere kanallarını vektörel hesapla
+
+    Dönüş: {kanal: (times, values)}
+    """
+    derived = {}
+    for source, kind, window in specs:
+        series = telemetry_data.get(source) or {}
+        if not len(series.get('times', [])):
+            continue
+        times = np.asarray(series['times'], dtype=np.float64)
+        values = np.asarray(series['values'], dtype=np.float64)
+        if kind == 'mean':
+            result = rolling_mean(times, values, window)
+        elif kind == 'ewma':
+            result = ewma(times, values, window)
+        else:
+            result = rolling_extreme(times, values, window, kind)
+        derived[rolling_channel_name(source, kind, window)] = (times, result)
+    return derived
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Senaryo Motoru
+Simülatörlerin ortak araç modeli. Hız, akım, gerilim ve güç rastgele yürüyüş
+yerine betiklenmiş evrelerden türetilir:
+
+    launch  - hedef hıza ivmelen
+    cruise  - hedef hız çevresinde seyir
+    braking - sıfıra kadar fren (rejeneratif akım)
+    stop    - bekleme
+    sag     - seyir sırasında batarya geriliminin düşmesi
+
+Tüm rastgelelik motorun kendi tohumlanmış üretecinden gelir ve zaman adımı
+simülasyon zamanıdır (duvar saati değil): aynı senaryo + tohum + adım dizisi
+her çalıştırmada bit düzeyinde aynı değerleri verir.
+
+Senaryolar JSON dosyasından yüklenebilir (bkz. scenario_endurance.json):
+
+    {"name": "Kısa tur", "loop": true, "phases": [
+        {"type": "launch", "target": 35, "accel": 3.0},
+        {"type": "cruise", "duration": 60, "target": 35},
+        {"type": "braking", "decel": 6.0},
+        {"type": "stop", "duration": 5}
+    ]}
+"""
+
+import json
+import math
+import random
+
+import numpy as np
+
+# Araç sabitleri - tüm simülatörlerde ortak
+GEAR_RATIO = 14             # ERPM / RPM
+WHEEL_DIAMETER_M = 0.5
+MAX_SPEED = 80.0            # km/h
+KMH_PER_RPM = WHEEL_DIAMETER_M * math.pi * 60 / 1000
+
+# Elektriksel model
+FULL_VOLTAGE = 20.5         # Dolu batarya açık devre gerilimi (V)
+MIN_VOLTAGE = 16.0
+MAX_VOLTAGE = 21.0
+INTERNAL_RESISTANCE = 0.1   # Ω - yük altında gerilim düşümü
+VOLTS_PER_AH = 0.3          # Çekilen yük başına açık devre gerilim kaybı
+ROLLING_CURRENT = 0.08      # A / (km/h)
+DRAG_CURRENT = 0.002        # A / (km/h)^2
+ACCEL_CURRENT = 1.5         # A / (km/h/s)
+REGEN_CURRENT = 0.8         # A / (km/h/s) - frenlemede negatif akım
+REGEN_MIN_DECEL = 1.0       # km/h/s - bunun altındaki yavaşlama serbest sürüştür
+MIN_CURRENT = -10.0
+MAX_CURRENT = 30.0
+
+# Simülatörlerin örnek alanları
+FIELDS = ('erpm', 'rpm', 'speed', 'current', 'duty', 'voltage', 'power')
+
+PHASE_TYPES = ('launch', 'cruise', 'braking', 'stop', 'sag')
+
+# Dosya verilmezse kullanılan senaryo: kalkış, seyir, fren, durak, gerilim düşüşü
+DEFAULT_SCENARIO = {
+    'name': 'Varsayılan tur',
+    'loop': True,
+    'phases': [
+        {'type': 'launch', 'target': 30.0, 'accel': 2.5},
+        {'type': 'cruise', 'duration': 40.0, 'target': 30.0},
+        {'type': 'launch', 'target': 42.0, 'accel': 1.5},
+        {'type': 'sag', 'duration': 20.0, 'target': 42.0, 'drop': 0.6},
+        {'type': 'braking', 'decel': 5.0},
+        {'type': 'stop', 'duration': 5.0},
+    ],
+}
+
+
+def validate_phase(config):
+    """Evre sözlüğünü doğrula ve varsayılanları doldur"""
+    kind = config.get('type')
+    if kind not in PHASE_TYPES:
+        raise ValueError(f"Bilinmeyen evre tipi: {kind}")
+    phase = {
+        'type': kind,
+        'duration': config.get('duration'),
+        'target': config.get('target'),
+        'accel': float(config.get('accel', 3.0)),
+        'decel': float(config.get('decel', 6.0)),
+        'noise': float(config.get('noise', 0.8)),
+        'drop': float(config.get('drop', 0.0)),
+    }
+    if kind in ('cruise', 'stop', 'sag') and phase['duration'] is None:
+        raise ValueError(f"{kind}: 'duration' gerekli")
+    if kind == 'launch' and phase['target'] is None:
+        raise ValueError("launch: 'target' gerekli")
+    if phase['duration'] is not None and phase['duration'] <= 0:
+        raise ValueError(f"{kind}: 'duration' pozitif olmalı")
+    if phase['accel'] <= 0 or phase['decel'] <= 0:
+        raise ValueError(f"{kind}: 'accel' ve 'decel' pozitif olmalı")
+    return phase
+
+
+def load_scenario(filename):
+    """Senaryo dosyasını oku ve doğrula"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    return parse_scenario(config)
+
+
+def parse_scenario(config):
+    phases = [validate_phase(phase) for phase in config.get('phases', [])]
+    if not phases:
+        raise ValueError("Senaryoda en az bir evre olmalı")
+    return {'name': config.get('name', 'Senaryo'), 'loop': bool(config.get('loop', True)),
+            'phases': phases}
+
+
+class ScenarioEngine:
+    """
+    Tohumlanmış araç modeli
+
+    step(dt) simülasyon zamanını dt saniye ilerletir ve FIELDS alanlarını
+    içeren bir örnek döndürür. Senaryo bitince loop ise baştan (dolu
+    bataryayla) başlar, değilse araç son evrenin ardından durur.
+    """
+
+    def __init__(self, scenario=None, seed=None):
+        if scenario is None:
+            scenario = DEFAULT_SCENARIO
+        elif isinstance(scenario, str):
+            scenario = load_scenario(scenario)
+        self.scenario = parse_scenario(scenario)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.reset()
+
+    def reset(self):
+        self.rng.seed(self.seed)
+        self.time = 0.0
+        self.speed = 0.0
+        self.wobble = 0.0
+        self.finished = False
+        self._start_lap()
+        self.sample = self._sample(0.0, 0.0)
+
+    def _start_lap(self):
+        self.ocv = FULL_VOLTAGE
+        self.phase_index = 0
+        self.phase_time = 0.0
+
+    @property
+    def phase(self):
+        return self.scenario['phases'][self.phase_index]
+
+    def _next_phase(self):
+        self.phase_index += 1
+        self.phase_time = 0.0
+        if self.phase_index >= len(self.scenario['phases']):
+            if self.scenario['loop']:
+                self._start_lap()
+            else:
+                self.phase_index = len(self.scenario['phases']) - 1
+                self.finished = True
+
+    def _phase_done(self, phase):
+        if phase['duration'] is not None:
+            return self.phase_time >= phase['duration']
+        if phase['type'] == 'launch':
+            return self.speed >= phase['target']
+        if phase['type'] == 'braking':
+            return self.speed <= 0.0
+        return False
+
+    def _acceleration(self, phase, dt):
+        """Evreye göre istenen ivme (km/h/s)"""
+        kind = phase['type']
+        if self.finished or kind == 'stop':
+            return -self.speed / dt
+        if kind == 'braking':
+            return -min(phase['decel'], self.speed / dt)
+        if kind == 'launch':
+            return max(-phase['decel'], min(phase['accel'], (phase['target'] - self.speed) / dt))
+
+        # cruise/sag: hedef çevresinde yavaş salınım (Ornstein-Uhlenbeck)
+        target = self.speed if phase['target'] is None else phase['target']
+        self.wobble += -self.wobble * dt / 5.0 + phase['noise'] * math.sqrt(dt) * self.rng.gauss(0.0, 1.0)
+        desired = 2.0 * (target + self.wobble - self.speed)
+        return max(-phase['decel'], min(phase['accel'], desired))
+
+    def step(self, dt=0.1):
+        """Modeli dt saniye ilerlet, yeni örneği döndür"""
+        phase = self.phase
+        accel = self._acceleration(phase, dt)
+        self.speed = max(0.0, min(MAX_SPEED, self.speed + accel * dt))
+        if phase['type'] == 'sag' and not self.finished:
+            self.ocv -= phase['drop'] * dt / phase['duration']
+
+        self.time += dt
+        self.phase_time += dt
+        self.sample = self._sample(accel, dt)
+        if not self.finished and self._phase_done(phase):
+            self._next_phase()
+        return self.sample
+
+    def _sample(self, accel, dt):
+        moving = self.speed > 0.1
+        current = ROLLING_CURRENT * self.speed + DRAG_CURRENT * self.speed ** 2 + ACCEL_CURRENT * accel
+        if current < 0:
+            # Hafif yavaşlamada serbest sürüş, belirgin frende rejenerasyon
+            current = REGEN_CURRENT * accel if moving and accel <= -REGEN_MIN_DECEL else 0.0
+        current += self.rng.gauss(0.0, 0.2 if moving else 0.05)
+        current = max(MIN_CURRENT, min(MAX_CURRENT, current))
+
+        self.ocv = max(MIN_VOLTAGE, self.ocv - max(current, 0.0) * dt / 3600 * VOLTS_PER_AH)
+        voltage = self.ocv - INTERNAL_RESISTANCE * current + self.rng.gauss(0.0, 0.03)
+        voltage = max(MIN_VOLTAGE, min(MAX_VOLTAGE, voltage))
+
+        erpm = int(round(self.speed / KMH_PER_RPM * GEAR_RATIO))
+        duty = 0
+        if moving or accel > 0:
+            duty = int(round(max(0.0, min(100.0, self.speed / MAX_SPEED * 100 + max(accel, 0.0) * 5))))
+
+        return {
+            'erpm': erpm,
+            'rpm': erpm // GEAR_RATIO,
+            'speed': self.speed,
+            'current': current,
+            'duty': duty,
+            'voltage': voltage,
+            'power': voltage * current,
+        }
+
+    def copy_to(self, target):
+        """Son örneği simülatörün alanlarına (erpm, speed, ...) yaz"""
+        for name, value in self.sample.items():
+            setattr(target, name, value)
+
+    def apply(self, target, dt=0.1):
+        """Modeli ilerletip örneği simülatörün alanlarına yaz"""
+        self.step(dt)
+        self.copy_to(target)
+
+
+def ar1_filter(x, a, state=0.0):
+    """
+    y[n] = a * y[n-1] + x[n] vektörel (blok başına ölçekli kümülatif toplam)
+
+    Dönüş: (y, son durum) - durum sonraki parçaya aktarılır
+    """
+    x = np.asarray(x, dtype=np.float64)
+    if a <= 0.0:
+        return x.copy(), (float(x[-1]) if len(x) else state)
+    # a^-blok taşmasın diye blok boyu a'ya göre seçilir
+    block = int(max(1, min(4096, 300.0 / max(-math.log(a), 1e-12))))
+    powers = a ** np.arange(1, block + 1)
+    y = np.empty_like(x)
+    for start in range(0, len(x), block):
+        segment = x[start:start + block]
+        p = powers[:len(segment)]
+        y[start:start + len(segment)] = p * (state + np.cumsum(segment / p))
+        state = float(y[start + len(segment) - 1])
+    return y, state
+
+
+class BulkScenario:
+    """
+    ScenarioEngine ile aynı sabit ve evrelerle vektörel örnek üretimi
+
+    Kare kare model yerine tur başına bir hız şablonu oluşturulur; seyir
+    salınımı ve hız takibi AR(1) filtreleriyle, akım ve gerilim NumPy dizi
+    işlemleriyle hesaplanır. next_chunk() ardışık parçalar üretir, filtre
+    ve batarya durumu parçalar arasında korunur. Aynı senaryo, tohum ve
+    parça dizisi aynı çıktıyı verir (adım motoruyla bit düzeyinde aynı değil,
+    aynı modelin vektörel karşılığıdır).
+    """
+
+    def __init__(self, scenario=None, seed=None, dt=0.1):
+        if scenario is None:
+            scenario = DEFAULT_SCENARIO
+        elif isinstance(scenario, str):
+            scenario = load_scenario(scenario)
+        self.scenario = parse_scenario(scenario)
+        self.dt = dt
+        # Her gürültü kaynağının ayrı üreteci: çıktı parça boyutundan bağımsız olur
+        wobble_seed, current_seed, voltage_seed = np.random.SeedSequence(seed).spawn(3)
+        self.wobble_rng = np.random.default_rng(wobble_seed)
+        self.current_rng = np.random.default_rng(current_seed)
+        self.voltage_rng = np.random.default_rng(voltage_seed)
+        self.first_lap = self._lap_template(0.0)
+        self.lap = self._lap_template(self.first_lap['speed'][-1])
+        self.index = 0
+        self.wobble = 0.0
+        self.deviation = 0.0
+        self.last_speed = 0.0
+        self.drain = 0.0
+
+    def _lap_template(self, speed):
+        """Bir turun gürültüsüz hız şablonu, seyir maskesi ve gerilim düşüşü"""
+        dt = self.dt
+        speeds, noise, sag = [], [], []
+        for phase in self.scenario['phases']:
+            kind = phase['type']
+            if phase['duration'] is not None:
+                count = max(1, int(round(phase['duration'] / dt)))
+            elif kind == 'launch':
+                count = max(1, int(math.ceil(abs(phase['target'] - speed) / (phase['accel'] * dt))))
+            else:  # braking
+                count = max(1, int(math.ceil(speed / (phase['decel'] * dt))))
+            steps = np.arange(1, count + 1) * dt
+
+            if kind == 'braking':
+                profile = np.maximum(speed - phase['decel'] * steps, 0.0)
+            elif kind == 'stop':
+                profile = np.zeros(count)
+            else:
+                # Kalkış ve seyir hedef hıza ivme/fren sınırıyla yaklaşır
+                target = speed if phase['target'] is None else min(MAX_SPEED, float(phase['target']))
+                if target >= speed:
+                    profile = np.minimum(speed + phase['accel'] * steps, target)
+                else:
+                    profile = np.maximum(speed - phase['decel'] * steps, target)
+
+            cruising = kind in ('cruise', 'sag')
+            speeds.append(profile)
+            noise.append(np.full(count, phase['noise'] if cruising else 0.0))
+            sag.append(np.full(count, phase['drop'] / count if kind == 'sag' else 0.0))
+            speed = float(profile[-1])
+
+        return {
+            'speed': np.concatenate(speeds),
+            'noise': np.concatenate(noise),
+            'sag': np.cumsum(np.concatenate(sag)),
+        }
+
+    def _positions(self, count):
+        """Parçadaki karelerin (şablon, konum) eşlemesi"""
+        index = self.index + np.arange(count)
+        first_len = len(self.first_lap['speed'])
+        in_first = index < first_len
+        lap_pos = index - first_len
+        if self.scenario['loop']:
+            lap_pos = lap_pos % len(self.lap['speed'])
+        return index, in_first, lap_pos
+
+    def _template(self, name, index, in_first, lap_pos):
+        first = self.first_lap[name]
+        values = np.empty(len(index))
+        values[in_first] = first[index[in_first]]
+        rest = ~in_first
+        if self.scenario['loop']:
+            values[rest] = self.lap[name][lap_pos[rest]]
+        else:
+            # Senaryo bitti: araç durur, batarya düşüşü son değerinde kalır
+            values[rest] = 0.0 if name != 'sag' else first[-1]
+        return values
+
+    def next_chunk(self, count):
+        """Sıradaki count örnek: {alan: dizi}"""
+        dt = self.dt
+        index, in_first, lap_pos = self._positions(count)
+        base = self._template('speed', index, in_first, lap_pos)
+        noise = self._template('noise', index, in_first, lap_pos)
+        sag = self._template('sag', index, in_first, lap_pos)
+
+        # Seyir salınımı (OU) yalnızca seyir karelerinde ilerler; hız sapması
+        # seyirden sonra da takip sabitiyle söner, evre geçişlerinde sıçrama olmaz
+        cruising = noise > 0
+        wobble_in = noise[cruising] * math.sqrt(dt) * self.wobble_rng.standard_normal(int(cruising.sum()))
+        wobble, self.wobble = ar1_filter(wobble_in, 1.0 - dt / 5.0, self.wobble)
+        tracking = np.zeros(count)
+        tracking[cruising] = 2.0 * dt * wobble
+        deviation, self.deviation = ar1_filter(tracking, max(0.0, 1.0 - 2.0 * dt), self.deviation)
+        speed = np.clip(base + deviation, 0.0, MAX_SPEED)
+
+        accel = np.diff(speed, prepend=self.last_speed) / dt
+        self.last_speed = float(speed[-1]) if count else self.last_speed
+
+        moving = speed > 0.1
+        current = ROLLING_CURRENT * speed + DRAG_CURRENT * speed ** 2 + ACCEL_CURRENT * accel
+        negative = current < 0
+        regen = negative & moving & (accel <= -REGEN_MIN_DECEL)
+        current[negative] = 0.0
+        current[regen] = REGEN_CURRENT * accel[regen]
+        current += self.current_rng.standard_normal(count) * np.where(moving, 0.2, 0.05)
+        np.clip(current, MIN_CURRENT, MAX_CURRENT, out=current)
+
+        # Çekilen yükle açık devre gerilimi düşer, her tur dolu bataryayla başlar
+        drain = np.maximum(current, 0.0) * dt / 3600 * VOLTS_PER_AH
+        lap_start = np.flatnonzero((index == 0) | (~in_first & (lap_pos == 0)))
+        drain_total = np.empty(count)
+        edges = np.concatenate(([0], lap_start[lap_start > 0], [count]))
+        for left, right in zip(edges[:-1], edges[1:]):
+            if left in lap_start:
+                self.drain = 0.0
+            drain_total[left:right] = self.drain + np.cumsum(drain[left:right])
+            if right > left:
+                self.drain = float(drain_total[right - 1])
+        ocv = np.maximum(MIN_VOLTAGE, FULL_VOLTAGE - sag - drain_total)
+        voltage = ocv - INTERNAL_RESISTANCE * current + self.voltage_rng.standard_normal(count) * 0.03
+        np.clip(voltage, MIN_VOLTAGE, MAX_VOLTAGE, out=voltage)
+
+        erpm = np.rint(speed / KMH_PER_RPM * GEAR_RATIO).astype(np.int64)
+        duty = np.rint(np.clip(speed / MAX_SPEED * 100 + np.maximum(accel, 0.0) * 5, 0.0, 100.0))
+        duty = np.where(moving | (accel > 0), duty, 0.0).astype(np.int64)
+
+        self.index += count
+        return {
+            'erpm': erpm,
+            'rpm': erpm // GEAR_RATIO,
+            'speed': speed,
+            'current': current,
+            'duty': duty,
+            'voltage': voltage,
+            'power': voltage * current,
+        }
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tur / Segment Tespiti
+Oturumu turlara (toplam mesafe mod pist uzunluğu) veya duraklarla ayrılan
+stint'lere böler. Sonuç, Speed serisindeki başlangıç/bitiş örnek ofsetleri ve
+segment başına özetlerden oluşan küçük bir indekstir; turlar bu indeks
+üzerinden karşılaştırılır, ham örnekler yeniden taranmaz.
+"""
+
+from array import array
+
+import numpy as np
+
+from distance_engine import DEFAULT_MAX_GAP, cumulative_distance
+from energy_engine import cumulative_integral
+
+# Bu süreden (saniye) uzun Speed == 0 aralıkları durak sayılır
+DEFAULT_MIN_STOP = 10.0
+
+# Bu hızın (km/h) altı durmuş kabul edilir
+STOP_SPEED = 0.0
+
+# Segment indeksinin kullandığı kanallar
+SEGMENT_CHANNELS = ('Speed', 'Power', 'Current')
+
+# Segment indeksi satır yapısı (ofsetler Speed serisinde, 'end' dahil)
+SEGMENT_DTYPE = np.dtype([
+    ('start', np.int64),
+    ('end', np.int64),
+    ('start_time', np.float64),
+    ('end_time', np.float64),
+    ('duration_s', np.float64),
+    ('distance_km', np.float64),
+    ('energy_wh', np.float64),
+    ('max_current', np.float64),
+    ('avg_speed', np.float64),
+    ('complete', np.bool_),
+])
+
+
+def lap_boundaries(distance, track_length_km):
+    """
+    Toplam mesafe pist uzunluğunun katlarını geçtiği örneklerde turları böl
+
+    Dönüş: (starts, ends) - ardışık turlar sınır örneğini paylaşır
+    """
+    n = len(distance)
+    if n < 2 or track_length_km <= 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    lap_count = int(distance[-1] // track_length_km)
+    crossings = np.searchsorted(distance, np.arange(1, lap_count + 1) * track_length_km)
+    crossings = crossings[(crossings > 0) & (crossings < n - 1)]
+    starts = np.unique(np.concatenate(([0], crossings))).astype(np.int64)
+    ends = np.append(starts[1:], n - 1).astype(np.int64)
+    return starts, ends
+
+
+def stop_boundaries(times, speeds, min_stop_s=DEFAULT_MIN_STOP, stop_speed=STOP_SPEED):
+    """
+    En az min_stop_s süren durakların arasında kalan hareket bölümlerini bul
+
+    Dönüş: (starts, ends) - duraklar segmentlere dahil edilmez
+    """
+    times = np.asarray(times, dtype=np.float64)
+    moving = np.asarray(speeds, dtype=np.float64) > stop_speed
+    if not np.any(moving):
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    # Hareket bölümlerinin sınırları (run-length)
+    padded = np.concatenate(([False], moving, [False]))
+    edges = np.flatnonzero(np.diff(padded.astype(np.int8)))
+    run_starts, run_ends = edges[0::2], edges[1::2] - 1
+
+    # Kısa duraklarla ayrılan bölümleri birleştir
+    stop_durations = times[run_starts[1:]] - times[run_ends[:-1]]
+    split = np.flatnonzero(stop_durations >= min_stop_s)
+    starts = np.concatenate(([run_starts[0]], run_starts[split + 1])).astype(np.int64)
+    ends = np.concatenate((run_ends[split], [run_ends[-1]])).astype(np.int64)
+    return starts, ends
+
+
+def _series(telemetry_data, channel):
+    series = telemetry_data.get(channel) or {}
+    times = np.asarray(series.get('times', []), dtype=np.float64)
+    values = np.asarray(series.get('values', []), dtype=np.float64)
+    return times, values
+
+
+class SegmentHistory:
+    """
+    Segment kanallarının oturum boyunca tüm örnekleri
+
+    Görüntü tamponları max_data_points ile kırpılır; turlar ve stint'ler tüm
+    oturumdan bulunabilsin diye SEGMENT_CHANNELS örnekleri burada sıkı double
+    dizilerinde (örnek başına 16 bayt, amortize O(1) ekleme) tutulur.
+    """
+
+    def __init__(self, channels=SEGMENT_CHANNELS):
+        self.channels = {channel: (array('d'), array('d')) for channel in channels}
+
+    def add(self, data_type, value, timestamp):
+        series = self.channels.get(data_type)
+        if series is not None:
+            series[0].append(timestamp)
+            series[1].append(value)
+
+    def rebuild(self, telemetry_data):
+        """Mevcut telemetri listelerinden yeniden oluştur (ör. JSON yükleme sonrası)"""
+        self.clear()
+        for data_type, (times, values) in self.channels.items():
+            series = telemetry_data.get(data_type) or {}
+            times.extend(series.get('times', []))
+            values.extend(series.get('values', []))
+
+    def clear(self):
+        for times, values in self.channels.values():
+            del times[:]
+            del values[:]
+
+    def as_telemetry_data(self):
+        """
+        build_segment_index için {'kanal': {'times', 'values'}} kopyası
+
+        Görünüm (frombuffer) yerine kopya döner: dışa aktarılmış tampon varken
+        array büyüyemez ve canlı akışta ekleme BufferError verir.
+        """
+        return {data_type: {'times': np.array(times, dtype=np.float64),
+                            'values': np.array(values, dtype=np.float64)}
+                for data_type, (times, values) in self.channels.items()}
+
+
+class SegmentIndex:
+    """Tur veya stint indeksi ve segment başına özetler"""
+
+    def __init__(self, kind, segments, track_length_km=None):
+        self.kind = kind  # 'lap' veya 'stint'
+        self.segments = segments
+        self.track_length_km = track_length_km
+
+    def __len__(self):
+        return len(self.segments)
+
+    def best(self):
+        """Tamamlanmış segmentler içinde en kısa süreli olanın sırası, yoksa None"""
+        complete = np.flatnonzero(self.segments['complete'])
+        if len(complete) == 0:
+            return None
+        return int(complete[np.argmin(self.segments['duration_s'][complete])])
+
+    def records(self):
+        """Tablo/dışa aktarma için satır sözlükleri (en iyiye göre fark dahil)"""
+        best = self.best()
+        best_duration = self.segments['duration_s'][best] if best is not None else None
+        rows = []
+        for number, segment in enumerate(self.segments, start=1):
+            row = {name: segment[name].item() for name in SEGMENT_DTYPE.names}
+            row['segment'] = number
+            row['wh_per_km'] = (row['energy_wh'] / row['distance_km']
+                                if row['distance_km'] > 0 else None)
+            row['delta_best_s'] = (row['duration_s'] - best_duration
+                                   if best_duration is not None and row['complete'] else None)
+            rows.append(row)
+        return rows
+
+
+def build_segment_index(telemetry_data, track_length_km=None, min_stop_s=DEFAULT_MIN_STOP,
+                        max_gap=DEFAULT_MAX_GAP):
+    """
+    Zaman sıralı kanallardan segment indeksini oluştur
+
+    telemetry_data: {'Speed': {'times', 'values'}, 'Power': ..., 'Current': ...}
+    track_length_km verilirse turlara, verilmezse duraklara göre bölünür.
+    """
+    times, speeds = _series(telemetry_data, 'Speed')
+    distance = cumulative_distance(times, speeds, max_gap)
+
+    if track_length_km:
+        kind = 'lap'
+        starts, ends = lap_boundaries(distance, track_length_km)
+    else:
+        kind = 'stint'
+        starts, ends = stop_boundaries(times, speeds, min_stop_s)
+
+    segments = np.zeros(len(starts), dtype=SEGMENT_DTYPE)
+    if len(starts) == 0:
+        return SegmentIndex(kind, segments, track_length_km)
+
+    segments['start'] = starts
+    segments['end'] = ends
+    segments['start_time'] = times[starts]
+    segments['end_time'] = times[ends]
+    segments['duration_s'] = segments['end_time'] - segments['start_time']
+    segments['distance_km'] = distance[ends] - distance[starts]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        avg_speed = segments['distance_km'] / segments['duration_s'] * 3600.0
+    segments['avg_speed'] = np.where(segments['duration_s'] > 0, avg_speed, 0.0)
+
+    # Enerji: Power integralinin segment sınırlarındaki farkı
+    power_times, power = _series(telemetry_data, 'Power')
+    if len(power_times) > 1:
+        energy = cumulative_integral(power_times, power, 1.0 / 3600.0, max_gap)
+        segments['energy_wh'] = (np.interp(segments['end_time'], power_times, energy) -
+                                 np.interp(segments['start_time'], power_times, energy))
+
+    # Maksimum akım: her segmentin zaman aralığındaki akım örnekleri
+    current_times, current = _series(telemetry_data, 'Current')
+    segments['max_current'] = np.nan
+    if len(current_times):
+        lo = np.searchsorted(current_times, segments['start_time'], side='left')
+        hi = np.searchsorted(current_times, segments['end_time'], side='right')
+        for i in range(len(segments)):
+            if hi[i] > lo[i]:
+                segments['max_current'][i] = current[lo[i]:hi[i]].max()
+
+    # Son tur pist uzunluğuna ulaşmadıysa eksik sayılır
+    segments['complete'] = True
+    if kind == 'lap':
+        segments['complete'][-1] = segments['distance_km'][-1] >= track_length_km * 0.999
+
+    return SegmentIndex(kind, segments, track_length_km)
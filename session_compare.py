@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Oturum Karşılaştırma
+Birden çok kayıtlı oturumu salt okunur depolar (SessionStore) üzerinden aynı
+eksende üst üste çizmek için yardımcılar. Eksen geçen süre (dakika) veya
+mesafe (km) olabilir; mesafe ekseninde aynı pist konumundaki örnekler
+karşılaştırılır. Görünür aralık her oturumdan ayrıntı seviyesine (LOD) göre
+seyrekleştirilmiş olarak okunur, ham veri belleğe alınmaz.
+"""
+
+import os
+
+import numpy as np
+
+from distance_engine import DEFAULT_MAX_GAP, cumulative_distance
+from resampler import median_spacing, resample
+
+COMPARE_CHANNELS = ['Speed', 'Current', 'Voltage', 'Power']
+
+# Eksen adı -> etiket
+AXES = {
+    'time': 'Zaman (dakika)',
+    'distance': 'Mesafe (km)',
+}
+
+# Fark grafiğinde mesafe ekseninde zaman farkı (saniye)
+DELTA_TIME = 'DeltaTime'
+
+# Fark eğrisinde boşluk sayılan aralık: ızgara adımı / örnek aralığının katı
+DELTA_GAP_FACTOR = 3.0
+
+
+class CompareSession:
+    """Tek oturum: salt okunur depo ve eksen dönüşümleri"""
+
+    def __init__(self, store, label=None, max_gap=DEFAULT_MAX_GAP):
+        self.store = store
+        self.label = label or os.path.splitext(os.path.basename(store.path.rstrip('/\\')))[0]
+        self.max_gap = max_gap
+        self._distance = None
+
+    @property
+    def start_time(self):
+        return self.store.start_time
+
+    @property
+    def duration_min(self):
+        return (self.store.end_time - self.store.start_time) / 60.0
+
+    def distance_axis(self):
+        """
+        Speed zamanları ve kümülatif mesafe (km) - ilk kullanımda bir kez hesaplanır
+
+        Hız kanalı oturumun en küçük kanalıdır; mesafe ekseni için ham hali gerekir.
+        """
+        if self._distance is None:
+            times, speeds = self.store.read_channel('Speed')
+            self._distance = (times, cumulative_distance(times, speeds, self.max_gap))
+        return self._distance
+
+    @property
+    def total_km(self):
+        _, distance = self.distance_axis()
+        return float(distance[-1]) if len(distance) else 0.0
+
+    def extent(self, axis):
+        """Eksendeki (başlangıç, bitiş)"""
+        return (0.0, self.total_km if axis == 'distance' else self.duration_min)
+
+    def to_axis(self, times, axis):
+        """Mutlak zamanları eksen değerlerine çevir"""
+        times = np.asarray(times, dtype=np.float64)
+        if axis == 'distance':
+            speed_times, distance = self.distance_axis()
+            if len(speed_times) == 0:
+                return np.full(len(times), np.nan)
+            return np.interp(times, speed_times, distance)
+        return (times - self.start_time) / 60.0
+
+    def to_times(self, x, axis):
+        """Eksen değerlerini mutlak zamanlara çevir (mesafede ilk ulaşılan an)"""
+        x = np.asarray(x, dtype=np.float64)
+        if axis == 'distance':
+            speed_times, distance = self.distance_axis()
+            if len(speed_times) == 0:
+                return np.full(len(x), np.nan)
+            # Duraklarda mesafe sabit kalır; searchsorted ilk ulaşılan örneği verir
+            index = np.clip(np.searchsorted(distance, x, side='left'), 1, len(distance) - 1)
+            d0, d1 = distance[index - 1], distance[index]
+            t0, t1 = speed_times[index - 1], speed_times[index]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                weight = np.where(d1 > d0, (x - d0) / (d1 - d0), 1.0)
+            return t0 + np.clip(weight, 0.0, 1.0) * (t1 - t0)
+        return self.start_time + x * 60.0
+
+    def query(self, channel, x0, x1, axis='time', max_points=4000, level=None):
+        """
+        Eksen aralığındaki örnekler
+
+        level verilmezse görünür aralığa göre seçilir (LOD seviyelerinde min/max
+        noktaları iç içe gelir); level=0 ham örnekleri döndürür.
+        Dönüş: (eksen değerleri, değerler, seviye)
+        """
+        t0, t1 = self.to_times([x0, x1], axis)
+        if axis == 'distance' and x1 >= self.total_km:
+            # Son konumdan sonraki duraklar da dahil olsun
+            t1 = self.store.end_time
+        times, values, level = self.store.query(channel, t0, t1, max_points, level)
+        return self.to_axis(times, axis), values, level
+
+
+def binned_trace(x, values, grid):
+    """
+    Örnekleri ızgara hücrelerine ortalayıp ızgaraya doğrusal yerleştir
+
+    Her ızgara noktası çevresindeki hücrenin ortalamasını alır; ardışık dolu hücreler
+    arasındaki boşluk ızgara adımının veya örnek aralığının DELTA_GAP_FACTOR
+    katını aşarsa aradaki noktalar NaN kalır (kayıt boşluğu üzerinden çizgi
+    çekilmez).
+    """
+    valid = ~np.isnan(x) & ~np.isnan(values)
+    x, values = x[valid], values[valid]
+    if len(x) == 0 or len(grid) < 2:
+        return np.full(len(grid), np.nan)
+
+    step = grid[1] - grid[0]
+    cell = np.rint((x - grid[0]) / step).astype(np.int64)
+    inside = (cell >= 0) & (cell < len(grid))
+    cell, x, values = cell[inside], x[inside], values[inside]
+    counts = np.bincount(cell, minlength=len(grid))
+    filled = counts > 0
+    if not filled.any():
+        return np.full(len(grid), np.nan)
+    cell_mean = np.bincount(cell, weights=values, minlength=len(grid))[filled] / counts[filled]
+
+    tolerance = DELTA_GAP_FACTOR * max(step, median_spacing(x))
+    return resample(grid[filled], cell_mean, grid, 'linear', tolerance)
+
+
+def delta_trace(reference, other, channel, axis, x0, x1, points=2000):
+    """
+    Ortak eksen ızgarasında other - reference farkı (vektörel)
+
+    channel == DELTA_TIME ise mesafe ekseninde aynı konuma ulaşma süreleri
+    arasındaki fark (saniye, pozitif = daha yavaş) döner. Diğer kanallarda fark
+    LOD min/max noktalarından değil ham örneklerin hücre ortalamalarından
+    hesaplanır. İki oturumdan birinin kapsamadığı noktalar ve kayıt boşlukları
+    NaN olur.
+    Dönüş: (ızgara, fark)
+    """
+    grid = np.linspace(x0, x1, max(2, int(points)))
+
+    if channel == DELTA_TIME:
+        if axis != 'distance':
+            raise ValueError("Zaman farkı yalnızca mesafe ekseninde hesaplanır")
+        ref_elapsed = reference.to_times(grid, axis) - reference.start_time
+        other_elapsed = other.to_times(grid, axis) - other.start_time
+        delta = other_elapsed - ref_elapsed
+        delta[(grid > reference.total_km) | (grid > other.total_km)] = np.nan
+        return grid, delta
+
+    traces = []
+    for session in (reference, other):
+        x, values, _ = session.query(channel, x0, x1, axis, level=0)
+        traces.append(binned_trace(x, values, grid))
+    return grid, traces[1] - traces[0]
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Oturum Özet İndeksi
+Her kayıtlı oturumun yanına küçük bir özet dosyası (oturum_index.json, oturum
+depolarında klasörün içinde summary_index.json) yazar:
+kanal başına sayı/ortalama/min/maks/std, süre, mesafe, enerji ve dakika başına
+özetler. Oturum tarayıcısı ve toplu komut satırı yüzlerce oturumu yalnızca bu
+dosyaları okuyarak listeler ve sıralar. Kaynak dosyanın boyutu veya değişiklik
+zamanı indekstekinden farklıysa indeks otomatik olarak yeniden oluşturulur.
+
+Kullanım:
+    python session_index.py kayitlar/ --sort distance_km --desc
+"""
+
+import argparse
+import glob
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+
+from distance_engine import DEFAULT_MAX_GAP, distance_totals
+from energy_engine import cumulative_integral, wh_per_km
+from session_store import MANIFEST_NAME, SessionStore, json_session_channels
+
+INDEX_FORMAT = 'session_index'
+INDEX_VERSION = 1
+INDEX_SUFFIX = '_index.json'
+STORE_INDEX_NAME = 'summary_index.json'
+
+# Oturum taramasında atlanan çıktı dosyaları (özet indeksi ve analiz raporları)
+SKIP_SUFFIXES = (INDEX_SUFFIX, '_summary.json', '_distance_summary.json')
+
+# Dakika başına özet tutulan kanallar
+PER_MINUTE_CHANNELS = ['Speed', 'Current', 'Voltage', 'Power']
+
+# Sıralama/listeleme satırındaki alanlar
+ROW_FIELDS = ['file', 'start', 'duration_min', 'distance_km', 'energy_wh', 'wh_per_km',
+              'avg_speed', 'max_speed', 'max_current', 'max_power', 'samples']
+
+
+def is_store_path(source):
+    source = source.rstrip('/\\')
+    return (os.path.basename(source) == MANIFEST_NAME or
+            os.path.exists(os.path.join(source, MANIFEST_NAME)))
+
+
+def index_path_for(source):
+    """Kaynak oturum için özet dosyası adı (depolarda klasörün içinde)"""
+    source = source.rstrip('/\\')
+    if os.path.basename(source) == MANIFEST_NAME:
+        source = os.path.dirname(source)
+    if is_store_path(source):
+        # JSON'dan dönüştürülen depo ile JSON'un indeksleri çakışmasın
+        return os.path.join(source, STORE_INDEX_NAME)
+    base, _ = os.path.splitext(source)
+    return base + INDEX_SUFFIX
+
+
+def source_signature(source):
+    """İndeksin bayatlığını belirleyen kaynak boyutu ve değişiklik zamanı"""
+    source = source.rstrip('/\\')
+    if os.path.isdir(source):
+        source = os.path.join(source, MANIFEST_NAME)
+    stat = os.stat(source)
+    return {'size': stat.st_size, 'mtime': stat.st_mtime}
+
+
+def channel_summary(values):
+    """Tek kanalın özeti (std popülasyon std'si, RunningStats ile aynı)"""
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) == 0:
+        return {'count': 0, 'mean': None, 'min': None, 'max': None, 'std': None}
+    return {
+        'count': int(len(values)),
+        'mean': float(values.mean()),
+        'min': float(values.min()),
+        'max': float(values.max()),
+        'std': float(values.std()),
+    }
+
+
+def per_minute_summary(times, values, start_time, minutes):
+    """
+    Dakika başına ortalama/min/maks - örneği olmayan dakikalar None
+
+    times artan sırada olmalıdır.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    result = {'mean': [None] * minutes, 'min': [None] * minutes, 'max': [None] * minutes}
+    if len(values) == 0 or minutes == 0:
+        return result
+
+    minute = np.minimum(((times - start_time) // 60.0).astype(np.int64), minutes - 1)
+    counts = np.bincount(minute, minlength=minutes)
+    sums = np.bincount(minute, weights=values, minlength=minutes)
+    # Zaman sıralı olduğundan her dakika bitişik bir gruptur
+    starts = np.flatnonzero(np.diff(np.concatenate(([-1], minute))))
+    occupied = minute[starts]
+    mins = np.minimum.reduceat(values, starts)
+    maxs = np.maximum.reduceat(values, starts)
+
+    for i, m in enumerate(occupied.tolist()):
+        result['mean'][m] = float(sums[m] / counts[m])
+        result['min'][m] = float(mins[i])
+        result['max'][m] = float(maxs[i])
+    return result
+
+
+def build_index(channels, max_gap=DEFAULT_MAX_GAP):
+    """
+    Kanal dizilerinden özet indeksi oluştur
+
+    channels: {kanal: (times, values)} - zaman sıralı
+    """
+    channels = {name: (np.asarray(t, dtype=np.float64), np.asarray(v, dtype=np.float64))
+                for name, (t, v) in channels.items() if len(t)}
+    index = {'format': INDEX_FORMAT, 'version': INDEX_VERSION, 'built': datetime.now().isoformat()}
+    if not channels:
+        index.update({'start_time': None, 'end_time': None, 'duration_s': 0.0, 'samples': 0,
+                      'distance_km': 0.0, 'energy_wh': 0.0, 'channels': {}, 'per_minute': {}})
+        return index
+
+    start_time = min(float(t[0]) for t, _ in channels.values())
+    end_time = max(float(t[-1]) for t, _ in channels.values())
+
+    distance_km = 0.0
+    if 'Speed' in channels:
+        distance_km = distance_totals(*channels['Speed'], max_gap=max_gap)['total_km']
+    energy_wh = 0.0
+    if 'Power' in channels and len(channels['Power'][0]) > 1:
+        power_times, power = channels['Power']
+        energy_wh = float(cumulative_integral(power_times, power, 1.0 / 3600.0, max_gap)[-1])
+
+    minutes = int((end_time - start_time) // 60.0) + 1
+    index.update({
+        'start_time': start_time,
+        'end_time': end_time,
+        'duration_s': end_time - start_time,
+        'samples': int(sum(len(v) for _, v in channels.values())),
+        'distance_km': distance_km,
+        'energy_wh': energy_wh,
+        'channels': {name: channel_summary(values) for name, (_, values) in channels.items()},
+        'per_minute': {name: per_minute_summary(*channels[name], start_time, minutes)
+                       for name in PER_MINUTE_CHANNELS if name in channels},
+    })
+    return index
+
+
+def read_source_channels(source):
+    """JSON oturumu veya oturum deposundan kanal dizileri"""
+    if is_store_path(source):
+        store = SessionStore(source)
+        return {channel: store.read_channel(channel) for channel in store.channels}
+    with open(source, 'r', encoding='utf-8') as f:
+        return json_session_channels(json.load(f))
+
+
+def write_index(source, index):
+    """İndeksi kaynağın imzasıyla birlikte yanına yaz"""
+    index = dict(index)
+    index['source'] = os.path.basename(source.rstrip('/\\'))
+    index['signature'] = source_signature(source)
+    path = index_path_for(source)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False)
+    return index
+
+
+def build_source_index(source):
+    """Kaynağı okuyup indeksini oluştur ve yaz"""
+    return write_index(source, build_index(read_source_channels(source)))
+
+
+def is_stale(index, source):
+    """İndeks eski sürümdeyse veya kaynak indeks yazıldıktan sonra değiştiyse True"""
+    if not isinstance(index, dict):
+        return True
+    if index.get('format') != INDEX_FORMAT or index.get('version') != INDEX_VERSION:
+        return True
+    return index.get('signature') != source_signature(source)
+
+
+def load_index(source, rebuild=True):
+    """
+    Oturumun özet indeksini oku, yoksa veya bayatsa yeniden oluştur
+
+    rebuild=False iken bayat/eksik indeks için None döner.
+    """
+    index = None
+    try:
+        with open(index_path_for(source), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    if is_stale(index, source):
+        return build_source_index(source) if rebuild else None
+    return index
+
+
+def index_row(source, index):
+    """İndeksten listeleme/sıralama satırı"""
+    channels = index.get('channels', {})
+
+    def stat(channel, key):
+        return (channels.get(channel) or {}).get(key)
+
+    start = index.get('start_time')
+    duration_s = index.get('duration_s') or 0.0
+    distance = index.get('distance_km') or 0.0
+    return {
+        'file': os.path.basename(source.rstrip('/\\')),
+        'path': source,
+        'start': datetime.fromtimestamp(start).isoformat(timespec='seconds') if start else None,
+        'duration_min': duration_s / 60.0,
+        'distance_km': distance,
+        'energy_wh': index.get('energy_wh') or 0.0,
+        'wh_per_km': wh_per_km(index.get('energy_wh') or 0.0, distance),
+        'avg_speed': distance / duration_s * 3600.0 if duration_s > 0 else 0.0,
+        'max_speed': stat('Speed', 'max'),
+        'max_current': stat('Current', 'max'),
+        'max_power': stat('Power', 'max'),
+        'samples': index.get('samples', 0),
+    }
+
+
+def find_sessions(patterns):
+    """Dizin/glob desenlerinden oturum dosyaları (indeks ve rapor dosyaları hariç)"""
+    sources = []
+    for pattern in patterns:
+        if os.path.isdir(pattern) and not is_store_path(pattern):
+            candidates = [os.path.join(pattern, name) for name in sorted(os.listdir(pattern))]
+        else:
+            candidates = sorted(glob.glob(pattern)) or [pattern]
+        for path in candidates:
+            if ((path.endswith('.json') and not path.endswith(SKIP_SUFFIXES)) or is_store_path(path)) \
+                    and path not in sources:
+                sources.append(path)
+    return sources
+
+
+def collect_rows(sources, rebuild=True, sort_key=None, descending=False):
+    """
+    Oturumların indeks satırları (gerekirse indeksi yeniden oluşturarak)
+
+    Dönüş: (satırlar, yeniden oluşturulan indeks sayısı)
+    """
+    rows = []
+    rebuilt = 0
+    for source in sources:
+        try:
+            index = load_index(source, rebuild=False)
+            if index is None and rebuild:
+                index = build_source_index(source)
+                rebuilt += 1
+            if index is not None:
+                rows.append(index_row(source, index))
+        except (OSError, ValueError) as e:
+            rows.append({'file': os.path.basename(source), 'path': source, 'error': str(e)})
+
+    if sort_key:
+        present = [row for row in rows if row.get(sort_key) is not None]
+        missing = [row for row in rows if row.get(sort_key) is None]
+        rows = sorted(present, key=lambda row: row[sort_key], reverse=descending) + missing
+    return rows, rebuilt
+
+
+def print_rows(rows):
+    """Satırları hizalı tablo olarak yazdır"""
+    headers = ['Dosya', 'Başlangıç', 'Süre (dk)', 'Mesafe (km)', 'Enerji (Wh)', 'Wh/km',
+               'Ort. Hız', 'Maks. Akım']
+    table = []
+    for row in rows:
+        if 'error' in row:
+            table.append([row['file'], f"❌ {row['error']}"])
+            continue
+        table.append([
+            row['file'],
+            row['start'] or '-',
+            f"{row['duration_min']:.1f}",
+            f"{row['distance_km']:.3f}",
+            f"{row['energy_wh']:.1f}",
+            f"{row['wh_per_km']:.1f}" if row['wh_per_km'] is not None else '-',
+            f"{row['avg_speed']:.1f}",
+            f"{row['max_current']:.2f}" if row['max_current'] is not None else '-',
+        ])
+
+    widths = [max([len(headers[i])] + [len(line[i]) for line in table if len(line) > i])
+              for i in range(len(headers))]
+    print("  ".join(h.ljust(w) for h, w in zip(headers, widths)))
+    print("-" * (sum(widths) + 2 * (len(widths) - 1)))
+    for line in table:
+        print("  ".join(cell.ljust(w) for cell, w in zip(line, widths)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Oturumları özet indeksleri üzerinden listeler ve sıralar')
+    parser.add_argument('patterns', nargs='+', help='JSON dosyaları, .tstore depoları, glob desenleri veya dizinler')
+    parser.add_argument('--sort', choices=ROW_FIELDS, default='start', help='Sıralama alanı')
+    parser.add_argument('--desc', action='store_true', help='Azalan sırada listele')
+    parser.add_argument('--rebuild', action='store_true', help='Tüm indeksleri yeniden oluştur')
+    args = parser.parse_args(argv)
+
+    sources = find_sessions(args.patterns)
+    if args.rebuild:
+        for source in sources:
+            build_source_index(source)
+    rows, rebuilt = collect_rows(sources, sort_key=args.sort, descending=args.desc)
+    print_rows(rows)
+    print(f"\n📚 {len(rows)} oturum ({rebuilt} indeks yeniden oluşturuldu)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kayıt Oynatma Yardımcıları
+Kaydedilmiş JSON oturumlarını, ham seri port kayıtlarını ve sıkıştırılmış
+ham bayt kayıtlarını zaman sıralı örnek listesine çevirir, oynatma hızını
+ayarlayan saat sınıfını içerir
+"""
+
+import bisect
+import json
+import os
+import time
+from datetime import datetime, timedelta
+
+from raw_capture import CaptureReader, is_capture_path
+from telemetry_parser import CHANNEL_TYPES, StreamParser, parse_line
+
+# Hız çarpanı 0 ise veriler beklemeden (olabildiğince hızlı) gönderilir
+REPLAY_MAX_SPEED = 0.0
+
+
+class ReplayEvent:
+    """Oynatılacak tek bir örnek"""
+    __slots__ = ('time', 'data_type', 'value', 'timestamp')
+
+    def __init__(self, time, data_type, value, timestamp):
+        self.time = time            # Unix zaman damgası (saniye)
+        self.data_type = data_type
+        self.value = value
+        self.timestamp = timestamp  # Arduino formatındaki zaman metni
+
+
+def load_json_session(filename, data_types=None):
+    """Datetime anahtarlı JSON oturumunu örnek listesine çevir"""
+    with open(filename, 'r', encoding='utf-8') as jsonfile:
+        json_data = json.load(jsonfile)
+
+    if 'data' not in json_data or not isinstance(json_data['data'], dict):
+        raise ValueError("Desteklenmeyen JSON formatı!")
+
+    events = []
+    for record in json_data['data'].values():
+        if not isinstance(record, dict) or not record.get('timestamp'):
+            continue
+
+        timestamp = float(record['timestamp'])
+        time_text = datetime.fromtimestamp(timestamp).strftime("%H:%M:%S.%f")[:-3]
+
+        for data_type, value in record.items():
+            if data_type in ('timestamp', 'datetime') or value is None:
+                continue
+            if data_types is not None and data_type not in data_types:
+                continue
+            events.append(ReplayEvent(timestamp, data_type, value, time_text))
+
+    events.sort(key=lambda event: event.time)
+    return events
+
+
+def load_text_capture(filename):
+    """
+    Ham seri port kaydını (Arduino metin protokolü) örnek listesine çevir
+
+    Satırlardaki "HH:MM:SS.mmm" zaman damgaları dosyanın değiştirilme tarihi ile
+    birleştirilir, gece yarısı geçişleri bir sonraki güne taşınır.
+    """
+    base_date = datetime.fromtimestamp(os.path.getmtime(filename)).date()
+    day_offset = 0
+    last_seconds = None
+    fallback_time = None
+
+    events = []
+    with open(filename, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+
+            for data_type, value, timestamp in parse_line(line):
+                try:
+                    clock = datetime.strptime(timestamp, "%H:%M:%S.%f").time()
+                except ValueError:
+                    # Zaman damgası okunamazsa bir önceki örneğin zamanı kullanılır
+                    if fallback_time is not None:
+                        events.append(ReplayEvent(fallback_time, data_type, value, timestamp))
+                    continue
+
+                seconds = clock.hour * 3600 + clock.minute * 60 + clock.second
+                if last_seconds is not None and seconds < last_seconds - 12 * 3600:
+                    day_offset += 1
+                last_seconds = seconds
+
+                moment = datetime.combine(base_date, clock) + timedelta(days=day_offset)
+                fallback_time = moment.timestamp()
+                events.append(ReplayEvent(fallback_time, data_type, value, timestamp))
+
+    return events
+
+
+def load_raw_capture(filename):
+    """Ham bayt kaydını (.rawcap.gz/.xz) güncel ayrıştırıcıyla örnek listesine çevir"""
+    events = [ReplayEvent(moment, data_type, value, timestamp)
+              for moment, data_type, value, timestamp in StreamParser().samples(CaptureReader(filename))]
+    events.sort(key=lambda event: event.time)
+    return events
+
+
+def load_replay_events(filename):
+    """Dosya türüne göre uygun yükleyiciyi seç"""
+    if is_capture_path(filename):
+        return load_raw_capture(filename)
+    if filename.lower().endswith('.json'):
+        # Türetilmiş kanallar (ör. Distance) oynatma sırasında yeniden hesaplanır
+        return load_json_session(filename, data_types=CHANNEL_TYPES)
+    return load_text_capture(filename)
+
+
+class ReplayClock:
+    """
+    Oturum zamanını duvar saatine eşleyen oynatma saati
+
+    speed=1 gerçek zaman, speed=N N kat hız, speed=0 beklemesiz oynatma demektir.
+    Hız değişimi, duraklatma ve atlama sonrası saat yeniden çapalanır.
+    """
+
+    def __init__(self, speed=1.0, clock=time.monotonic):
+        self.speed = speed
+        self.clock = clock
+        self.anchor_session_time = None
+        self.anchor_wall_time = None
+
+    def anchor(self, session_time):
+        """Verilen oturum zamanını şimdiki duvar saatine sabitle"""
+        self.anchor_session_time = session_time
+        self.anchor_wall_time = self.clock()
+
+    def set_speed(self, speed, session_time):
+        """Oynatma hızını değiştir"""
+        self.speed = speed
+        self.anchor(session_time)
+
+    def delay_until(self, session_time):
+        """Örneğin gönderilmesine kalan süre (saniye), beklemesiz modda 0"""
+        if self.speed <= REPLAY_MAX_SPEED or self.anchor_session_time is None:
+            return 0.0
+        due = self.anchor_wall_time + (session_time - self.anchor_session_time) / self.speed
+        return max(0.0, due - self.clock())
+
+
+def seek_index(event_times, session_time):
+    """Verilen oturum zamanındaki ilk örneğin indeksini bul"""
+    return bisect.bisect_left(event_times, session_time)
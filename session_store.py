@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Disk Tabanlı Oturum Deposu
+Arşivlenmiş oturumları kanal başına zaman sıralı parçalar (chunk) halinde saklar.
+Her kanal için min/max ayrıntı seviyeleri (LOD) önceden hesaplanır, böylece
+grafikler yalnızca görünen zaman aralığına düşen parçaları yükler.
+
+Klasör yapısı:
+    oturum.tstore/
+        manifest.json
+        Speed/L0_00000.npy   -> [zaman, değer] satırları (ham veri)
+        Speed/L1_00000.npy   -> [t_a, v_a, t_b, v_b] satırları (16 örnekte bir min/max)
+        ...
+"""
+
+import json
+import os
+import shutil
+import sys
+from collections import OrderedDict
+
+import numpy as np
+
+STORE_FORMAT = 'columnar_session'
+STORE_VERSION = 1
+STORE_EXTENSION = '.tstore'
+MANIFEST_NAME = 'manifest.json'
+
+# Yazım sırasında kullanılan geçici klasör eki; close() klasörü hedefin yerine koyar
+PARTIAL_SUFFIX = '.partial'
+
+# Parça başına satır sayısı ve seviyeler arası küçültme oranı
+DEFAULT_CHUNK_SIZE = 65536
+LOD_FACTOR = 16
+
+
+def reduce_min_max(times, values, factor):
+    """
+    Ham örnekleri 'factor' büyüklüğünde kovalara ayırıp min/max çiftine indir
+
+    Dönüş: (n_kova, 4) dizisi -> [t_a, v_a, t_b, v_b], a ve b zaman sırasında
+    """
+    count = len(values)
+    n_buckets = -(-count // factor)
+    padded = n_buckets * factor
+
+    # Son kova eksikse NaN ile doldurulur, nanargmin/nanargmax bunları atlar
+    v = np.full(padded, np.nan)
+    v[:count] = values
+    t = np.empty(padded)
+    t[:count] = times
+    t[count:] = times[-1]
+
+    v = v.reshape(n_buckets, factor)
+    t = t.reshape(n_buckets, factor)
+    rows = np.arange(n_buckets)
+
+    i_min = np.nanargmin(v, axis=1)
+    i_max = np.nanargmax(v, axis=1)
+    i_a = np.minimum(i_min, i_max)
+    i_b = np.maximum(i_min, i_max)
+
+    return np.column_stack((t[rows, i_a], v[rows, i_a], t[rows, i_b], v[rows, i_b]))
+
+
+class _LevelBuffer:
+    """Bir ayrıntı seviyesinin diske yazılmayı bekleyen satırları"""
+
+    def __init__(self, level, factor):
+        self.level = level
+        self.factor = factor
+        self.pending = []
+        self.pending_rows = 0
+        self.chunks = []
+
+
+class SessionStoreWriter:
+    """
+    Oturum deposunu akış halinde yazar
+
+    append() ile gelen örnekler kanal başına tamponlanır, her tam parça diske
+    yazılırken ayrıntı seviyeleri de aynı parçadan hesaplanır. Parçalar önce
+    "<yol>.partial" klasörüne yazılır; close() manifest dosyasını oluşturup
+    klasörü hedefin yerine koyar, aynı yoldaki eski deponun parçaları kalmaz.
+    """
+
+    def __init__(self, path, chunk_size=DEFAULT_CHUNK_SIZE, lod_factor=LOD_FACTOR, info=None):
+        self.path = path.rstrip('/\\')
+        if os.path.exists(self.path) and not is_store_dir(self.path):
+            raise FileExistsError(f"Hedef oturum deposu değil, üzerine yazılmadı: {path}")
+        self.write_path = self.path + PARTIAL_SUFFIX
+        self.chunk_size = chunk_size
+        self.lod_factor = lod_factor
+        self.info = dict(info or {})
+        self.channels = {}
+        # Yarıda kalmış önceki yazımın artıkları
+        if os.path.isdir(self.write_path):
+            shutil.rmtree(self.write_path)
+        os.makedirs(self.write_path)
+
+        # chunk_size'ı aşmayan tüm seviyeler (16, 256, 4096, ...)
+        self.level_factors = []
+        factor = lod_factor
+        while factor <= chunk_size:
+            self.level_factors.append(factor)
+            factor *= lod_factor
+
+    def _channel(self, name):
+        if name not in self.channels:
+            os.makedirs(os.path.join(self.write_path, name))
+            self.channels[name] = {
+                'times': [],
+                'values': [],
+                'count': 0,
+                'buffered': 0,
+                'raw': _LevelBuffer(0, 1),
+                'levels': [_LevelBuffer(i + 1, f) for i, f in enumerate(self.level_factors)],
+            }
+        return self.channels[name]
+
+    def append(self, channel, times, values):
+        """Kanala zaman sıralı örnekler ekle"""
+        state = self._channel(channel)
+        times = np.asarray(times, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        if len(times) == 0:
+            return
+
+        state['times'].append(times)
+        state['values'].append(values)
+        state['count'] += len(times)
+        state['buffered'] += len(times)
+
+        if state['buffered'] >= self.chunk_size:
+            all_times = np.concatenate(state['times'])
+            all_values = np.concatenate(state['values'])
+            full = (len(all_times) // self.chunk_size) * self.chunk_size
+            for start in range(0, full, self.chunk_size):
+                end = start + self.chunk_size
+                self._write_raw_chunk(channel, state, all_times[start:end], all_values[start:end])
+            state['times'] = [all_times[full:]] if full < len(all_times) else []
+            state['values'] = [all_values[full:]] if full < len(all_values) else []
+            state['buffered'] = len(all_times) - full
+
+    def _write_raw_chunk(self, channel, state, times, values):
+        """Ham parçayı yaz ve ayrıntı seviyelerini besle"""
+        self._write_chunk(channel, state['raw'], np.column_stack((times, values)))
+        for level in state['levels']:
+            self._append_level(channel, level, reduce_min_max(times, values, level.factor))
+
+    def _append_level(self, channel, level, rows, flush=False):
+        if len(rows):
+            level.pending.append(rows)
+            level.pending_rows += len(rows)
+        if level.pending_rows >= self.chunk_size or (flush and level.pending_rows):
+            self._write_chunk(channel, level, np.concatenate(level.pending))
+            level.pending = []
+            level.pending_rows = 0
+
+    def _write_chunk(self, channel, level, rows):
+        filename = f"L{level.level}_{len(level.chunks):05d}.npy"
+        np.save(os.path.join(self.write_path, channel, filename), rows)
+
+        # Parça zaman sınırları manifest'e yazılır, sorgular yalnızca bunlara bakar
+        t_first = float(rows[0, 0])
+        t_last = float(rows[-1, -2] if rows.shape[1] == 4 else rows[-1, 0])
+        level.chunks.append({
+            'file': f"{channel}/{filename}",
+            't0': t_first,
+            't1': t_last,
+            'count': int(len(rows)),
+        })
+
+    def close(self):
+        """Kalan tamponları yaz ve manifest'i oluştur"""
+        manifest_channels = {}
+        for name, state in self.channels.items():
+            if state['times']:
+                times = np.concatenate(state['times'])
+                values = np.concatenate(state['values'])
+                self._write_raw_chunk(name, state, times, values)
+                state['times'], state['values'] = [], []
+                state['buffered'] = 0
+
+            for level in state['levels']:
+                self._append_level(name, level, np.empty((0, 4)), flush=True)
+
+            levels = [{'factor': 1, 'chunks': state['raw'].chunks}]
+            levels += [{'factor': level.factor, 'chunks': level.chunks}
+                       for level in state['levels'] if level.chunks]
+            manifest_channels[name] = {'count': state['count'], 'levels': levels}
+
+        all_chunks = [level['chunks'] for ch in manifest_channels.values() for level in ch['levels'][:1]]
+        starts = [chunks[0]['t0'] for chunks in all_chunks if chunks]
+        ends = [chunks[-1]['t1'] for chunks in all_chunks if chunks]
+
+        manifest = {
+            'format': STORE_FORMAT,
+            'version': STORE_VERSION,
+            'chunk_size': self.chunk_size,
+            'lod_factor': self.lod_factor,
+            'start_time': min(starts) if starts else None,
+            'end_time': max(ends) if ends else None,
+            'info': self.info,
+            'channels': manifest_channels,
+        }
+        with open(os.path.join(self.write_path, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        self._replace_target()
+        return manifest
+
+    def _replace_target(self):
+        """Yazılan klasörü hedefe taşı; eski depo ancak yenisi yerine geçince silinir"""
+        previous = None
+        if os.path.exists(self.path):
+            previous = self.path + '.old'
+            if os.path.isdir(previous):
+                shutil.rmtree(previous)
+            os.rename(self.path, previous)
+        os.rename(self.write_path, self.path)
+        if previous is not None:
+            shutil.rmtree(previous, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+
+
+class ChunkCache:
+    """Bellek bütçeli LRU parça önbelleği"""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path):
+        """Parçayı önbellekten getir, yoksa diskten yükle"""
+        if path in self.entries:
+            self.entries.move_to_end(path)
+            self.hits += 1
+            return self.entries[path]
+
+        self.misses += 1
+        array = np.load(path)
+        self.entries[path] = array
+        self.current_bytes += array.nbytes
+
+        # Bütçe aşılırsa en eski parçaları at (en az bir parça her zaman kalır)
+        while self.current_bytes > self.max_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.current_bytes -= evicted.nbytes
+        return array
+
+    def clear(self):
+        self.entries.clear()
+        self.current_bytes = 0
+
+
+class SessionStore:
+    """Disk tabanlı oturum deposunu okur, görünür aralık sorgularını yanıtlar"""
+
+    def __init__(self, path, cache_bytes=64 * 1024 * 1024):
+        if os.path.basename(path) == MANIFEST_NAME:
+            path = os.path.dirname(path)
+        self.path = path
+
+        with open(os.path.join(path, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            self.manifest = json.load(f)
+
+        if self.manifest.get('format') != STORE_FORMAT:
+            raise ValueError("Desteklenmeyen oturum deposu formatı!")
+
+        self.cache = ChunkCache(cache_bytes)
+
+    @property
+    def channels(self):
+        return list(self.manifest['channels'].keys())
+
+    @property
+    def start_time(self):
+        return self.manifest.get('start_time')
+
+    @property
+    def end_time(self):
+        return self.manifest.get('end_time')
+
+    @property
+    def info(self):
+        return self.manifest.get('info', {})
+
+    def choose_level(self, channel, t0, t1, max_points):
+        """Görünür aralıktaki nokta sayısını max_points altında tutan en ayrıntılı seviye"""
+        meta = self.manifest['channels'][channel]
+        duration = (self.end_time - self.start_time) or 1.0
+        visible = meta['count'] * min(1.0, max(0.0, (t1 - t0) / duration))
+
+        for index, level in enumerate(meta['levels']):
+            # LOD seviyelerinde her satır iki nokta üretir
+            points = visible / level['factor'] * (1 if level['factor'] == 1 else 2)
+            if points <= max_points:
+                return index
+        return len(meta['levels']) - 1
+
+    def query(self, channel, t0, t1, max_points=4000, level=None):
+        """
+        [t0, t1] aralığındaki örnekleri yükle
+
+        Dönüş: (zamanlar, değerler, seviye) - LOD seviyelerinde min/max noktaları
+        zaman sırasında iç içe döndürülür.
+        """
+        if channel not in self.manifest['channels']:
+            return np.empty(0), np.empty(0), 0
+
+        if level is None:
+            level = self.choose_level(channel, t0, t1, max_points)
+        level_meta = self.manifest['channels'][channel]['levels'][level]
+
+        # Yalnızca aralıkla kesişen parçalar yüklenir
+        parts = [self.cache.get(os.path.join(self.path, chunk['file']))
+                 for chunk in level_meta['chunks']
+                 if chunk['t1'] >= t0 and chunk['t0'] <= t1]
+        if not parts:
+            return np.empty(0), np.empty(0), level
+
+        rows = np.concatenate(parts) if len(parts) > 1 else parts[0]
+        if level_meta['factor'] == 1:
+            times, values = rows[:, 0], rows[:, 1]
+        else:
+            times = rows[:, [0, 2]].reshape(-1)
+            values = rows[:, [1, 3]].reshape(-1)
+
+        # Kenarlarda çizginin kesilmemesi için aralığın bir örnek dışı da alınır
+        start = max(0, np.searchsorted(times, t0, side='left') - 1)
+        end = min(len(times), np.searchsorted(times, t1, side='right') + 1)
+        return times[start:end], values[start:end], level
+
+    def read_channel(self, channel):
+        """Kanalın tüm ham verisini yükle"""
+        return self.query(channel, -np.inf, np.inf, level=0)[:2]
+
+
+def is_store_dir(path):
+    """Klasör bir oturum deposu mu (manifest'i var veya boş)"""
+    return os.path.isdir(path) and (os.path.exists(os.path.join(path, MANIFEST_NAME))
+                                    or not os.listdir(path))
+
+
+def store_path_for(json_file):
+    """JSON oturumu için varsayılan depo klasörü"""
+    base, _ = os.path.splitext(json_file)
+    return base + STORE_EXTENSION
+
+
+def json_session_channels(json_data):
+    """
+    Datetime anahtarlı JSON kayıtlarını kanal başına zaman sıralı dizilere ayır
+
+    Dönüş: {kanal: (times, values)} - boş (None) hücreler atlanır
+    """
+    if 'data' not in json_data or not isinstance(json_data['data'], dict):
+        raise ValueError("Desteklenmeyen JSON formatı!")
+
+    columns = {}
+    for record in json_data['data'].values():
+        if not isinstance(record, dict) or not record.get('timestamp'):
+            continue
+        timestamp = float(record['timestamp'])
+        for data_type, value in record.items():
+            if data_type in ('timestamp', 'datetime') or value is None:
+                continue
+            times, values = columns.setdefault(data_type, ([], []))
+            times.append(timestamp)
+            values.append(float(value))
+
+    channels = {}
+    for data_type, (times, values) in columns.items():
+        times = np.asarray(times)
+        values = np.asarray(values)
+        order = np.argsort(times, kind='stable')
+        channels[data_type] = (times[order], values[order])
+    return channels
+
+
+def convert_json_session(json_file, store_path=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Datetime anahtarlı JSON oturumunu disk tabanlı depoya dönüştür"""
+    with open(json_file, 'r', encoding='utf-8') as f:
+        json_data = json.load(f)
+
+    channels = json_session_channels(json_data)
+
+    store_path = store_path or store_path_for(json_file)
+    with SessionStoreWriter(store_path, chunk_size=chunk_size,
+                            info=json_data.get('export_info', {})) as writer:
+        for data_type, (times, values) in channels.items():
+            writer.append(data_type, times, values)
+
+    return store_path
+
+
+def ensure_session_store(filename):
+    """
+    Depo klasörü/manifest veya JSON oturumu için depo yolunu döndür
+
+    JSON oturumu ilk açılışta depoya dönüştürülür; depo JSON'dan eskiyse
+    yeniden oluşturulur, aksi halde mevcut depo kullanılır.
+    """
+    if os.path.basename(filename) == MANIFEST_NAME:
+        return os.path.dirname(filename)
+    if os.path.isdir(filename):
+        return filename
+
+    store_path = store_path_for(filename)
+    manifest_path = os.path.join(store_path, MANIFEST_NAME)
+    if (not os.path.exists(manifest_path) or
+            os.path.getmtime(manifest_path) < os.path.getmtime(filename)):
+        convert_json_session(filename, store_path)
+    return store_path
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Kullanım: python session_store.py <json_dosyasi> [depo_klasoru]")
+        print("Örnek: python session_store.py telemetri_data_20250930_215719.json")
+        return
+
+    json_file = sys.argv[1]
+    store_path = sys.argv[2] if len(sys.argv) > 2 else None
+
+    try:
+        store_path = convert_json_session(json_file, store_path)
+    except Exception as e:
+        print(f"❌ Dönüştürme hatası: {e}")
+        return
+
+    store = SessionStore(store_path)
+    print(f"✅ Oturum deposu oluşturuldu: {store_path}")
+    for channel, meta in store.manifest['channels'].items():
+        print(f"  • {channel}: {meta['count']} örnek, {len(meta['levels'])} seviye")
+
+
+if __name__ == '__main__':
+    main()
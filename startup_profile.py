@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Başlangıç Süresi Profili ve Ölçümü
+main.py açılışı aşamalara bölünerek ölçülür (import, QApplication, arayüz
+kurulumu, ilk çizim, arka plan port taraması). Ölçüm aracı uygulamayı her
+seferinde yeni bir süreçte başlatır, aşamaların medyanını raporlar ve ilk
+çizime kadar geçen süreyi hedefle karşılaştırır.
+
+Kullanım:
+    python main.py --startup-profile          # Açılışta aşama tablosunu yazdır
+    python startup_profile.py                 # 5 soğuk başlangıç, hedef 2.0 s
+    python startup_profile.py --runs 10 --target 1.5 --offscreen
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# İlk çizime kadar kabul edilen en uzun süre (saniye)
+DEFAULT_TARGET_SECONDS = 2.0
+
+# Ölçüm modunda main.py profili bu önekle tek satır JSON olarak yazar
+PROFILE_PREFIX = "STARTUP_PROFILE "
+
+PROFILE_FLAG = '--startup-profile'
+BENCHMARK_FLAG = '--startup-benchmark'
+
+# Hedefle karşılaştırılan aşama: pencere bu aşamanın sonunda görünür
+FIRST_PAINT = 'first_paint'
+
+
+class StartupProfile:
+    """
+    Açılış aşamalarının süreleri
+
+    mark(aşama) bir önceki işaretten bu yana geçen süreyi aşamaya yazar;
+    nesne oluşturulduğu an başlangıç kabul edilir.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.started = clock()
+        self.last = self.started
+        self.phases = []
+        self.marks = {}
+
+    def mark(self, phase):
+        now = self.clock()
+        self.phases.append((phase, now - self.last))
+        self.marks[phase] = now - self.started
+        self.last = now
+
+    def until(self, phase):
+        """Başlangıçtan aşamanın sonuna kadar geçen süre, aşama yoksa None"""
+        return self.marks.get(phase)
+
+    @property
+    def total(self):
+        return self.last - self.started
+
+    def as_dict(self):
+        return {'phases': dict(self.phases), 'marks': dict(self.marks), 'total': self.total}
+
+    def report(self):
+        lines = ["⏱️ Başlangıç profili:"]
+        for phase, seconds in self.phases:
+            lines.append(f"   {phase:<14} {seconds * 1000:8.1f} ms  (toplam {self.marks[phase] * 1000:8.1f} ms)")
+        return "\n".join(lines)
+
+
+def parse_profile_output(output):
+    """main.py çıktısından profil sözlüğünü bul"""
+    for line in reversed(output.splitlines()):
+        if line.startswith(PROFILE_PREFIX):
+            return json.loads(line[len(PROFILE_PREFIX):])
+    raise ValueError("Çıktıda başlangıç profili bulunamadı")
+
+
+def summarize_runs(profiles, target=DEFAULT_TARGET_SECONDS):
+    """Koşuların aşama medyanları ve ilk çizim süresinin hedefle karşılaştırması"""
+    phase_names = []
+    for profile in profiles:
+        for name in profile['phases']:
+            if name not in phase_names:
+                phase_names.append(name)
+
+    phases = {name: statistics.median(p['phases'][name] for p in profiles if name in p['phases'])
+              for name in phase_names}
+    first_paint = [p['marks'][FIRST_PAINT] for p in profiles if FIRST_PAINT in p['marks']]
+    median_first_paint = statistics.median(first_paint) if first_paint else None
+    return {
+        'runs': len(profiles),
+        'phases': phases,
+        'first_paint': median_first_paint,
+        'first_paint_max': max(first_paint) if first_paint else None,
+        'total': statistics.median(p['total'] for p in profiles),
+        'target': target,
+        'passed': median_first_paint is not None and median_first_paint <= target,
+    }
+
+
+def run_once(script, offscreen=False, timeout=60.0):
+    """Uygulamayı yeni bir süreçte ölçüm modunda başlat, profili ve süreç süresini döndür"""
+    env = dict(os.environ)
+    if offscreen:
+        env['QT_QPA_PLATFORM'] = 'offscreen'
+    began = time.perf_counter()
+    result = subprocess.run([sys.executable, script, BENCHMARK_FLAG], env=env, timeout=timeout,
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+                            encoding='utf-8', errors='replace')
+    wall = time.perf_counter() - began
+    if result.returncode != 0:
+        raise RuntimeError(f"main.py çıkış kodu {result.returncode}:\n{result.stdout[-2000:]}")
+    profile = parse_profile_output(result.stdout)
+    profile['process'] = wall
+    return profile
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Telemetri arayüzü başlangıç süresi ölçümü')
+    parser.add_argument('--runs', type=int, default=5, help='Soğuk başlangıç sayısı (varsayılan 5)')
+    parser.add_argument('--target', type=float, default=DEFAULT_TARGET_SECONDS,
+                        help=f'İlk çizim hedefi, saniye (varsayılan {DEFAULT_TARGET_SECONDS})')
+    parser.add_argument('--offscreen', action='store_true', help='Pencereyi ekrana çizmeden ölç')
+    parser.add_argument('--script', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main.py'),
+                        help='Ölçülecek uygulama')
+    args = parser.parse_args(argv)
+
+    profiles = []
+    for run in range(args.runs):
+        try:
+            profile = run_once(args.script, args.offscreen)
+        except (OSError, RuntimeError, ValueError, subprocess.TimeoutExpired) as e:
+            print(f"❌ Ölçüm başarısız: {e}")
+            sys.exit(1)
+        profiles.append(profile)
+        print(f"  {run + 1}/{args.runs}: ilk çizim {profile['marks'].get(FIRST_PAINT, 0) * 1000:.0f} ms, "
+              f"süreç {profile['process'] * 1000:.0f} ms")
+
+    summary = summarize_runs(profiles, args.target)
+    print(f"\n⏱️ Aşama medyanları ({summary['runs']} koşu):")
+    for phase, seconds in summary['phases'].items():
+        print(f"   {phase:<14} {seconds * 1000:8.1f} ms")
+    print(f"\n🖼️ İlk çizim: {summary['first_paint'] * 1000:.0f} ms (en kötü {summary['first_paint_max'] * 1000:.0f} ms)"
+          f" | Hedef: {summary['target'] * 1000:.0f} ms")
+    print("✅ Hedef tutturuldu" if summary['passed'] else "⚠️ Hedef aşıldı")
+    if not summary['passed']:
+        sys.exit(1)
+    return summary
+
+
+if __name__ == '__main__':
+    main()
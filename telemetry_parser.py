@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Telemetri Satır Ayrıştırıcı
+Seri port, TCP ve kayıt oynatma kaynaklarının ortak kullandığı parse mantığı
+"""
+
+import codecs
+import functools
+import re
+from datetime import datetime
+
+# Alan tanımları: (veri tipi, anahtar kelime, regex, dönüştürücü)
+# Sıra önemli: "ERPM:" satırı "RPM:" içerdiği için önce kontrol edilmeli
+FIELD_PATTERNS = [
+    ('ERPM', 'ERPM:', re.compile(r'\bERPM:\s*(-?\d+)'), int),
+    ('RPM', 'RPM:', re.compile(r'\bRPM:\s*(-?\d+)'), int),
+    ('Speed', 'Hız', re.compile(r'Hız(?:\s*\([^():]+\))?\s*:\s*(-?\d+\.?\d*)'), float),
+    ('Current', 'Akım', re.compile(r'Akım(?:\s*\([^():]+\))?\s*:\s*(-?\d+\.?\d*)'), float),
+    ('Duty', 'Duty:', re.compile(r'\bDuty:\s*(-?\d+)'), int),
+    ('Voltage', 'Gerilim', re.compile(r'Gerilim(?:\s*\([^():]+\))?\s*:\s*(-?\d+\.?\d*)'), float),
+    ('Power', 'Güç', re.compile(r'Güç(?:\s*\([^():]+\))?\s*:\s*(-?\d+\.?\d*)'), float),
+    # İsteğe bağlı: hidrojen akış ölçeri olan firmware (L/dk)
+    ('H2Flow', 'Hidrojen', re.compile(r'Hidrojen.*?:\s*(-?\d+\.?\d*)'), float),
+]
+
+# Firmware'in gönderdiği ham kanallar
+CHANNEL_TYPES = [data_type for data_type, _, _, _ in FIELD_PATTERNS]
+
+# Formatsız satırlarda aranan anahtar kelimeler
+RAW_KEYWORDS = ["ERPM", "RPM", "Hız", "Akım", "Duty", "Gerilim", "Güç", "Hidrojen"]
+
+# Etiketi bozulmuş (ör. "Hız" içinde geçersiz UTF-8) satırlar birimden tanınır
+UNIT_PATTERNS = [
+    ('Speed', re.compile(r'[^\s:()]{1,12}\s*\(km/[hs]\)\s*:\s*(-?\d+\.?\d*)'), float),
+    ('Current', re.compile(r'[^\s:()]{1,12}\s*\(A\)\s*:\s*(-?\d+\.?\d*)'), float),
+    ('Voltage', re.compile(r'[^\s:()]{1,12}\s*\(V\)\s*:\s*(-?\d+\.?\d*)'), float),
+    ('Power', re.compile(r'[^\s:()]{1,12}\s*\(W\)\s*:\s*(-?\d+\.?\d*)'), float),
+]
+
+# Satır sonu kaybolup birleşen kayıtların başlangıcı: "HH:MM:SS.mmm ->"
+RECORD_START = re.compile(r'\d{2}:\d{2}:\d{2}\.\d{3}\s*->')
+TIMESTAMP = re.compile(r'\d{2}:\d{2}:\d{2}\.\d{3}')
+
+# Formatsız satırda bulunmayan, bozulmuş protokol satırı kalıntıları
+# (zaman damgası parçası, "->" oku, birim parantezi, geçersiz bayt)
+PROTOCOL_REMNANT = re.compile(r'^\d|[>(\ufffd]')
+
+# Birleşmiş kaydın kesilmemiş sayılması için ondalıklı değer tam iki basamak olmalı
+COMPLETE_FLOAT = re.compile(r'-?\d+\.\d{2}')
+
+# Satır sonu gelmeden biriken en fazla karakter (çöp veri tamponu büyütmesin)
+MAX_LINE_LENGTH = 4096
+
+# Örnek zamanı: satırın zaman damgası veya alım anı
+CLOCKS = ('line', 'receipt')
+
+
+@functools.lru_cache(maxsize=256)
+def valid_timestamp(timestamp):
+    """HH:MM:SS.mmm biçimi - bir çerçevenin 8 satırı aynı damgayı taşır, sonuç önbellekte"""
+    return TIMESTAMP.fullmatch(timestamp) is not None
+
+
+def parse_record(timestamp, data_part, complete=True):
+    """
+    "->" sonrasındaki tek alanı parse et
+
+    Etiket kaydın başında olmalı, değer kaydı bitirmelidir; araya karakter
+    girmişse (bozulmuş satır) alan atlanır. complete=False ise kayıt bir
+    sonrakiyle birleşmiştir, kesilmiş olabilir: yalnızca tam iki basamaklı
+    ondalık değerler kabul edilir. Zaman damgası HH:MM:SS.mmm biçiminde
+    değilse satır bozulmuştur.
+    """
+    for data_type, keyword, pattern, convert in FIELD_PATTERNS:
+        if keyword in data_part:
+            match = pattern.fullmatch(data_part)
+            break
+    else:
+        # Etiket bozulmuşsa birimden tanı (birimli alanlar parantez içerir)
+        if '(' not in data_part:
+            return []
+        for data_type, pattern, convert in UNIT_PATTERNS:
+            match = pattern.fullmatch(data_part)
+            if match:
+                break
+        else:
+            return []
+
+    if not match or not valid_timestamp(timestamp):
+        return []
+    if not complete and not (convert is float and COMPLETE_FLOAT.fullmatch(match.group(1))):
+        return []
+    return [(data_type, convert(match.group(1)), timestamp)]
+
+
+def parse_line(line):
+    """
+    Arduino'dan gelen tek bir satırı parse et
+
+    Dönüş: [(veri_tipi, değer, zaman_damgası), ...] listesi
+    """
+    samples = []
+
+    # Zaman damgası ve veri kısmını ayır
+    if "->" in line:
+        parts = line.split("->", 1)
+        if len(parts) == 2:
+            timestamp = parts[0].strip()
+            data_part = parts[1].strip()
+
+            if "->" not in data_part:
+                # Her satırda tek bir alan bulunur - ilk eşleşen anahtar kelime geçerli
+                return parse_record(timestamp, data_part)
+
+            # Satır sonu kaybolmuş: kayıtları zaman damgalarından ayır
+            starts = [m.start() for m in RECORD_START.finditer(line)]
+            if not starts or starts[0] > 0:
+                starts.insert(0, 0)
+            for i, start in enumerate(starts):
+                end = starts[i + 1] if i + 1 < len(starts) else len(line)
+                record = line[start:end]
+                if "->" not in record:
+                    continue
+                timestamp, data_part = record.split("->", 1)
+                samples.extend(parse_record(timestamp.strip(), data_part.strip(),
+                                            complete=end == len(line)))
+    else:
+        # Arduino'nun direkt veri göndermesi durumu (format olmadan)
+        # Örnek: ERPM:-6 RPM:0 Hız:0.00 Akım:-0.20 Duty:0 Gerilim:19.47 Güç:-3.89
+        if any(keyword in line for keyword in RAW_KEYWORDS) and not PROTOCOL_REMNANT.search(line):
+            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+
+            # Her parametreyi ayrı ayrı parse et
+            for data_type, _, pattern, convert in FIELD_PATTERNS:
+                match = pattern.search(line)
+                if match:
+                    samples.append((data_type, convert(match.group(1)), timestamp))
+
+    return samples
+
+
+class LineFramer:
+    """
+    Bayt akışını satırlara böler
+
+    Artımlı UTF-8 çözücü, recv/read parçaları arasında bölünen çok baytlı
+    karakterleri ("ı", "ü", "ç") kaybetmez; geçersiz baytlar U+FFFD olur.
+    MAX_LINE_LENGTH'i aşan satır sonu olmayan veri atılır.
+    """
+
+    def __init__(self, max_line=MAX_LINE_LENGTH):
+        self.decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self.max_line = max_line
+        self.buffer = ""
+        self.overflows = 0
+
+    def feed(self, data):
+        """Gelen baytları ekle, tamamlanan (boş olmayan) satırları döndür"""
+        self.buffer += self.decoder.decode(data)
+        if '\n' not in self.buffer:
+            if len(self.buffer) > self.max_line:
+                self.buffer = ""
+                self.overflows += 1
+            return []
+
+        *lines, self.buffer = self.buffer.split('\n')
+        return [line for line in map(str.strip, lines) if line]
+
+
+class LineClock:
+    """
+    Satırın "HH:MM:SS.mmm" damgasını alım anına en yakın güne yerleştirir
+
+    Bir çerçevenin satırları aynı damgayı taşıdığından son dönüşüm, alım
+    gününün başlangıcı da gün değişene kadar önbellekte tutulur.
+    """
+
+    def __init__(self):
+        self.last_text = None
+        self.last_seconds = None
+        self.day_start = None
+
+    def resolve(self, timestamp, receipt_time):
+        if timestamp != self.last_text:
+            # parse_line damgayı HH:MM:SS.mmm olarak doğrulamıştır
+            try:
+                seconds = (int(timestamp[0:2]) * 3600 + int(timestamp[3:5]) * 60
+                           + int(timestamp[6:8]) + int(timestamp[9:12]) / 1000.0)
+            except ValueError:
+                return receipt_time
+            self.last_text = timestamp
+            self.last_seconds = seconds
+        if self.day_start is None or not 0.0 <= receipt_time - self.day_start < 86400.0:
+            receipt_day = datetime.fromtimestamp(receipt_time).date()
+            self.day_start = datetime.combine(receipt_day, datetime.min.time()).timestamp()
+        moment = self.day_start + self.last_seconds
+        # Gece yarısı çevresinde alım ile satır farklı günlere düşebilir
+        if moment - receipt_time > 43200.0:
+            moment -= 86400.0
+        elif receipt_time - moment > 43200.0:
+            moment += 86400.0
+        return moment
+
+
+class StreamParser:
+    """
+    Alınan bayt parçalarını çerçeveleyip ayrıştırır, bayt ve satırları sayar
+
+    clock='line' satırın zaman damgasını, 'receipt' alım anını kullanır;
+    damgasız (formatsız) satırlarda her zaman alım anı kullanılır.
+    """
+
+    def __init__(self, clock='line'):
+        if clock not in CLOCKS:
+            raise ValueError(f"Bilinmeyen zaman kaynağı: {clock}")
+        self.clock = clock
+        self.framer = LineFramer()
+        self.line_clock = LineClock()
+        self.records = 0
+        self.bytes = 0
+        self.lines = 0
+
+    def samples(self, records):
+        """(alım zamanı, baytlar) çiftlerinden (zaman, veri_tipi, değer, zaman_damgası) üreteci"""
+        use_receipt = self.clock == 'receipt'
+        for receipt_time, data in records:
+            self.records += 1
+            self.bytes += len(data)
+            lines = self.framer.feed(data)
+            self.lines += len(lines)
+            for line in lines:
+                line_time = not use_receipt and "->" in line
+                for data_type, value, timestamp in parse_line(line):
+                    moment = self.line_clock.resolve(timestamp, receipt_time) if line_time else receipt_time
+                    yield moment, data_type, value, timestamp
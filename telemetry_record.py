@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Başsız Telemetri Kaydedici
+Arayüz olmadan (pit sunucusu, Raspberry Pi) bir kaynağı saatlerce okuyup
+oturum deposuna (.tstore) yazar. Okuma, ayrıştırma ve türetilmiş kanallar
+arayüzle aynı ingest_core boru hattından geçer; bağlantı koparsa yeniden
+bağlanılır, SIGINT/SIGTERM ile depo düzgünce kapatılır.
+
+Kullanım:
+    python telemetry_record.py socket://localhost:9999
+    python telemetry_record.py /dev/ttyUSB0 --baud 115200 -o yaris.tstore --capture
+    python telemetry_record.py COM3 --duration 3600 --alarms alarm_rules.json
+    python telemetry_record.py captures/ham_kayit_20250930_210000.rawcap.gz --speed 10
+"""
+
+import argparse
+import signal
+import sys
+import threading
+import time
+from datetime import datetime
+
+from alarm_engine import AlarmEngine
+from ingest_core import (DEFAULT_RECONNECT_DELAY, CaptureSource, DerivedChannels, IngestPipeline,
+                         StoreSink, open_source)
+from raw_capture import capture_filename
+from session_store import STORE_EXTENSION
+from telemetry_parser import CLOCKS
+
+# Durum satırı aralığı (saniye)
+DEFAULT_STATUS_INTERVAL = 60.0
+
+
+def default_output(started=None):
+    started = started or datetime.now()
+    return started.strftime(f"telemetri_kayit_%Y%m%d_%H%M%S{STORE_EXTENSION}")
+
+
+class StatusReporter:
+    """Belirli aralıklarla örnek hızı, CPU kullanımı ve son değerleri yazar"""
+
+    def __init__(self, pipeline, interval):
+        self.pipeline = pipeline
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.last_values = {}
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        if self.interval > 0:
+            self.thread.start()
+
+    def run(self):
+        last_wall, last_cpu = time.monotonic(), time.process_time()
+        last_samples = 0
+        while not self.stopped.wait(self.interval):
+            wall, cpu = time.monotonic(), time.process_time()
+            stats = self.pipeline.stats
+            rate = (stats['samples'] - last_samples) / (wall - last_wall)
+            cpu_percent = 100.0 * (cpu - last_cpu) / (wall - last_wall)
+            values = ", ".join(f"{name}={self.last_values[name]:.2f}"
+                               for name in ('Speed', 'Voltage', 'Distance') if name in self.last_values)
+            print(f"[{datetime.now():%H:%M:%S}] {stats['samples']:,} örnek ({rate:.0f}/s), "
+                  f"{stats['bytes'] / 1e6:.1f} MB, CPU %{cpu_percent:.1f}"
+                  + (f" | {values}" if values else ""), flush=True)
+            last_wall, last_cpu, last_samples = wall, cpu, stats['samples']
+
+    def stop(self):
+        self.stopped.set()
+
+
+def record(source, output, capture_path=None, clock='receipt', derived=True, duration=None,
+           status_interval=DEFAULT_STATUS_INTERVAL, alarms=None, reconnect_delay=DEFAULT_RECONNECT_DELAY):
+    """Kaynağı depoya kaydet; süre dolunca, kaynak bitince veya sinyalle döner"""
+    info = {
+        'source': source.name,
+        'recorder': 'telemetry_record',
+        'started_iso': datetime.now().isoformat(),
+        'clock': clock,
+    }
+    pipeline = IngestPipeline(
+        source, clock=clock,
+        derived=DerivedChannels() if derived else None,
+        store=StoreSink(output, info=info),
+        capture_path=capture_path,
+        reconnect_delay=None if isinstance(source, CaptureSource) else reconnect_delay,
+        on_status=lambda message: print(f"⚠️ {message}", flush=True))
+
+    def stop(signum=None, frame=None):
+        pipeline.stop()
+
+    previous = {}
+    if threading.current_thread() is threading.main_thread():
+        previous = {sig: signal.signal(sig, stop) for sig in (signal.SIGINT, signal.SIGTERM)}
+    timer = threading.Timer(duration, stop) if duration else None
+    if timer:
+        timer.daemon = True
+        timer.start()
+    reporter = StatusReporter(pipeline, status_interval)
+    reporter.start()
+
+    last_values = reporter.last_values
+    began = time.monotonic()
+    cpu_began = time.process_time()
+    try:
+        for sample in pipeline.samples():
+            last_values[sample.data_type] = sample.value
+            if alarms is not None:
+                for event in alarms.evaluate(sample.data_type, sample.value, sample.time):
+                    state = f"🚨 ALARM [{event['severity']}]" if event['active'] else "✅ Alarm bitti:"
+                    print(f"{state} {event['rule']}: {event['message']} "
+                          f"({event['channel']} = {event['value']:.2f})", flush=True)
+    finally:
+        reporter.stop()
+        if timer:
+            timer.cancel()
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+
+    stats = pipeline.stats
+    stats['seconds'] = time.monotonic() - began
+    stats['cpu_seconds'] = time.process_time() - cpu_began
+    if derived:
+        stats['total_distance_km'] = pipeline.derived.total_distance
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Arayüz olmadan telemetri kaynağını oturum deposuna kaydet')
+    parser.add_argument('source', help='socket://host:port, seri port (COM3, /dev/ttyUSB0) veya .rawcap.gz/.xz')
+    parser.add_argument('-o', '--output', default=None,
+                        help=f'Oturum deposu (varsayılan telemetri_kayit_<zaman>{STORE_EXTENSION})')
+    parser.add_argument('--baud', type=int, default=9600, help='Seri port hızı (varsayılan 9600)')
+    parser.add_argument('--capture', nargs='?', const='', default=None,
+                        help='Ham baytları da kaydet (yol verilmezse captures/ altında)')
+    parser.add_argument('--duration', type=float, default=None, help='Kayıt süresi (saniye)')
+    parser.add_argument('--clock', choices=CLOCKS, default='receipt',
+                        help='Örnek zamanı: alım anı (varsayılan) veya satır zaman damgası')
+    parser.add_argument('--no-derived', action='store_true',
+                        help='Mesafe, enerji ve kayan pencere kanallarını hesaplama')
+    parser.add_argument('--alarms', default=None, help='Alarm kural dosyası (JSON)')
+    parser.add_argument('--status', type=float, default=DEFAULT_STATUS_INTERVAL,
+                        help='Durum satırı aralığı, saniye (0 kapatır)')
+    parser.add_argument('--reconnect', type=float, default=DEFAULT_RECONNECT_DELAY,
+                        help='Bağlantı koparsa yeniden deneme aralığı, saniye')
+    parser.add_argument('--speed', type=float, default=0.0,
+                        help='Ham kayıt kaynağında oynatma hızı (0 = beklemeden)')
+    args = parser.parse_args(argv)
+
+    try:
+        source = open_source(args.source, baudrate=args.baud, speed=args.speed)
+        alarms = None
+        if args.alarms:
+            alarms = AlarmEngine()
+            alarms.load(args.alarms)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    output = args.output or default_output()
+    capture_path = None
+    if args.capture is not None:
+        capture_path = args.capture or capture_filename()
+
+    print(f"⏺️ Kayıt: {source.name} → {output}")
+    if capture_path:
+        print(f"   Ham kayıt: {capture_path}")
+    if args.duration:
+        print(f"   Süre: {args.duration:.0f} s")
+    print("   Durdurmak için Ctrl+C", flush=True)
+
+    try:
+        stats = record(source, output, capture_path, clock=args.clock, derived=not args.no_derived,
+                       duration=args.duration, status_interval=args.status, alarms=alarms,
+                       reconnect_delay=args.reconnect)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    cpu_percent = 100.0 * stats['cpu_seconds'] / stats['seconds'] if stats['seconds'] > 0 else 0.0
+    print(f"✅ {stats['samples']:,} örnek, {stats['bytes'] / 1e6:.1f} MB, {stats['lines']:,} satır, "
+          f"{stats['seconds']:.0f} s (ortalama CPU %{cpu_percent:.1f})")
+    if 'total_distance_km' in stats:
+        print(f"🛣️ Toplam Mesafe: {stats['total_distance_km']:.3f} km")
+    print(f"📁 Oturum: {output}")
+    return stats
+
+
+if __name__ == '__main__':
+    main()
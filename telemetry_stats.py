@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Akış Halinde İstatistikler
+Veri geldikçe kanal başına güncellenen toplayıcılar: Welford ortalama/varyans,
+min, max, sayı ve P² kantil tahmini. Analiz penceresi bu değerleri O(1) okur,
+grafik penceresinden düşen noktalar oturum istatistiklerini etkilemez.
+"""
+
+import math
+
+# Varsayılan olarak izlenen kantiller (medyan ve p95)
+DEFAULT_QUANTILES = (0.5, 0.95)
+
+
+class P2Quantile:
+    """
+    P² algoritması ile tek bir kantilin sabit bellekte tahmini
+    (Jain & Chlamtac, 1985) - beş işaretçi, örnek başına O(1)
+    """
+
+    def __init__(self, q):
+        self.q = q
+        self.initial = []
+        self.heights = None
+        self.positions = [0, 1, 2, 3, 4]
+        self.desired = [0.0, 2 * q, 4 * q, 2 + 2 * q, 4.0]
+        self.increments = [0.0, q / 2, q, (1 + q) / 2, 1.0]
+
+    def add(self, x):
+        if self.heights is None:
+            self.initial.append(x)
+            if len(self.initial) == 5:
+                self.initial.sort()
+                self.heights = self.initial
+            return
+
+        h = self.heights
+        n = self.positions
+
+        # x'in düştüğü hücreyi bul, uç işaretçileri gerekirse genişlet
+        if x < h[0]:
+            h[0] = x
+            k = 0
+        elif x >= h[4]:
+            h[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= h[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        # Ara işaretçileri istenen konumlara doğru kaydır
+        for i in range(1, 4):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                candidate = h[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (h[i + 1] - h[i]) / (n[i + 1] - n[i]) +
+                    (n[i + 1] - n[i] - d) * (h[i] - h[i - 1]) / (n[i] - n[i - 1]))
+                if not h[i - 1] < candidate < h[i + 1]:
+                    # Parabolik tahmin sırayı bozarsa doğrusal tahmine dön
+                    candidate = h[i] + d * (h[i + d] - h[i]) / (n[i + d] - n[i])
+                h[i] = candidate
+                n[i] += d
+
+    def value(self):
+        """Güncel kantil tahmini, veri yoksa None"""
+        if self.heights is not None:
+            return self.heights[2]
+        if not self.initial:
+            return None
+        ordered = sorted(self.initial)
+        return ordered[min(len(ordered) - 1, int(round(self.q * (len(ordered) - 1))))]
+
+
+class RunningStats:
+    """Tek kanal için akış halinde istatistik toplayıcı"""
+
+    __slots__ = ('count', 'mean', 'm2', 'min', 'max', 'quantiles')
+
+    def __init__(self, quantiles=DEFAULT_QUANTILES):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.quantiles = {q: P2Quantile(q) for q in quantiles}
+
+    def add(self, value):
+        """Yeni değer ekle - Welford güncellemesi"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        for estimator in self.quantiles.values():
+            estimator.add(value)
+
+    def update_many(self, values):
+        """Değer dizisini sırayla ekle"""
+        for value in values:
+            self.add(value)
+
+    @property
+    def variance(self):
+        """Popülasyon varyansı (np.var ile aynı)"""
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def sample_variance(self):
+        """Örneklem varyansı (pandas .var() ile aynı)"""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    def quantile(self, q):
+        """İzlenen kantilin tahmini"""
+        estimator = self.quantiles.get(q)
+        return estimator.value() if estimator else None
+
+    def as_dict(self):
+        """Analiz penceresinin kullandığı özet"""
+        return {
+            'mean': self.mean,
+            'min': self.min,
+            'max': self.max,
+            'std': self.std,
+            'count': self.count,
+            'median': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+        }
+
+
+class SessionStats:
+    """Oturum boyunca kanal başına istatistikler"""
+
+    def __init__(self, quantiles=DEFAULT_QUANTILES):
+        self.quantiles = quantiles
+        self.channels = {}
+
+    def add(self, data_type, value):
+        stats = self.channels.get(data_type)
+        if stats is None:
+            stats = self.channels[data_type] = RunningStats(self.quantiles)
+        stats.add(value)
+
+    def get(self, data_type):
+        """Kanalın toplayıcısı, veri yoksa None"""
+        return self.channels.get(data_type)
+
+    def rebuild(self, telemetry_data):
+        """Mevcut telemetri listelerinden yeniden oluştur (ör. JSON yükleme sonrası)"""
+        self.clear()
+        for data_type, series in telemetry_data.items():
+            if series['values']:
+                stats = self.channels[data_type] = RunningStats(self.quantiles)
+                stats.update_many(series['values'])
+
+    def clear(self):
+        self.channels.clear()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Alarm Kural Motoru Testleri
+"""
+
+import json
+import threading
+
+from alarm_engine import DEFAULT_RULES_FILE, AlarmEngine, RateRule, ThresholdRule, ZScoreRule, benchmark
+
+
+def transitions(engine, channel, values, dt=1.0):
+    """Her örnekteki geçişleri (örnek sırası, aktif) olarak topla"""
+    result = []
+    for i, value in enumerate(values):
+        for event in engine.evaluate(channel, value, i * dt):
+            result.append((i, event['active']))
+    return result
+
+
+def test_threshold_hysteresis():
+    """Sınırda salınım tek alarm üretmeli, histerezis altına inince bitmeli"""
+    engine = AlarmEngine([ThresholdRule('akım', 'Current', above=30.0, hysteresis=2.0)])
+    values = [10, 31, 29.5, 30.5, 29, 27.9, 31]
+    assert transitions(engine, 'Current', values) == [(1, True), (5, False), (6, True)]
+    assert engine.evaluate('Voltage', 100.0, 0.0) == ()
+
+
+def test_rate_and_zscore_rules():
+    """Ani değişim ve aykırı değer yakalanmalı"""
+    engine = AlarmEngine([RateRule('hız', 'Current', max_rate=10.0)])
+    assert transitions(engine, 'Current', [0, 5, 20, 21], dt=1.0) == [(2, True), (3, False)]
+
+    engine = AlarmEngine([ZScoreRule('z', 'Power', z=4.0, span=50, min_samples=20)])
+    values = [100.0 + (i % 5) for i in range(100)] + [300.0, 101.0]
+    assert transitions(engine, 'Power', values) == [(100, True), (101, False)]
+
+
+def test_load_rules_and_benchmark(tmp_path):
+    """Kural dosyası yüklenmeli, 1 kHz akışta maliyet küçük kalmalı"""
+    engine = AlarmEngine()
+    assert engine.load(DEFAULT_RULES_FILE) > 0
+
+    custom = tmp_path / "rules.json"
+    custom.write_text(json.dumps({'rules': [
+        {'name': 'düşük', 'channel': 'Voltage', 'type': 'threshold', 'below': 16.0}
+    ]}), encoding='utf-8')
+    assert engine.load(str(custom)) == 1
+
+    per_sample_us, cpu_share = benchmark(engine, rate_hz=1000, seconds=2.0)
+    assert cpu_share < 0.05
+
+
+def test_reset_waits_for_reader_thread():
+    """GUI'den gelen reset() okuyucu thread'in değerlendirmesini bölmemeli"""
+    entered, release = threading.Event(), threading.Event()
+
+    class BlockingRule(ThresholdRule):
+        def update(self, value, timestamp):
+            entered.set()
+            release.wait(2.0)
+            return super().update(value, timestamp)
+
+    engine = AlarmEngine([BlockingRule('akım', 'Current', above=30.0)])
+    reader = threading.Thread(target=engine.evaluate, args=('Current', 40.0, 0.0))
+    reader.start()
+    entered.wait(2.0)
+
+    reset_done = threading.Event()
+    gui = threading.Thread(target=lambda: (engine.reset(), reset_done.set()))
+    gui.start()
+    assert not reset_done.wait(0.1)
+    release.set()
+    reader.join()
+    gui.join()
+    assert reset_done.is_set() and engine.active_alarms() == []
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Toplu Telemetri Analizi Testleri
+"""
+
+import json
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyze_telemetry import (FLOAT32_RTOL, TelemetryAnalyzer, analyze_file, downcast_column,
+                               local_datetime_index)
+from session_index import find_sessions
+from session_store import convert_json_session
+
+
+def write_session(path, count=50):
+    data = {}
+    for i in range(count):
+        data[f"2025-01-01T10:00:{i:02d}"] = {'timestamp': 1735725600.0 + i, 'Speed': float(i), 'Current': 1.0}
+    path.write_text(json.dumps({'export_info': {'format': 'datetime_keyed'}, 'data': data}), encoding='utf-8')
+
+
+def test_find_sessions_skips_outputs(tmp_path):
+    """Dizin taramasında özet dosyaları atlanmalı"""
+    write_session(tmp_path / "a.json")
+    (tmp_path / "a_distance_summary.json").write_text("{}", encoding='utf-8')
+    (tmp_path / "notes.txt").write_text("", encoding='utf-8')
+
+    assert find_sessions([str(tmp_path)]) == [str(tmp_path / "a.json")]
+
+
+def test_analyze_file_returns_row(tmp_path):
+    """Tek dosya analizi karşılaştırma satırı döndürmeli, hatalar satıra yazılmalı"""
+    write_session(tmp_path / "a.json")
+    row = analyze_file(str(tmp_path / "a.json"), make_plot=False)
+    assert row['records'] == 50
+    assert row['Speed_max'] == 49.0
+    assert (tmp_path / "a_summary.txt").exists()
+
+    (tmp_path / "bad.json").write_text("{}", encoding='utf-8')
+    assert 'error' in analyze_file(str(tmp_path / "bad.json"), make_plot=False)
+
+
+def test_analyze_file_error_without_output(tmp_path, monkeypatch):
+    """Analizör mesaj yazmadan başarısız olsa da satırda anlamlı hata olmalı"""
+    write_session(tmp_path / "a.json")
+    monkeypatch.setattr(TelemetryAnalyzer, 'load_data', lambda self: False)
+    assert analyze_file(str(tmp_path / "a.json"), make_plot=False)['error'] == "Dosya yüklenemedi"
+
+
+def load_frame(path):
+    analyzer = TelemetryAnalyzer(str(path))
+    assert analyzer.load_data() and analyzer.convert_to_dataframe()
+    return analyzer.df
+
+
+def test_json_and_store_columns_match(tmp_path):
+    """JSON ve .tstore aynı DataFrame'i vermeli, None hücreler NaN olmalı"""
+    data = {}
+    for i in range(40):
+        record = {'timestamp': 1735725600.0 + i * 0.5, 'Speed': float(i), 'Voltage': 48.0 + i * 0.1}
+        record['Current'] = None if i % 4 else 2.5
+        data[datetime.fromtimestamp(record['timestamp']).isoformat()] = record
+    path = tmp_path / "a.json"
+    path.write_text(json.dumps({'export_info': {'data_types': ['Speed', 'Current', 'Voltage']},
+                                'data': data}), encoding='utf-8')
+
+    from_json = load_frame(path)
+    from_store = load_frame(convert_json_session(str(path)))
+    assert from_json['Current'].isna().sum() == 30
+    pd.testing.assert_frame_equal(from_json, from_store[from_json.columns], check_like=True)
+
+
+def test_downcast_threshold():
+    """float32'ye yalnızca göreli hata eşiğin altındaysa inilmeli"""
+    exact = np.array([1.5, 36.25, np.nan, -2.0])
+    assert downcast_column(exact).dtype == np.float32
+    assert np.isnan(downcast_column(exact)[2])
+    values = np.random.default_rng(1).normal(50.0, 20.0, 1000)
+    downcast = downcast_column(values)
+    assert downcast.dtype == np.float32
+    assert np.all(np.abs(downcast - values) <= FLOAT32_RTOL * np.maximum(1.0, np.abs(values)))
+    # float32 aralığını aşan değer taşar, kanal float64 kalır
+    assert downcast_column(np.array([1.0, 1e39])).dtype == np.float64
+    assert downcast_column(np.array([np.nan, np.nan])).dtype == np.float32
+
+
+def test_mixed_precision_isoformat_keys(tmp_path):
+    """Mikrosaniyeli ve mikrosaniyesiz datetime metinleri karışık olsa da yüklenmeli"""
+    data = {}
+    for timestamp in (1735725600.0, 1735725600.25, 1735725601.0):
+        key = datetime.fromtimestamp(timestamp).isoformat()
+        data[key] = {'timestamp': timestamp, 'datetime': key, 'Speed': 10.0}
+    path = tmp_path / "a.json"
+    path.write_text(json.dumps({'data': data}), encoding='utf-8')
+
+    df = load_frame(path)
+    assert [stamp.isoformat() for stamp in df.index] == list(data)
+
+
+@pytest.mark.skipif(not hasattr(time, 'tzset'), reason="saat dilimi değiştirilemiyor")
+def test_local_index_follows_dst(monkeypatch):
+    """Yaz saatine geçen oturumda her örnek kendi ofsetini almalı"""
+    monkeypatch.setenv('TZ', 'Europe/Berlin')
+    time.tzset()
+    try:
+        # 2025-03-30 01:00 UTC: 02:00 CET → 03:00 CEST
+        switch = datetime(2025, 3, 30, 1, 0, tzinfo=timezone.utc).timestamp()
+        index = local_datetime_index(np.array([switch - 60.0, switch + 60.0]))
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+    assert [stamp.strftime('%H:%M') for stamp in index] == ['01:59', '03:01']
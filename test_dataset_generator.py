@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Toplu Veri Seti Üretici Testleri
+"""
+
+import json
+from datetime import datetime
+
+import numpy as np
+
+from dataset_generator import TEXT_HEADER, write_dataset
+from session_store import SessionStore, json_session_channels
+from telemetry_parser import parse_line
+
+START = datetime(2025, 9, 30, 21, 0, 0)
+
+
+def test_text_and_raw_follow_protocol(tmp_path):
+    """Metin dosyası ve ham akış telemetri ayrıştırıcısıyla okunabilmeli"""
+    text_file = tmp_path / 'data.txt'
+    raw_file = tmp_path / 'data.raw'
+    stats = write_dataset(str(text_file), 1200, 'text', seed=1, start=START,
+                          chunk_frames=500, verbose=False)
+    write_dataset(str(raw_file), 1200, 'raw', seed=1, start=START, chunk_frames=700, verbose=False)
+
+    text = text_file.read_text(encoding='utf-8')
+    assert text.startswith(TEXT_HEADER)
+    assert text[len(TEXT_HEADER):].encode('utf-8') == raw_file.read_bytes()
+    assert stats['frames'] == 1200 and stats['bytes'] == text_file.stat().st_size
+
+    samples = [s for line in text.splitlines() for s in parse_line(line)]
+    speeds = [s for s in samples if s[0] == 'Speed']
+    assert len(speeds) == 1200
+    assert speeds[0][2] == '21:00:00.000' and speeds[-1][2] == '21:01:59.900'
+
+
+def test_json_and_store_sessions(tmp_path):
+    """JSON oturumu ve depo aynı örnekleri içermeli"""
+    json_file = tmp_path / 'session.json'
+    store_path = tmp_path / 'session.tstore'
+    write_dataset(str(json_file), 3000, 'json', seed=2, start=START, chunk_frames=1000, verbose=False)
+    write_dataset(str(store_path), 3000, 'tstore', seed=2, start=START, chunk_frames=1000, verbose=False)
+
+    with open(json_file, 'r', encoding='utf-8') as f:
+        json_data = json.load(f)
+    assert json_data['export_info']['total_records'] == 3000
+    channels = json_session_channels(json_data)
+    times, speeds = channels['Speed']
+    assert len(times) == 3000
+    assert np.allclose(np.diff(times), 0.1)
+
+    store = SessionStore(str(store_path))
+    store_times, store_speeds = store.read_channel('Speed')
+    assert np.allclose(store_times, times)
+    assert np.allclose(np.round(store_speeds, 2), speeds)
+    assert set(store.channels) == set(channels)
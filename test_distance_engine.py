@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mesafe Motoru Testleri
+"""
+
+import time
+
+import numpy as np
+
+from distance_engine import DistanceIntegrator, cumulative_distance, distance_totals
+
+
+def test_trapezoid_constant_acceleration():
+    """Doğrusal hızlanmada yamuk kuralı tam sonucu vermeli"""
+    times = np.arange(0.0, 11.0)
+    speeds = times * 3.6  # 0 → 36 km/h, 10 s
+    assert abs(cumulative_distance(times, speeds)[-1] - 0.05) < 1e-12
+
+
+def test_live_and_offline_agree():
+    """Artımlı ve vektörel hesap aynı sonucu vermeli, kesintiler atlanmalı"""
+    rng = np.random.default_rng(1)
+    times = np.cumsum(rng.uniform(0.05, 0.2, 2000))
+    times[1000:] += 30.0  # bağlantı kopması
+    speeds = rng.uniform(-2.0, 30.0, 2000)
+
+    integrator = DistanceIntegrator(max_gap=5.0)
+    live = [integrator.add(v, t) for t, v in zip(times, speeds)]
+    offline = cumulative_distance(times, speeds, max_gap=5.0)
+    totals = distance_totals(times, speeds, max_gap=5.0)
+
+    assert np.allclose(live, offline, rtol=1e-12)
+    assert integrator.gaps == totals['gap_count'] == 1
+    assert abs(integrator.backward - totals['backward_km']) < 1e-12
+    assert abs(totals['total_km'] - offline[-1]) < 1e-9
+
+
+def test_vectorized_million_samples():
+    """1M örnek milisaniyeler içinde işlenmeli"""
+    times = np.arange(1_000_000) * 0.01
+    speeds = np.full(1_000_000, 36.0)
+    start = time.perf_counter()
+    distance = cumulative_distance(times, speeds)
+    assert time.perf_counter() - start < 0.5
+    assert abs(distance[-1] - 99.9999) < 1e-6
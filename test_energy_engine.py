@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Enerji ve Hidrojen Verimliliği Testleri
+"""
+
+import numpy as np
+
+from energy_engine import EnergyTracker, derive_energy_channels, km_per_m3, wh_per_km
+
+
+def test_live_and_vectorized_energy_agree():
+    """Canlı toplayıcı ile vektörel hesap aynı Wh değerini vermeli"""
+    times = np.arange(0.0, 100.0, 0.5)
+    power = 200.0 + 50.0 * np.sin(times / 7.0)
+
+    tracker = EnergyTracker()
+    live = [tracker.add_power(p, t) for t, p in zip(times, power)]
+
+    derived = derive_energy_channels({'Power': {'times': times, 'values': power}})
+    assert np.allclose(derived['Energy'][1], live, rtol=1e-12)
+    assert 'WhPerKm' not in derived  # mesafe yoksa oran üretilmez
+
+
+def test_efficiency_channels():
+    """Wh/km ve km/m³ mesafe ve hidrojen akışından hesaplanmalı"""
+    times = np.arange(0.0, 61.0)
+    channels = {
+        'Power': {'times': times, 'values': np.full(61, 360.0)},         # 6 Wh
+        'Distance': {'times': times, 'values': times / 60.0 * 0.5},      # 0.5 km
+        'H2Flow': {'times': times, 'values': np.full(61, 2.0)},          # 2 L
+    }
+    derived = derive_energy_channels(channels)
+    assert abs(derived['Energy'][1][-1] - 6.0) < 1e-9
+    assert abs(derived['WhPerKm'][1][-1] - 12.0) < 1e-9
+    assert abs(derived['H2Used'][1][-1] - 2.0) < 1e-9
+    assert abs(derived['KmPerM3'][1][-1] - 250.0) < 1e-9
+
+    assert wh_per_km(1.0, 0.0) is None
+    assert km_per_m3(1.0, 0.0) is None
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Hata Enjeksiyonu ve Ayrıştırıcı Dayanıklılık Testleri
+"""
+
+import pytest
+
+from fault_harness import run_harness
+from fault_injector import FaultInjector, parse_fault_spec
+from telemetry_parser import LineFramer, parse_line
+
+FRAME = ("12:00:00.000 -> ----- ALINAN VERİ -----\n"
+         "12:00:00.000 -> Hız (km/h): 12.50\n"
+         "12:00:00.000 -> Güç (W): 74.19\n\n").encode('utf-8')
+
+
+def test_fault_spec():
+    """Tanım metni olasılıklara çevrilmeli, hatalı tanım reddedilmeli"""
+    assert parse_fault_spec("truncate=0.01, stall=0.5,stall_s=2") == {
+        'truncate': 0.01, 'stall': 0.5, 'stall_s': 2.0}
+    assert FaultInjector.from_spec("") is None
+    with pytest.raises(ValueError):
+        parse_fault_spec("noise=0.1")
+    with pytest.raises(ValueError):
+        parse_fault_spec("merge=2")
+
+
+def test_injector_is_seeded():
+    """Aynı tohum aynı bozulmaları üretmeli"""
+    def corrupt(seed):
+        injector = FaultInjector(seed, truncate=0.3, merge=0.3, garbage=0.3, bad_utf8=0.3, stall=0.3)
+        return [injector.apply(FRAME) for _ in range(50)], injector.counts
+
+    assert corrupt(7) == corrupt(7)
+    assert corrupt(7)[0] != corrupt(8)[0]
+
+    injector = FaultInjector(1, merge=1.0, stall=1.0, stall_s=0.25)
+    assert injector.apply(FRAME) == FRAME.rstrip(b'\n')
+    assert injector.take_stall() == 0.25 and injector.take_stall() == 0.0
+
+
+def test_parser_recovers_merged_and_mislabeled_records():
+    """Birleşmiş satırlar ayrılmalı, kesilmiş ve bozuk kayıtlar atlanmalı"""
+    merged = "11:00:00.000 -> Güç (W): 74.1912:00:00.100 -> Hız (km/h): 3.50"
+    assert parse_line(merged) == [('Power', 74.19, '11:00:00.000'), ('Speed', 3.5, '12:00:00.100')]
+    # Kesilmiş değer birleşmiş kayıtta kabul edilmez
+    assert parse_line("11:00:00.000 -> Akım (A): 3.11:00:00.000 -> Duty: 40") == [
+        ('Duty', 40, '11:00:00.000')]
+    # Etiketi bozulmuş alan birimden tanınır
+    assert parse_line("11:00:00.000 -> H�z (km/h): 8.25") == [('Speed', 8.25, '11:00:00.000')]
+    # Değerden sonra çöp, bozuk zaman damgası, kaybolmuş satır sonu
+    assert parse_line("11:00:00.000 -> Hız (km/h): 3.6X8") == []
+    assert parse_line("11:0\x07#:00.000 -> ERPM: 120") == []
+    assert parse_line("11:00:00.000 -> Hız (km/h):  Akım (A): 3.82") == []
+    assert parse_line("0> RPM: 201") == []
+
+
+def test_framer_keeps_split_characters():
+    """Parçalar arasında bölünen çok baytlı karakter kaybolmamalı"""
+    framer = LineFramer(max_line=64)
+    lines = []
+    for i in range(len(FRAME)):
+        lines.extend(framer.feed(FRAME[i:i + 1]))
+    assert lines == FRAME.decode('utf-8').split('\n')[:3]
+
+    # Satır sonu gelmeyen çöp tamponu büyütmez
+    assert framer.feed(b'x' * 100) == [] and framer.overflows == 1
+    assert framer.feed(b'\xffDuty: 5\n') == ['�Duty: 5']
+
+
+def test_harness_reports_recovery():
+    """Temiz akış tamamen, bozulmuş akış büyük ölçüde kurtarılmalı"""
+    clean = run_harness(2000, None, seed=3, recv_size=256)
+    assert clean['recovered'] == 2000 and clean['false_parses'] == 0
+
+    faults = "truncate=0.05,merge=0.05,garbage=0.05,bad_utf8=0.05,stall=0.01"
+    stats = run_harness(2000, faults, seed=3, fault_seed=4, recv_size=256)
+    again = run_harness(2000, faults, seed=3, fault_seed=4, recv_size=256)
+    for key in ('bytes', 'chunks', 'recovered', 'partial', 'dropped', 'false_parses', 'faults'):
+        assert stats[key] == again[key]
+    assert stats['recovered'] + stats['partial'] + stats['dropped'] == 2000
+    assert stats['recovered'] > 1500
+    assert stats['false_parses'] < 20
+    assert set(stats['faults']) == {'truncate', 'merge', 'garbage', 'bad_utf8', 'stall'}
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Telemetri Alım Çekirdeği Testleri
+"""
+
+import socket
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from dataset_generator import format_text_frames, frame_clock
+from ingest_core import (CaptureSource, DerivedChannels, IngestPipeline, SerialSource, StoreSink,
+                         TcpSource, open_source)
+from raw_capture import CaptureWriter
+from scenario_engine import BulkScenario
+from session_store import SessionStore
+
+START = datetime(2025, 9, 30, 12, 0, 0)
+
+FRAME = ("12:00:00.000 -> Hız (km/h): 36.00\n"
+         "12:00:00.000 -> Güç (W): 720.00\n").encode('utf-8')
+
+
+def test_open_source_specs(tmp_path):
+    """Kaynak tanımı doğru kaynak tipine çevrilmeli"""
+    source = open_source("socket://192.168.4.1:8888")
+    assert isinstance(source, TcpSource) and source.port == 8888
+    assert isinstance(open_source(str(tmp_path / 'kayit.rawcap.xz')), CaptureSource)
+    assert isinstance(open_source("/dev/ttyUSB0", baudrate=115200), SerialSource)
+    with pytest.raises(ValueError):
+        open_source("socket://localhost")
+
+
+def test_derived_channels():
+    """Türetilmiş kanallar arayüzdeki canlı hesapla aynı olmalı"""
+    derived = DerivedChannels()
+    assert derived.add('Speed', 36.0, 0.0)[0] == ('Distance', 0.0)
+    assert dict(derived.add('Speed', 36.0, 2.0))['Distance'] == pytest.approx(0.02)
+    assert derived.total_distance == pytest.approx(0.02)
+
+    derived.add('Power', 720.0, 0.0)
+    channels = dict(derived.add('Power', 720.0, 5.0))
+    assert channels['Energy'] == pytest.approx(1.0)
+    assert channels['WhPerKm'] == pytest.approx(50.0)
+    assert 'Power_mean5s' in channels
+
+    derived.add('H2Flow', 6.0, 0.0)
+    channels = dict(derived.add('H2Flow', 6.0, 5.0))
+    assert channels['H2Used'] == pytest.approx(0.5)
+    assert channels['KmPerM3'] == pytest.approx(40.0)
+
+    derived.reset(distance_km=1.5)
+    assert derived.total_distance == 1.5
+    assert derived.add('Voltage', 48.0, 0.0) == []
+
+
+def test_capture_pipeline_into_store(tmp_path):
+    """Ham kayıttan okunan örnekler türetilmiş kanallarla depoya yazılmalı"""
+    capture = tmp_path / 'kayit.rawcap.gz'
+    _, local = frame_clock(START, 0, 500, 0.1)
+    stream = format_text_frames(local, BulkScenario(None, 1, 0.1).next_chunk(500)).encode('utf-8')
+    with CaptureWriter(str(capture), source='test') as writer:
+        for i in range(0, len(stream), 333):
+            writer.write(stream[i:i + 333], START.timestamp() + i * 1e-5)
+
+    store_path = str(tmp_path / 'oturum.tstore')
+    received = []
+    pipeline = IngestPipeline(CaptureSource(str(capture)), clock='line',
+                              derived=DerivedChannels(), store=StoreSink(store_path))
+    stats = pipeline.run(received.append)
+
+    speeds = [s for s in received if s.data_type == 'Speed']
+    distances = [s for s in received if s.data_type == 'Distance']
+    assert len(speeds) == len(distances) == 500
+    assert speeds[0].time == pytest.approx(START.timestamp())
+    assert stats['samples'] == len(received) and stats['connections'] == 1
+
+    store = SessionStore(store_path)
+    assert len(store.read_channel('Speed')[0]) == 500
+    assert store.info['total_distance_km'] == pytest.approx(distances[-1].value)
+    assert {'Energy', 'Power_mean5s'} <= set(store.channels)
+    assert (tmp_path / 'oturum.tstore' / 'summary_index.json').exists()
+
+
+def test_tcp_pipeline_reconnects():
+    """Kopan bağlantı yeniden açılmalı, yarım kalan satır yeni akışa karışmamalı"""
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    port = server.getsockname()[1]
+
+    def serve():
+        for payload in (FRAME + "12:00:00.000 -> Gerilim (".encode('utf-8'), FRAME):
+            client, _ = server.accept()
+            client.sendall(payload)
+            client.close()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+
+    pipeline = IngestPipeline(TcpSource('127.0.0.1', port), reconnect_delay=0.05)
+    received = []
+    for sample in pipeline.samples():
+        received.append(sample)
+        if len(received) == 4:
+            pipeline.stop()
+    thread.join(2)
+    server.close()
+
+    assert [s.data_type for s in received] == ['Speed', 'Power', 'Speed', 'Power']
+    assert pipeline.stats['connections'] == 2
+
+
+def test_stop_before_start_is_kept(tmp_path):
+    """Okuma başlamadan gelen stop() kaybolmamalı"""
+    capture = tmp_path / 'kayit.rawcap.gz'
+    with CaptureWriter(str(capture), source='test') as writer:
+        writer.write(FRAME, START.timestamp())
+
+    pipeline = IngestPipeline(CaptureSource(str(capture)))
+    pipeline.stop()
+    assert list(pipeline.samples()) == []
+    assert pipeline.stats['connections'] == 0
+
+
+def test_capture_write_error_keeps_reading(tmp_path):
+    """Ham kayıt yazılamazsa (disk dolu) okuma kayıtsız sürmeli"""
+    capture = tmp_path / 'kayit.rawcap.gz'
+    with CaptureWriter(str(capture), source='test') as writer:
+        for second in range(3):
+            writer.write(FRAME.replace(b'00.000', f'{second:02d}.000'.encode()), START.timestamp() + second)
+
+    class FullDiskWriter:
+        def write(self, data, receipt_time=None):
+            raise OSError(28, "No space left on device")
+
+        def close(self):
+            raise OSError(28, "No space left on device")
+
+    messages = []
+    pipeline = IngestPipeline(CaptureSource(str(capture)), on_status=messages.append)
+    pipeline.capture = FullDiskWriter()
+    samples = list(pipeline.samples())
+
+    assert len(samples) == 6
+    assert pipeline.capture is None
+    assert any("Ham kayıt durduruldu" in message for message in messages)
+
+
+def test_store_sink_orders_across_batches(tmp_path):
+    """Toplu yazım sınırını aşan geç örnekler depoda sıralı kalmalı"""
+    store_path = str(tmp_path / 'oturum.tstore')
+    sink = StoreSink(store_path, batch=8, reorder_seconds=1.0)
+    moments = [float(i) for i in range(20)]
+    moments[8], moments[9] = moments[9], moments[8]  # 8. örnek toplu yazımdan sonra gelir
+    moments.append(3.0)  # yazılmış aralıktan da eski
+    for moment in moments:
+        sink.add('Speed', moment, moment)
+    sink.close()
+
+    times, values = SessionStore(store_path).read_channel('Speed')
+    assert len(times) == len(moments)
+    assert all(a <= b for a, b in zip(times, times[1:]))
+    assert sink.late_samples == 1
+
+
+def test_tcp_cancel_during_connect():
+    """Bağlantı beklenirken cancel() okuma zaman aşımı içinde fark edilmeli"""
+    # Kabul kuyruğu dolu sunucu: yeni bağlantı beklemede kalır
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(0)
+    port = server.getsockname()[1]
+    waiting = socket.create_connection(('127.0.0.1', port))
+
+    source = TcpSource('127.0.0.1', port, timeout=0.1, connect_timeout=30.0)
+    threading.Timer(0.2, source.cancel).start()
+    started = time.monotonic()
+    with pytest.raises(OSError):
+        source.open()
+    assert time.monotonic() - started < 2.0
+
+    with pytest.raises(OSError):
+        source.open()
+    assert not source.is_open
+    waiting.close()
+    server.close()
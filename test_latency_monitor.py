@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gecikme Ölçümü Testleri
+"""
+
+from latency_monitor import LatencyMonitor, RollingHistogram, now
+
+
+def test_rolling_histogram_percentiles():
+    """Yüzdelikler kova çözünürlüğü içinde doğru olmalı, pencere dışı değerler düşmeli"""
+    histogram = RollingHistogram(window=1000)
+    for i in range(1, 1001):
+        histogram.add(i / 1000.0)  # 1 ms ... 1 s
+
+    assert abs(histogram.percentile(50) - 0.5) / 0.5 < 0.15
+    assert abs(histogram.percentile(99) - 0.99) / 0.99 < 0.15
+
+    for _ in range(1000):
+        histogram.add(0.002)
+    assert len(histogram) == 1000
+    assert histogram.percentile(99) < 0.003
+
+
+def test_monitor_stages_and_queue_depth():
+    """Örnek damgaları aşama histogramlarına ve kuyruk derinliğine yansımalı"""
+    monitor = LatencyMonitor()
+    monitor.set_enabled(True)
+
+    data = {'type': 'Speed'}
+    monitor.stamp_parsed(data, now())
+    assert monitor.queue_depth == 1
+
+    monitor.record_dequeue(data)
+    monitor.record_frame()
+    snapshot = monitor.snapshot()
+    assert monitor.queue_depth == 0
+    assert all(stage['count'] == 1 for stage in snapshot['stages'])
+
+
+def test_reset_keeps_reader_counter():
+    """GUI'deki reset() okuyucu thread'in sayacına yazmamalı"""
+    monitor = LatencyMonitor()
+    monitor.set_enabled(True)
+    for _ in range(3):
+        monitor.stamp_parsed({}, now())
+    monitor.reset()
+    assert monitor.emitted == 3 and monitor.queue_depth == 0
+
+    data = {}
+    monitor.stamp_parsed(data, now())
+    assert monitor.queue_depth == 1
+    monitor.record_dequeue(data)
+    assert monitor.queue_depth == 0
+
+
+def test_pending_render_is_bounded():
+    """Çizim gelmezse bekleyen örnekler pencereyle sınırlı kalmalı"""
+    monitor = LatencyMonitor(window=16)
+    monitor.set_enabled(True)
+    for _ in range(100):
+        data = {}
+        monitor.stamp_parsed(data, now())
+        monitor.record_dequeue(data)
+    assert len(monitor.pending_render) == 16
+
+    monitor.set_enabled(False)
+    assert len(monitor.pending_render) == 0
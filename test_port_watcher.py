@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Seri Port Takibi Testleri
+"""
+
+from types import SimpleNamespace
+
+from port_watcher import PortWatcher, board_key, classify_port, is_arduino_port
+
+
+def make_port(device, description='n/a', vid=None, pid=None, serial_number=None, manufacturer=None):
+    return SimpleNamespace(device=device, description=description, vid=vid, pid=pid,
+                           serial_number=serial_number, manufacturer=manufacturer)
+
+
+UNO = make_port('COM5', 'USB Seri Aygıt (COM5)', 0x2341, 0x0043, 'A1')
+CH340 = make_port('COM7', 'USB-SERIAL CH340 (COM7)', 0x1A86, 0x7523)
+BT = make_port('COM3', 'Standard Serial over Bluetooth link (COM3)')
+
+
+def test_classification():
+    """VID/PID listesindeki kart Arduino, diğerleri açıklamadan sınıflanmalı"""
+    assert is_arduino_port(UNO) and is_arduino_port(CH340)
+    assert not is_arduino_port(BT) and not is_arduino_port(make_port('COM1', vid=0x2341))
+    assert classify_port(UNO) == ("🔧 Arduino", "Arduino")
+    assert classify_port(BT)[1] == "Bluetooth"
+    # Üretici bilgisi olmayan (None) port hata vermemeli
+    assert classify_port(make_port('/dev/ttyS0', description=None))[1] == "Unknown"
+
+
+def test_watcher_diffs_device_sets(tmp_path):
+    """Yalnızca değişiklikler bildirilmeli, imza değişmedikçe tarama yapılmamalı"""
+    ports = [UNO, BT]
+    devices = {'signature': 1}
+    pty_link = tmp_path / 'ttyVirtualArduino'
+    watcher = PortWatcher(list_ports=lambda: list(ports), signature=lambda: devices['signature'],
+                          virtual_devices=[str(pty_link)])
+
+    added, removed = watcher.poll()
+    assert [entry.device for entry in added] == ['COM5', 'COM3'] and removed == []
+    assert added[0].kind == 'Arduino'
+
+    # İmza aynıysa port listesi hiç okunmaz
+    ports.append(CH340)
+    assert watcher.poll() == ([], []) and watcher.scans == 1
+
+    devices['signature'] = 2
+    ports.remove(UNO)
+    pty_link.write_text('')
+    added, removed = watcher.poll()
+    assert {entry.device for entry in added} == {'COM7', str(pty_link)}
+    assert removed == ['COM5']
+    assert watcher.ports[str(pty_link)].kind == 'Virtual'
+
+    # Yeniden takılan kart önbellekten sınıflanır
+    misses = watcher.classifier.misses
+    assert watcher.poll(force=True) == ([], [])
+    ports.append(UNO)
+    devices['signature'] = 3
+    assert [entry.device for entry in watcher.poll()[0]] == ['COM5']
+    assert watcher.classifier.misses == misses
+
+
+def test_board_key_follows_board_across_ports():
+    """USB kart başka bir cihaz adıyla takılsa da aynı kimliği taşımalı"""
+    watcher = PortWatcher(list_ports=lambda: [UNO], signature=None)
+    first = watcher.poll()[0][0]
+    moved = watcher.classifier.entry(make_port('COM6', UNO.description, 0x2341, 0x0043, 'A1'))
+    assert board_key(first) == board_key(moved) == (0x2341, 0x0043, 'A1')
+    assert board_key(watcher.classifier.entry(BT)) == 'COM3'
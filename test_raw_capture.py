@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ham Bayt Kaydı Testleri
+"""
+
+import json
+import random
+from datetime import datetime
+
+import pytest
+
+from dataset_generator import format_text_frames, frame_clock
+from raw_capture import (CaptureReader, CaptureWriter, capture_filename,
+                         is_capture_path, reparse_capture)
+from scenario_engine import BulkScenario
+from session_replay import load_replay_events
+from session_store import SessionStore
+from telemetry_parser import LineClock
+
+START = datetime(2025, 9, 30, 23, 59, 0)
+
+
+def write_capture(path, frames=3000, chunk_bytes=16 * 1024):
+    """Simülatör akışını rastgele boyutlu okumalar halinde kaydet"""
+    _, local = frame_clock(START, 0, frames, 0.1)
+    stream = format_text_frames(local, BulkScenario(None, 1, 0.1).next_chunk(frames)).encode('utf-8')
+    chunks = []
+    rng = random.Random(2)
+    position = 0
+    while position < len(stream):
+        size = rng.randint(1, 700)
+        chunks.append(stream[position:position + size])
+        position += size
+
+    with CaptureWriter(str(path), source='test', chunk_bytes=chunk_bytes) as writer:
+        for i, chunk in enumerate(chunks):
+            writer.write(chunk, START.timestamp() + i * 0.01)
+    return chunks
+
+
+@pytest.mark.parametrize('compression', ['gz', 'xz'])
+def test_capture_round_trip(tmp_path, compression):
+    """Okumalar alım zamanlarıyla aynen geri okunmalı"""
+    path = tmp_path / f'kayit.rawcap.{compression}'
+    chunks = write_capture(path)
+
+    reader = CaptureReader(str(path))
+    assert reader.info['source'] == 'test'
+    records = list(reader)
+    assert [data for _, data in records] == chunks
+    assert records[5][0] == pytest.approx(START.timestamp() + 0.05)
+    assert not reader.truncated
+
+
+def test_truncated_capture_keeps_complete_chunks(tmp_path):
+    """Yarıda kesilen kayıtta yalnızca son parça kaybolmalı"""
+    path = tmp_path / 'kayit.rawcap.gz'
+    chunks = write_capture(path)
+    data = path.read_bytes()
+    path.write_bytes(data[:len(data) - 2000])
+
+    reader = CaptureReader(str(path))
+    records = list(reader)
+    assert reader.truncated
+    assert 0 < len(records) < len(chunks)
+    assert [data for _, data in records] == chunks[:len(records)]
+
+
+def test_reparse_into_sessions(tmp_path):
+    """Kayıt depo ve JSON oturumuna dönüştürülmeli, gece yarısı geçişi korunmalı"""
+    path = tmp_path / 'kayit.rawcap.gz'
+    write_capture(path)
+
+    stats = reparse_capture(str(path), str(tmp_path / 'oturum.tstore'), verbose=False)
+    assert stats['samples'] == 3000 * 7 and not stats['truncated']
+    times, _ = SessionStore(str(tmp_path / 'oturum.tstore')).read_channel('Speed')
+    assert len(times) == 3000
+    assert times[0] == pytest.approx(START.timestamp())
+    assert times[-1] == pytest.approx(START.timestamp() + 299.9)
+
+    reparse_capture(str(path), str(tmp_path / 'oturum.json'), verbose=False)
+    session = json.loads((tmp_path / 'oturum.json').read_text(encoding='utf-8'))
+    assert session['export_info']['total_records'] == 3000
+    assert (tmp_path / 'oturum_index.json').exists()
+
+    events = load_replay_events(str(path))
+    assert len(events) == 3000 * 7
+    assert events[0].time <= events[-1].time
+
+
+def test_line_clock_and_names():
+    """Satır damgası alım gününe yerleşmeli, dosya adı tanınmalı"""
+    clock = LineClock()
+    receipt = datetime(2025, 10, 1, 0, 0, 1).timestamp()
+    assert clock.resolve('23:59:59.500', receipt) == pytest.approx(receipt - 1.5)
+    assert clock.resolve('00:00:00.900', receipt) == pytest.approx(receipt - 0.1)
+
+    name = capture_filename('captures', 'xz', started=START)
+    assert name.endswith('ham_kayit_20250930_235900.rawcap.xz')
+    assert is_capture_path(name) and not is_capture_path('oturum.json.gz')
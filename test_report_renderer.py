@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rapor Çizimi Testleri
+"""
+
+import numpy as np
+
+from report_renderer import decimate_min_max, draw_panels, new_figure, save_figure
+
+
+def test_decimate_keeps_extremes():
+    """Seyrekleştirme her sütunun min/max değerini ve uçları korumalı"""
+    rng = np.random.default_rng(5)
+    times = np.arange(100000) * 0.01
+    values = rng.normal(size=len(times))
+    values[12345] = 50.0
+    values[67890] = -50.0
+
+    keep = decimate_min_max(times, values, 200)
+    assert len(keep) <= 4 * 200 + 2
+    assert np.all(np.diff(keep) > 0)
+    assert keep[0] == 0 and keep[-1] == len(times) - 1
+    assert 12345 in keep and 67890 in keep
+
+    # Kısa seriler olduğu gibi kalır
+    assert np.array_equal(decimate_min_max(times[:50], values[:50], 200), np.arange(50))
+
+
+def test_render_formats(tmp_path):
+    """Ekransız figür istenen her biçimde kaydedilmeli"""
+    times = np.arange(50000) * 0.1
+    figure = new_figure(rows=1)
+    raw, drawn = draw_panels(figure, [('Speed', times, np.sin(times)), ('Power', times, np.cos(times))])
+    assert raw == 100000 and drawn < raw
+
+    files = save_figure(figure, str(tmp_path / 'rapor'), ('png', 'svg', 'pdf'))
+    assert [f.rsplit('.', 1)[1] for f in files] == ['png', 'svg', 'pdf']
+    assert all((tmp_path / f'rapor.{fmt}').stat().st_size > 0 for fmt in ('png', 'svg', 'pdf'))
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Zaman Hizalama Testleri
+"""
+
+import numpy as np
+
+from analyze_telemetry import align_sparse_columns
+from resampler import align_channels, resample, unaligned_table, unused_samples
+
+
+def test_resample_methods():
+    """Yöntemler tolerans dışındaki noktaları boş bırakmalı"""
+    times = [0.0, 1.0, 2.0]
+    values = [10.0, 20.0, 30.0]
+    grid = [0.4, 0.6, 1.5, 5.0]
+
+    nearest = resample(times, values, grid, 'nearest', tolerance=0.5)
+    assert np.allclose(nearest[:3], [10.0, 20.0, 20.0])
+    assert np.isnan(nearest[3])
+
+    previous = resample(times, values, grid, 'previous', tolerance=1.0)
+    assert np.allclose(previous[:3], [10.0, 10.0, 20.0])
+    assert np.isnan(previous[3])
+
+    linear = resample(times, values, grid, 'linear', tolerance=1.0)
+    assert np.allclose(linear[:3], [14.0, 16.0, 25.0])
+    assert np.isnan(linear[3])
+
+
+def test_align_jittered_channels():
+    """Birkaç ms kaymış kanallar referans ızgarada tek satırda buluşmalı"""
+    times = np.arange(0.0, 10.0, 0.1)
+    data = {
+        'Speed': {'times': times, 'values': np.full(len(times), 25.0)},
+        'Power': {'times': times + 0.003, 'values': np.full(len(times), 80.0)},
+        'Voltage': {'times': times[::2] + 0.001, 'values': np.full(len(times) // 2, 19.5)},
+    }
+    grid, aligned = align_channels(data)
+    assert np.array_equal(grid, times)
+    assert not np.isnan(aligned['Power']).any()
+    # Seyrek kanal yalnızca kendi örneklerinin yakınında dolu
+    assert np.count_nonzero(~np.isnan(aligned['Voltage'])) == len(times) // 2
+
+
+def test_align_sparse_columns():
+    """Alan başına ayrı kayıtlı tablo hizalanmalı, yoğun tablo değişmemeli"""
+    nan = np.nan
+    timestamps = np.array([0.0, 0.001, 0.002, 0.1, 0.101, 0.102])
+    columns = {
+        'Speed': np.array([1.0, nan, nan, 2.0, nan, nan]),
+        'Power': np.array([nan, 5.0, nan, nan, 6.0, nan]),
+        'Voltage': np.array([nan, nan, 19.0, nan, nan, 19.5]),
+    }
+    grid, aligned = align_sparse_columns(timestamps, columns)
+    assert np.allclose(grid, [0.0, 0.1])
+    assert np.allclose(aligned['Power'], [5.0, 6.0])
+    assert np.allclose(aligned['Voltage'], [19.0, 19.5])
+
+    dense = {'Speed': np.array([1.0, 2.0]), 'Power': np.array([5.0, 6.0])}
+    same_times, same = align_sparse_columns(np.array([0.0, 0.1]), dense)
+    assert same is dense
+
+
+def test_alignment_losses_and_unaligned_table():
+    """Izgaraya sığmayan örnekler sayılmalı, kayıpsız tablo hepsini tutmalı"""
+    grid = np.arange(0.0, 1.0, 0.1)
+    fast = np.arange(0.0, 1.0, 0.025)
+    assert unused_samples(grid + 0.003, grid, 0.05) == 0
+    assert unused_samples(fast, grid, 0.05) == len(fast) - len(grid)
+    assert unused_samples([5.0], grid, 0.05) == 1
+
+    data = {
+        'Speed': {'times': grid, 'values': np.full(len(grid), 25.0)},
+        'Current': {'times': fast, 'values': np.arange(len(fast), dtype=float)},
+    }
+    times, table = unaligned_table(data)
+    assert len(times) == len(fast)
+    assert np.count_nonzero(~np.isnan(table['Speed'])) == len(grid)
+    assert np.array_equal(table['Current'], np.arange(len(fast), dtype=float))
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tur / Segment Tespiti Testleri
+"""
+
+import numpy as np
+
+from segment_index import SegmentHistory, build_segment_index, lap_boundaries, stop_boundaries
+
+
+def make_session():
+    """Her 300 s'de 20 s duran, 30 km/h hızla giden oturum"""
+    times = np.arange(0.0, 1200.0, 0.5)
+    speeds = np.where((times % 300) < 280, 30.0, 0.0)
+    return {
+        'Speed': {'times': times, 'values': speeds},
+        'Power': {'times': times, 'values': speeds * 10.0},
+        'Current': {'times': times, 'values': np.where(times > 600, 8.0, 5.0)},
+    }
+
+
+def test_lap_boundaries_share_crossing_sample():
+    """Turlar pist uzunluğunun katlarında bölünmeli"""
+    distance = np.linspace(0.0, 2.5, 26)
+    starts, ends = lap_boundaries(distance, 1.0)
+    assert starts.tolist() == [0, 10, 20]
+    assert ends.tolist() == [10, 20, 25]
+
+
+def test_stop_boundaries_merge_short_stops():
+    """Kısa duraklar stint'i bölmemeli"""
+    times = np.arange(10.0)
+    speeds = np.array([5, 5, 0, 5, 5, 0, 0, 0, 5, 5], dtype=float)
+    starts, ends = stop_boundaries(times, speeds, min_stop_s=3.0)
+    assert starts.tolist() == [0, 8]
+    assert ends.tolist() == [4, 9]
+
+
+def test_segment_index_aggregates():
+    """Segment özetleri mesafe, enerji ve maksimum akımı içermeli"""
+    laps = build_segment_index(make_session(), track_length_km=0.5)
+    assert laps.kind == 'lap'
+    assert np.allclose(laps.segments['distance_km'][1:-1], 0.5, atol=0.005)
+    assert not laps.segments['complete'][-1]
+    assert laps.segments['max_current'][-1] == 8.0
+
+    stints = build_segment_index(make_session())
+    assert stints.kind == 'stint' and len(stints) == 4
+    records = stints.records()
+    assert abs(records[0]['wh_per_km'] - 10.0) < 1e-6
+    assert records[0]['delta_best_s'] == 0.0
+
+
+def test_segment_history_keeps_whole_session():
+    """Görüntü tamponu kırpılsa da turlar tüm oturumdan bulunmalı"""
+    session = make_session()
+    history = SegmentHistory()
+    for channel, series in session.items():
+        for t, value in zip(series['times'], series['values']):
+            history.add(channel, value, t)
+    history.add('Voltage', 48.0, 0.0)  # segment kanalı olmayan örnek atlanır
+    assert set(history.channels) == {'Speed', 'Power', 'Current'}
+
+    stints = build_segment_index(history.as_telemetry_data())
+    assert len(stints) == 4
+    history.add('Speed', 30.0, 1200.0)  # kopya döndüğü için ekleme engellenmez
+
+    history.clear()
+    assert len(build_segment_index(history.as_telemetry_data())) == 0
+    history.rebuild(session)
+    assert len(history.as_telemetry_data()['Speed']['times']) == len(session['Speed']['times'])
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Oturum Karşılaştırma Testleri
+"""
+
+import numpy as np
+
+from session_compare import DELTA_TIME, CompareSession, delta_trace
+from session_store import SessionStore, SessionStoreWriter
+
+
+def make_session(path, speed, seconds=600.0, rate=10.0):
+    """Sabit hızlı, akımı zamana bağlı test oturumu"""
+    times = 1700000000.0 + np.arange(0.0, seconds, 1.0 / rate)
+    with SessionStoreWriter(str(path), chunk_size=1024) as writer:
+        writer.append('Speed', times, np.full(len(times), speed))
+        writer.append('Current', times, np.linspace(0.0, 10.0, len(times)))
+    return CompareSession(SessionStore(str(path)))
+
+
+def test_axis_round_trip(tmp_path):
+    """Zaman ve mesafe eksenleri birbirine tutarlı dönüşmeli"""
+    session = make_session(tmp_path / 'a.tstore', speed=36.0)
+    assert abs(session.total_km - 6.0) < 0.01  # 36 km/h × 10 dk
+
+    times = session.start_time + np.array([60.0, 300.0])
+    assert np.allclose(session.to_axis(times, 'time'), [1.0, 5.0])
+    distance = session.to_axis(times, 'distance')
+    assert np.allclose(distance, [0.6, 3.0])
+    assert np.allclose(session.to_times(distance, 'distance'), times)
+
+
+def test_delta_traces(tmp_path):
+    """Fark eğrileri ortak ızgarada hesaplanmalı"""
+    slow = make_session(tmp_path / 'slow.tstore', speed=36.0)
+    fast = make_session(tmp_path / 'fast.tstore', speed=72.0)
+
+    # Aynı konuma hızlı oturum yarı sürede ulaşır
+    grid, delta = delta_trace(slow, fast, DELTA_TIME, 'distance', 0.0, 5.9, points=60)
+    assert np.allclose(delta, -grid / 72.0 * 3600.0)
+
+    # Zaman ekseninde akım profilleri aynı
+    grid, delta = delta_trace(slow, fast, 'Current', 'time', 0.0, 9.0, points=100)
+    assert np.nanmax(np.abs(delta)) < 0.05
+
+    # Bir oturumun kapsamadığı mesafe NaN
+    grid, delta = delta_trace(slow, fast, DELTA_TIME, 'distance', 0.0, 12.0, points=13)
+    assert np.isnan(delta[grid > 6.0]).all()
+
+
+def test_delta_uses_raw_samples_across_lod_levels(tmp_path):
+    """Uzaklaştırılmış görünümde fark min/max zikzakı değil ortalama farkı olmalı"""
+    rng = np.random.default_rng(7)
+    times = 1700000000.0 + np.arange(0.0, 600.0, 0.1)
+    sessions = []
+    for name, offset, keep in (('ref', 0.0, np.ones(len(times), bool)),
+                               ('other', 1.0, (times - times[0] < 200.0) | (times - times[0] > 260.0))):
+        path = str(tmp_path / f'{name}.tstore')
+        with SessionStoreWriter(path, chunk_size=1024) as writer:
+            writer.append('Speed', times, np.full(len(times), 36.0))
+            writer.append('Current', times[keep], offset + rng.normal(0.0, 2.0, keep.sum()))
+        sessions.append(CompareSession(SessionStore(path)))
+
+    reference, other = sessions
+    assert len(reference.store.manifest['channels']['Current']['levels']) > 1
+    assert reference.query('Current', 0.0, 10.0, 'time', 100)[2] > 0
+
+    grid, delta = delta_trace(reference, other, 'Current', 'time', 0.0, 9.9, points=100)
+    covered = ~np.isnan(delta)
+    assert abs(np.mean(delta[covered]) - 1.0) < 0.1 and np.std(delta[covered]) < 0.5
+
+    # 200-260 s arasındaki kayıt boşluğuna çizgi çekilmemeli
+    assert np.isnan(delta[(grid > 3.45) & (grid < 4.25)]).all()
+    assert covered[(grid < 3.2) | (grid > 4.5)].all()
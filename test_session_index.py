@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Oturum Özet İndeksi Testleri
+"""
+
+import json
+import os
+
+import numpy as np
+
+from session_index import build_index, collect_rows, index_path_for, load_index, per_minute_summary
+
+
+def write_session(path, speed, seconds=180.0):
+    """Sabit hızlı, 1 Hz datetime anahtarlı JSON oturumu"""
+    data = {}
+    for i in range(int(seconds)):
+        timestamp = 1700000000.0 + i
+        data[str(timestamp)] = {'timestamp': timestamp, 'datetime': str(timestamp),
+                                'Speed': speed, 'Power': 100.0}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'data': data}, f)
+
+
+def test_build_index_totals():
+    """Süre, mesafe, enerji ve kanal özetleri"""
+    times = np.arange(0.0, 3600.0, 1.0)
+    index = build_index({'Speed': (times, np.full(len(times), 36.0)),
+                         'Power': (times, np.full(len(times), 200.0))})
+    assert abs(index['duration_s'] - 3599.0) < 1e-9
+    assert abs(index['distance_km'] - 36.0 * 3599.0 / 3600.0) < 1e-9
+    assert abs(index['energy_wh'] - 200.0 * 3599.0 / 3600.0) < 1e-9
+    assert index['channels']['Speed']['count'] == 3600
+    assert len(index['per_minute']['Power']['mean']) == 60
+
+
+def test_per_minute_gaps():
+    """Örneği olmayan dakikalar None kalmalı"""
+    summary = per_minute_summary([0.0, 30.0, 130.0], [1.0, 3.0, 5.0], 0.0, 3)
+    assert summary['mean'] == [2.0, None, 5.0]
+    assert summary['min'] == [1.0, None, 5.0]
+    assert summary['max'] == [3.0, None, 5.0]
+
+
+def test_stale_index_rebuilt(tmp_path):
+    """İndeks bir kez yazılmalı, kaynak değişince yeniden oluşturulmalı"""
+    slow, fast = str(tmp_path / 'slow.json'), str(tmp_path / 'fast.json')
+    write_session(slow, 20.0)
+    write_session(fast, 40.0)
+
+    rows, rebuilt = collect_rows([slow, fast], sort_key='distance_km', descending=True)
+    assert rebuilt == 2
+    assert [row['file'] for row in rows] == ['fast.json', 'slow.json']
+    assert os.path.exists(index_path_for(slow))
+
+    rows, rebuilt = collect_rows([slow, fast])
+    assert rebuilt == 0
+
+    write_session(slow, 60.0, seconds=240.0)
+    assert load_index(slow, rebuild=False) is None
+    rows, rebuilt = collect_rows([slow, fast], sort_key='distance_km', descending=True)
+    assert rebuilt == 1
+    assert rows[0]['file'] == 'slow.json'
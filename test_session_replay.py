@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Satır Ayrıştırıcı ve Kayıt Oynatma Testleri
+"""
+
+import json
+
+from telemetry_parser import parse_line
+from session_replay import ReplayClock, load_json_session, load_text_capture, seek_index
+
+
+def test_parse_line_formats():
+    """Zaman damgalı ve formatsız satırlar parse edilmeli"""
+    assert parse_line("11:19:12.823 -> ERPM: -6") == [('ERPM', -6, '11:19:12.823')]
+    assert parse_line("11:19:12.823 -> Hız (km/s): 12.50") == [('Speed', 12.5, '11:19:12.823')]
+    assert parse_line("11:19:12.823 -> ----- ALINAN VERİ -----") == []
+
+    raw = dict((t, v) for t, v, _ in parse_line("Hız:3.5 Akım:-0.20 Gerilim:19.47 Güç:-3.89"))
+    assert raw == {'Speed': 3.5, 'Current': -0.2, 'Voltage': 19.47, 'Power': -3.89}
+
+
+def test_load_text_capture(tmp_path):
+    """Ham kayıt zaman sıralı örneklere çevrilmeli"""
+    capture = tmp_path / "capture.txt"
+    capture.write_text("Arduino Telemetri Simülasyon Verileri\n"
+                       "23:59:59.900 -> Hız (km/h): 10.00\n"
+                       "00:00:00.100 -> Hız (km/h): 12.00\n", encoding='utf-8')
+
+    events = load_text_capture(str(capture))
+    assert [event.value for event in events] == [10.0, 12.0]
+    # Gece yarısı geçişi bir sonraki güne taşınmalı
+    assert abs((events[1].time - events[0].time) - 0.2) < 1e-6
+
+
+def test_load_json_session_skips_derived(tmp_path):
+    """JSON oturumunda yalnızca istenen kanallar oynatılmalı"""
+    session = tmp_path / "session.json"
+    session.write_text(json.dumps({'data': {
+        'b': {'timestamp': 2.0, 'datetime': 'b', 'Speed': 5.0, 'Distance': 0.1},
+        'a': {'timestamp': 1.0, 'datetime': 'a', 'Speed': 4.0, 'Current': None},
+    }}), encoding='utf-8')
+
+    events = load_json_session(str(session), data_types=['Speed', 'Current'])
+    assert [(event.time, event.data_type) for event in events] == [(1.0, 'Speed'), (2.0, 'Speed')]
+    assert seek_index([event.time for event in events], 1.5) == 1
+
+
+def test_replay_clock_pacing():
+    """Oynatma saati hız çarpanına göre beklemeli"""
+    now = [100.0]
+    clock = ReplayClock(speed=10.0, clock=lambda: now[0])
+    clock.anchor(0.0)
+    assert clock.delay_until(5.0) == 0.5
+
+    clock.set_speed(0.0, 0.0)
+    assert clock.delay_until(1000.0) == 0.0
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Disk Tabanlı Oturum Deposu Testleri
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from session_store import (ChunkCache, SessionStore, SessionStoreWriter,
+                           convert_json_session, reduce_min_max)
+
+
+def make_store(path, count=10000, chunk_size=1024):
+    """Test için sinüs dalgası içeren depo oluştur"""
+    times = 1000.0 + np.arange(count) * 0.1
+    values = np.sin(np.arange(count) / 50.0)
+    with SessionStoreWriter(str(path), chunk_size=chunk_size) as writer:
+        # Parça sınırlarıyla hizalı olmayan küçük bloklar halinde yaz
+        for start in range(0, count, 333):
+            writer.append('Speed', times[start:start + 333], values[start:start + 333])
+    return times, values
+
+
+def test_reduce_min_max_keeps_extremes():
+    """Min/max indirgeme her kovanın uç değerlerini korumalı"""
+    values = np.array([1.0, 5.0, -2.0, 3.0, 0.0])
+    rows = reduce_min_max(np.arange(5.0), values, 4)
+    assert rows.tolist() == [[1.0, 5.0, 2.0, -2.0], [4.0, 0.0, 4.0, 0.0]]
+
+
+def test_roundtrip_and_range_query(tmp_path):
+    """Ham seviye yazılan veriyi aynen döndürmeli, sorgu yalnızca aralığı yüklemeli"""
+    times, values = make_store(tmp_path / "s.tstore")
+    store = SessionStore(str(tmp_path / "s.tstore"))
+
+    all_times, all_values = store.read_channel('Speed')
+    assert np.array_equal(all_times, times)
+    assert np.array_equal(all_values, values)
+
+    store.cache.clear()
+    misses = store.cache.misses
+    t, v, level = store.query('Speed', times[5000], times[5100], max_points=1000)
+    assert level == 0
+    assert t[0] <= times[5000] and t[-1] >= times[5100]
+    assert store.cache.misses - misses == 1
+
+
+def test_lod_level_selection(tmp_path):
+    """Geniş aralıkta nokta sayısı max_points altında kalmalı, uç değerler korunmalı"""
+    times, values = make_store(tmp_path / "s.tstore")
+    store = SessionStore(str(tmp_path / "s.tstore"))
+
+    t, v, level = store.query('Speed', times[0], times[-1], max_points=2000)
+    assert level > 0
+    assert len(t) <= 2000
+    assert np.all(np.diff(t) >= 0)
+    assert v.max() == values.max() and v.min() == values.min()
+
+
+def test_chunk_cache_budget(tmp_path):
+    """LRU önbellek bellek bütçesini aşmamalı"""
+    make_store(tmp_path / "s.tstore")
+    store = SessionStore(str(tmp_path / "s.tstore"), cache_bytes=40000)
+    store.read_channel('Speed')
+    assert store.cache.current_bytes <= 40000
+    assert isinstance(store.cache, ChunkCache)
+
+
+def test_convert_json_session(tmp_path):
+    """JSON oturumu depoya dönüştürülebilmeli"""
+    session = tmp_path / "session.json"
+    session.write_text(json.dumps({
+        'export_info': {'format': 'datetime_keyed'},
+        'data': {
+            'b': {'timestamp': 2.0, 'Speed': 5.0, 'Current': None},
+            'a': {'timestamp': 1.0, 'Speed': 4.0, 'Current': 1.5},
+        }
+    }), encoding='utf-8')
+
+    store = SessionStore(convert_json_session(str(session)))
+    assert sorted(store.channels) == ['Current', 'Speed']
+    assert store.read_channel('Speed')[1].tolist() == [4.0, 5.0]
+    assert (store.start_time, store.end_time) == (1.0, 2.0)
+
+
+def test_rewrite_replaces_old_chunks(tmp_path):
+    """Aynı yola yeniden yazılan depoda eski parçalar ve kanallar kalmamalı"""
+    path = tmp_path / "s.tstore"
+    make_store(path, count=10000)
+    with SessionStoreWriter(str(path), chunk_size=1024) as writer:
+        writer.append('Current', [1.0, 2.0], [0.5, 0.6])
+
+    assert sorted(p.name for p in path.iterdir()) == ['Current', 'manifest.json']
+    assert SessionStore(str(path)).channels == ['Current']
+    assert not (tmp_path / "s.tstore.partial").exists()
+
+    other = tmp_path / "notlar"
+    other.mkdir()
+    (other / "oku.txt").write_text("depo değil", encoding='utf-8')
+    with pytest.raises(FileExistsError):
+        SessionStoreWriter(str(other))
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Başlangıç Profili Testleri
+"""
+
+import json
+
+import pytest
+
+from startup_profile import PROFILE_PREFIX, StartupProfile, parse_profile_output, summarize_runs
+
+
+class FakeClock:
+    def __init__(self, *times):
+        self.times = list(times)
+
+    def __call__(self):
+        return self.times.pop(0)
+
+
+def test_profile_phases():
+    """Her aşama bir önceki işaretten bu yana geçen süreyi almalı"""
+    profile = StartupProfile(clock=FakeClock(10.0, 10.3, 10.5, 11.0))
+    profile.mark('qt_imports')
+    profile.mark('init_ui')
+    profile.mark('first_paint')
+
+    assert profile.phases == [('qt_imports', pytest.approx(0.3)), ('init_ui', pytest.approx(0.2)),
+                              ('first_paint', pytest.approx(0.5))]
+    assert profile.until('first_paint') == pytest.approx(1.0)
+    assert profile.until('port_scan') is None
+    assert profile.total == pytest.approx(1.0)
+    assert 'init_ui' in profile.report()
+
+
+def test_benchmark_summary():
+    """Koşuların medyanı alınmalı, ilk çizim hedefle karşılaştırılmalı"""
+    def run(first_paint):
+        profile = StartupProfile(clock=FakeClock(0.0, first_paint - 0.1, first_paint, first_paint + 0.2))
+        for phase in ('init_ui', 'first_paint', 'port_scan'):
+            profile.mark(phase)
+        return json.loads(json.dumps(profile.as_dict()))
+
+    output = "Seri port verisi\n" + PROFILE_PREFIX + json.dumps(run(0.8)) + "\n"
+    assert parse_profile_output(output)['marks']['first_paint'] == pytest.approx(0.8)
+    with pytest.raises(ValueError):
+        parse_profile_output("çıktı yok")
+
+    summary = summarize_runs([run(0.8), run(1.2), run(3.0)], target=2.0)
+    assert summary['first_paint'] == pytest.approx(1.2)
+    assert summary['first_paint_max'] == pytest.approx(3.0)
+    assert summary['phases']['port_scan'] == pytest.approx(0.2)
+    assert summary['passed']
+    assert not summarize_runs([run(2.5)], target=2.0)['passed']
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Akış Halinde İstatistik Testleri
+"""
+
+import random
+
+import numpy as np
+
+from telemetry_stats import RunningStats, SessionStats
+
+
+def test_running_stats_matches_numpy():
+    """Welford toplayıcısı numpy ile aynı sonucu vermeli"""
+    rng = random.Random(42)
+    values = [rng.gauss(20.0, 3.0) for _ in range(5000)]
+
+    stats = RunningStats()
+    stats.update_many(values)
+
+    assert stats.count == len(values)
+    assert abs(stats.mean - np.mean(values)) < 1e-9
+    assert abs(stats.std - np.std(values)) < 1e-9
+    assert stats.min == min(values) and stats.max == max(values)
+
+    # P² tahmini gerçek kantile yakın olmalı
+    assert abs(stats.quantile(0.5) - np.percentile(values, 50)) < 0.2
+    assert abs(stats.quantile(0.95) - np.percentile(values, 95)) < 0.3
+
+
+def test_session_stats_counts_every_added_sample():
+    """Oturum istatistiği eklenen tüm örnekleri saymalı, görülmeyen kanal None olmalı"""
+    session = SessionStats()
+    for value in range(100):
+        session.add('Speed', float(value))
+
+    speed = session.get('Speed')
+    assert speed.count == 100
+    assert speed.min == 0.0 and speed.mean == 49.5
+    assert session.get('Current') is None
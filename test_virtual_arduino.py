@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Virtual Arduino Simulatörü Testleri
+"""
+
+import os
+import socket
+import threading
+import time
+
+import pytest
+import serial
+
+from pty_port import pty_supported
+from telemetry_parser import parse_line
+from virtual_arduino import LoadGenerator, PtySimulator
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('localhost', 0))
+        return s.getsockname()[1]
+
+
+def receive_all(port):
+    """Sunucuya bağlan ve bağlantı kapanana kadar okunan baytları döndür"""
+    for _ in range(50):
+        try:
+            client = socket.create_connection(('localhost', port))
+            break
+        except ConnectionRefusedError:
+            time.sleep(0.05)
+    chunks = []
+    with client:
+        while True:
+            data = client.recv(1 << 16)
+            if not data:
+                break
+            chunks.append(data)
+    return b"".join(chunks)
+
+
+def test_load_generator_frame_limit():
+    """Çerçeve sınırına kadar gruplar halinde göndermeli ve hızı raporlamalı"""
+    port = free_port()
+    generator = LoadGenerator('localhost', port, rate=0, batch_frames=100, max_frames=1050)
+    thread = threading.Thread(target=generator.run_simulation)
+    thread.start()
+    payload = receive_all(port)
+    thread.join(timeout=10)
+
+    assert payload.decode('utf-8').count("----- ALINAN VERİ -----") == 1050
+    assert generator.stats['frames'] == 1050
+    assert generator.stats['bytes'] == len(payload)
+    assert generator.stats['frames_per_s'] > 0
+
+
+def connect(port):
+    for _ in range(50):
+        try:
+            return socket.create_connection(('localhost', port))
+        except ConnectionRefusedError:
+            time.sleep(0.05)
+    raise ConnectionRefusedError(port)
+
+
+def test_fanout_same_frames_to_all_clients():
+    """Her çerçeve bir kez üretilip tüm istemcilere aynı baytlarla gitmeli"""
+    port = free_port()
+    generator = LoadGenerator('localhost', port, rate=0, batch_frames=50, max_frames=500,
+                              wait_clients=2)
+    thread = threading.Thread(target=generator.run_simulation)
+    thread.start()
+    results = [None, None]
+
+    def read(i):
+        results[i] = receive_all(port)
+
+    readers = [threading.Thread(target=read, args=(i,)) for i in range(2)]
+    for reader in readers:
+        reader.start()
+    for reader in readers:
+        reader.join(timeout=10)
+    thread.join(timeout=10)
+
+    assert results[0] == results[1]
+    assert results[0].decode('utf-8').count("----- ALINAN VERİ -----") == 500
+    assert generator.stats['bytes'] == len(results[0])
+
+
+def test_fanout_drops_slow_client():
+    """Okumayan istemci düşürülmeli, diğeri veri almaya devam etmeli"""
+    port = free_port()
+    generator = LoadGenerator('localhost', port, rate=0, batch_frames=100, max_frames=100000,
+                              wait_clients=2, max_buffer=64 * 1024)
+    thread = threading.Thread(target=generator.run_simulation)
+    thread.start()
+    stalled = connect(port)
+    stalled.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    payload = receive_all(port)
+    thread.join(timeout=20)
+    stalled.close()
+
+    assert generator.stats['slow_dropped'] == 1
+    assert payload.decode('utf-8').count("----- ALINAN VERİ -----") == 100000
+
+
+@pytest.mark.skipif(not pty_supported(), reason="pty yalnızca Linux/macOS'ta")
+def test_pty_simulator_feeds_serial_reader(tmp_path):
+    """Seri port okuyucusu pty üzerinden ayrıştırılabilir çerçeveler almalı"""
+    link = str(tmp_path / 'ttyTest')
+    simulator = PtySimulator(link, rate=200.0, baudrate=0, duration=1.5, seed=1)
+    thread = threading.Thread(target=simulator.run_simulation)
+    thread.start()
+    for _ in range(50):
+        if os.path.islink(link):
+            break
+        time.sleep(0.02)
+    # Okuyucu yokken üretilen çerçeveler bayatlamasın diye düşürülür
+    time.sleep(0.3)
+
+    received = b""
+    with serial.Serial(link, 115200, timeout=0.2) as port:
+        # SerialThread gibi yalnızca bekleyen baytlar okunur
+        while thread.is_alive():
+            waiting = port.in_waiting
+            if waiting:
+                received += port.read(waiting)
+            else:
+                time.sleep(0.01)
+    thread.join(timeout=5)
+
+    frames = received.decode('utf-8').count("----- ALINAN VERİ -----")
+    assert simulator.stats['dropped'] > 0
+    # pyserial açılışta giriş tamponunu temizler; o anda yazılan birkaç çerçeve kaybolabilir
+    assert 100 < frames <= simulator.stats['sent'] <= frames + 20
+    assert received.endswith(b"\n\n")
+    samples = [s for line in received.decode('utf-8').splitlines() for s in parse_line(line)]
+    assert sum(1 for s in samples if s[0] == 'Speed') == frames
+    assert not os.path.exists(link)
@@ -5,50 +5,178 @@ Gelişmiş Arduino Telemetri Simulatörü
 Virtual seri port oluşturur veya dosya üzerinden simülasyon yapar
 """
 
+import argparse
 import sys
 import time
 import random
 import threading
 from datetime import datetime
 import socket
-import select
+import selectors
+
+from dataset_generator import FORMATS, write_dataset
+from fault_injector import FaultInjector
+from pty_port import DEFAULT_PTY_LINK, PtySerialPort, wire_seconds
+from scenario_engine import ScenarioEngine
+
+# İstemci başına gönderilmeyi bekleyen en fazla bayt - aşan yavaş istemci düşürülür
+DEFAULT_CLIENT_BUFFER = 4 * 1024 * 1024
+
+# Normal modda çerçeve aralığı (saniye) - 10 paket/saniye
+FRAME_INTERVAL = 0.1
+
+
+class FanoutServer:
+    """
+    Engellemeyen, çok istemcili TCP yayın sunucusu (selectors)
+
+    Her çerçeve bir kez kodlanır ve tüm istemcilere gönderilir. Soket o an
+    kabul etmediği baytlar istemcinin kendi tamponunda bekler; tamponu
+    max_buffer'ı aşan yavaş istemci diğerlerini bekletmemek için düşürülür.
+    """
+    
+    def __init__(self, host='localhost', port=9999, max_buffer=DEFAULT_CLIENT_BUFFER):
+        self.host = host
+        self.port = port
+        self.max_buffer = max_buffer
+        self.selector = selectors.DefaultSelector()
+        self.server_socket = None
+        self.clients = {}  # soket -> bytearray gönderim tamponu
+        self.addresses = {}
+        self.slow_dropped = 0
+    
+    def start(self):
+        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server_socket.bind((self.host, self.port))
+        self.server_socket.listen(16)
+        self.server_socket.setblocking(False)
+        self.selector.register(self.server_socket, selectors.EVENT_READ)
+    
+    @property
+    def client_count(self):
+        return len(self.clients)
+    
+    def pending_bytes(self):
+        """Tüm istemci tamponlarındaki en büyük bekleyen bayt sayısı"""
+        return max((len(buffer) for buffer in self.clients.values()), default=0)
+    
+    def min_pending_bytes(self):
+        """En hızlı istemcinin tamponunda bekleyen bayt sayısı"""
+        return min((len(buffer) for buffer in self.clients.values()), default=0)
+    
+    def poll(self, timeout=0.0):
+        """Yeni bağlantıları kabul et, bekleyen tamponları gönder, kapanan istemcileri at"""
+        for key, events in self.selector.select(timeout):
+            sock = key.fileobj
+            if sock is self.server_socket:
+                self._accept()
+                continue
+            if events & selectors.EVENT_READ:
+                # İstemciden gelen veri kullanılmaz, yalnızca kapanma tespit edilir
+                try:
+                    if not sock.recv(4096):
+                        self.drop(sock, "🔌 Bağlantı kesildi")
+                        continue
+                except (BlockingIOError, InterruptedError):
+                    pass
+                except OSError:
+                    self.drop(sock, "🔌 Bağlantı kesildi")
+                    continue
+            if events & selectors.EVENT_WRITE and sock in self.clients:
+                self._flush(sock)
+    
+    def _accept(self):
+        while True:
+            try:
+                client, addr = self.server_socket.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            client.setblocking(False)
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.clients[client] = bytearray()
+            self.addresses[client] = addr
+            self.selector.register(client, selectors.EVENT_READ)
+            print(f"✅ Bağlantı kuruldu: {addr} (toplam {self.client_count} istemci)")
+    
+    def _flush(self, sock):
+        buffer = self.clients[sock]
+        try:
+            sent = sock.send(buffer)
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        except OSError:
+            self.drop(sock, "🔌 Bağlantı kesildi")
+            return
+        del buffer[:sent]
+        # Yazılabilirlik yalnızca tamponda veri varken izlenir
+        events = selectors.EVENT_READ | (selectors.EVENT_WRITE if buffer else 0)
+        if self.selector.get_key(sock).events != events:
+            self.selector.modify(sock, events)
+    
+    def broadcast(self, payload):
+        """Kodlanmış çerçeveleri tüm istemcilere gönder"""
+        for sock in list(self.clients):
+            buffer = self.clients[sock]
+            buffer += payload
+            if len(buffer) > self.max_buffer:
+                self.slow_dropped += 1
+                self.drop(sock, f"🐢 Yavaş istemci düşürüldü ({len(buffer) / 1e6:.1f} MB bekliyordu)")
+                continue
+            self._flush(sock)
+    
+    def drain(self, timeout=2.0):
+        """Kapatmadan önce tamponlardaki baytları göndermeye çalış"""
+        deadline = time.monotonic() + timeout
+        while self.pending_bytes() and time.monotonic() < deadline:
+            self.poll(max(0.0, deadline - time.monotonic()))
+    
+    def drop(self, sock, message=None):
+        if sock not in self.clients:
+            return
+        del self.clients[sock]
+        addr = self.addresses.pop(sock, None)
+        self.selector.unregister(sock)
+        sock.close()
+        if message:
+            print(f"{message}: {addr} (kalan {self.client_count} istemci)")
+    
+    def close(self):
+        for sock in list(self.clients):
+            self.drop(sock)
+        if self.server_socket:
+            self.selector.unregister(self.server_socket)
+            self.server_socket.close()
+            self.server_socket = None
+        self.selector.close()
+
 
 class VirtualSerialSimulator:
-    """TCP socket tabanlı virtual seri port simulatörü"""
+    """TCP socket tabanlı virtual seri port simulatörü - istemci sayısı sınırsız"""
     
-    def __init__(self, host='localhost', port=9999):
+    def __init__(self, host='localhost', port=9999, max_buffer=DEFAULT_CLIENT_BUFFER,
+                 scenario=None, seed=None, faults=None):
         self.host = host
         self.port = port
         self.is_running = False
-        self.server_socket = None
-        self.client_socket = None
+        self.server = FanoutServer(host, port, max_buffer)
         
-        # Simülasyon parametreleri
-        self.erpm = 0
-        self.rpm = 0
-        self.speed = 0.0
-        self.current = 0.0
-        self.duty = 0
-        self.voltage = 19.5
-        self.power = 0.0
+        # Araç modeli - aynı senaryo ve tohum her çalıştırmada aynı değerleri üretir
+        self.engine = ScenarioEngine(scenario, seed)
+        self.step_seconds = FRAME_INTERVAL
+        self.engine.copy_to(self)
         
-        # Mesafe takibi için
-        self.last_time = time.time()
+        # Telsiz hattı bozulmaları (fault_injector.FaultInjector) - None ise temiz akış
+        self.faults = faults
+        self.stalled_seconds = 0.0
     
     def start_server(self):
-        """TCP server başlat"""
+        """TCP server başlat - bağlantılar veri üretimi sırasında kabul edilir"""
         try:
-            self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.server_socket.bind((self.host, self.port))
-            self.server_socket.listen(1)
+            self.server.start()
             print(f"🌐 Virtual Arduino Server başlatıldı: {self.host}:{self.port}")
             print(f"📡 Telemetri arayüzünde TCP bağlantısı için: socket://{self.host}:{self.port}")
-            print("⏳ Bağlantı bekleniyor...")
-            
-            self.client_socket, addr = self.server_socket.accept()
-            print(f"✅ Bağlantı kuruldu: {addr}")
-            print("📊 Veri gönderimi başladı...")
+            print("⏳ Bağlantılar bekleniyor (birden çok arayüz bağlanabilir)...")
             return True
             
         except Exception as e:
@@ -56,41 +184,8 @@ class VirtualSerialSimulator:
             return False
     
     def generate_data(self):
-        """Gerçekçi telemetri verisi üret"""
-        # Rastgele değişimler - daha gerçekçi (küçük adımlar)
-        change = random.randint(-30, 40)  # Daha yumuşak değişimler
-        self.erpm += change
-        self.erpm = max(-3000, min(3000, self.erpm))  # Daha geniş aralık
-        
-        # RPM hesapla
-        self.rpm = abs(self.erpm) // 14  # Gear ratio
-        
-        # Hız hesapla (km/h olarak)
-        # Hız = RPM × tekerlek çapı × π / 60
-        wheel_diameter_m = 0.5  # 50cm çaplı tekerlek
-        self.speed = (abs(self.rpm) * wheel_diameter_m * 3.14159 * 60) / 1000
-        self.speed = max(0, min(80, self.speed))
-        
-        # Akım hesapla (yük ile ilişkili)
-        base_current = abs(self.erpm) * 0.002
-        self.current = base_current + random.uniform(-0.5, 0.5)
-        self.current = max(-10.0, min(20.0, self.current))
-        
-        # Duty cycle
-        if abs(self.erpm) > 10:
-            self.duty = min(100, abs(self.erpm) // 20 + random.randint(-5, 5))
-        else:
-            self.duty = 0
-        self.duty = max(0, min(100, self.duty))
-        
-        # Gerilim (batarya voltajı simülasyonu)
-        self.voltage = 19.5 + random.uniform(-0.8, 0.3)
-        if self.current > 5:  # Yüksek akımda voltaj düşer
-            self.voltage -= (self.current - 5) * 0.1
-        self.voltage = max(16.0, min(21.0, self.voltage))
-        
-        # Güç hesapla
-        self.power = self.voltage * self.current
+        """Senaryo motorunu bir çerçeve ilerlet"""
+        self.engine.apply(self, self.step_seconds)
     
     def send_data_set(self):
         """Bir set veri oluştur ve gönder"""
@@ -110,36 +205,58 @@ class VirtualSerialSimulator:
         
         return "\n".join(lines) + "\n"
     
+    def encode_frame(self):
+        """Bir çerçeve üret, kodla ve varsa hata enjeksiyonunu uygula"""
+        self.generate_data()
+        payload = self.send_data_set().encode('utf-8')
+        if self.faults is not None:
+            payload = self.faults.apply(payload)
+        return payload
+    
+    def take_stall(self):
+        """Enjekte edilen duraklama süresi (saniye) - takvim bu kadar kaydırılır"""
+        if self.faults is None:
+            return 0.0
+        stall = self.faults.take_stall()
+        self.stalled_seconds += stall
+        return stall
+    
+    def report_faults(self):
+        if self.faults is not None:
+            print(f"💥 Enjekte edilen hatalar: {self.faults.summary()}")
+    
     def run_simulation(self):
-        """Simülasyonu çalıştır"""
+        """Simülasyonu çalıştır - istemci kopsa da sunucu çalışmaya devam eder"""
         if not self.start_server():
             return
             
         self.is_running = True
         data_count = 0
+        next_frame = time.monotonic()
         
         try:
             while self.is_running:
-                if self.client_socket:
-                    # Veri üret ve gönder
-                    self.generate_data()
-                    data = self.send_data_set()
-                    
-                    try:
-                        self.client_socket.send(data.encode('utf-8'))
-                        data_count += 1
-                        
-                        # Her 50 pakette bir özet bilgi göster (yaklaşık her 5 saniyede)
-                        if data_count % 50 == 0:
-                            print(f"📤 {data_count} veri paketi gönderildi | "
-                                  f"Hız: {self.speed:.1f}km/h | "
-                                  f"Akım: {self.current:.1f}A | "
-                                  f"Güç: {self.power:.1f}W")
-                    except (ConnectionResetError, BrokenPipeError):
-                        print("🔌 Bağlantı kesildi!")
-                        break
+                # Bir sonraki çerçeveye kadar bağlantı/gönderim olaylarını işle
+                self.server.poll(max(0.0, next_frame - time.monotonic()))
+                if time.monotonic() < next_frame:
+                    continue
+                next_frame += FRAME_INTERVAL
+                
+                if not self.server.client_count:
+                    continue
                 
-                time.sleep(0.1)  # 100ms (0.1 saniye) bekle - 10 paket/saniye
+                # Çerçeve bir kez üretilip kodlanır, tüm istemcilere gönderilir
+                self.server.broadcast(self.encode_frame())
+                next_frame += self.take_stall()
+                data_count += 1
+                
+                # Her 50 pakette bir özet bilgi göster (yaklaşık her 5 saniyede)
+                if data_count % 50 == 0:
+                    print(f"📤 {data_count} veri paketi gönderildi | "
+                          f"{self.server.client_count} istemci | "
+                          f"Hız: {self.speed:.1f}km/h | "
+                          f"Akım: {self.current:.1f}A | "
+                          f"Güç: {self.power:.1f}W")
                 
         except KeyboardInterrupt:
             print(f"\n⏹️ Simülasyon durduruldu. Toplam {data_count} veri paketi gönderildi.")
@@ -149,64 +266,335 @@ class VirtualSerialSimulator:
     def cleanup(self):
         """Temizlik işlemleri"""
         self.is_running = False
-        if self.client_socket:
-            try:
-                self.client_socket.close()
-            except:
-                pass
-        if self.server_socket:
-            try:
-                self.server_socket.close()
-            except:
-                pass
+        try:
+            self.server.drain()
+            self.server.close()
+        except OSError:
+            pass
+        self.report_faults()
         print("🧹 Temizlik tamamlandı.")
 
 
-class FileSimulator:
-    """Dosya tabanlı simulatör - test amaçlı"""
+class LoadGenerator(VirtualSerialSimulator):
+    """
+    Yüksek hızlı yük üreteci - arayüzün veri alma hattını sınamak için
+
+    rate çerçeve/saniye (0 = sınırsız). Çerçeveler batch_frames'lik gruplar
+    halinde tek parça olarak bağlı tüm istemcilere yayınlanır. Gönderim
+    zamanları mutlak takvime göre hesaplanır, böylece uyku hataları birikmez:
+        burst  - burst çerçeve art arda gönderilir, ortalama hız korunur
+        jitter - her grubun zamanı aralığın ±jitter katı kadar kaydırılır
+    """
     
-    def __init__(self, filename="arduino_data.txt"):
-        self.filename = filename
-        self.is_running = False
-        
-        # Simülasyon parametreleri
-        self.erpm = 0
-        self.rpm = 0
-        self.speed = 0.0
-        self.current = 0.0
-        self.duty = 0
-        self.voltage = 19.5
-        self.power = 0.0
+    def __init__(self, host='localhost', port=9999, rate=1000.0, batch_frames=64,
+                 burst=0, jitter=0.0, duration=None, max_frames=None, seed=None,
+                 wait_clients=1, max_buffer=DEFAULT_CLIENT_BUFFER, scenario=None, faults=None):
+        super().__init__(host, port, max_buffer, scenario, seed, faults)
+        self.wait_clients = max(1, wait_clients)
+        self.rate = rate
+        self.batch_frames = max(1, batch_frames)
+        self.burst = burst
+        self.jitter = jitter
+        self.duration = duration
+        self.max_frames = max_frames
+        self.jitter_random = random.Random(seed)
+        self.stats = {}
+        # Simülasyon zamanı hedef hıza göre ilerler (sınırsız hızda normal aralık)
+        if rate > 0:
+            self.step_seconds = 1.0 / rate
     
-    def generate_data(self):
-        """VirtualSerialSimulator ile aynı veri üretimi"""
-        change = random.randint(-50, 50)
-        self.erpm += change
-        self.erpm = max(-2000, min(2000, self.erpm))
+    def frame_group_size(self):
+        """Tek parça halinde yayınlanan çerçeve sayısı"""
+        return self.burst if self.burst else self.batch_frames
+    
+    def build_batch(self, count):
+        """count çerçeveyi üretip tek bayt dizisinde birleştir"""
+        if self.faults is not None:
+            return b"".join([self.encode_frame() for _ in range(count)])
+        frames = []
+        for _ in range(count):
+            self.generate_data()
+            frames.append(self.send_data_set())
+        return "".join(frames).encode('utf-8')
+    
+    def wait_for_clients(self):
+        """Ölçüm, beklenen sayıda istemci bağlanınca başlar"""
+        while self.is_running and self.server.client_count < self.wait_clients:
+            self.server.poll(0.1)
+        return self.is_running
+    
+    def run_simulation(self):
+        """Yük üretecini çalıştır, ulaşılan hızı raporla"""
+        if not self.start_server():
+            return None
         
-        self.rpm = abs(self.erpm) // 14
+        self.is_running = True
+        try:
+            if not self.wait_for_clients():
+                return None
+        except KeyboardInterrupt:
+            self.cleanup()
+            return None
+        print(f"📊 {self.server.client_count} istemci bağlı, yük testi başladı")
         
-        # Hız hesaplama (km/h)
-        wheel_diameter_m = 0.5
-        self.speed = (abs(self.rpm) * wheel_diameter_m * 3.14159 * 60) / 1000
-        self.speed = max(0, min(80, self.speed))
+        group = self.frame_group_size()
+        frames_sent = 0
+        bytes_sent = 0
+        start = time.perf_counter()
+        last_report = start
+        last_frames = 0
+        reason = "süre/çerçeve sınırı"
         
-        base_current = abs(self.erpm) * 0.002
-        self.current = base_current + random.uniform(-0.5, 0.5)
-        self.current = max(-10.0, min(20.0, self.current))
+        try:
+            while self.is_running:
+                elapsed = time.perf_counter() - start
+                if self.duration is not None and elapsed >= self.duration:
+                    break
+                if self.max_frames is not None and frames_sent >= self.max_frames:
+                    break
+                
+                count = group
+                if self.max_frames is not None:
+                    count = min(count, self.max_frames - frames_sent)
+                
+                if self.rate > 0:
+                    # Grubun takvimdeki gönderim anı (başlangıca göre, duraklamalar dahil)
+                    due = frames_sent / self.rate + self.stalled_seconds
+                    if self.jitter:
+                        due += self.jitter_random.uniform(-self.jitter, self.jitter) * count / self.rate
+                    if self.duration is not None and due >= self.duration:
+                        # Ölçüm penceresi test süresinin tamamı olsun
+                        remaining = self.duration - (time.perf_counter() - start)
+                        while remaining > 0:
+                            self.server.poll(remaining)
+                            remaining = self.duration - (time.perf_counter() - start)
+                        break
+                    # Beklerken tamponlar gönderilmeye devam eder
+                    delay = due - (time.perf_counter() - start)
+                    while delay > 0:
+                        self.server.poll(delay)
+                        delay = due - (time.perf_counter() - start)
+                else:
+                    # Sınırsız hızda üreteç en hızlı istemcinin alabildiği kadar hızlıdır;
+                    # geride kalan istemcinin tamponu dolar ve düşürülür
+                    while self.server.min_pending_bytes() > self.server.max_buffer // 2:
+                        self.server.poll(0.01)
+                
+                self.server.poll(0.0)
+                if not self.server.client_count:
+                    reason = "tüm istemciler ayrıldı"
+                    break
+                
+                payload = self.build_batch(count)
+                self.server.broadcast(payload)
+                frames_sent += count
+                bytes_sent += len(payload)
+                
+                stall = self.take_stall()
+                if stall and self.rate <= 0:
+                    # Sınırsız hızda takvim yok - duraklama burada beklenir
+                    until = time.perf_counter() + stall
+                    while time.perf_counter() < until:
+                        self.server.poll(until - time.perf_counter())
+                
+                now = time.perf_counter()
+                if now - last_report >= 1.0:
+                    print(f"📤 {frames_sent} çerçeve | "
+                          f"{(frames_sent - last_frames) / (now - last_report):,.0f} çerçeve/s | "
+                          f"{bytes_sent / (now - start) / 1e6:.2f} MB/s")
+                    last_report = now
+                    last_frames = frames_sent
+                    
+        except KeyboardInterrupt:
+            reason = "kullanıcı durdurdu"
+        finally:
+            elapsed = time.perf_counter() - start
+            self.cleanup()
+        
+        self.stats = {
+            'frames': frames_sent,
+            'bytes': bytes_sent,
+            'seconds': elapsed,
+            'frames_per_s': frames_sent / elapsed if elapsed > 0 else 0.0,
+            'mb_per_s': bytes_sent / elapsed / 1e6 if elapsed > 0 else 0.0,
+            'target_rate': self.rate,
+            'group_frames': group,
+            'slow_dropped': self.server.slow_dropped,
+            'stalled_seconds': self.stalled_seconds,
+        }
+        target = f"{self.rate:,.0f}" if self.rate > 0 else "sınırsız"
+        print(f"\n⏹️ Yük testi bitti ({reason})")
+        print(f"📊 {frames_sent} çerçeve, {bytes_sent / 1e6:.2f} MB, {elapsed:.2f} s")
+        print(f"🚀 Ulaşılan: {self.stats['frames_per_s']:,.0f} çerçeve/s "
+              f"({self.stats['mb_per_s']:.2f} MB/s) | Hedef: {target} çerçeve/s | "
+              f"Grup: {group} çerçeve/gönderim")
+        if self.server.slow_dropped:
+            print(f"🐢 Düşürülen yavaş istemci: {self.server.slow_dropped}")
+        return self.stats
+
+
+class PtySimulator(VirtualSerialSimulator):
+    """
+    Sanal seri port simülatörü - arayüz SerialThread ile bağlanır
+
+    Çerçeveler rate çerçeve/saniye takvimine göre pty'nin ana ucuna yazılır.
+    baudrate verilirse hattın taşıyabileceği bayt hızı da uygulanır (8N1,
+    bayt başına 10 bit); hedef hız hattı aşarsa hız hatta sınırlanır.
+    """
+    
+    def __init__(self, link=DEFAULT_PTY_LINK, rate=10.0, baudrate=115200, duration=None,
+                 scenario=None, seed=None, faults=None):
+        super().__init__(scenario=scenario, seed=seed, faults=faults)
+        self.port = PtySerialPort(link, baudrate)
+        self.rate = rate
+        self.baudrate = baudrate
+        self.duration = duration
+        self.step_seconds = 1.0 / rate
+        self.stats = {}
+    
+    def run_simulation(self):
+        """Simülasyonu çalıştır - okuyucu yokken üretilen çerçeveler düşürülür"""
+        try:
+            device = self.port.open()
+        except OSError as e:
+            print(f"❌ Sanal seri port oluşturulamadı: {e}")
+            return None
         
-        if abs(self.erpm) > 10:
-            self.duty = min(100, abs(self.erpm) // 20 + random.randint(-5, 5))
-        else:
-            self.duty = 0
-        self.duty = max(0, min(100, self.duty))
+        print(f"🔌 Sanal seri port hazır: {device}")
+        if self.port.link:
+            print(f"📡 Telemetri arayüzünde port olarak '{self.port.link}' seçin")
+        print(f"⏳ Okuyucu bekleniyor... ({self.rate:g} çerçeve/s, "
+              f"{self.baudrate or 'sınırsız'} baud)")
         
-        self.voltage = 19.5 + random.uniform(-0.8, 0.3)
-        if self.current > 5:
-            self.voltage -= (self.current - 5) * 0.1
-        self.voltage = max(16.0, min(21.0, self.voltage))
+        self.is_running = True
+        frames = sent = bytes_sent = 0
+        wire_free = 0.0
+        start = time.perf_counter()
+        last_report = start
+        had_reader = False
+        
+        try:
+            while self.is_running:
+                # Mutlak takvim; hat doluysa bir sonraki çerçeve hattın boşalmasını bekler
+                due = max(frames / self.rate + self.stalled_seconds, wire_free)
+                if self.duration is not None and due >= self.duration:
+                    break
+                delay = due - (time.perf_counter() - start)
+                if delay > 0:
+                    time.sleep(delay)
+                
+                payload = self.encode_frame()
+                frames += 1
+                if self.port.write(payload):
+                    sent += 1
+                    bytes_sent += len(payload)
+                    wire_free = max(wire_free, due) + wire_seconds(len(payload), self.baudrate)
+                self.take_stall()
+                
+                reader = self.port.has_reader
+                if reader != had_reader:
+                    print("✅ Okuyucu bağlandı" if reader else "🔌 Okuyucu ayrıldı")
+                    had_reader = reader
+                
+                now = time.perf_counter()
+                if now - last_report >= 5.0:
+                    print(f"📤 {sent} çerçeve gönderildi | {sent / (now - start):.1f} çerçeve/s | "
+                          f"düşen: {self.port.frames_dropped}")
+                    last_report = now
+                    
+        except KeyboardInterrupt:
+            print("\n⏹️ Simülasyon durduruldu.")
+        finally:
+            elapsed = time.perf_counter() - start
+            self.cleanup()
         
-        self.power = self.voltage * self.current
+        self.stats = {
+            'frames': frames,
+            'sent': sent,
+            'dropped': self.port.frames_dropped,
+            'bytes': bytes_sent,
+            'seconds': elapsed,
+            'frames_per_s': sent / elapsed if elapsed > 0 else 0.0,
+        }
+        print(f"📊 {sent} çerçeve gönderildi, {self.port.frames_dropped} düşürüldü, "
+              f"{elapsed:.1f} s")
+        return self.stats
+    
+    def cleanup(self):
+        self.is_running = False
+        self.port.close()
+        self.server.close()
+        self.report_faults()
+        print("🧹 Temizlik tamamlandı.")
+
+
+def add_fault_arguments(parser):
+    """Hata enjeksiyonu seçenekleri (tcp, load ve pty modları)"""
+    parser.add_argument('--faults', default=None,
+                        help='Çerçeve başına hata olasılıkları, ör. '
+                             'truncate=0.01,merge=0.005,garbage=0.005,bad_utf8=0.01,stall=0.001,stall_s=0.5')
+    parser.add_argument('--fault-seed', type=int, default=None,
+                        help='Hata enjeksiyonu için rastgele tohum')
+
+
+def build_faults(parser, args):
+    """--faults tanımından FaultInjector (tanım yoksa None)"""
+    try:
+        return FaultInjector.from_spec(args.faults, args.fault_seed)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+def pty_main(argv):
+    """Sanal seri port komut satırı"""
+    parser = argparse.ArgumentParser(
+        prog='virtual_arduino.py pty',
+        description='Arayüzün seri port yolunu donanımsız sınamak için sözde terminal simülatörü')
+    parser.add_argument('--link', default=DEFAULT_PTY_LINK,
+                        help=f'Bağımlı uç için sembolik bağlantı (varsayılan {DEFAULT_PTY_LINK})')
+    parser.add_argument('--rate', type=float, default=10.0, help='Çerçeve/saniye (varsayılan 10)')
+    parser.add_argument('--baud', type=int, default=115200,
+                        help='Hat hızı sınırı (0 = sınırsız, varsayılan 115200)')
+    parser.add_argument('--duration', type=float, default=None, help='Süre (saniye)')
+    parser.add_argument('--scenario', default=None, help='Senaryo dosyası (JSON)')
+    parser.add_argument('--seed', type=int, default=None, help='Rastgele tohum')
+    add_fault_arguments(parser)
+    args = parser.parse_args(argv)
+    
+    simulator = PtySimulator(args.link, args.rate, args.baud, args.duration,
+                             scenario=args.scenario, seed=args.seed,
+                             faults=build_faults(parser, args))
+    simulator.run_simulation()
+
+
+class FileSimulator:
+    """Dosya tabanlı simulatör - test amaçlı"""
+    
+    def __init__(self, filename="arduino_data.txt", scenario=None, seed=None):
+        self.filename = filename
+        self.is_running = False
+        self.engine = ScenarioEngine(scenario, seed)
+        self.engine.copy_to(self)
+    
+    def generate_data(self):
+        """VirtualSerialSimulator ile aynı araç modeli"""
+        self.engine.apply(self, FRAME_INTERVAL)
+    
+    def generate_offline(self, frames, fmt='text'):
+        """
+        frames çerçeveyi beklemeden, vektörel olarak dosyaya yaz
+
+        Çerçeve zamanları 100ms aralıklıdır; 2 saatlik kayıt (72.000 çerçeve)
+        saniyeler içinde oluşur.
+        """
+        print(f"📄 Toplu üretim: {self.filename} ({fmt}, {frames:,} çerçeve, "
+              f"{frames * FRAME_INTERVAL / 60:.1f} dakikalık kayıt)")
+        stats = write_dataset(self.filename, frames, fmt, scenario=self.engine.scenario,
+                              seed=self.engine.seed, dt=FRAME_INTERVAL)
+        print(f"✅ {stats['frames']:,} çerçeve, {stats['bytes'] / 1e6:.1f} MB, "
+              f"{stats['seconds']:.2f} s ({stats['mb_per_s']:.1f} MB/s)")
+        print(f"📁 Veriler: {self.filename}")
+        return stats
     
     def run_simulation(self, duration=60):
         """Dosyaya veri yaz"""
@@ -257,6 +645,57 @@ class FileSimulator:
         print(f"📁 Veriler: {self.filename}")
 
 
+def load_main(argv):
+    """Yük üreteci komut satırı"""
+    parser = argparse.ArgumentParser(
+        prog='virtual_arduino.py load',
+        description='Telemetri arayüzünün veri alma hattı için yüksek hızlı yük üreteci')
+    parser.add_argument('host', nargs='?', default='localhost')
+    parser.add_argument('port', nargs='?', type=int, default=9999)
+    parser.add_argument('--rate', type=float, default=1000.0,
+                        help='Çerçeve/saniye (0 = sınırsız, varsayılan 1000)')
+    parser.add_argument('--batch', type=int, default=64, help='Gönderim başına çerçeve sayısı')
+    parser.add_argument('--burst', type=int, default=0,
+                        help='Art arda gönderilecek çerçeve sayısı (ortalama hız korunur)')
+    parser.add_argument('--jitter', type=float, default=0.0,
+                        help='Gönderim zamanı sapması, aralığın katı olarak (ör. 0.5)')
+    parser.add_argument('--duration', type=float, default=None, help='Test süresi (saniye)')
+    parser.add_argument('--frames', type=int, default=None, help='Gönderilecek çerçeve sayısı')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Araç modeli ve jitter için rastgele tohum')
+    parser.add_argument('--scenario', default=None, help='Senaryo dosyası (JSON)')
+    parser.add_argument('--clients', type=int, default=1,
+                        help='Teste başlamadan önce beklenen istemci sayısı')
+    parser.add_argument('--max-buffer', type=float, default=DEFAULT_CLIENT_BUFFER / 1e6,
+                        help='İstemci başına gönderim tamponu (MB), aşan istemci düşürülür')
+    add_fault_arguments(parser)
+    args = parser.parse_args(argv)
+    faults = build_faults(parser, args)
+    
+    print(f"\n🔧 Yük testi: {args.rate:g} çerçeve/s (0 = sınırsız), "
+          f"{args.burst or args.batch} çerçeve/gönderim, jitter ±{args.jitter:g}")
+    generator = LoadGenerator(args.host, args.port, rate=args.rate, batch_frames=args.batch,
+                              burst=args.burst, jitter=args.jitter, duration=args.duration,
+                              max_frames=args.frames, seed=args.seed, wait_clients=args.clients,
+                              max_buffer=int(args.max_buffer * 1e6), scenario=args.scenario,
+                              faults=faults)
+    generator.run_simulation()
+
+
+def mode_options(argv):
+    """--scenario, --seed, --faults ve toplu üretim seçeneklerini ayıkla, kalan konumsal argümanları döndür"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--scenario', default=None)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--frames', type=int, default=None)
+    parser.add_argument('--format', choices=FORMATS, default='text')
+    add_fault_arguments(parser)
+    options, args = parser.parse_known_args(argv)
+    options.fault_spec = options.faults
+    options.faults = build_faults(parser, options)
+    return options, args
+
+
 def main():
     print("🚀 Arduino Telemetri Simulatörü v3.1 (Hızlı Mod)")
     print("=" * 50)
@@ -266,43 +705,68 @@ def main():
         mode = sys.argv[1].lower()
     else:
         print("Kullanım modları:")
-        print("1. tcp    - TCP server modu (önerilen)")
-        print("2. file   - Dosya modu")
+        print("1. tcp    - TCP server modu (önerilen, --faults ile hat bozulmaları)")
+        print("2. file   - Dosya modu (--frames N --format text/raw/json/tstore ile toplu üretim)")
+        print("3. load   - Yüksek hızlı yük testi (ör. load --rate 20000 --duration 10)")
+        print("4. pty    - Sanal seri port (Linux/macOS, ör. pty --rate 100 --baud 115200)")
         print()
-        mode = input("Mod seçin (tcp/file) [tcp]: ").lower() or 'tcp'
+        mode = input("Mod seçin (tcp/file/load/pty) [tcp]: ").lower() or 'tcp'
+    
+    if mode == 'load':
+        load_main(sys.argv[2:])
+        return
+    if mode == 'pty':
+        pty_main(sys.argv[2:])
+        return
+    
+    options, args = mode_options(sys.argv[2:])
+    scenario_text = options.scenario or "varsayılan"
+    if options.seed is not None:
+        scenario_text += f" (tohum {options.seed})"
     
     if mode == 'tcp':
         # TCP server modu
-        host = sys.argv[2] if len(sys.argv) > 2 else 'localhost'
-        port = int(sys.argv[3]) if len(sys.argv) > 3 else 9999
+        host = args[0] if len(args) > 0 else 'localhost'
+        port = int(args[1]) if len(args) > 1 else 9999
         
         print(f"\n🔧 Ayarlar:")
         print(f"   Host: {host}")
         print(f"   Port: {port}")
         print(f"   Hız: 10 paket/saniye (100ms aralık)")
+        print(f"   Senaryo: {scenario_text}")
+        if options.faults is not None:
+            print(f"   Hata enjeksiyonu: {options.fault_spec}")
         print(f"\n💡 Bağlantı komutu:")
         print(f"   Telemetri arayüzünde 'socket://{host}:{port}' seçin")
         print()
         
-        simulator = VirtualSerialSimulator(host, port)
+        simulator = VirtualSerialSimulator(host, port, scenario=options.scenario, seed=options.seed,
+                                           faults=options.faults)
         simulator.run_simulation()
         
     elif mode == 'file':
         # Dosya modu
-        filename = sys.argv[2] if len(sys.argv) > 2 else "arduino_data.txt"
-        duration = int(sys.argv[3]) if len(sys.argv) > 3 else 60
+        filename = args[0] if len(args) > 0 else "arduino_data.txt"
+        duration = int(args[1]) if len(args) > 1 else 60
+        
+        if options.frames:
+            # Çevrimdışı toplu üretim - duvar saati beklenmez
+            simulator = FileSimulator(filename, scenario=options.scenario, seed=options.seed)
+            simulator.generate_offline(options.frames, options.format)
+            return
         
         print(f"\n🔧 Ayarlar:")
         print(f"   Dosya: {filename}")
         print(f"   Süre: {duration} saniye")
         print(f"   Hız: 10 paket/saniye (100ms aralık)")
+        print(f"   Senaryo: {scenario_text}")
         print()
         
-        simulator = FileSimulator(filename)
+        simulator = FileSimulator(filename, scenario=options.scenario, seed=options.seed)
         simulator.run_simulation(duration)
         
     else:
-        print("❌ Geçersiz mod! tcp veya file seçin.")
+        print("❌ Geçersiz mod! tcp, file, load veya pty seçin.")
 
 
 if __name__ == '__main__':